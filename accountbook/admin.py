@@ -1,7 +1,209 @@
+import heapq
+import itertools
+from contextlib import nullcontext
+
 from django.contrib import admin
+from django.contrib.admin.utils import unquote
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin
+from django.db import DEFAULT_DB_ALIAS
+from django.http import QueryDict
 
 from .models import Account, Analysis, CustomUser, Notification, TransactionHistory
+from .utils import ledger, shards
+from .utils.user_cache import invalidate_user
+
+SHARD_PARAM = 'shard'
+
+
+def admin_shard(request):
+    """관리자 화면이 보는 샤드 - 목록의 ?shard=, 고르지 않았으면 None (전체 샤드)
+
+    변경/삭제 화면은 목록의 필터를 _changelist_filters 로 넘겨받고, 없으면 객체가 있는
+    샤드를 찾아 request 에 둔다.
+    """
+    alias = getattr(request, '_admin_shard', None) or request.GET.get(SHARD_PARAM)
+    if alias is None:
+        filters = QueryDict(request.GET.get('_changelist_filters', ''))
+        alias = filters.get(SHARD_PARAM)
+    if alias in shards.data_aliases():
+        return alias
+    return None
+
+
+def object_shard(model, object_id):
+    """객체가 있는 DB - 샤드마다 ID 범위가 달라 한 곳에만 있음"""
+    for alias in shards.data_aliases():
+        if model._default_manager.using(alias).filter(pk=object_id).exists():
+            return alias
+    return None
+
+
+class _Descending:
+    """내림차순 정렬 키"""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+class ShardResults:
+    """
+    모든 DB 에 같은 조회를 보내 정렬 순서대로 합친 읽기 전용 목록 (Paginator 용)
+
+    각 DB 는 이미 정렬된 앞쪽 stop 개만 읽고 heapq.merge 로 합친다. 정렬 기준은 쿼리셋의
+    필드 이름 정렬만 쓴다 (관리자 목록은 항상 -pk 를 덧붙여 순서가 정해짐).
+    """
+
+    def __init__(self, queryset):
+        self.querysets = [queryset.using(alias) for alias in shards.data_aliases()]
+        self.ordering = [
+            (field.lstrip('-').split('__'), field.startswith('-'))
+            for field in queryset.query.order_by
+            if isinstance(field, str)
+        ]
+        self._count = None
+
+    def sort_key(self, obj):
+        key = []
+        for path, descending in self.ordering:
+            value = obj
+            for name in path:
+                value = None if value is None else getattr(value, name)
+            # PostgreSQL 처럼 NULL 은 오름차순에서 마지막
+            value = (value is None, value)
+            key.append(_Descending(value) if descending else value)
+        return key
+
+    def count(self):
+        if self._count is None:
+            self._count = sum(queryset.count() for queryset in self.querysets)
+        return self._count
+
+    def __len__(self):
+        return self.count()
+
+    def __iter__(self):
+        return iter(self[: self.count()])
+
+    def _clone(self):
+        # 한 페이지이거나 전체 보기이면 ChangeList 가 쿼리셋 복사본을 목록으로 씀
+        return list(self)
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index : index + 1][0]
+        start = index.start or 0
+        stop = self.count() if index.stop is None else index.stop
+        merged = heapq.merge(
+            *(queryset[:stop] for queryset in self.querysets), key=self.sort_key
+        )
+        return list(itertools.islice(merged, start, stop))
+
+
+class ShardChangeList(ChangeList):
+    """샤드를 고르지 않으면 모든 DB 의 행을 합쳐 보여주는 목록"""
+
+    def get_results(self, request):
+        if admin_shard(request) is not None:
+            return super().get_results(request)
+        self.queryset = ShardResults(self.queryset)
+        self.root_queryset = ShardResults(self.root_queryset)
+        super().get_results(request)
+
+
+class ShardListFilter(admin.SimpleListFilter):
+    """샤드 선택 - '전체'는 모든 DB 를 합친 읽기 전용 목록"""
+
+    title = '샤드'
+    parameter_name = SHARD_PARAM
+
+    def lookups(self, request, model_admin):
+        return [(alias, alias) for alias in shards.data_aliases()]
+
+    def queryset(self, request, queryset):
+        # 조회할 DB 는 ShardAdminMixin.get_queryset / ShardChangeList 가 정함
+        return queryset
+
+    def choices(self, changelist):
+        current = self.value()
+        yield {
+            'selected': current is None,
+            'query_string': changelist.get_query_string(remove=[self.parameter_name]),
+            'display': '전체',
+        }
+        for lookup, title in self.lookup_choices:
+            yield {
+                'selected': current == lookup,
+                'query_string': changelist.get_query_string(
+                    {self.parameter_name: lookup}
+                ),
+                'display': title,
+            }
+
+
+class ShardAdminMixin:
+    """
+    샤드 모델 관리 화면 (샤딩을 켰을 때만)
+
+    목록은 샤드 필터로 고른 샤드, 고르지 않으면 모든 DB 를 합쳐 보여준다(검색 포함,
+    일괄 작업 없음). 변경/삭제는 객체가 있는 샤드에서 처리한다.
+    """
+
+    def shard_context(self, request, object_id=None):
+        if not shards.sharding_enabled():
+            return nullcontext()
+        alias = admin_shard(request)
+        if alias is None and object_id is not None:
+            alias = object_shard(self.model, unquote(object_id))
+            request._admin_shard = alias
+        if alias is None:
+            # 추가 화면 - 라우터가 소유 사용자의 샤드에 저장
+            return nullcontext()
+        return shards.using_shard(alias)
+
+    def get_changelist(self, request, **kwargs):
+        if shards.sharding_enabled():
+            return ShardChangeList
+        return super().get_changelist(request, **kwargs)
+
+    def get_list_filter(self, request):
+        list_filter = super().get_list_filter(request)
+        if shards.sharding_enabled():
+            return (ShardListFilter, *list_filter)
+        return list_filter
+
+    def get_actions(self, request):
+        # 전체 목록은 읽기 전용
+        if shards.sharding_enabled() and admin_shard(request) is None:
+            return {}
+        return super().get_actions(request)
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if shards.sharding_enabled():
+            queryset = queryset.using(admin_shard(request) or DEFAULT_DB_ALIAS)
+        return queryset
+
+    # 폼의 선택지, 트랜잭션, 저장 후 처리(정산 등)도 같은 샤드에서
+    def changelist_view(self, request, extra_context=None):
+        with self.shard_context(request):
+            return super().changelist_view(request, extra_context)
+
+    def changeform_view(self, request, object_id=None, *args, **kwargs):
+        with self.shard_context(request, object_id):
+            return super().changeform_view(request, object_id, *args, **kwargs)
+
+    def delete_view(self, request, object_id, *args, **kwargs):
+        with self.shard_context(request, object_id):
+            return super().delete_view(request, object_id, *args, **kwargs)
 
 
 @admin.register(CustomUser)
@@ -19,6 +221,7 @@ class CustomUserAdmin(UserAdmin):
     search_fields = ('email', 'nickname', 'name', 'phone_number')
     ordering = ('-date_joined',)
     list_filter = ('is_active', 'is_staff')  #  필터링 조건 추가
+    list_select_related = ('shard_location',)
     readonly_fields = ('last_login', 'is_admin')  #  수정 불가 필드 설정
 
     fieldsets = (
@@ -40,16 +243,64 @@ class CustomUserAdmin(UserAdmin):
         ('Important dates', {'fields': ('date_joined',)}),  #  last_login 제거
     )
 
+    @admin.display(description='샤드', ordering='shard_location__shard')
+    def shard(self, obj):
+        location = getattr(obj, 'shard_location', None)
+        return location.shard if location else '-'
+
+    # 샤딩을 켰을 때만 사용자 데이터가 있는 샤드 표시
+    def get_list_display(self, request):
+        list_display = super().get_list_display(request)
+        if shards.sharding_enabled():
+            return (*list_display, 'shard')
+        return list_display
+
+    def get_list_filter(self, request):
+        list_filter = super().get_list_filter(request)
+        if shards.sharding_enabled():
+            return (*list_filter, 'shard_location__shard')
+        return list_filter
+
+    # 관리자 수정/삭제 시 인증 사용자 캐시 무효화
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if change:
+            invalidate_user(obj.pk)
+
+    def delete_model(self, request, obj):
+        user_id = obj.pk
+        super().delete_model(request, obj)
+        invalidate_user(user_id)
+
+    def delete_queryset(self, request, queryset):
+        user_ids = list(queryset.values_list('pk', flat=True))
+        super().delete_queryset(request, queryset)
+        for user_id in user_ids:
+            invalidate_user(user_id)
+
 
 @admin.register(Account)
-class AccountAdmin(admin.ModelAdmin):
-    list_display = ('user', 'account_number', 'bank_code', 'account_type', 'balance')
+class AccountAdmin(ShardAdminMixin, admin.ModelAdmin):
+    list_display = (
+        'user',
+        'account_number',
+        'bank_code',
+        'account_type',
+        'balance',
+        'write_combining',
+    )
     search_fields = ('account_number',)
-    list_filter = ('bank_code', 'account_type')
+    list_filter = ('bank_code', 'account_type', 'write_combining')
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # 입금 묶음 반영을 끄면 남은 대기 입금을 바로 정산
+        if 'write_combining' in form.changed_data and not obj.write_combining:
+            ledger.settle_pending(obj.pk)
 
 
 @admin.register(TransactionHistory)
-class TransactionHistoryAdmin(admin.ModelAdmin):
+class TransactionHistoryAdmin(ShardAdminMixin, admin.ModelAdmin):
     list_display = (
         'account',
         'transaction_amount',
@@ -63,7 +314,7 @@ class TransactionHistoryAdmin(admin.ModelAdmin):
 
 
 @admin.register(Analysis)
-class AnalysisAdmin(admin.ModelAdmin):
+class AnalysisAdmin(ShardAdminMixin, admin.ModelAdmin):
     list_display = (
         'user',
         'analysis_target',
@@ -75,7 +326,7 @@ class AnalysisAdmin(admin.ModelAdmin):
 
 
 @admin.register(Notification)
-class NotificationAdmin(admin.ModelAdmin):
+class NotificationAdmin(ShardAdminMixin, admin.ModelAdmin):
     list_display = ('user', 'message', 'is_read', 'created_at')
     list_filter = ('is_read',)
     search_fields = ('message',)
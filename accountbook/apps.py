@@ -1,6 +1,19 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.core.signals import request_finished
 
 
 class AccountbookConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "accountbook"
+
+    def ready(self):
+        from . import signals  # noqa: F401
+
+        # 연결 풀을 쓰는 DB 가 있으면 요청이 끝날 때 풀 대기 통계를 모음
+        if any(db.get("OPTIONS", {}).get("pool") for db in settings.DATABASES.values()):
+            from .utils.db_pool import flush_on_request_finished
+
+            request_finished.connect(
+                flush_on_request_finished, dispatch_uid="db_pool_stats"
+            )
@@ -1,4 +1,10 @@
+from django.utils.translation import gettext_lazy as _
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .utils.token_cache import get_validated_token
+from .utils.user_cache import get_cached_user
 
 
 class CookieJWTAuthentication(JWTAuthentication):
@@ -19,3 +25,26 @@ class CookieJWTAuthentication(JWTAuthentication):
             return None
 
         return self.get_user(validated_token), validated_token
+
+    def get_validated_token(self, raw_token):
+        # 같은 토큰은 exp 전까지 서명 검증/디코드 결과 재사용
+        return get_validated_token(raw_token, super().get_validated_token)
+
+    def get_user(self, validated_token):
+        # 비밀번호 해시 비교가 필요하면 캐시를 쓰지 않음
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = get_cached_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
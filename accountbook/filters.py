@@ -0,0 +1,103 @@
+# accountbook/filters.py
+
+from datetime import datetime, time, timedelta
+from decimal import Decimal, InvalidOperation
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+
+from .constants import TRANSACTION_TYPE
+
+VALID_TRANSACTION_TYPES = [type_code for type_code, _ in TRANSACTION_TYPE]
+
+
+def normalize_params(params):
+    """앞뒤 공백을 제거하고 빈 값은 뺀 조회 파라미터 - 필터와 목록 캐시 키가 같은 값을 사용"""
+    normalized = {}
+    for name in params:
+        value = params.get(name, '').strip()
+        if value:
+            normalized[name] = value
+    return normalized
+
+
+def get_filter_timezone(params):
+    """tz 파라미터(IANA 이름)가 있으면 사용, 없으면 현재 활성 타임존"""
+    tz_name = params.get('tz')
+    if not tz_name:
+        return timezone.get_current_timezone()
+    try:
+        return ZoneInfo(tz_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValidationError({'tz': '유효하지 않은 타임존입니다.'})
+
+
+def local_day_start(value, tz):
+    """해당 날짜 00:00(사용자 타임존)을 aware datetime으로 변환"""
+    return timezone.make_aware(datetime.combine(value, time.min), tz)
+
+
+def _parse_date_param(params, name):
+    raw = params.get(name)
+    if not raw:
+        return None
+    try:
+        value = parse_date(raw)
+    except ValueError:
+        value = None
+    if value is None:
+        raise ValidationError({name: '날짜 형식은 YYYY-MM-DD 입니다.'})
+    return value
+
+
+def _parse_amount_param(params, name):
+    raw = params.get(name)
+    if not raw:
+        return None
+    try:
+        value = Decimal(raw)
+    except InvalidOperation:
+        raise ValidationError({name: '유효한 금액이 아닙니다.'})
+    if not value.is_finite():
+        raise ValidationError({name: '유효한 금액이 아닙니다.'})
+    return value
+
+
+def build_transaction_filters(params):
+    """
+    거래내역 목록 필터를 인덱스 범위 조건으로 변환
+
+    transaction_timestamp__date 처럼 컬럼을 캐스팅하지 않고
+    [start_date 00:00, end_date 다음날 00:00) 반개구간으로 비교한다.
+    """
+    params = normalize_params(params)
+    filters = Q()
+
+    transaction_type = params.get('transaction_type')
+    if transaction_type in VALID_TRANSACTION_TYPES:
+        filters &= Q(transaction_type=transaction_type)
+
+    min_amount = _parse_amount_param(params, 'min_amount')
+    max_amount = _parse_amount_param(params, 'max_amount')
+    if min_amount is not None:
+        filters &= Q(transaction_amount__gte=min_amount)
+    if max_amount is not None:
+        filters &= Q(transaction_amount__lte=max_amount)
+
+    start_date = _parse_date_param(params, 'start_date')
+    end_date = _parse_date_param(params, 'end_date')
+    if start_date or end_date:
+        tz = get_filter_timezone(params)
+        if start_date:
+            filters &= Q(transaction_timestamp__gte=local_day_start(start_date, tz))
+        if end_date:
+            filters &= Q(
+                transaction_timestamp__lt=local_day_start(
+                    end_date + timedelta(days=1), tz
+                )
+            )
+
+    return filters
@@ -0,0 +1,89 @@
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accountbook.models import Account, TransactionHistory
+from accountbook.utils import cache_tags
+from accountbook.utils.account_cache import account_record_key, clear_local_cache
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = '거래내역 API p50/p99 지연시간 비교: 계좌 소유권 near cache 없음 vs 있음'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        count = options['count']
+        # 구독 스레드가 준비되어야 near cache 가 동작
+        cache_tags.listening_for_bumps()
+        cache_tags._listener.ready.wait(2)
+
+        # 벤치마크 데이터는 남기지 않음
+        with transaction.atomic():
+            user = User.objects.create_user(
+                email='near-bench@test.com', password='password123'
+            )
+            account = Account.objects.create(
+                user=user,
+                account_number='NEAR-BENCH',
+                bank_code='001',
+                account_type='CHECKING',
+            )
+            TransactionHistory.objects.create(
+                account=account,
+                transaction_amount=1000,
+                post_transaction_amount=1000,
+                transaction_details='입금',
+                transaction_type='DEPOSIT',
+                transaction_method='ATM',
+                transaction_timestamp=timezone.now(),
+            )
+            client = APIClient()
+            client.force_authenticate(user=user)
+            urls = {
+                '목록 (캐시 HIT)': reverse(
+                    'transaction_list_create', kwargs={'account_id': account.id}
+                ),
+                '내보내기': reverse(
+                    'transaction_export', kwargs={'account_id': account.id}
+                ),
+            }
+
+            for name, url in urls.items():
+                for label, ttl in (('near cache 없음', 0), ('near cache 있음', 5)):
+                    clear_local_cache()
+                    # 디버그 툴바/쿼리 기록 비용은 제외
+                    with override_settings(DEBUG=False, ACCOUNT_NEAR_CACHE_TTL=ttl):
+                        p50, p99 = self._run(client, url, count)
+                    self.stdout.write(
+                        f"{name:12} {label:14} p50 {p50:7.1f}us  p99 {p99:7.1f}us"
+                    )
+
+            clear_local_cache()
+            cache.delete(account_record_key(account.id))
+            transaction.set_rollback(True)
+
+    def _run(self, client, url, count):
+        # 캐시 채우기
+        for _ in range(10):
+            client.get(url)
+        timings = []
+        for _ in range(count):
+            start = time.perf_counter()
+            response = client.get(url)
+            if getattr(response, 'streaming', False):
+                b''.join(response.streaming_content)
+            timings.append((time.perf_counter() - start) * 1_000_000)
+        percentiles = statistics.quantiles(timings, n=100)
+        return percentiles[49], percentiles[98]
@@ -0,0 +1,82 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from accountbook.utils.partitions import (
+    ARCHIVE_SCHEMA,
+    PartitioningNotSupported,
+    copy_partition_to,
+    detach_partition,
+    ensure_postgresql,
+    monthly_partitions_before,
+)
+from accountbook.utils.shards import data_connection, each_data_db
+
+
+class Command(BaseCommand):
+    help = (
+        '기준 월 이전의 거래내역 파티션을 분리해 archive 스키마로 옮기거나 삭제 '
+        '(샤드마다 적용)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--before', required=True, help='이 월(YYYY-MM) 이전 파티션이 대상'
+        )
+        parser.add_argument('--schema', default=ARCHIVE_SCHEMA, help='보관 스키마')
+        parser.add_argument(
+            '--export-dir', help='분리 전에 파티션별 CSV 백업을 저장할 디렉터리'
+        )
+        parser.add_argument(
+            '--drop', action='store_true', help='보관하지 않고 분리 후 삭제'
+        )
+        parser.add_argument('--dry-run', action='store_true', help='대상 파티션만 출력')
+
+    def handle(self, *args, **options):
+        try:
+            year, month = (int(part) for part in options['before'].split('-'))
+            before = date(year, month, 1)
+        except ValueError:
+            raise CommandError("--before 는 YYYY-MM 형식이어야 합니다.")
+
+        for alias in each_data_db():
+            self.archive(alias, before, options)
+
+    def archive(self, alias, before, options):
+        try:
+            ensure_postgresql()
+        except PartitioningNotSupported as e:
+            raise CommandError(str(e))
+
+        with data_connection().cursor() as cursor:
+            targets = monthly_partitions_before(cursor, before)
+        if not targets:
+            self.stdout.write(f"[{alias}] 대상 파티션이 없습니다.")
+            return
+
+        for name in targets:
+            if options['dry_run']:
+                self.stdout.write(f"[{alias}] 대상: {name}")
+                continue
+
+            if options['export_dir']:
+                # 샤드마다 같은 이름의 파티션이 있으므로 샤드 별칭을 붙임
+                prefix = '' if alias == DEFAULT_DB_ALIAS else f'{alias}_'
+                path = f"{options['export_dir'].rstrip('/')}/{prefix}{name}.csv"
+                with open(path, 'wb') as stream:
+                    copy_partition_to(name, stream)
+                self.stdout.write(f"백업: {path}")
+
+            archived = detach_partition(
+                name, archive_schema=options['schema'], drop=options['drop']
+            )
+            if archived:
+                self.stdout.write(f"[{alias}] 분리/보관: {name} -> {archived}")
+            else:
+                self.stdout.write(f"[{alias}] 분리/삭제: {name}")
+
+        if not options['dry_run']:
+            self.stdout.write(
+                self.style.SUCCESS(f"[{alias}] 파티션 {len(targets)}개 처리 완료")
+            )
@@ -0,0 +1,72 @@
+import pickle
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from accountbook.models import Account
+from accountbook.utils.cache_codec import ACCOUNT_SCHEMA
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        '계좌 목록 캐시 항목 크기/디코딩 시간 비교: pickle(list(queryset)) vs 캐시 코덱'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='1,5,20,100')
+        parser.add_argument('--repeat', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options['sizes'].split(',')]
+        # 벤치마크 데이터는 남기지 않음
+        with transaction.atomic():
+            user = User.objects.create_user(
+                email='codec-bench@test.com', password='password123'
+            )
+            Account.objects.bulk_create(
+                Account(
+                    user=user,
+                    account_number=f'CODEC-BENCH-{i}',
+                    bank_code='004',
+                    account_type='SAVINGS',
+                    balance=1_234_567 + i,
+                )
+                for i in range(max(sizes))
+            )
+            queryset = Account.objects.filter(user=user).order_by('id')
+            queryset = queryset.only(*ACCOUNT_SCHEMA.fields)
+
+            self.stdout.write(
+                f"{'계좌 수':>6} {'pickle':>9} {'코덱':>9} {'비율':>6} "
+                f"{'pickle 읽기':>12} {'코덱 읽기':>10}"
+            )
+            for size in sizes:
+                accounts = list(queryset[:size])
+                # django-redis 는 bytes 도 pickle 해서 저장하므로 같은 기준으로 비교
+                before = pickle.dumps(accounts, pickle.HIGHEST_PROTOCOL)
+                encoded = ACCOUNT_SCHEMA.encode(accounts, many=True)
+                after = pickle.dumps(encoded, pickle.HIGHEST_PROTOCOL)
+
+                unpickle_us = self._time(
+                    lambda: pickle.loads(before), options['repeat']
+                )
+                decode_us = self._time(
+                    lambda: ACCOUNT_SCHEMA.decode(pickle.loads(after), many=True),
+                    options['repeat'],
+                )
+                self.stdout.write(
+                    f"{size:>8} {len(before):>8}B {len(after):>8}B "
+                    f"{len(before) / len(after):>5.1f}x "
+                    f"{unpickle_us:>10.1f}us {decode_us:>10.1f}us"
+                )
+            transaction.set_rollback(True)
+
+    def _time(self, func, repeat):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        return (time.perf_counter() - start) / repeat * 1_000_000
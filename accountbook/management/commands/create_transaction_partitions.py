@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from accountbook.utils.partitions import (
+    PartitioningNotSupported,
+    create_future_partitions,
+    is_partitioned,
+    list_partitions,
+)
+from accountbook.utils.shards import data_connection, each_data_db
+
+
+class Command(BaseCommand):
+    help = '거래내역 월별 파티션을 미리 생성 (cron 등으로 주기 실행, 샤드마다 적용)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months-ahead', type=int, default=3, help='이번 달 이후 미리 만들 개월 수'
+        )
+        parser.add_argument(
+            '--list', action='store_true', help='생성 후 현재 파티션 목록 출력'
+        )
+
+    def handle(self, *args, **options):
+        for alias in each_data_db():
+            self.create(alias, options)
+
+    def create(self, alias, options):
+        connection = data_connection()
+        try:
+            with connection.cursor() as cursor:
+                if connection.vendor == 'postgresql' and not is_partitioned(cursor):
+                    raise CommandError(
+                        f"[{alias}] transaction_history 가 파티션 테이블이 아닙니다. migrate 를 먼저 실행하세요."
+                    )
+            created = create_future_partitions(options['months_ahead'])
+        except PartitioningNotSupported as e:
+            raise CommandError(str(e))
+
+        for name in created:
+            self.stdout.write(f"[{alias}] 생성: {name}")
+        self.stdout.write(
+            self.style.SUCCESS(f"[{alias}] 파티션 {len(created)}개 생성 완료")
+        )
+
+        if options['list']:
+            with connection.cursor() as cursor:
+                for name, bound in list_partitions(cursor):
+                    self.stdout.write(f"{name:40} {bound}")
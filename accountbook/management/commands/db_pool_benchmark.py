@@ -0,0 +1,105 @@
+import os
+import sys
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accountbook.utils.db_pool import get_pool_stats, reset_pool_stats
+from accountbook.utils.load_test import HOST, run_load, running_server, summarize
+
+User = get_user_model()
+
+# (이름, 서버 환경 변수)
+SCENARIOS = (
+    ('매 요청 새 연결', {'DB_POOL': 'false', 'DB_CONN_MAX_AGE': '0'}),
+    ('지속 연결', {'DB_POOL': 'false', 'DB_CONN_MAX_AGE': '60'}),
+    ('연결 풀', {'DB_POOL': 'true'}),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        '분석 목록 API 응답 시간 비교: 매 요청 새 연결 vs 지속 연결 vs 연결 풀 '
+        '(serve 를 스레드 워커로 띄우고 여러 클라이언트 프로세스로 요청)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--port', type=int, default=8766)
+        parser.add_argument('--clients', type=int, default=32)
+        parser.add_argument(
+            '--duration', type=float, default=10.0, help='측정 시간(초)'
+        )
+        parser.add_argument('--warmup', type=float, default=2.0)
+        parser.add_argument('--workers', type=int, default=2)
+        parser.add_argument('--threads', type=int, default=8, help='워커당 스레드 수')
+        parser.add_argument(
+            '--pool-max-size',
+            type=int,
+            default=settings.DB_POOL_MAX_SIZE,
+            help='워커당 최대 연결 수',
+        )
+
+    def handle(self, *args, **options):
+        port = options['port']
+        command = [
+            sys.executable,
+            os.path.join(settings.BASE_DIR, 'manage.py'),
+            'serve',
+            '--bind',
+            f'{HOST}:{port}',
+            '--workers',
+            str(options['workers']),
+            '--threads',
+            str(options['threads']),
+            # 측정 중 워커 교체가 끼지 않도록
+            '--max-requests',
+            '0',
+        ]
+        pool_env = {
+            'DB_POOL_MIN_SIZE': str(
+                min(settings.DB_POOL_MIN_SIZE, options['pool_max_size'])
+            ),
+            'DB_POOL_MAX_SIZE': str(options['pool_max_size']),
+            'DB_POOL_STATS_INTERVAL': '1',
+        }
+
+        # 서버 프로세스들이 읽도록 커밋해 두고 끝에 삭제
+        user = User.objects.create_user(
+            email='db-pool-bench@test.com', password='password123'
+        )
+        try:
+            headers = {'Authorization': f'Bearer {AccessToken.for_user(user)}'}
+            # 결과를 캐시하지 않아 매 요청 DB 를 읽는 목록 (사용자 조회는 캐시됨)
+            path = reverse('analysis_list_create')
+            connections.close_all()
+
+            for label, env in SCENARIOS:
+                with running_server(
+                    command, port, path, headers, env={**pool_env, **env}
+                ):
+                    run_load(port, path, headers, options['clients'], options['warmup'])
+                    reset_pool_stats()
+                    requests, errors, timings = run_load(
+                        port, path, headers, options['clients'], options['duration']
+                    )
+                    stats = get_pool_stats()
+                self.stdout.write(
+                    summarize(
+                        f'{label:10}', requests, errors, timings, options['duration']
+                    )
+                )
+                if env['DB_POOL'] == 'true':
+                    # 워커들이 같은 캐시(Redis)를 쓸 때만 집계됨
+                    self.stdout.write(
+                        f"{'':10} 풀 대기 {stats['queued']}/{stats['requests']}회 "
+                        f"({stats['queued_rate']:.1%}), "
+                        f"평균 {stats['avg_wait_ms']:.2f}ms, "
+                        f"대기한 요청 평균 {stats['avg_queued_wait_ms']:.2f}ms, "
+                        f"시간 초과 {stats['timeouts']}"
+                    )
+        finally:
+            user.delete()
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from accountbook.utils.db_pool import get_pool_stats, reset_pool_stats
+
+
+class Command(BaseCommand):
+    help = 'DB 연결 풀 대기 통계 조회 (모든 워커 합계)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default')
+        parser.add_argument(
+            '--reset', action='store_true', help='조회 후 카운터 초기화'
+        )
+
+    def handle(self, *args, **options):
+        stats = get_pool_stats(options['database'])
+        self.stdout.write(f"requests       : {stats['requests']}")
+        self.stdout.write(
+            f"queued         : {stats['queued']} ({stats['queued_rate']:.1%})"
+        )
+        self.stdout.write(f"wait total     : {stats['wait_ms']}ms")
+        self.stdout.write(f"wait avg       : {stats['avg_wait_ms']:.2f}ms")
+        self.stdout.write(f"wait avg (대기) : {stats['avg_queued_wait_ms']:.2f}ms")
+        self.stdout.write(f"timeouts       : {stats['timeouts']}")
+        self.stdout.write(
+            f"connections    : {stats['connections']} ({stats['connect_ms']}ms)"
+        )
+        self.stdout.write(f"lost           : {stats['lost']}")
+
+        if options['reset']:
+            reset_pool_stats(options['database'])
+            self.stdout.write(self.style.SUCCESS('카운터를 초기화했습니다.'))
@@ -0,0 +1,100 @@
+import multiprocessing
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connections, transaction
+from django.test import override_settings
+from django.utils import timezone
+
+from accountbook.models import Account
+from accountbook.utils import ledger
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        '한 계좌에 동시 입금 처리량 비교: 잠금 후 UPDATE vs UPDATE ... RETURNING '
+        '(PostgreSQL 에서 실행)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--writers', type=int, default=50)
+        parser.add_argument('--deposits', type=int, default=40, help='작성자당 입금 수')
+
+    def handle(self, *args, **options):
+        writers = options['writers']
+        deposits = options['deposits']
+        for label, returning in (
+            ('잠금 후 UPDATE (이전)', False),
+            ('UPDATE ... RETURNING', True),
+        ):
+            with override_settings(LEDGER_UPDATE_RETURNING=returning):
+                elapsed, timings, balance = self._run(writers, deposits)
+            total = writers * deposits
+            percentiles = statistics.quantiles(timings, n=100)
+            self.stdout.write(
+                f"{label:22} {total / elapsed:8.0f} 건/s  "
+                f"p50 {percentiles[49]:6.2f}ms  p99 {percentiles[98]:6.2f}ms  "
+                f"잔액 {balance}"
+            )
+
+    def _run(self, writers, deposits):
+        # 작성자마다 별도 프로세스/연결로 커밋하므로 데이터는 끝에 직접 삭제
+        user = User.objects.create_user(
+            email='deposit-bench@test.com', password='password123'
+        )
+        account = Account.objects.create(
+            user=user,
+            account_number='DEPOSIT-BENCH',
+            bank_code='001',
+            account_type='CHECKING',
+        )
+        # fork 된 프로세스가 부모 연결을 공유하지 않도록 먼저 닫음
+        connections.close_all()
+        context = multiprocessing.get_context('fork')
+        barrier = context.Barrier(writers + 1)
+        results = context.Queue()
+        processes = [
+            context.Process(target=_write, args=(account, deposits, barrier, results))
+            for _ in range(writers)
+        ]
+        for process in processes:
+            process.start()
+        barrier.wait()
+        started = time.perf_counter()
+        timings = []
+        for _ in processes:
+            timings.extend(results.get())
+        elapsed = time.perf_counter() - started
+        for process in processes:
+            process.join()
+
+        account.refresh_from_db(fields=['balance'])
+        balance = account.balance
+        user.delete()
+        return elapsed, timings, balance
+
+
+def _write(account, deposits, barrier, results):
+    """작성자 프로세스 - 입금 deposits 건의 소요 시간(ms) 목록을 results 에 전달"""
+    timings = []
+    barrier.wait()
+    for _ in range(deposits):
+        started = time.perf_counter()
+        with transaction.atomic():
+            ledger.record_transaction(
+                account,
+                {
+                    'transaction_amount': 1000,
+                    'transaction_details': '벤치마크 입금',
+                    'transaction_type': 'DEPOSIT',
+                    'transaction_method': 'TRANSFER',
+                    'transaction_timestamp': timezone.now(),
+                },
+            )
+        timings.append((time.perf_counter() - started) * 1000)
+    connections.close_all()
+    results.put(timings)
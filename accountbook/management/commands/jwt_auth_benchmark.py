@@ -0,0 +1,64 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accountbook.authentication import CookieJWTAuthentication
+from accountbook.utils.token_cache import clear_token_cache
+from accountbook.utils.user_cache import get_cached_user, invalidate_user
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        'CookieJWTAuthentication.authenticate 처리량 비교: JWT 검증 캐시 없음 vs 있음'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=20000)
+
+    def handle(self, *args, **options):
+        count = options['count']
+        # 벤치마크 사용자는 남기지 않음
+        with transaction.atomic():
+            user = User.objects.create_user(
+                email='jwt-bench@test.com', password='password123'
+            )
+            request = APIRequestFactory().get(
+                '/api/users/me/',
+                HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}',
+            )
+            # 사용자 조회 캐시는 양쪽 모두 채워 두고 토큰 검증 비용만 비교
+            get_cached_user(user.pk)
+
+            results = {}
+            for mode, label, size in (
+                ('before', '검증 캐시 없음 (이전)', 0),
+                ('after', '검증 캐시 (이후)', 10000),
+            ):
+                clear_token_cache()
+                with override_settings(JWT_CACHE_SIZE=size):
+                    results[mode] = self._run(request, count)
+                elapsed = results[mode]
+                self.stdout.write(
+                    f"{label:16} {count / elapsed:10.0f} req/s  "
+                    f"{elapsed / count * 1_000_000:6.1f}us/req"
+                )
+            self.stdout.write(
+                f"처리량 {results['before'] / results['after']:.1f}배 (토큰 {count}회 재사용)"
+            )
+            clear_token_cache()
+            invalidate_user(user.pk)
+            transaction.set_rollback(True)
+
+    def _run(self, request, count):
+        authentication = CookieJWTAuthentication()
+        start = time.perf_counter()
+        for _ in range(count):
+            authentication.authenticate(request)
+        return time.perf_counter() - start
@@ -0,0 +1,98 @@
+import statistics
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accountbook.models import Account, TransactionHistory
+from accountbook.pagination import TransactionCursorPagination
+from accountbook.views.transactions_views import TransactionListCreateView
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = '거래내역 목록 페이지 번호(OFFSET) 방식과 커서(키셋) 방식의 깊은 페이지 응답 시간 비교'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=200_000)
+        parser.add_argument('--page-size', type=int, default=20)
+        parser.add_argument('--deep-page', type=int, default=10_000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        page_size = options['page_size']
+        deep_page = min(options['deep_page'], max(rows // page_size, 1))
+        repeat = options['repeat']
+
+        user, _ = User.objects.get_or_create(email='pagination-bench@test.com')
+        account, _ = Account.objects.get_or_create(
+            user=user,
+            account_number='PAGINATION_BENCH',
+            defaults={'bank_code': '001', 'account_type': 'CHECKING'},
+        )
+
+        existing = TransactionHistory.objects.filter(account=account).count()
+        if existing != rows:
+            self.stdout.write(f"더미 거래내역 {rows}건 생성 중...")
+            TransactionHistory.objects.filter(account=account).delete()
+            now = timezone.now()
+            batch = []
+            for i in range(rows):
+                batch.append(
+                    TransactionHistory(
+                        account=account,
+                        transaction_amount=1000,
+                        post_transaction_amount=1000 * (i + 1),
+                        transaction_details=f'벤치마크 거래 {i}',
+                        transaction_type='DEPOSIT',
+                        transaction_method='ATM',
+                        # 동일 시각 거래가 섞이도록 3건씩 같은 timestamp 부여
+                        transaction_timestamp=now - timedelta(seconds=i // 3),
+                    )
+                )
+                if len(batch) == 5000:
+                    TransactionHistory.objects.bulk_create(batch)
+                    batch = []
+            if batch:
+                TransactionHistory.objects.bulk_create(batch)
+
+        # 깊은 페이지의 커서는 해당 위치 직전 행으로 미리 생성 (측정 대상 아님)
+        boundary = (
+            TransactionHistory.objects.filter(account=account)
+            .order_by('-transaction_timestamp', '-id')
+            .only('id', 'transaction_timestamp')[(deep_page - 1) * page_size - 1]
+        )
+        deep_cursor = TransactionCursorPagination().make_cursor(boundary)
+
+        factory = APIRequestFactory()
+        view = TransactionListCreateView.as_view()
+        url = f'/api/accounts/{account.id}/transactions/'
+
+        def measure(params):
+            timings = []
+            for _ in range(repeat):
+                request = factory.get(url, {'page_size': page_size, **params})
+                force_authenticate(request, user=user)
+                started = time.perf_counter()
+                response = view(request, account_id=account.id)
+                timings.append((time.perf_counter() - started) * 1000)
+                assert response.status_code == 200, response.data
+            return statistics.median(timings)
+
+        results = [
+            ('page=1', measure({'page': 1})),
+            (f'page={deep_page}', measure({'page': deep_page})),
+            ('cursor (1페이지)', measure({'pagination': 'cursor'})),
+            (f'cursor ({deep_page}페이지)', measure({'cursor': deep_cursor})),
+        ]
+
+        self.stdout.write(
+            f"\n거래내역 {rows}건, 페이지 크기 {page_size}, 중앙값 {repeat}회"
+        )
+        for label, elapsed in results:
+            self.stdout.write(f"{label:<24} {elapsed:8.2f} ms")
@@ -0,0 +1,125 @@
+import math
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from accountbook.models import UserShard
+from accountbook.utils import shards
+
+
+class Command(BaseCommand):
+    help = (
+        '사용자 샤드 준비와 재배치 - 샤드 ID 범위를 설정하고, 기본 DB 에 남은 사용자 '
+        '데이터를 샤드로 옮긴 뒤 샤드별 사용자 수를 고르게 맞춤'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=int,
+            action='append',
+            help='옮길 사용자 ID (여러 번 지정 가능, --to 와 함께 사용)',
+        )
+        parser.add_argument('--to', help='--user 를 옮길 샤드')
+        parser.add_argument(
+            '--no-balance',
+            action='store_true',
+            help='기본 DB 의 데이터만 옮기고 샤드 사이 재배치는 하지 않음',
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=100, help='한 번에 옮길 사용자 수'
+        )
+        parser.add_argument(
+            '--wait',
+            type=float,
+            default=settings.SHARD_MAP_LOCAL_TTL,
+            help='이동 중 표시/맵 변경이 모든 프로세스에 보이기까지 기다릴 시간(초)',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='계획만 출력')
+
+    def handle(self, *args, **options):
+        aliases = shards.shard_aliases()
+        if not aliases:
+            raise CommandError(
+                "DATABASE_SHARDS 가 비어 있습니다 (DB_SHARD_HOSTS 설정)."
+            )
+
+        if options['user']:
+            if options['to'] not in aliases:
+                raise CommandError(
+                    f"--to 는 다음 중 하나여야 합니다: {', '.join(aliases)}"
+                )
+            plan = {options['to']: options['user']}
+        else:
+            plan = self.plan(aliases, options['no_balance'])
+
+        for target, user_ids in plan.items():
+            self.stdout.write(f"{target} 로 옮길 사용자 {len(user_ids)}명")
+        if options['dry_run']:
+            return
+
+        # 옮긴 행이 대상 샤드에서 새로 발급한 ID 와 겹치지 않도록 먼저 범위를 설정
+        for alias in aliases:
+            shards.prepare_shard(alias)
+
+        users = rows = 0
+        batch_size = options['batch_size']
+        for target, user_ids in plan.items():
+            for start in range(0, len(user_ids), batch_size):
+                batch = user_ids[start : start + batch_size]
+                moved = shards.move_users(batch, target, wait=options['wait'])
+                users += len(batch)
+                rows += sum(moved.values())
+                for source, count in moved.items():
+                    self.stdout.write(f"{source} -> {target}: 행 {count}개")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"사용자 {users}명, 행 {rows}개 이동 완료")
+        )
+
+    def plan(self, aliases, no_balance):
+        """{대상 샤드: 사용자 ID 목록} - 기본 DB 의 사용자를 먼저, 그다음 많은 샤드에서"""
+        legacy = set(
+            UserShard.objects.filter(shard=DEFAULT_DB_ALIAS).values_list(
+                'user_id', flat=True
+            )
+        )
+        # 샤드 맵에 아직 없는(샤딩 후 요청이 없었던) 사용자의 기존 데이터
+        for model in shards.LEGACY_MODELS:
+            legacy.update(
+                model.objects.using(DEFAULT_DB_ALIAS)
+                .values_list('user_id', flat=True)
+                .distinct()
+            )
+
+        counts = Counter({alias: 0 for alias in aliases})
+        members = {alias: [] for alias in aliases}
+        for user_id, alias in UserShard.objects.filter(shard__in=aliases).values_list(
+            'user_id', 'shard'
+        ):
+            counts[alias] += 1
+            members[alias].append(user_id)
+
+        plan = {alias: [] for alias in aliases}
+        # 기본 DB 의 사용자는 가장 적은 샤드부터 채움
+        for user_id in sorted(legacy):
+            target = min(aliases, key=lambda alias: counts[alias])
+            plan[target].append(user_id)
+            counts[target] += 1
+
+        if not no_balance:
+            limit = math.ceil(sum(counts.values()) / len(aliases))
+            for source in aliases:
+                # 최근 가입자부터 옮김 (ID 가 큰 순)
+                surplus = sorted(members[source], reverse=True)
+                while counts[source] > limit and surplus:
+                    target = min(aliases, key=lambda alias: counts[alias])
+                    if counts[target] + 1 >= counts[source]:
+                        break
+                    plan[target].append(surplus.pop(0))
+                    counts[source] -= 1
+                    counts[target] += 1
+
+        return {target: user_ids for target, user_ids in plan.items() if user_ids}
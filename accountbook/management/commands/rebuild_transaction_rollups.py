@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from accountbook.models import Account
+from accountbook.utils.rollups import rebuild_rollups
+from accountbook.utils.shards import each_data_db
+
+
+class Command(BaseCommand):
+    help = '거래내역 일별/월별 집계 테이블을 원본 거래내역에서 다시 계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--account',
+            type=int,
+            action='append',
+            help='대상 계좌 ID (여러 번 지정 가능)',
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=500, help='한 트랜잭션에서 처리할 계좌 수'
+        )
+
+    def handle(self, *args, **options):
+        for alias in each_data_db():
+            self.rebuild(alias, options)
+
+        self.stdout.write(self.style.SUCCESS("집계 재계산 완료"))
+
+    def rebuild(self, alias, options):
+        account_ids = Account.objects.order_by('id').values_list('id', flat=True)
+        if options['account']:
+            account_ids = account_ids.filter(id__in=options['account'])
+        account_ids = list(account_ids)
+
+        batch_size = options['batch_size']
+        for start in range(0, len(account_ids), batch_size):
+            batch = account_ids[start : start + batch_size]
+            rebuild_rollups(batch)
+            self.stdout.write(
+                f"[{alias}] {start + len(batch)}/{len(account_ids)} 계좌 처리"
+            )
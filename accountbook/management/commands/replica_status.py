@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from accountbook.utils.replicas import check_replica, replica_aliases
+
+
+class Command(BaseCommand):
+    help = '읽기 복제본 연결 상태와 복제 지연 확인'
+
+    def handle(self, *args, **options):
+        aliases = replica_aliases()
+        if not aliases:
+            self.stdout.write('설정된 복제본이 없습니다. (DB_REPLICA_HOSTS)')
+            return
+        for alias in aliases:
+            status = check_replica(alias)
+            if status.lag is None:
+                self.stdout.write(self.style.ERROR(f"{alias:12} 연결 실패"))
+            elif status.available:
+                self.stdout.write(f"{alias:12} 지연 {status.lag:.2f}초")
+            else:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"{alias:12} 지연 {status.lag:.2f}초 (허용 초과)"
+                    )
+                )
@@ -0,0 +1,39 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accountbook.utils.outbox import send_batch
+
+
+class Command(BaseCommand):
+    help = '메일 발송 대기열을 묶음 단위로 발송 (SMTP 연결은 묶음마다 한 번만 수립)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument(
+            '--loop', action='store_true', help='종료하지 않고 계속 대기열을 확인'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=5.0,
+            help='대기열이 비었을 때 대기 시간(초)',
+        )
+
+    def handle(self, *args, **options):
+        total_sent = total_failed = 0
+        while True:
+            sent, failed = send_batch(options['batch_size'])
+            total_sent += sent
+            total_failed += failed
+            if sent or failed:
+                self.stdout.write(f"발송 {sent}건, 실패 {failed}건")
+
+            if sent + failed < options['batch_size']:
+                if not options['loop']:
+                    break
+                time.sleep(options['interval'])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"총 발송 {total_sent}건, 실패 {total_failed}건")
+        )
@@ -0,0 +1,110 @@
+import importlib
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.urls import get_resolver
+from gunicorn.app.base import BaseApplication
+
+# 인터페이스별 (애플리케이션 모듈, gunicorn 워커 클래스)
+INTERFACES = {
+    'wsgi': ('config.wsgi', 'sync'),
+    'asgi': ('config.asgi', 'uvicorn_worker.UvicornWorker'),
+}
+
+
+def cpu_count():
+    # 컨테이너 CPU 제한(cpuset)이 있으면 그 수를 따름
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def default_workers(interface, threads):
+    """동기 워커는 I/O 대기를 감안해 CPU x 2 + 1, 비동기/스레드 워커는 CPU 수"""
+    if interface == 'wsgi' and threads == 1:
+        return cpu_count() * 2 + 1
+    return cpu_count()
+
+
+class DjangoApplication(BaseApplication):
+    """이미 로드한 Django 애플리케이션을 그대로 넘기는 gunicorn 애플리케이션"""
+
+    def __init__(self, application, options):
+        self.application = application
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        return self.application
+
+
+class Command(BaseCommand):
+    help = (
+        '운영 서버 실행 - 앱을 미리 로드한 뒤 워커 프로세스를 fork (gunicorn). '
+        'config.wsgi / config.asgi 를 같은 방식으로 서빙'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--bind', default=settings.SERVE_BIND)
+        parser.add_argument(
+            '--interface', choices=sorted(INTERFACES), default=settings.SERVE_INTERFACE
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=settings.SERVE_WORKERS,
+            help='0이면 CPU 수 기준',
+        )
+        parser.add_argument('--threads', type=int, default=settings.SERVE_THREADS)
+        parser.add_argument(
+            '--max-requests',
+            type=int,
+            default=settings.SERVE_MAX_REQUESTS,
+            help='워커가 이 수만큼 요청을 처리하면 새 워커로 교체 (0이면 교체 안 함)',
+        )
+
+    def handle(self, *args, **options):
+        interface = options['interface']
+        if interface not in INTERFACES:
+            raise CommandError(f"지원하지 않는 인터페이스: {interface}")
+        module, worker_class = INTERFACES[interface]
+        threads = options['threads']
+        if interface == 'wsgi' and threads > 1:
+            worker_class = 'gthread'
+        workers = options['workers'] or default_workers(interface, threads)
+
+        # fork 전에 앱, URL 설정, 뷰 모듈까지 불러와 워커들이 메모리 페이지를 공유
+        application = importlib.import_module(module).application
+        get_resolver().url_patterns
+        # 부모의 DB 연결을 워커들이 나눠 쓰지 않도록 fork 전에 닫음
+        connections.close_all()
+        # 연결 풀(백그라운드 스레드 포함)도 닫아 워커마다 fork 뒤에 새로 만들게 함
+        for connection in connections.all(initialized_only=True):
+            if getattr(connection, 'pool', None):
+                connection.close_pool()
+
+        self.stdout.write(
+            f"{interface} 워커 {workers}개 ({worker_class}) - {options['bind']}"
+        )
+        DjangoApplication(
+            application,
+            {
+                'bind': options['bind'],
+                'workers': workers,
+                'worker_class': worker_class,
+                'threads': threads,
+                'preload_app': True,
+                'max_requests': options['max_requests'],
+                'max_requests_jitter': settings.SERVE_MAX_REQUESTS_JITTER,
+                'timeout': settings.SERVE_TIMEOUT,
+                # SIGTERM 을 받으면 새 연결은 받지 않고 처리 중인 요청을 이 시간까지 마침
+                'graceful_timeout': settings.SERVE_GRACEFUL_TIMEOUT,
+                'errorlog': '-',
+            },
+        ).run()
@@ -0,0 +1,75 @@
+import os
+import sys
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accountbook.models import Account
+from accountbook.utils.load_test import HOST, run_load, running_server, summarize
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        '계좌 목록 API 처리량 비교: runserver vs serve(wsgi) vs serve(asgi) '
+        '(서버를 하위 프로세스로 띄우고 여러 클라이언트 프로세스로 요청)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--clients', type=int, default=16)
+        parser.add_argument(
+            '--duration', type=float, default=10.0, help='측정 시간(초)'
+        )
+        parser.add_argument('--warmup', type=float, default=2.0)
+        parser.add_argument(
+            '--workers', type=int, default=0, help='serve 워커 수 (0이면 CPU 수 기준)'
+        )
+
+    def handle(self, *args, **options):
+        port = options['port']
+        manage = [sys.executable, os.path.join(settings.BASE_DIR, 'manage.py')]
+        bind = f'{HOST}:{port}'
+        serve = [*manage, 'serve', '--bind', bind, '--workers', str(options['workers'])]
+        servers = (
+            ('runserver', [*manage, 'runserver', bind, '--noreload']),
+            ('serve (wsgi)', [*serve, '--interface', 'wsgi']),
+            ('serve (asgi)', [*serve, '--interface', 'asgi']),
+        )
+
+        # 서버 프로세스들이 읽도록 커밋해 두고 끝에 삭제
+        user = User.objects.create_user(
+            email='serve-bench@test.com', password='password123'
+        )
+        try:
+            Account.objects.bulk_create(
+                Account(
+                    user=user,
+                    account_number=f'SERVE-BENCH-{i}',
+                    bank_code='001',
+                    account_type='CHECKING',
+                )
+                for i in range(10)
+            )
+            headers = {'Authorization': f'Bearer {AccessToken.for_user(user)}'}
+            path = reverse('account_list_create')
+            connections.close_all()
+
+            for label, command in servers:
+                with running_server(command, port, path, headers):
+                    run_load(port, path, headers, options['clients'], options['warmup'])
+                    requests, errors, timings = run_load(
+                        port, path, headers, options['clients'], options['duration']
+                    )
+                self.stdout.write(
+                    summarize(
+                        f'{label:14}', requests, errors, timings, options['duration']
+                    )
+                )
+        finally:
+            user.delete()
@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accountbook.utils.ledger import settle_accounts
+from accountbook.utils.shards import each_data_db
+
+
+class Command(BaseCommand):
+    help = (
+        '입금 묶음 반영 계좌의 정산 대기 입금을 잔액에 반영 '
+        '(입금이 멈춘 뒤 남은 대기분 처리용)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop', action='store_true', help='종료하지 않고 계속 대기 입금을 확인'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1.0,
+            help='확인 간격(초)',
+        )
+
+    def handle(self, *args, **options):
+        total = 0
+        while True:
+            settled = sum(settle_accounts() for _ in each_data_db())
+            total += settled
+            if settled:
+                self.stdout.write(f"정산 {settled}건")
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(f"총 정산 {total}건"))
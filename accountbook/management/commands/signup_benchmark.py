@@ -0,0 +1,131 @@
+import statistics
+import time
+
+from django.core.mail.backends.locmem import EmailBackend as LocmemEmailBackend
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory
+
+from accountbook.utils.outbox import send_batch
+from accountbook.utils.rate_limit import RateLimiter
+from accountbook.views.auth_views import SignupView
+
+BACKEND = f'{__name__}.SlowEmailBackend'
+
+
+class SlowEmailBackend(LocmemEmailBackend):
+    """SMTP 지연을 흉내 내는 메일 백엔드 (연결 수립 + 메일당 지연)"""
+
+    connect_delay = 0.0
+    send_delay = 0.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._opened = False
+
+    def open(self):
+        if self._opened:
+            return False
+        time.sleep(self.connect_delay)
+        self._opened = True
+        return True
+
+    def close(self):
+        self._opened = False
+
+    def send_messages(self, messages):
+        # smtp 백엔드처럼 열린 연결이 없으면 이번 발송을 위해 열고 닫음
+        new_connection = self.open()
+        time.sleep(self.send_delay * len(messages))
+        try:
+            return super().send_messages(messages)
+        finally:
+            if new_connection:
+                self.close()
+
+
+class Command(BaseCommand):
+    help = '회원가입 응답 시간 비교: 동기 SMTP 발송(이전) vs 발송 대기열(이후)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=30)
+        parser.add_argument(
+            '--connect-ms', type=float, default=150, help='SMTP 연결/TLS/로그인 지연'
+        )
+        parser.add_argument(
+            '--send-ms', type=float, default=50, help='메일당 전송 지연'
+        )
+        parser.add_argument(
+            '--fast-hasher',
+            action='store_true',
+            help='비밀번호 해시 비용을 빼고 메일 발송 영향만 비교 (MD5 해셔 사용)',
+        )
+
+    def handle(self, *args, **options):
+        SlowEmailBackend.connect_delay = options['connect_ms'] / 1000
+        SlowEmailBackend.send_delay = options['send_ms'] / 1000
+        count = options['count']
+
+        for mode, label, outbox in (
+            ('before', '동기 발송 (이전)', False),
+            ('after', '발송 대기열 (이후)', True),
+        ):
+            overrides = {'EMAIL_BACKEND': BACKEND, 'EMAIL_OUTBOX_ENABLED': outbox}
+            if options['fast_hasher']:
+                overrides['PASSWORD_HASHERS'] = [
+                    'django.contrib.auth.hashers.MD5PasswordHasher'
+                ]
+            with override_settings(**overrides):
+                timings, drain = self._run(count, mode, drain=outbox)
+            self.stdout.write(
+                f"{label:14} p50 {statistics.median(timings):7.1f}ms  "
+                f"p95 {self._p95(timings):7.1f}ms  max {max(timings):7.1f}ms"
+            )
+            if drain is not None:
+                self.stdout.write(
+                    f"{'':14} 워커 일괄 발송 {count}건: {drain:.1f}ms "
+                    f"(연결 1회 재사용)"
+                )
+
+    def _p95(self, timings):
+        return sorted(timings)[max(int(len(timings) * 0.95) - 1, 0)]
+
+    def _run(self, count, mode, drain):
+        factory = APIRequestFactory()
+        view = SignupView.as_view()
+        timings = []
+        drain_ms = None
+        limiter = RateLimiter.for_scope('signup')
+        # 벤치마크 데이터는 남기지 않음
+        with transaction.atomic():
+            for i in range(count):
+                limiter.reset(f'10.0.{i // 250}.{i % 250}')
+                request = factory.post(
+                    '/api/auth/signup/',
+                    {
+                        'email': f'signup-bench-{mode}-{i}@test.com',
+                        'password': 'password123',
+                        'nickname': f'bench-{mode}-{i}',
+                    },
+                    format='json',
+                    REMOTE_ADDR=f'10.0.{i // 250}.{i % 250}',
+                )
+                start = time.perf_counter()
+                response = view(request)
+                timings.append((time.perf_counter() - start) * 1000)
+                if response.status_code != 201:
+                    self.stderr.write(f"회원가입 실패: {response.data}")
+
+            if drain:
+                start = time.perf_counter()
+                sent = 0
+                while True:
+                    batch_sent, batch_failed = send_batch(100)
+                    sent += batch_sent
+                    if batch_sent + batch_failed == 0:
+                        break
+                drain_ms = (time.perf_counter() - start) * 1000
+
+            transaction.set_rollback(True)
+        return timings, drain_ms
@@ -0,0 +1,55 @@
+import statistics
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from accountbook.utils.startup import measure_startup
+
+PROFILES = (
+    ('운영 (config.settings.prod)', 'config.settings.prod'),
+    ('개발 (config.settings.dev)', 'config.settings.dev'),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        '설정별 기동 비용 비교 - python -X importtime 의 import 합계, '
+        'URL 설정 로딩까지 시간, 첫 요청 응답 시간 (새 인터프리터에서 측정)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=5, help='중앙값을 낼 반복 수')
+        parser.add_argument('--top', type=int, default=10, help='무거운 모듈 출력 수')
+
+    def handle(self, *args, **options):
+        results = {}
+        for label, module in PROFILES:
+            runs = [measure_startup(module) for _ in range(options['repeat'])]
+            results[module] = runs
+            import_ms = statistics.median(run['import_ms'] for run in runs)
+            ready_ms = statistics.median(run['ready_ms'] for run in runs)
+            first_ms = statistics.median(run['first_request_ms'] for run in runs)
+            self.stdout.write(
+                f"{label:28} import {import_ms:7.1f}ms  준비 {ready_ms:7.1f}ms  "
+                f"첫 요청 {first_ms:6.1f}ms"
+            )
+
+        runs = results['config.settings.prod']
+        self.stdout.write("\n운영 설정 최상위 import 상위 모듈 (첫 실행 기준)")
+        for cumulative, name in runs[0]['heaviest'][: options['top']]:
+            self.stdout.write(f"  {cumulative:7.1f}ms  {name}")
+
+        import_ms = statistics.median(run['import_ms'] for run in runs)
+        first_ms = statistics.median(run['first_request_ms'] for run in runs)
+        within = (
+            import_ms <= settings.STARTUP_IMPORT_BUDGET_MS
+            and first_ms <= settings.STARTUP_FIRST_REQUEST_BUDGET_MS
+        )
+        message = (
+            f"\n예산: import {settings.STARTUP_IMPORT_BUDGET_MS}ms, "
+            f"첫 요청 {settings.STARTUP_FIRST_REQUEST_BUDGET_MS}ms"
+        )
+        if within:
+            self.stdout.write(self.style.SUCCESS(f"{message} - 통과"))
+        else:
+            self.stdout.write(self.style.ERROR(f"{message} - 초과"))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from accountbook.utils.transaction_cache import get_cache_stats, reset_cache_stats
+
+
+class Command(BaseCommand):
+    help = '거래내역 목록 결과 캐시 적중/미스 통계 조회'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset', action='store_true', help='조회 후 카운터 초기화'
+        )
+
+    def handle(self, *args, **options):
+        stats = get_cache_stats()
+        self.stdout.write(f"hits     : {stats['hits']}")
+        self.stdout.write(f"misses   : {stats['misses']}")
+        self.stdout.write(f"hit rate : {stats['hit_rate']:.1%}")
+
+        if options['reset']:
+            reset_cache_stats()
+            self.stdout.write(self.style.SUCCESS('카운터를 초기화했습니다.'))
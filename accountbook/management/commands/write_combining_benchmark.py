@@ -0,0 +1,165 @@
+import multiprocessing
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, connections, transaction
+from django.test import override_settings
+from django.utils import timezone
+
+from accountbook.models import Account, TransactionHistory
+from accountbook.utils import ledger
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        '한 계좌에 동시 입금 처리량과 계좌 행 잠금 대기 비교: 현재 방식 vs 입금 묶음 반영 '
+        '(PostgreSQL 에서 실행)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--writers', type=int, default=50)
+        parser.add_argument('--deposits', type=int, default=40, help='작성자당 입금 수')
+        parser.add_argument('--window', type=float, default=0.2, help='정산 주기(초)')
+        parser.add_argument(
+            '--settler',
+            action='store_true',
+            help=(
+                '정산을 별도 프로세스가 주기마다 실행 (작성자 프로세스끼리 캐시를 '
+                '공유하지 않아 커밋 직후 정산이 주기마다 한 번으로 묶이지 않을 때)'
+            ),
+        )
+
+    def handle(self, *args, **options):
+        writers = options['writers']
+        deposits = options['deposits']
+        for label, combining in (
+            ('UPDATE ... RETURNING (이전)', False),
+            ('입금 묶음 반영', True),
+        ):
+            window = options['window']
+            settler = combining and options['settler']
+            # 별도 정산 프로세스를 쓰면 작성자는 처음 한 번만 정산
+            with override_settings(
+                DEBUG=False, LEDGER_COMBINE_WINDOW=3600 if settler else window
+            ):
+                elapsed, timings, waits, balance, chain_ok = self._run(
+                    writers, deposits, combining, window if settler else None
+                )
+            total = writers * deposits
+            percentiles = statistics.quantiles(timings, n=100)
+            wait_percentiles = statistics.quantiles(waits, n=100)
+            self.stdout.write(
+                f"{label:26} {total / elapsed:8.0f} 건/s  "
+                f"p50 {percentiles[49]:7.2f}ms  p99 {percentiles[98]:7.2f}ms  "
+                f"잠금 대기 p50 {wait_percentiles[49]:7.2f}ms "
+                f"p99 {wait_percentiles[98]:7.2f}ms  "
+                f"잔액 {balance} (체인 {'일치' if chain_ok else '불일치'})"
+            )
+
+    def _run(self, writers, deposits, combining, settle_interval):
+        # 작성자마다 별도 프로세스/연결로 커밋하므로 데이터는 끝에 직접 삭제
+        user = User.objects.create_user(
+            email='combining-bench@test.com', password='password123'
+        )
+        account = Account.objects.create(
+            user=user,
+            account_number='COMBINING-BENCH',
+            bank_code='001',
+            account_type='CHECKING',
+            write_combining=combining,
+        )
+        # fork 된 프로세스가 부모 연결을 공유하지 않도록 먼저 닫음
+        connections.close_all()
+        context = multiprocessing.get_context('fork')
+        barrier = context.Barrier(writers + 1 + bool(settle_interval))
+        results = context.Queue()
+        done = context.Event()
+        processes = [
+            context.Process(target=_write, args=(account, deposits, barrier, results))
+            for _ in range(writers)
+        ]
+        if settle_interval:
+            processes.append(
+                context.Process(
+                    target=_settle, args=(account, settle_interval, barrier, done)
+                )
+            )
+        for process in processes:
+            process.start()
+        barrier.wait()
+        started = time.perf_counter()
+        timings = []
+        waits = []
+        for _ in range(writers):
+            process_timings, process_waits = results.get()
+            timings.extend(process_timings)
+            waits.extend(process_waits)
+        done.set()
+        # 마지막 주기에 남은 대기 입금까지 반영돼야 끝난 것으로 봄
+        ledger.settle_pending(account.pk)
+        elapsed = time.perf_counter() - started
+        for process in processes:
+            process.join()
+
+        account.refresh_from_db(fields=['balance'])
+        balance = account.balance
+        last_post = (
+            TransactionHistory.objects.filter(account=account)
+            .order_by('-transaction_timestamp', '-id')
+            .values_list('post_transaction_amount', flat=True)
+            .first()
+        )
+        user.delete()
+        return elapsed, timings, waits, balance, last_post == balance
+
+
+def _settle(account, interval, barrier, done):
+    """정산 프로세스 - 작성자가 끝날 때까지 주기마다 대기 입금 정산"""
+    barrier.wait()
+    while not done.wait(interval):
+        ledger.settle_pending(account.pk)
+    connections.close_all()
+
+
+def _write(account, deposits, barrier, results):
+    """작성자 프로세스 - 입금별 (소요 시간, 계좌 행 잠금 문장 시간) 목록(ms)을 전달"""
+    timings = []
+    waits = []
+    lock_time = 0.0
+
+    def measure(execute, sql, params, many, context):
+        # 계좌 행을 잠그는 문장(잔액 UPDATE, FOR UPDATE/FOR SHARE)에 걸린 시간
+        nonlocal lock_time
+        locking = sql.startswith('UPDATE "accounts"') or ' FOR ' in sql
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            if locking:
+                lock_time += time.perf_counter() - started
+
+    barrier.wait()
+    with connection.execute_wrapper(measure):
+        for _ in range(deposits):
+            lock_time = 0.0
+            started = time.perf_counter()
+            # 정산은 커밋 직후 같은 요청에서 실행되므로 소요 시간에 포함
+            with transaction.atomic():
+                ledger.record_transaction(
+                    account,
+                    {
+                        'transaction_amount': 1000,
+                        'transaction_details': '벤치마크 입금',
+                        'transaction_type': 'DEPOSIT',
+                        'transaction_method': 'TRANSFER',
+                        'transaction_timestamp': timezone.now(),
+                    },
+                )
+            timings.append((time.perf_counter() - started) * 1000)
+            waits.append(lock_time * 1000)
+    connections.close_all()
+    results.put((timings, waits))
@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from .utils import replicas, shards
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class ReplicaRoutingMiddleware:
+    """
+    안전한 메서드 요청의 읽기를 복제본으로 보냄 (PrimaryReplicaRouter 와 함께 사용)
+
+    쓰기 요청(또는 쓰기가 있었던 요청) 뒤에는 쿠키와 사용자별 캐시 키로
+    REPLICA_STICKY_SECONDS 동안 그 클라이언트/사용자의 읽기를 기본 DB 에 고정한다.
+    """
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        safe = request.method in SAFE_METHODS
+        pinned = not safe or replicas.STICKY_COOKIE in request.COOKIES
+        token = replicas.begin(request, pinned)
+        try:
+            response = self.get_response(request)
+            wrote = replicas.current_state().wrote
+        finally:
+            replicas.end(token)
+        if not safe or wrote:
+            self.stick_to_primary(request, response)
+        return response
+
+    def stick_to_primary(self, request, response):
+        response.set_cookie(
+            replicas.STICKY_COOKIE,
+            '1',
+            max_age=settings.REPLICA_STICKY_SECONDS,
+            httponly=True,
+            secure=settings.SESSION_COOKIE_SECURE,
+            samesite='Lax',
+        )
+        # 쿠키를 보내지 않는 클라이언트(Bearer 토큰)와 사용자의 다른 기기도 고정
+        user = replicas.request_user(request)
+        if user is not None and user.is_authenticated:
+            replicas.mark_user_sticky(user.pk)
+
+
+class ShardRoutingMiddleware:
+    """요청 안의 샤드 모델 쿼리를 요청 사용자의 샤드로 보냄 (ShardRouter 와 함께 사용)"""
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_SHARDS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        # 사용자는 뷰에서 인증(DRF)된 뒤에 정해지므로 요청만 두고 조회할 때 샤드를 찾음
+        token = shards.bind_request(request)
+        try:
+            return self.get_response(request)
+        finally:
+            shards.unbind(token)
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.2 on 2026-10-18 05:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accountbook', '0002_alter_account_account_number'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transactionhistory',
+            index=models.Index(
+                fields=['account', '-transaction_timestamp', '-id'],
+                name='txn_account_ts_id_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.2 on 2026-10-18 05:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accountbook', '0003_transaction_account_ts_id_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transactionhistory',
+            index=models.Index(
+                fields=['account', 'transaction_type', '-transaction_timestamp'],
+                name='txn_account_type_ts_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='transactionhistory',
+            index=models.Index(
+                fields=['account', 'transaction_amount'], name='txn_account_amount_idx'
+            ),
+        ),
+    ]
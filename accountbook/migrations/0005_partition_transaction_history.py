@@ -0,0 +1,135 @@
+"""
+transaction_history 를 transaction_timestamp 기준 월별 RANGE 파티션 테이블로 전환
+
+PostgreSQL에서만 동작하고 다른 DB에서는 아무것도 하지 않는다.
+기존 테이블의 컬럼/기본값/IDENTITY/CHECK 제약, 인덱스, 외래키 정의를 그대로 옮기고
+기본 키만 파티션 키를 포함한 (id, transaction_timestamp) 로 바뀐다.
+데이터 복사 동안 테이블이 잠기므로 대용량 운영 DB는 점검 시간에 적용한다.
+"""
+
+from datetime import datetime, timezone
+
+from django.db import migrations
+
+from accountbook.utils.partitions import (
+    DEFAULT_PARTITION,
+    PARENT_TABLE,
+    add_months,
+    create_partition_sql,
+    is_partitioned,
+    month_start,
+)
+
+# 전환 시점에 미리 만들어 둘 미래 파티션 개월 수
+MONTHS_AHEAD = 3
+
+LEGACY_TABLE = f'{PARENT_TABLE}_unpartitioned'
+
+
+def _table_definitions(cursor, table):
+    # 기본 키를 제외한 인덱스와 외래키 정의 (원래 이름 그대로 재생성)
+    cursor.execute(
+        "SELECT indexdef FROM pg_indexes WHERE schemaname = current_schema() "
+        "AND tablename = %s AND indexname NOT IN ("
+        "SELECT conname FROM pg_constraint "
+        "WHERE conrelid = to_regclass(%s) AND contype = 'p')",
+        [table, table],
+    )
+    # 파티션 부모의 인덱스 정의는 ON ONLY 로 나오므로 일반 CREATE INDEX 로 되돌림
+    indexes = [row[0].replace(' ON ONLY ', ' ON ') for row in cursor.fetchall()]
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+        [table],
+    )
+    foreign_keys = cursor.fetchall()
+    return indexes, foreign_keys
+
+
+def _swap_table(cursor, create_sql, finish_sql):
+    indexes, foreign_keys = _table_definitions(cursor, PARENT_TABLE)
+    cursor.execute(f'ALTER TABLE {PARENT_TABLE} RENAME TO {LEGACY_TABLE}')
+    # 새 테이블의 기본 키가 원래 이름(transaction_history_pkey)을 쓰도록 비켜 둠
+    cursor.execute(f'ALTER INDEX {PARENT_TABLE}_pkey RENAME TO {LEGACY_TABLE}_pkey')
+    cursor.execute(create_sql)
+    for sql in finish_sql:
+        cursor.execute(sql)
+    cursor.execute(
+        f'INSERT INTO {PARENT_TABLE} OVERRIDING SYSTEM VALUE '
+        f'SELECT * FROM {LEGACY_TABLE}'
+    )
+    cursor.execute(
+        f"SELECT setval(pg_get_serial_sequence('{PARENT_TABLE}', 'id'), "
+        f"COALESCE((SELECT MAX(id) FROM {PARENT_TABLE}), 0) + 1, false)"
+    )
+    # 기존 테이블을 지워야 인덱스/외래키 이름을 다시 쓸 수 있다
+    cursor.execute(f'DROP TABLE {LEGACY_TABLE}')
+    for indexdef in indexes:
+        cursor.execute(indexdef)
+    for name, definition in foreign_keys:
+        cursor.execute(f'ALTER TABLE {PARENT_TABLE} ADD CONSTRAINT {name} {definition}')
+
+
+def partition_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        if is_partitioned(cursor):
+            return
+        cursor.execute(
+            f'SELECT MIN(transaction_timestamp), MAX(transaction_timestamp) '
+            f'FROM {PARENT_TABLE}'
+        )
+        oldest, newest = cursor.fetchone()
+
+        current = month_start(datetime.now(timezone.utc))
+        first, last = current, add_months(current, MONTHS_AHEAD)
+        if oldest is not None:
+            first = min(month_start(oldest.astimezone(timezone.utc)), first)
+            last = max(month_start(newest.astimezone(timezone.utc)), last)
+
+        months = []
+        month = first
+        while month <= last:
+            months.append(create_partition_sql(month))
+            month = add_months(month, 1)
+
+        _swap_table(
+            cursor,
+            f'CREATE TABLE {PARENT_TABLE} (LIKE {LEGACY_TABLE} INCLUDING DEFAULTS '
+            f'INCLUDING IDENTITY INCLUDING CONSTRAINTS) '
+            f'PARTITION BY RANGE (transaction_timestamp)',
+            [
+                f'ALTER TABLE {PARENT_TABLE} '
+                f'ADD PRIMARY KEY (id, transaction_timestamp)',
+                *months,
+                f'CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {PARENT_TABLE} DEFAULT',
+            ],
+        )
+
+
+def unpartition_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        if not is_partitioned(cursor):
+            return
+        _swap_table(
+            cursor,
+            f'CREATE TABLE {PARENT_TABLE} (LIKE {LEGACY_TABLE} INCLUDING DEFAULTS '
+            f'INCLUDING IDENTITY INCLUDING CONSTRAINTS)',
+            [f'ALTER TABLE {PARENT_TABLE} ADD PRIMARY KEY (id)'],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accountbook', '0004_transaction_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_table, unpartition_table),
+    ]
@@ -0,0 +1,162 @@
+# Generated by Django 5.2.2 on 2026-10-18 06:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accountbook', '0005_partition_transaction_history'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TransactionDailyRollup',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'transaction_method',
+                    models.CharField(
+                        choices=[
+                            ('ATM', 'ATM 거래'),
+                            ('TRANSFER', '계좌이체'),
+                            ('AUTOMATIC_TRANSFER', '자동이체'),
+                            ('CARD', '카드결제'),
+                            ('INTEREST', '이자'),
+                        ],
+                        max_length=20,
+                        verbose_name='거래 방법',
+                    ),
+                ),
+                (
+                    'deposit_total',
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=17,
+                        verbose_name='입금 합계',
+                    ),
+                ),
+                (
+                    'deposit_count',
+                    models.IntegerField(default=0, verbose_name='입금 건수'),
+                ),
+                (
+                    'withdraw_total',
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=17,
+                        verbose_name='출금 합계',
+                    ),
+                ),
+                (
+                    'withdraw_count',
+                    models.IntegerField(default=0, verbose_name='출금 건수'),
+                ),
+                ('day', models.DateField(verbose_name='일자')),
+                (
+                    'account',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to='accountbook.account',
+                        verbose_name='계좌',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': '일별 거래 집계',
+                'verbose_name_plural': '일별 거래 집계 목록',
+                'db_table': 'transaction_daily_rollup',
+                'constraints': [
+                    models.UniqueConstraint(
+                        fields=('account', 'day', 'transaction_method'),
+                        name='daily_rollup_account_day_method_uniq',
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name='TransactionMonthlyRollup',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'transaction_method',
+                    models.CharField(
+                        choices=[
+                            ('ATM', 'ATM 거래'),
+                            ('TRANSFER', '계좌이체'),
+                            ('AUTOMATIC_TRANSFER', '자동이체'),
+                            ('CARD', '카드결제'),
+                            ('INTEREST', '이자'),
+                        ],
+                        max_length=20,
+                        verbose_name='거래 방법',
+                    ),
+                ),
+                (
+                    'deposit_total',
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=17,
+                        verbose_name='입금 합계',
+                    ),
+                ),
+                (
+                    'deposit_count',
+                    models.IntegerField(default=0, verbose_name='입금 건수'),
+                ),
+                (
+                    'withdraw_total',
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=17,
+                        verbose_name='출금 합계',
+                    ),
+                ),
+                (
+                    'withdraw_count',
+                    models.IntegerField(default=0, verbose_name='출금 건수'),
+                ),
+                ('month', models.DateField(verbose_name='월 (1일)')),
+                (
+                    'account',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to='accountbook.account',
+                        verbose_name='계좌',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': '월별 거래 집계',
+                'verbose_name_plural': '월별 거래 집계 목록',
+                'db_table': 'transaction_monthly_rollup',
+                'constraints': [
+                    models.UniqueConstraint(
+                        fields=('account', 'month', 'transaction_method'),
+                        name='monthly_rollup_account_month_method_uniq',
+                    )
+                ],
+            },
+        ),
+    ]
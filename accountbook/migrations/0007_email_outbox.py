@@ -0,0 +1,77 @@
+# Generated by Django 5.2.2 on 2026-10-18 06:21
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accountbook', '0006_transaction_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmailOutbox',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('to_email', models.EmailField(max_length=254, verbose_name='수신자')),
+                ('subject', models.CharField(max_length=255, verbose_name='제목')),
+                ('body', models.TextField(verbose_name='본문')),
+                (
+                    'status',
+                    models.CharField(
+                        choices=[
+                            ('PENDING', '대기'),
+                            ('SENT', '발송 완료'),
+                            ('FAILED', '발송 실패'),
+                        ],
+                        default='PENDING',
+                        max_length=10,
+                        verbose_name='상태',
+                    ),
+                ),
+                (
+                    'attempts',
+                    models.PositiveIntegerField(default=0, verbose_name='시도 횟수'),
+                ),
+                (
+                    'next_attempt_at',
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name='다음 시도 시각'
+                    ),
+                ),
+                (
+                    'last_error',
+                    models.TextField(blank=True, verbose_name='마지막 오류'),
+                ),
+                (
+                    'created_at',
+                    models.DateTimeField(auto_now_add=True, verbose_name='생성일'),
+                ),
+                (
+                    'sent_at',
+                    models.DateTimeField(blank=True, null=True, verbose_name='발송일'),
+                ),
+            ],
+            options={
+                'verbose_name': '메일 발송 대기열',
+                'verbose_name_plural': '메일 발송 대기열 목록',
+                'db_table': 'email_outbox',
+                'indexes': [
+                    models.Index(
+                        fields=['status', 'next_attempt_at'],
+                        name='outbox_status_next_idx',
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.2 on 2026-10-18 07:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accountbook', '0007_email_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='account',
+            name='write_combining',
+            field=models.BooleanField(default=False, verbose_name='입금 묶음 반영'),
+        ),
+        migrations.CreateModel(
+            name='PendingDeposit',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('transaction_id', models.BigIntegerField(verbose_name='거래 ID')),
+                (
+                    'transaction_amount',
+                    models.DecimalField(
+                        decimal_places=2, max_digits=15, verbose_name='거래 금액'
+                    ),
+                ),
+                (
+                    'transaction_timestamp',
+                    models.DateTimeField(verbose_name='거래 시간'),
+                ),
+                (
+                    'account',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='pending_deposits',
+                        to='accountbook.account',
+                        verbose_name='계좌',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': '정산 대기 입금',
+                'verbose_name_plural': '정산 대기 입금 목록',
+                'db_table': 'pending_deposits',
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.2 on 2026-10-18 08:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accountbook', '0008_write_combining'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserShard',
+            fields=[
+                (
+                    'user',
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name='shard_location',
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name='사용자',
+                    ),
+                ),
+                ('shard', models.CharField(max_length=30, verbose_name='샤드')),
+                ('moving', models.BooleanField(default=False, verbose_name='이동 중')),
+                (
+                    'updated_at',
+                    models.DateTimeField(auto_now=True, verbose_name='수정일'),
+                ),
+            ],
+            options={
+                'verbose_name': '사용자 샤드',
+                'verbose_name_plural': '사용자 샤드 목록',
+                'db_table': 'user_shards',
+                'indexes': [models.Index(fields=['shard'], name='user_shard_idx')],
+            },
+        ),
+    ]
@@ -97,6 +97,8 @@ class Account(models.Model):
     balance = models.DecimalField(
         max_digits=15, decimal_places=2, default=0, verbose_name='잔액'
     )
+    # 입금이 몰리는 계좌용 - 입금은 거래내역만 추가하고 잔액은 짧은 주기로 모아서 반영
+    write_combining = models.BooleanField(default=False, verbose_name='입금 묶음 반영')
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
 
@@ -139,12 +141,102 @@ class TransactionHistory(models.Model):
         verbose_name_plural = '거래 내역 목록'
         db_table = 'transaction_history'
         ordering = ['-transaction_timestamp']
+        indexes = [
+            # 계좌별 최신순 목록 + 키셋(커서) 페이지네이션용 복합 인덱스
+            models.Index(
+                fields=['account', '-transaction_timestamp', '-id'],
+                name='txn_account_ts_id_idx',
+            ),
+            # 거래 유형 필터 + 최신순 정렬
+            models.Index(
+                fields=['account', 'transaction_type', '-transaction_timestamp'],
+                name='txn_account_type_ts_idx',
+            ),
+            # 금액 범위 필터
+            models.Index(
+                fields=['account', 'transaction_amount'],
+                name='txn_account_amount_idx',
+            ),
+        ]
 
     def __str__(self):
         transaction_type = '입금' if self.transaction_type == 'DEPOSIT' else '출금'
         return f"{self.transaction_timestamp.strftime('%Y-%m-%d %H:%M')} - {transaction_type} {self.transaction_amount:,}원"
 
 
+class PendingDeposit(models.Model):
+    """잔액에 아직 반영되지 않은 입금 (입금 묶음 반영 계좌)"""
+
+    account = models.ForeignKey(
+        Account,
+        on_delete=models.CASCADE,
+        related_name='pending_deposits',
+        verbose_name='계좌',
+    )
+    # transaction_history 는 (id, 거래 시간) 복합 기본 키의 분할 테이블이라 FK 대신 id 만 보관
+    transaction_id = models.BigIntegerField(verbose_name='거래 ID')
+    transaction_amount = models.DecimalField(
+        max_digits=15, decimal_places=2, verbose_name='거래 금액'
+    )
+    transaction_timestamp = models.DateTimeField(verbose_name='거래 시간')
+
+    class Meta:
+        verbose_name = '정산 대기 입금'
+        verbose_name_plural = '정산 대기 입금 목록'
+        db_table = 'pending_deposits'
+
+
+class TransactionRollup(models.Model):
+    """계좌/기간/거래 방법별 입출금 합계 (분석용 사전 집계)"""
+
+    account = models.ForeignKey(Account, on_delete=models.CASCADE, verbose_name='계좌')
+    transaction_method = models.CharField(
+        max_length=20, choices=TRANSACTION_METHOD, verbose_name='거래 방법'
+    )
+    deposit_total = models.DecimalField(
+        max_digits=17, decimal_places=2, default=0, verbose_name='입금 합계'
+    )
+    # 증분 UPSERT 시 음수 증감분이 INSERT 값으로 들어가므로 PositiveIntegerField 를 쓰지 않음
+    deposit_count = models.IntegerField(default=0, verbose_name='입금 건수')
+    withdraw_total = models.DecimalField(
+        max_digits=17, decimal_places=2, default=0, verbose_name='출금 합계'
+    )
+    withdraw_count = models.IntegerField(default=0, verbose_name='출금 건수')
+
+    class Meta:
+        abstract = True
+
+
+class TransactionDailyRollup(TransactionRollup):
+    day = models.DateField(verbose_name='일자')
+
+    class Meta:
+        verbose_name = '일별 거래 집계'
+        verbose_name_plural = '일별 거래 집계 목록'
+        db_table = 'transaction_daily_rollup'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['account', 'day', 'transaction_method'],
+                name='daily_rollup_account_day_method_uniq',
+            ),
+        ]
+
+
+class TransactionMonthlyRollup(TransactionRollup):
+    month = models.DateField(verbose_name='월 (1일)')
+
+    class Meta:
+        verbose_name = '월별 거래 집계'
+        verbose_name_plural = '월별 거래 집계 목록'
+        db_table = 'transaction_monthly_rollup'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['account', 'month', 'transaction_method'],
+                name='monthly_rollup_account_month_method_uniq',
+            ),
+        ]
+
+
 class Analysis(models.Model):
     user = models.ForeignKey(
         CustomUser,
@@ -197,3 +289,66 @@ class Notification(models.Model):
 
     def __str__(self):
         return f"{self.message[:30]}... ({self.created_at.strftime('%Y-%m-%d %H:%M')})"
+
+
+class UserShard(models.Model):
+    """사용자 데이터(계좌, 거래내역, 분석, 알림)가 있는 DB - 기본 DB 에만 둠"""
+
+    user = models.OneToOneField(
+        CustomUser,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='shard_location',
+        verbose_name='사용자',
+    )
+    shard = models.CharField(max_length=30, verbose_name='샤드')
+    # 샤드 사이 이동 중에는 쓰기를 받지 않음
+    moving = models.BooleanField(default=False, verbose_name='이동 중')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
+
+    class Meta:
+        verbose_name = '사용자 샤드'
+        verbose_name_plural = '사용자 샤드 목록'
+        db_table = 'user_shards'
+        indexes = [models.Index(fields=['shard'], name='user_shard_idx')]
+
+    def __str__(self):
+        return f"{self.user_id} -> {self.shard}"
+
+
+class EmailOutbox(models.Model):
+    """발송 대기 메일 - 요청 트랜잭션과 함께 커밋되고 워커가 일괄 발송"""
+
+    STATUS_CHOICES = [
+        ('PENDING', '대기'),
+        ('SENT', '발송 완료'),
+        ('FAILED', '발송 실패'),
+    ]
+
+    to_email = models.EmailField(verbose_name='수신자')
+    subject = models.CharField(max_length=255, verbose_name='제목')
+    body = models.TextField(verbose_name='본문')
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default='PENDING', verbose_name='상태'
+    )
+    attempts = models.PositiveIntegerField(default=0, verbose_name='시도 횟수')
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now, verbose_name='다음 시도 시각'
+    )
+    last_error = models.TextField(blank=True, verbose_name='마지막 오류')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name='발송일')
+
+    class Meta:
+        verbose_name = '메일 발송 대기열'
+        verbose_name_plural = '메일 발송 대기열 목록'
+        db_table = 'email_outbox'
+        indexes = [
+            # 워커의 발송 대상 조회 (status=PENDING, next_attempt_at <= now)
+            models.Index(
+                fields=['status', 'next_attempt_at'], name='outbox_status_next_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.to_email} - {self.subject} ({self.status})"
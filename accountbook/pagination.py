@@ -0,0 +1,159 @@
+# accountbook/pagination.py
+
+import base64
+from collections import OrderedDict
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .utils.transaction_cache import list_url
+
+
+class TransactionPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    # 링크는 목록 캐시 키와 같은 URL(목록 파라미터만)에서 만듦
+    def get_next_link(self):
+        if not self.page.has_next():
+            return None
+        return replace_query_param(
+            list_url(self.request), self.page_query_param, self.page.next_page_number()
+        )
+
+    def get_previous_link(self):
+        if not self.page.has_previous():
+            return None
+        url = list_url(self.request)
+        page_number = self.page.previous_page_number()
+        if page_number == 1:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, page_number)
+
+
+class TransactionCursorPagination(BasePagination):
+    """(transaction_timestamp, id) 기준 키셋 페이지네이션 - OFFSET/COUNT 없음"""
+
+    cursor_query_param = 'cursor'
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    invalid_cursor_message = '유효하지 않은 커서입니다.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = list_url(request)
+        page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+        self.reverse = bool(position and position[2])
+
+        if position:
+            timestamp, pk, _ = position
+            if self.reverse:
+                # 이전 페이지: 커서보다 뒤(최신) 거래를 오름차순으로 조회
+                queryset = queryset.filter(
+                    Q(transaction_timestamp__gte=timestamp),
+                    Q(transaction_timestamp__gt=timestamp)
+                    | Q(transaction_timestamp=timestamp, id__gt=pk),
+                )
+            else:
+                # 다음 페이지: 커서보다 앞(과거) 거래. lte 조건으로 인덱스 범위 스캔 유도
+                queryset = queryset.filter(
+                    Q(transaction_timestamp__lte=timestamp),
+                    Q(transaction_timestamp__lt=timestamp)
+                    | Q(transaction_timestamp=timestamp, id__lt=pk),
+                )
+
+        if self.reverse:
+            queryset = queryset.order_by('transaction_timestamp', 'id')
+        else:
+            queryset = queryset.order_by('-transaction_timestamp', '-id')
+
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        results = list(queryset[: page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+        if self.reverse:
+            results.reverse()
+
+        if self.reverse:
+            self.has_next = bool(results)
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None and bool(results)
+
+        self.page = results
+        return results
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            decoded = base64.urlsafe_b64decode(encoded.encode('ascii')).decode('ascii')
+            reverse, timestamp, pk = decoded.split('|')
+            timestamp = parse_datetime(timestamp)
+            pk = int(pk)
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if timestamp is None:
+            raise NotFound(self.invalid_cursor_message)
+        return timestamp, pk, reverse == 'r'
+
+    def make_cursor(self, obj, reverse=False):
+        raw = f"{'r' if reverse else 'f'}|{obj.transaction_timestamp.isoformat()}|{obj.pk}"
+        return base64.urlsafe_b64encode(raw.encode('ascii')).decode('ascii')
+
+    def encode_cursor(self, obj, reverse=False):
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, self.make_cursor(obj, reverse)
+        )
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ('next', self.get_next_link()),
+                    ('previous', self.get_previous_link()),
+                    ('results', data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
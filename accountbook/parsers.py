@@ -0,0 +1,32 @@
+# accountbook/parsers.py
+
+import codecs
+import csv
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+def read_csv_rows(stream, encoding='utf-8'):
+    """CSV 스트림을 헤더 기준 dict 목록으로 변환 (BOM 허용)"""
+    if encoding.lower().replace('-', '') == 'utf8':
+        encoding = 'utf-8-sig'
+    reader = csv.DictReader(codecs.getreader(encoding)(stream))
+    try:
+        return [
+            {key.strip(): value for key, value in row.items() if key} for row in reader
+        ]
+    except (csv.Error, UnicodeDecodeError) as exc:
+        raise ParseError(f'CSV 파싱 오류 - {exc}')
+
+
+class CSVParser(BaseParser):
+    """text/csv 요청 본문을 행(dict) 목록으로 파싱"""
+
+    media_type = 'text/csv'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        return read_csv_rows(stream, encoding)
@@ -7,5 +7,5 @@ class IsAccountOwner(permissions.BasePermission):
     # 계좌 소유자만 접근/수정/삭제 가능
 
     def has_object_permission(self, request, view, obj):
-        # obj: Account 인스턴스
-        return obj.user == request.user
+        # obj: Account 인스턴스 - user 를 불러오지 않도록 user_id 로 비교
+        return obj.user_id == request.user.id
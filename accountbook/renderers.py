@@ -0,0 +1,31 @@
+# accountbook/renderers.py
+
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+
+class StreamingExportRenderer(BaseRenderer):
+    """
+    내보내기 포맷 협상용 렌더러
+
+    실제 본문은 뷰가 StreamingHttpResponse로 직접 생성하고,
+    여기서는 오류 응답(dict)만 JSON 텍스트로 렌더링한다.
+    """
+
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return json.dumps(data, ensure_ascii=False).encode(self.charset)
+
+
+class CSVRenderer(StreamingExportRenderer):
+    media_type = 'text/csv'
+    format = 'csv'
+
+
+class NDJSONRenderer(StreamingExportRenderer):
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
@@ -0,0 +1,84 @@
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from .models import CustomUser
+from .utils import replicas, shards
+
+
+class ShardRouter:
+    """
+    계좌, 거래내역, 분석, 알림 쿼리를 소유 사용자의 샤드로 (샤딩을 켰을 때만)
+
+    인스턴스가 있으면 그 인스턴스를 읽은 DB 나 소유자의 샤드, 없으면 현재 요청 사용자
+    (또는 using_shard 블록)의 샤드. 정할 수 없으면 다음 라우터(기본 DB)에 맡긴다.
+    """
+
+    def _db(self, model, hints):
+        if not shards.sharding_enabled() or not shards.is_sharded(model):
+            return None
+        instance = hints.get('instance')
+        if instance is not None:
+            if shards.is_sharded(type(instance)) and instance._state.db:
+                return instance._state.db
+            owner = shards.owner_of(instance)
+            if owner is not None:
+                return shards.shard_for_user(owner)
+        return shards.current_shard()
+
+    def db_for_read(self, model, **hints):
+        return self._db(model, hints)
+
+    def db_for_write(self, model, **hints):
+        db = self._db(model, hints)
+        if db is not None:
+            shards.check_writable()
+        return db
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 샤드마다 users 사본이 있으므로 사용자와는 어느 샤드의 객체든 연결 가능
+        if shards.sharding_enabled() and (
+            isinstance(obj1, CustomUser) or isinstance(obj2, CustomUser)
+        ):
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # 샤드도 전체 스키마를 받음 (users 사본의 FK 대상 테이블 포함)
+        return None
+
+
+class PrimaryReplicaRouter:
+    """요청 처리 중 안전한 메서드의 읽기는 복제본으로, 나머지는 기본 DB 로"""
+
+    def db_for_read(self, model, **hints):
+        state = replicas.current_state()
+        if state is None or state.pinned:
+            return None
+        # 트랜잭션 안의 읽기는 같은 트랜잭션의 쓰기를 봐야 함
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        if not state.user_checked:
+            user = replicas.request_user(state.request)
+            if user is not None and user.is_authenticated:
+                state.user_checked = True
+                if replicas.is_user_sticky(user.pk):
+                    state.pinned = True
+                    return None
+        return state.replica()
+
+    def db_for_write(self, model, **hints):
+        state = replicas.current_state()
+        if state is not None:
+            # 이 요청의 이후 읽기는 방금 쓴 내용을 보도록 기본 DB 로
+            state.wrote = True
+            state.pinned = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 기본 DB 와 같은 데이터
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # 복제본은 기본 DB 의 복제로 스키마를 받음
+        if db in replicas.replica_aliases():
+            return False
+        return None
@@ -1,13 +1,15 @@
 # accountbook/serializers.py 최적화 진행 완료
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db import transaction
-from django.db.models import F
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
 from .constants import ACCOUNT_TYPE, BANK_CODES, TRANSACTION_METHOD, TRANSACTION_TYPE
-from .models import Account, TransactionHistory
-from .utils_common import send_verification_email
+from .models import Account, Analysis, TransactionHistory
+from .utils import ledger
+from .utils.ledger import InsufficientBalanceError
+from .utils.outbox import enqueue_email
+from .utils_common import build_verification_email, send_verification_email
 
 User = get_user_model()
 
@@ -44,7 +46,11 @@ class SignupSerializer(serializers.ModelSerializer):
         user.set_password(password)
         user.is_active = False
         user.save()
-        send_verification_email(user)  # 이메일전송
+        if settings.EMAIL_OUTBOX_ENABLED:
+            # SMTP 왕복 없이 대기열에만 추가 (회원가입 트랜잭션과 함께 커밋)
+            enqueue_email(user.email, *build_verification_email(user))
+        else:
+            send_verification_email(user)  # 이메일전송
         return user
 
 
@@ -71,6 +77,20 @@ class UserUpdateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("이미 사용 중인 닉네임입니다.")
         return value
 
+    def update(self, instance, validated_data):
+        # 인증 캐시에서 만든 사용자일 수 있으므로 실제로 바뀐 필드만 저장
+        # (비밀번호는 fields 에 없어 이 경로로 쓰이지 않음)
+        changed = [
+            field
+            for field, value in validated_data.items()
+            if getattr(instance, field) != value
+        ]
+        for field in changed:
+            setattr(instance, field, validated_data[field])
+        if changed:
+            instance.save(update_fields=changed)
+        return instance
+
 
 class AccountSerializer(serializers.ModelSerializer):
     # 상수 딕셔너리 캐싱
@@ -168,6 +188,13 @@ class TransactionHistorySerializer(serializers.ModelSerializer):
         return self.TRANSACTION_METHOD_DICT.get(obj.transaction_method, '기타')
 
 
+class TransactionBulkCreateSerializer(serializers.ListSerializer):
+    # 거래내역 일괄 등록: 한 번의 검증, 메모리 잔액 계산, 일괄 INSERT, 잔액 1회 갱신
+
+    def create(self, validated_data):
+        return ledger.record_batch(self.context['account'], enumerate(validated_data))
+
+
 class TransactionCreateSerializer(serializers.ModelSerializer):
     # 유효한 타입과 방법을 클래스 변수로 캐싱
     VALID_TRANSACTION_TYPES = [type_code for type_code, _ in TRANSACTION_TYPE]
@@ -182,6 +209,7 @@ class TransactionCreateSerializer(serializers.ModelSerializer):
             'transaction_method',
             'transaction_timestamp',
         ]
+        list_serializer_class = TransactionBulkCreateSerializer
 
     def validate_transaction_amount(self, value):
         if value <= 0:
@@ -198,27 +226,36 @@ class TransactionCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("유효하지 않은 거래 방법입니다.")
         return value
 
-    @transaction.atomic
     def create(self, validated_data):
-        account = self.context['account']
-        amount = validated_data['transaction_amount']
-        transaction_type = validated_data['transaction_type']
-
-        # F() 표현식을 사용하여 경쟁 상태 방지
-        if transaction_type == 'DEPOSIT':
-            Account.objects.filter(pk=account.pk).update(balance=F('balance') + amount)
-        elif transaction_type == 'WITHDRAW':
-            updated = Account.objects.filter(pk=account.pk, balance__gte=amount).update(
-                balance=F('balance') - amount
-            )
-            if not updated:
-                raise serializers.ValidationError("잔액이 부족합니다.")
-
-        # 업데이트된 계좌 정보 다시 가져오기
-        account.refresh_from_db()
-
-        # 거래 후 잔액 설정
-        validated_data['account'] = account
-        validated_data['post_transaction_amount'] = account.balance
+        # 잔액 체인(거래 후 잔액, 계좌 잔액)은 ledger가 한 트랜잭션으로 관리
+        try:
+            return ledger.record_transaction(self.context['account'], validated_data)
+        except InsufficientBalanceError:
+            raise serializers.ValidationError("잔액이 부족합니다.")
 
-        return super().create(validated_data)
+    def update(self, instance, validated_data):
+        try:
+            return ledger.update_transaction(instance, validated_data)
+        except InsufficientBalanceError:
+            raise serializers.ValidationError("잔액이 부족합니다.")
+
+
+class AnalysisSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Analysis
+        fields = [
+            'id',
+            'analysis_target',
+            'analysis_period',
+            'start_date',
+            'end_date',
+            'description',
+            'result_image',
+            'created_at',
+        ]
+        read_only_fields = ['id', 'result_image', 'created_at']
+
+    def validate(self, attrs):
+        if attrs['start_date'] > attrs['end_date']:
+            raise serializers.ValidationError("시작일은 종료일보다 늦을 수 없습니다.")
+        return attrs
@@ -0,0 +1,66 @@
+# accountbook/signals.py
+
+from functools import partial
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import Account, CustomUser, TransactionHistory
+from .utils import shards
+from .utils.cache_tags import (
+    account_tag,
+    accounts_tag,
+    invalidate_tags,
+    transaction_tag,
+    user_tag,
+)
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_user_caches(sender, instance, update_fields=None, **kwargs):
+    # 로그인 때마다 갱신되는 last_login 은 캐시된 응답에 영향 없음
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    invalidate_tags(user_tag(instance.pk))
+
+
+@receiver(post_save, sender=Account)
+@receiver(post_delete, sender=Account)
+def invalidate_account_caches(sender, instance, **kwargs):
+    invalidate_tags(account_tag(instance.pk), accounts_tag(instance.user_id))
+
+
+# post_delete 는 연결하지 않음 - 수신자가 있으면 계좌 삭제 시 거래내역 CASCADE 가
+# 한 번의 DELETE 대신 행 단위 조회/삭제로 바뀐다. 거래 삭제는 ledger 가 계좌 태그를 무효화하고,
+# 계좌 삭제는 위 Account 수신자가 처리한다.
+@receiver(post_save, sender=TransactionHistory)
+def invalidate_transaction_caches(sender, instance, **kwargs):
+    invalidate_tags(transaction_tag(instance.pk), account_tag(instance.account_id))
+
+
+# 샤드 - 기본 DB 의 사용자 변경을 샤드의 users 사본과 샤드 데이터에 반영
+@receiver(post_save, sender=CustomUser)
+def sync_shard_user(sender, instance, using, update_fields=None, **kwargs):
+    if using != DEFAULT_DB_ALIAS or not shards.sharding_enabled():
+        return
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    alias = shards.assigned_shard(instance.pk)
+    if alias is not None:
+        shards.copy_users([instance], alias)
+
+
+@receiver(pre_delete, sender=CustomUser)
+def delete_shard_data(sender, instance, using, **kwargs):
+    if using != DEFAULT_DB_ALIAS or not shards.sharding_enabled():
+        return
+    alias = shards.assigned_shard(instance.pk)
+    shards.forget(instance.pk)
+    if alias is not None and alias != DEFAULT_DB_ALIAS:
+        # 샤드 맵(UserShard)은 사용자와 함께 CASCADE 삭제
+        transaction.on_commit(
+            partial(shards.delete_user_data, [instance.pk], alias),
+            using=DEFAULT_DB_ALIAS,
+        )
@@ -0,0 +1,45 @@
+# accountbook/throttling.py
+
+from rest_framework.throttling import BaseThrottle
+
+from .utils.rate_limit import FIXED_WINDOW, RateLimiter, get_client_ip
+
+
+class RateLimitThrottle(BaseThrottle):
+    """
+    settings.RATE_LIMITS 기반 원자적 속도 제한
+
+    scope 를 지정하지 않으면 뷰의 throttle_scope 를 사용한다.
+    식별자는 로그인 사용자면 사용자 ID, 아니면 클라이언트 IP.
+    """
+
+    scope = None
+    algorithm = FIXED_WINDOW
+
+    def get_scope(self, view):
+        return self.scope or getattr(view, 'throttle_scope', None)
+
+    def get_ident(self, request):
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            return f'user:{user.pk}'
+        return f'ip:{get_client_ip(request)}'
+
+    def allow_request(self, request, view):
+        scope = self.get_scope(view)
+        if scope is None:
+            return True
+        limiter = RateLimiter.for_scope(scope, algorithm=self.algorithm)
+        self.result = limiter.hit(self.get_ident(request))
+        return self.result.allowed
+
+    def wait(self):
+        result = getattr(self, 'result', None)
+        return result.retry_after if result else None
+
+
+class AnonRateLimitThrottle(RateLimitThrottle):
+    """IP 기준 제한 (로그인 여부와 무관)"""
+
+    def get_ident(self, request):
+        return f'ip:{get_client_ip(request)}'
@@ -0,0 +1,13 @@
+from django.urls import path
+
+from accountbook.views.analysis_views import (
+    AnalysisDetailView,
+    AnalysisJobView,
+    AnalysisListCreateView,
+)
+
+urlpatterns = [
+    path('', AnalysisListCreateView.as_view(), name='analysis_list_create'),
+    path('<int:analysis_id>/', AnalysisDetailView.as_view(), name='analysis_detail'),
+    path('jobs/<str:job_id>/', AnalysisJobView.as_view(), name='analysis_job'),
+]
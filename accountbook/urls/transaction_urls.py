@@ -1,7 +1,9 @@
 from django.urls import path
 
 from accountbook.views.transactions_views import (
+    TransactionBulkCreateView,
     TransactionDetailView,
+    TransactionExportView,
     TransactionListCreateView,
 )
 
@@ -11,6 +13,16 @@ urlpatterns = [
         TransactionListCreateView.as_view(),
         name='transaction_list_create',
     ),
+    path(
+        'accounts/<int:account_id>/transactions/bulk/',
+        TransactionBulkCreateView.as_view(),
+        name='transaction_bulk_create',
+    ),
+    path(
+        'accounts/<int:account_id>/transactions/export/',
+        TransactionExportView.as_view(),
+        name='transaction_export',
+    ),
     path(
         'accounts/<int:account_id>/transactions/<int:pk>/',
         TransactionDetailView.as_view(),
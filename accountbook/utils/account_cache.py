@@ -0,0 +1,110 @@
+"""
+계좌 소유권 near cache
+
+거래내역 API 는 매 요청 계좌 소유권을 확인한다. Account 모델 전체를 pickle 로 Redis 에
+두는 대신 (account_id, user_id, balance_version, write_combining) 레코드만 프로세스 내 LRU(짧은 TTL) ->
+Redis -> DB 순서로 조회한다. balance_version 은 계좌 캐시 태그 버전이라 거래내역 목록
+캐시 키에 그대로 쓰여, 로컬 적중 시 Redis 왕복 없이 소유권 확인과 목록 캐시 키 생성이 끝난다.
+
+로컬 항목은 태그 버전 증가 알림(이 프로세스는 즉시, 다른 프로세스는 Redis pub/sub)으로
+지워진다. 알림 구독이 끊긴 동안에는 로컬 계층을 건너뛴다.
+"""
+
+import threading
+from collections import namedtuple
+
+from django.conf import settings
+
+from ..models import Account
+from .cache_tags import (
+    account_tag,
+    get_with_versions,
+    listening_for_bumps,
+    on_tags_bumped,
+)
+from .local_cache import LocalLRUCache
+from .stampede import is_fresh, read_entry, recompute
+
+AccountRecord = namedtuple(
+    'AccountRecord', ['account_id', 'user_id', 'balance_version', 'write_combining']
+)
+
+# 로컬 항목은 계좌 태그 문자열을 키로 두어 알림받은 태그로 바로 지운다
+_local = LocalLRUCache(maxsize=settings.ACCOUNT_NEAR_CACHE_SIZE)
+
+# 무효화 횟수 - 조회 도중 무효화가 있었으면 읽은 레코드를 로컬에 넣지 않는다
+_evictions = 0
+_evictions_lock = threading.Lock()
+
+
+def account_record_key(account_id):
+    return f'account_owner_{account_id}'
+
+
+def _evict(tags):
+    global _evictions
+    with _evictions_lock:
+        _evictions += 1
+    if tags is None:
+        _local.clear()
+        return
+    for tag in tags:
+        _local.delete(tag)
+
+
+on_tags_bumped(_evict)
+
+
+def _local_enabled():
+    return settings.ACCOUNT_NEAR_CACHE_TTL > 0 and listening_for_bumps()
+
+
+def _load(account_id, tag):
+    key = account_record_key(account_id)
+    raw, versions = get_with_versions(key, [tag])
+    version = versions[tag]
+
+    def current(value):
+        # 저장 후 버전이 바뀌었으면 (잔액 변경, 계좌 삭제) 다시 조회
+        # 필드 수가 다른 이전 배포의 레코드도 다시 조회
+        return len(value) == len(AccountRecord._fields) and value[2] == version
+
+    def compute():
+        row = (
+            Account.objects.filter(pk=account_id)
+            .values_list('user_id', 'write_combining')
+            .first()
+        )
+        return None if row is None else (account_id, row[0], version, row[1])
+
+    entry = read_entry(raw)
+    stale = None
+    if entry is not None and current(entry.value):
+        if is_fresh(entry):
+            return AccountRecord(*entry.value)
+        stale = entry.value
+    # 동시 미스는 한 요청만 DB 조회, 만료가 가까우면 한 요청이 미리 갱신
+    value = recompute(
+        key, compute, settings.ACCOUNT_CACHE_TTL, stale=stale, accept=current
+    )
+    return None if value is None else AccountRecord(*value)
+
+
+def get_account_record(account_id):
+    """계좌 레코드 조회 (로컬 LRU -> Redis -> DB), 계좌가 없으면 None"""
+    tag = account_tag(account_id)
+    use_local = _local_enabled()
+    if use_local:
+        record = _local.get(tag)
+        if record is not None:
+            return record
+        evictions = _evictions
+
+    record = _load(account_id, tag)
+    if record is not None and use_local and evictions == _evictions:
+        _local.set(tag, record, settings.ACCOUNT_NEAR_CACHE_TTL)
+    return record
+
+
+def clear_local_cache():
+    _local.clear()
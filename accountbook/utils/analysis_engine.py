@@ -0,0 +1,133 @@
+"""
+분석 계산 엔진
+
+사용자 계좌들의 일별/월별 집계 행을 컬럼별 NumPy 배열로 읽어 들인 뒤
+주기 버킷 x 거래 유형 x 거래 방법 합계를 벡터 연산(np.unique, np.add.at)으로 계산한다.
+금액은 정밀도 손실이 없도록 원 단위가 아닌 정수 '전(1/100)' 단위로 다룬다.
+"""
+
+from decimal import Decimal
+
+import numpy as np
+
+from .rollups import fetch_rollup_rows
+
+# 분석 대상 -> 거래 유형
+TARGET_TYPES = {
+    'TOTAL_INCOME': 'DEPOSIT',
+    'TOTAL_SPENDING': 'WITHDRAW',
+}
+
+CENTS = 100
+
+
+def load_columns(accounts, period, start_date, end_date):
+    """집계 행을 컬럼 배열(dict)로 변환"""
+    rows = fetch_rollup_rows(accounts, period, start_date, end_date)
+    if not rows:
+        return {
+            'day': np.array([], dtype='datetime64[D]'),
+            'method': np.array([], dtype=str),
+            'DEPOSIT': np.array([], dtype=np.int64),
+            'DEPOSIT_count': np.array([], dtype=np.int64),
+            'WITHDRAW': np.array([], dtype=np.int64),
+            'WITHDRAW_count': np.array([], dtype=np.int64),
+        }
+
+    day, method, deposit, deposit_count, withdraw, withdraw_count = zip(*rows)
+    return {
+        'day': np.array(day, dtype='datetime64[D]'),
+        'method': np.array(method),
+        'DEPOSIT': _to_cents(deposit),
+        'DEPOSIT_count': np.array(deposit_count, dtype=np.int64),
+        'WITHDRAW': _to_cents(withdraw),
+        'WITHDRAW_count': np.array(withdraw_count, dtype=np.int64),
+    }
+
+
+def _to_cents(values):
+    return (np.array(values, dtype=object) * CENTS).astype(np.int64)
+
+
+def _from_cents(value):
+    # 전 단위 정수 -> 소수 둘째 자리 Decimal
+    return Decimal(int(value)).scaleb(-2)
+
+
+def period_buckets(day, period):
+    """일자 배열을 주기 버킷 시작일 배열로 변환 (주간은 월요일 시작)"""
+    if period == 'WEEKLY':
+        # 1970-01-01 은 목요일이므로 +3 하면 월요일이 0
+        return day - ((day.astype(np.int64) + 3) % 7).astype('timedelta64[D]')
+    if period == 'MONTHLY':
+        return day.astype('datetime64[M]').astype('datetime64[D]')
+    if period == 'YEARLY':
+        return day.astype('datetime64[Y]').astype('datetime64[D]')
+    return day
+
+
+def compute(columns, target, period):
+    """
+    컬럼 배열에서 분석 결과 계산
+
+    (결과, 차트 데이터) 를 반환한다. 결과의 series/total/count/by_method 는 분석 대상
+    (수입/지출) 기준, by_type 은 같은 기간 입금/출금 합계이고 차트 데이터는
+    렌더링 프로세스로 넘길 버킷 x 방법 행렬(원 단위 float)이다.
+    """
+    transaction_type = TARGET_TYPES[target]
+    buckets, bucket_index = np.unique(
+        period_buckets(columns['day'], period), return_inverse=True
+    )
+    methods, method_index = np.unique(columns['method'], return_inverse=True)
+
+    amounts = columns[transaction_type]
+    counts = columns[f'{transaction_type}_count']
+
+    matrix = np.zeros((len(buckets), len(methods)), dtype=np.int64)
+    np.add.at(matrix, (bucket_index, method_index), amounts)
+    bucket_counts = np.zeros(len(buckets), dtype=np.int64)
+    np.add.at(bucket_counts, bucket_index, counts)
+
+    bucket_totals = matrix.sum(axis=1)
+    method_totals = matrix.sum(axis=0)
+    # 대상 거래가 한 건도 없는 버킷/방법은 제외
+    keep_buckets = bucket_counts > 0
+    method_counts = np.zeros(len(methods), dtype=np.int64)
+    np.add.at(method_counts, method_index, counts)
+    keep_methods = method_counts > 0
+
+    result = {
+        'total': _from_cents(bucket_totals.sum()),
+        'count': int(bucket_counts.sum()),
+        'series': [
+            {
+                'period_start': bucket.item(),
+                'amount': _from_cents(amount),
+                'count': int(count),
+            }
+            for bucket, amount, count in zip(
+                buckets[keep_buckets],
+                bucket_totals[keep_buckets],
+                bucket_counts[keep_buckets],
+            )
+        ],
+        'by_method': {
+            str(method): _from_cents(total)
+            for method, total in zip(methods[keep_methods], method_totals[keep_methods])
+        },
+        'by_type': {
+            name: _from_cents(columns[name].sum()) for name in ('DEPOSIT', 'WITHDRAW')
+        },
+    }
+    chart = {
+        'labels': [str(bucket) for bucket in buckets[keep_buckets]],
+        'methods': [str(method) for method in methods[keep_methods]],
+        'matrix': matrix[np.ix_(keep_buckets, keep_methods)] / CENTS,
+    }
+    return result, chart
+
+
+def summarize(accounts, target, period, start_date, end_date):
+    """집계 테이블 조회 + 벡터 연산으로 분석 결과 계산"""
+    columns = load_columns(accounts, period, start_date, end_date)
+    return compute(columns, target, period)[0]
@@ -0,0 +1,124 @@
+"""
+분석 작업 - 결과 캐시와 차트 렌더링 프로세스 풀
+
+계산은 요청 스레드에서 집계 테이블 + 넘파이로 끝내고, CPU를 많이 쓰는 PNG 렌더링만
+프로세스 풀로 넘긴다. 작업 상태는 캐시에 저장하므로 어느 워커에서든 조회할 수 있다.
+"""
+
+import hashlib
+import logging
+import multiprocessing
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import close_old_connections
+
+from ..models import Account, Analysis
+from .charts import render_chart
+from .shards import for_user
+from .transaction_cache import get_generations
+
+logger = logging.getLogger('accountbook.analysis')
+
+JOB_TIMEOUT = 60 * 60
+RESULT_TIMEOUT = 60 * 60 * 24
+
+PENDING = 'pending'
+DONE = 'done'
+FAILED = 'failed'
+
+_executor = None
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        # fork 된 자식이 부모의 DB 연결/스레드를 물려받지 않도록 spawn 사용
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.ANALYSIS_RENDER_WORKERS,
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+    return _executor
+
+
+def _job_key(job_id):
+    return f'analysis_job_{job_id}'
+
+
+def data_version(user_id):
+    """사용자 계좌 목록과 계좌별 거래내역 세대 번호로 만든 데이터 버전"""
+    account_ids = sorted(
+        Account.objects.filter(user_id=user_id).values_list('id', flat=True)
+    )
+    generations = get_generations(account_ids)
+    raw = ','.join(
+        f'{account_id}:{generations[account_id]}' for account_id in account_ids
+    )
+    return hashlib.md5(raw.encode('utf-8')).hexdigest()
+
+
+def result_cache_key(user_id, target, period, start_date, end_date, version):
+    return (
+        f'analysis_result_{user_id}_{target}_{period}_'
+        f'{start_date:%Y%m%d}_{end_date:%Y%m%d}_{version}'
+    )
+
+
+def get_job(job_id):
+    return cache.get(_job_key(job_id))
+
+
+def _set_job(job_id, **state):
+    cache.set(_job_key(job_id), state, timeout=JOB_TIMEOUT)
+
+
+def chart_title(analysis):
+    return (
+        f'{analysis.analysis_target} {analysis.analysis_period} '
+        f'{analysis.start_date} ~ {analysis.end_date}'
+    )
+
+
+def start_render(analysis, chart):
+    """차트 렌더링 작업 등록 - 작업 ID 반환"""
+    job_id = uuid.uuid4().hex
+    _set_job(job_id, status=PENDING, analysis_id=analysis.pk, user_id=analysis.user_id)
+    args = (chart_title(analysis), chart['labels'], chart['methods'], chart['matrix'])
+
+    if settings.ANALYSIS_RENDER_WORKERS <= 0:
+        _save_chart(job_id, analysis.pk, analysis.user_id, render_chart(*args))
+        return job_id
+
+    future = get_executor().submit(render_chart, *args)
+    future.add_done_callback(
+        partial(_on_rendered, job_id, analysis.pk, analysis.user_id)
+    )
+    return job_id
+
+
+def _on_rendered(job_id, analysis_id, user_id, future):
+    # 실행기 내부 스레드에서 호출되므로 사용한 DB 연결을 직접 정리
+    try:
+        _save_chart(job_id, analysis_id, user_id, future.result())
+    except Exception:
+        logger.exception(f"Analysis chart rendering failed: {analysis_id}")
+        _set_job(job_id, status=FAILED, analysis_id=analysis_id, user_id=user_id)
+    finally:
+        close_old_connections()
+
+
+def _save_chart(job_id, analysis_id, user_id, png):
+    # 실행기 스레드는 요청의 샤드 정보를 이어받지 않으므로 사용자 샤드를 직접 지정
+    with for_user(user_id):
+        analysis = Analysis.objects.get(pk=analysis_id)
+        analysis.result_image.save(
+            f'analysis_{analysis_id}.png', ContentFile(png), save=False
+        )
+        Analysis.objects.filter(pk=analysis_id).update(
+            result_image=analysis.result_image.name
+        )
+    _set_job(job_id, status=DONE, analysis_id=analysis_id, user_id=user_id)
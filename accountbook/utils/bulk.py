@@ -0,0 +1,70 @@
+import csv
+import io
+
+from django.utils import timezone
+
+from ..models import TransactionHistory
+from .shards import data_connection
+
+# 이 건수 이상이면 PostgreSQL에서는 INSERT 대신 COPY 사용
+COPY_THRESHOLD = 500
+BULK_CREATE_BATCH_SIZE = 1000
+
+COPY_COLUMNS = [
+    'account_id',
+    'transaction_amount',
+    'post_transaction_amount',
+    'transaction_details',
+    'transaction_type',
+    'transaction_method',
+    'transaction_timestamp',
+    'created_at',
+    'updated_at',
+]
+
+
+def insert_transactions(rows):
+    """거래내역 대량 저장 - PostgreSQL은 COPY, 그 외 DB는 bulk_create"""
+    if data_connection().vendor == 'postgresql' and len(rows) >= COPY_THRESHOLD:
+        _copy_transactions(rows)
+        return len(rows)
+
+    TransactionHistory.objects.bulk_create(rows, batch_size=BULK_CREATE_BATCH_SIZE)
+    return len(rows)
+
+
+def _copy_transactions(rows):
+    now = timezone.now()
+    buffer = io.StringIO()
+    # QUOTE_ALL: 빈 문자열이 NULL로 해석되지 않도록 모든 값을 인용
+    writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+    for row in rows:
+        writer.writerow(
+            [
+                row.account_id,
+                row.transaction_amount,
+                row.post_transaction_amount,
+                row.transaction_details,
+                row.transaction_type,
+                row.transaction_method,
+                row.transaction_timestamp.isoformat(),
+                now.isoformat(),
+                now.isoformat(),
+            ]
+        )
+    buffer.seek(0)
+
+    connection = data_connection()
+    table = connection.ops.quote_name(TransactionHistory._meta.db_table)
+    columns = ', '.join(connection.ops.quote_name(c) for c in COPY_COLUMNS)
+    sql = f'COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)'
+
+    with connection.cursor() as cursor:
+        raw_cursor = cursor.cursor
+        if hasattr(raw_cursor, 'copy_expert'):
+            # psycopg2
+            raw_cursor.copy_expert(sql, buffer)
+        else:
+            # psycopg 3
+            with raw_cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
@@ -0,0 +1,165 @@
+"""
+캐시 코덱
+
+모델 인스턴스(_state 포함)를 통째로 pickle 하지 않고, 스키마에 정한 필드 값만 튜플로
+marshal 직렬화해 저장한다. 꺼낼 때는 from_db 처럼 그 필드만 채운 인스턴스를 만든다.
+
+    헤더(플래그 1바이트 + 스키마 버전 2바이트) + 본문(marshal, 임계값 이상이면 zlib)
+
+스키마 버전은 캐시 키와 헤더에 모두 들어가므로, 필드 구성을 바꾸고 버전을 올리면
+배포 전후 프로세스가 서로의 항목을 읽지 않는다. 형식이 맞지 않는 값은 캐시 미스로 취급한다.
+"""
+
+import datetime
+import logging
+import marshal
+import struct
+import zlib
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.base import ModelState
+
+from ..models import Account, TransactionHistory
+
+logger = logging.getLogger('accountbook.cache_codec')
+
+# marshal 형식 버전 4 는 Python 3.4 이후 동일
+MARSHAL_VERSION = 4
+FLAG_ZLIB = 0x01
+HEADER = struct.Struct('>BH')
+
+
+def _encode_decimal(value):
+    return str(value)
+
+
+def _encode_datetime(value):
+    return value.isoformat()
+
+
+# 내부 타입별 (인코더, 디코더) - 나머지(int, str, bool)는 그대로 저장
+# 날짜는 ISO 문자열 (fromisoformat 이 정수 + timedelta 계산보다 빠름)
+FIELD_CODECS = {
+    'DecimalField': (_encode_decimal, Decimal),
+    'DateTimeField': (_encode_datetime, datetime.datetime.fromisoformat),
+}
+
+
+def _passthrough(value):
+    return value
+
+
+class CacheSchema:
+    """캐시에 저장할 모델 필드 목록 - 필드를 바꾸면 version 을 올린다"""
+
+    def __init__(self, name, version, model, fields):
+        self.name = name
+        self.version = version
+        self.model = model
+        self.fields = tuple(fields)
+        self._encoders = []
+        self._decoders = []
+        for attname in self.fields:
+            field = next(f for f in model._meta.concrete_fields if f.attname == attname)
+            encode, decode = FIELD_CODECS.get(
+                field.get_internal_type(), (_passthrough, _passthrough)
+            )
+            self._encoders.append(encode)
+            self._decoders.append(decode)
+
+    def key(self, name):
+        return f'{name}:{self.name}.v{self.version}'
+
+    def dump_row(self, instance):
+        row = []
+        for attname, encode in zip(self.fields, self._encoders):
+            value = getattr(instance, attname)
+            row.append(None if value is None else encode(value))
+        return tuple(row)
+
+    def load_row(self, row):
+        # from_db 와 같은 상태의 인스턴스를 __init__ 없이 생성 (스키마 밖 필드는 deferred)
+        instance = self.model.__new__(self.model)
+        state = ModelState()
+        state.adding = False
+        state.db = DEFAULT_DB_ALIAS
+        values = instance.__dict__
+        values['_state'] = state
+        for attname, value, decode in zip(self.fields, row, self._decoders):
+            values[attname] = value if value is None else decode(value)
+        return instance
+
+    def encode(self, value, many=False):
+        rows = (
+            tuple(self.dump_row(item) for item in value)
+            if many
+            else self.dump_row(value)
+        )
+        body = marshal.dumps(rows, MARSHAL_VERSION)
+        flags = 0
+        if len(body) >= settings.CACHE_CODEC_COMPRESS_MIN:
+            body = zlib.compress(body, 1)
+            flags |= FLAG_ZLIB
+        return HEADER.pack(flags, self.version) + body
+
+    def decode(self, data, many=False):
+        """bytes -> 인스턴스 (목록), 형식이나 버전이 다르면 None"""
+        if not isinstance(data, bytes) or len(data) < HEADER.size:
+            return None
+        flags, version = HEADER.unpack_from(data)
+        if version != self.version:
+            return None
+        body = data[HEADER.size :]
+        try:
+            if flags & FLAG_ZLIB:
+                body = zlib.decompress(body)
+            rows = marshal.loads(body)
+        except (ValueError, EOFError, TypeError, zlib.error):
+            logger.warning("캐시 항목 디코딩 실패: %s", self.name)
+            return None
+        if many:
+            return [self.load_row(row) for row in rows]
+        return self.load_row(rows)
+
+
+def get_cached(schema, key, many=False):
+    """캐시에서 인스턴스 (목록) 조회, 없거나 읽을 수 없으면 None"""
+    data = cache.get(schema.key(key))
+    if data is None:
+        return None
+    return schema.decode(data, many=many)
+
+
+def set_cached(schema, key, value, timeout, many=False):
+    cache.set(schema.key(key), schema.encode(value, many=many), timeout=timeout)
+
+
+# 스키마 ----------------------------------------------------------------------
+
+# 계좌 목록 (AccountSerializer 필드)
+ACCOUNT_SCHEMA = CacheSchema(
+    'account',
+    1,
+    Account,
+    ['id', 'account_number', 'bank_code', 'account_type', 'balance', 'created_at'],
+)
+
+# 거래내역 상세 (TransactionHistorySerializer 필드)
+TRANSACTION_SCHEMA = CacheSchema(
+    'transaction',
+    1,
+    TransactionHistory,
+    [
+        'id',
+        'account_id',
+        'transaction_amount',
+        'post_transaction_amount',
+        'transaction_details',
+        'transaction_type',
+        'transaction_method',
+        'transaction_timestamp',
+    ],
+)
@@ -0,0 +1,232 @@
+"""
+태그 기반 캐시 무효화
+
+캐시 항목은 의존하는 태그(사용자, 계좌 목록, 계좌, 거래)들의 현재 버전을 키에 포함해 저장한다.
+무효화는 태그 버전 키 INCR 한 번이라 항목 수와 관계없이 O(1)이고, 이전 버전 키로 저장된
+항목은 더 이상 조회되지 않다가 TTL로 만료된다.
+
+버전 증가는 커밋 후에 실행하므로, 커밋 전 옛 데이터를 읽은 요청이 캐시를 채우더라도
+그 항목은 이미 버려진 버전의 키에 저장되어 이후 조회에 쓰이지 않는다.
+
+버전 증가는 Redis pub/sub 으로 다른 프로세스에도 알려, 프로세스 내 캐시(near cache)가
+Redis 를 거치지 않고 보관한 항목을 지울 수 있게 한다.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+
+from . import shards
+
+logger = logging.getLogger('accountbook.cache_tags')
+
+# 버전 증가 알림 채널
+BUMP_CHANNEL = 'cache_tags:bumped'
+
+
+def user_tag(user_id):
+    """사용자 프로필"""
+    return f'user:{user_id}'
+
+
+def accounts_tag(user_id):
+    """사용자의 계좌 목록 (계좌 추가/삭제, 잔액 변경)"""
+    return f'accounts:{user_id}'
+
+
+def account_tag(account_id):
+    """계좌 상세, 소유권 확인, 거래내역 목록/상세 (잔액 체인 포함)"""
+    return f'account:{account_id}'
+
+
+def transaction_tag(transaction_id):
+    return f'transaction:{transaction_id}'
+
+
+def shard_tag(user_id):
+    """사용자 데이터 위치 (샤드 맵)"""
+    return f'shard:{user_id}'
+
+
+def _version_key(tag):
+    return f'cache_tag_{tag}'
+
+
+def _initial_version():
+    # 버전 키가 축출된 뒤 다시 만들어져도 예전 버전 값과 겹치지 않도록 시각 기반 초기값
+    return time.time_ns() // 1000
+
+
+def get_versions(tags):
+    """태그별 현재 버전을 한 번에 조회 (없는 태그만 개별 생성)"""
+    keys = {_version_key(tag): tag for tag in tags}
+    found = cache.get_many(list(keys))
+    versions = {keys[key]: version for key, version in found.items()}
+    for tag in tags:
+        if tag not in versions:
+            key = _version_key(tag)
+            version = _initial_version()
+            if not cache.add(key, version, timeout=None):
+                version = cache.get(key, version)
+            versions[tag] = version
+    return versions
+
+
+def get_with_versions(key, tags):
+    """캐시 항목 하나와 태그 버전을 한 번의 왕복으로 조회 -> (값 또는 None, 버전 dict)"""
+    version_keys = {_version_key(tag): tag for tag in tags}
+    found = cache.get_many([key, *version_keys])
+    versions = {
+        version_keys[name]: value
+        for name, value in found.items()
+        if name in version_keys
+    }
+    missing = [tag for tag in tags if tag not in versions]
+    if missing:
+        versions.update(get_versions(missing))
+    return found.get(key), versions
+
+
+def tagged_key(name, tags):
+    """이름 + 태그 버전으로 캐시 키 생성 - 태그 중 하나라도 무효화되면 키가 바뀐다"""
+    versions = get_versions(tags)
+    return f'{name}@' + '.'.join(str(versions[tag]) for tag in tags)
+
+
+def bump_tags(tags):
+    """태그 버전 즉시 증가 + 이 프로세스와 다른 프로세스에 알림"""
+    for tag in tags:
+        key = _version_key(tag)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, _initial_version(), timeout=None)
+    _notify(tags)
+    _publish(tags)
+
+
+def invalidate_tags(*tags):
+    """
+    커밋 후 태그 버전 증가 (트랜잭션 밖이면 즉시)
+
+    프로세스 내 캐시는 즉시 한 번 지우고 커밋 후 한 번 더 지운다.
+    """
+    _notify(tags)
+    # 샤드 데이터 변경이면 그 샤드 트랜잭션의 커밋 후
+    shards.on_commit(partial(bump_tags, tags))
+
+
+# 버전 증가 알림 ------------------------------------------------------------
+
+_listeners = []
+
+
+def on_tags_bumped(callback):
+    """callback(tags) 등록 - 알림을 놓쳤을 수 있으면 tags 는 None (전체 무효화)"""
+    _listeners.append(callback)
+
+
+def _notify(tags):
+    for callback in _listeners:
+        callback(tags)
+
+
+def _uses_redis():
+    return settings.CACHES['default']['BACKEND'].startswith('django_redis')
+
+
+def _redis():
+    from django_redis import get_redis_connection
+
+    return get_redis_connection('default')
+
+
+# 프로세스 식별자 - fork 된 워커끼리 구분되도록 pid 를 붙인다
+_boot_id = uuid.uuid4().hex
+
+
+def _origin():
+    return f'{_boot_id}:{os.getpid()}'
+
+
+def _publish(tags):
+    if not _uses_redis():
+        return
+    try:
+        _redis().publish(BUMP_CHANNEL, json.dumps([_origin(), list(tags)]))
+    except Exception:
+        # 알림 실패 시 다른 프로세스의 near cache 는 TTL 로 만료된다
+        logger.warning("태그 버전 알림 발행 실패: %s", tags, exc_info=True)
+
+
+class _BumpListener:
+    """BUMP_CHANNEL 구독 스레드 (프로세스당 하나, fork 후에는 새로 시작)"""
+
+    def __init__(self):
+        self.pid = None
+        self.ready = threading.Event()
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        if self.pid == os.getpid():
+            return
+        with self._lock:
+            if self.pid == os.getpid():
+                return
+            self.pid = os.getpid()
+            self.ready = threading.Event()
+            thread = threading.Thread(
+                target=self._run,
+                args=(self.ready,),
+                name='cache-tags-listener',
+                daemon=True,
+            )
+            thread.start()
+
+    def _run(self, ready):
+        while True:
+            try:
+                pubsub = _redis().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(BUMP_CHANNEL)
+                ready.set()
+                while True:
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        self._handle(message['data'])
+            except Exception:
+                logger.warning("태그 버전 알림 구독 끊김, 재연결", exc_info=True)
+            # 끊긴 동안의 알림은 알 수 없으므로 전체 무효화
+            ready.clear()
+            _notify(None)
+            time.sleep(1)
+
+    def _handle(self, data):
+        try:
+            origin, tags = json.loads(data)
+        except ValueError:
+            return
+        if origin != _origin():
+            _notify(tags)
+
+
+_listener = _BumpListener()
+
+
+def listening_for_bumps():
+    """
+    다른 프로세스의 버전 증가를 받을 수 있는지 여부 (near cache 사용 가능 여부)
+
+    Redis 캐시면 구독 스레드를 시작하고 구독 중일 때만 True,
+    프로세스 메모리 캐시면 다른 프로세스와 캐시를 공유하지 않으므로 항상 True.
+    """
+    if not _uses_redis():
+        return True
+    _listener.ensure_started()
+    return _listener.ready.is_set()
@@ -0,0 +1,86 @@
+"""
+분석 차트 PNG 렌더링
+
+렌더링 프로세스 풀에서 실행되므로 Django 설정/모델에 의존하지 않고
+넘파이 배열과 문자열만 받아 PNG 바이트를 반환한다.
+"""
+
+import io
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+WIDTH = 960
+HEIGHT = 540
+MARGIN_LEFT = 110
+MARGIN_RIGHT = 170
+MARGIN_TOP = 50
+MARGIN_BOTTOM = 70
+
+PALETTE = [
+    (66, 133, 244),
+    (219, 68, 55),
+    (244, 180, 0),
+    (15, 157, 88),
+    (171, 71, 188),
+    (0, 172, 193),
+    (255, 112, 67),
+    (158, 157, 36),
+]
+
+
+def render_chart(title, labels, methods, matrix):
+    """버킷(x축) x 거래 방법(누적 막대) 차트"""
+    matrix = np.asarray(matrix, dtype=np.float64).reshape(len(labels), len(methods))
+    image = Image.new('RGB', (WIDTH, HEIGHT), 'white')
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=14)
+
+    draw.text((MARGIN_LEFT, 15), title, fill='black', font=font)
+    plot_width = WIDTH - MARGIN_LEFT - MARGIN_RIGHT
+    plot_height = HEIGHT - MARGIN_TOP - MARGIN_BOTTOM
+    bottom = MARGIN_TOP + plot_height
+    draw.line([(MARGIN_LEFT, MARGIN_TOP), (MARGIN_LEFT, bottom)], fill='black')
+    draw.line([(MARGIN_LEFT, bottom), (WIDTH - MARGIN_RIGHT, bottom)], fill='black')
+
+    totals = matrix.sum(axis=1)
+    peak = float(totals.max()) if totals.size else 0.0
+    if peak <= 0:
+        draw.text(
+            (MARGIN_LEFT + 10, MARGIN_TOP + 10), 'no data', fill='gray', font=font
+        )
+    else:
+        # y축 눈금 5개
+        for step in range(6):
+            value = peak * step / 5
+            y = bottom - plot_height * step / 5
+            draw.line([(MARGIN_LEFT - 4, y), (MARGIN_LEFT, y)], fill='black')
+            draw.text((10, y - 8), f'{value:,.0f}', fill='black', font=font)
+
+        # 막대 위치/높이는 누적합으로 한 번에 계산
+        slot = plot_width / len(labels)
+        bar_width = max(slot * 0.7, 1)
+        tops = np.cumsum(matrix, axis=1) / peak * plot_height
+        bases = tops - matrix / peak * plot_height
+        label_every = max(len(labels) // 12, 1)
+        for i, label in enumerate(labels):
+            x0 = MARGIN_LEFT + slot * i + (slot - bar_width) / 2
+            for j in range(len(methods)):
+                if matrix[i, j] <= 0:
+                    continue
+                draw.rectangle(
+                    [x0, bottom - tops[i, j], x0 + bar_width, bottom - bases[i, j]],
+                    fill=PALETTE[j % len(PALETTE)],
+                )
+            if i % label_every == 0:
+                draw.text((x0, bottom + 8), label, fill='black', font=font)
+
+    for j, method in enumerate(methods):
+        y = MARGIN_TOP + 22 * j
+        x = WIDTH - MARGIN_RIGHT + 20
+        draw.rectangle([x, y, x + 14, y + 14], fill=PALETTE[j % len(PALETTE)])
+        draw.text((x + 22, y), method, fill='black', font=font)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
@@ -0,0 +1,94 @@
+"""
+DB 연결 풀 대기 통계
+
+psycopg 풀 통계(pop_stats)는 워커 프로세스마다 따로 쌓이므로, 요청이 끝날 때
+DB_POOL_STATS_INTERVAL 초에 한 번씩 지난 전송 이후의 증가분을 캐시 카운터에 더해
+모든 워커의 합계를 모은다.
+
+- requests: 풀에서 연결을 꺼낸 횟수
+- queued: 남는 연결이 없어 기다린 횟수
+- wait_ms: 기다린 시간 합계 (ms)
+- timeouts: DB_POOL_TIMEOUT 안에 연결을 얻지 못한 횟수
+- connections / connect_ms: 새로 연 연결 수와 그 시간 합계
+- lost: 상태 확인에서 끊긴 것으로 확인돼 버린 연결 수
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+# 캐시 카운터 이름 -> psycopg 풀 통계 이름
+STATS = {
+    'requests': 'requests_num',
+    'queued': 'requests_queued',
+    'wait_ms': 'requests_wait_ms',
+    'timeouts': 'requests_errors',
+    'connections': 'connections_num',
+    'connect_ms': 'connections_ms',
+    'lost': 'connections_lost',
+}
+
+_flush_lock = threading.Lock()
+_last_flush = {}
+
+
+def counter_key(alias, name):
+    return f'db_pool_stats_{alias}_{name}'
+
+
+def get_pool(alias='default'):
+    """해당 DB 의 psycopg 풀, 풀을 쓰지 않으면 None"""
+    return getattr(connections[alias], 'pool', None)
+
+
+def _add(key, amount):
+    try:
+        cache.incr(key, amount)
+    except ValueError:
+        if not cache.add(key, amount, timeout=None):
+            cache.incr(key, amount)
+
+
+def flush_pool_stats(alias='default', force=False):
+    """이 워커의 풀 통계 증가분을 캐시 카운터에 더함, 전송했으면 True"""
+    pool = get_pool(alias)
+    if pool is None:
+        return False
+    now = time.monotonic()
+    # 스레드 워커에서는 같은 주기에 한 스레드만 전송
+    with _flush_lock:
+        last = _last_flush.get(alias)
+        if not force and last is not None:
+            if now - last < settings.DB_POOL_STATS_INTERVAL:
+                return False
+        _last_flush[alias] = now
+        stats = pool.pop_stats()
+    for name, stat in STATS.items():
+        if stats.get(stat):
+            _add(counter_key(alias, name), stats[stat])
+    return True
+
+
+def flush_on_request_finished(sender, **kwargs):
+    for alias in connections:
+        flush_pool_stats(alias)
+
+
+def get_pool_stats(alias='default'):
+    keys = {name: counter_key(alias, name) for name in STATS}
+    counters = cache.get_many(list(keys.values()))
+    stats = {name: counters.get(key, 0) for name, key in keys.items()}
+    requests = stats['requests']
+    stats['queued_rate'] = stats['queued'] / requests if requests else 0.0
+    stats['avg_wait_ms'] = stats['wait_ms'] / requests if requests else 0.0
+    stats['avg_queued_wait_ms'] = (
+        stats['wait_ms'] / stats['queued'] if stats['queued'] else 0.0
+    )
+    return stats
+
+
+def reset_pool_stats(alias='default'):
+    cache.delete_many([counter_key(alias, name) for name in STATS])
@@ -0,0 +1,90 @@
+import csv
+import io
+import json
+
+from django.utils import timezone
+
+from ..constants import TRANSACTION_METHOD, TRANSACTION_TYPE
+
+# 서버 사이드 커서에서 한 번에 가져올 행 수
+EXPORT_CHUNK_SIZE = 2000
+# 응답 스트림으로 한 번에 내보낼 행 수
+EXPORT_FLUSH_ROWS = 500
+
+EXPORT_FIELDS = [
+    'id',
+    'transaction_amount',
+    'post_transaction_amount',
+    'transaction_details',
+    'transaction_type',
+    'transaction_method',
+    'transaction_timestamp',
+]
+
+# TransactionHistorySerializer 와 같은 컬럼 구성
+EXPORT_COLUMNS = [
+    'id',
+    'transaction_amount',
+    'post_transaction_amount',
+    'transaction_details',
+    'transaction_type',
+    'transaction_type_name',
+    'transaction_method',
+    'transaction_method_name',
+    'transaction_timestamp',
+]
+
+TRANSACTION_TYPE_DICT = dict(TRANSACTION_TYPE)
+TRANSACTION_METHOD_DICT = dict(TRANSACTION_METHOD)
+
+
+def _format_timestamp(value):
+    # DRF DateTimeField 표현과 동일하게 현재 타임존 기준 ISO 8601, UTC는 Z 표기
+    value = timezone.localtime(value).isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+def iter_export_rows(queryset):
+    """직렬화기 인스턴스 없이 values_list + 서버 사이드 커서로 행 튜플 생성"""
+    rows = queryset.values_list(*EXPORT_FIELDS).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    for pk, amount, post_amount, details, t_type, method, timestamp in rows:
+        yield (
+            pk,
+            f'{amount:.2f}',
+            f'{post_amount:.2f}',
+            details,
+            t_type,
+            TRANSACTION_TYPE_DICT.get(t_type, '기타'),
+            method,
+            TRANSACTION_METHOD_DICT.get(method, '기타'),
+            _format_timestamp(timestamp),
+        )
+
+
+def stream_csv(queryset):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+
+    for count, row in enumerate(iter_export_rows(queryset), start=1):
+        writer.writerow(row)
+        if count % EXPORT_FLUSH_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
+
+
+def stream_ndjson(queryset):
+    lines = []
+    for row in iter_export_rows(queryset):
+        lines.append(json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False))
+        if len(lines) == EXPORT_FLUSH_ROWS:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+
+    if lines:
+        yield '\n'.join(lines) + '\n'
@@ -0,0 +1,581 @@
+"""
+거래내역 잔액 체인(post_transaction_amount) 관리
+
+거래는 (transaction_timestamp, id) 순서로 체인을 이루고, 각 행의 거래 후 잔액은
+직전 행의 거래 후 잔액 + 해당 거래 금액(입금 +, 출금 -)이다.
+삽입/수정/삭제 시 영향을 받는 뒤쪽 구간만 한 번의 UPDATE로 평행 이동하고
+Account.balance 도 같은 트랜잭션 안에서 함께 조정한다.
+
+입금 묶음 반영(Account.write_combining) 계좌의 입금은 계좌 행을 공유 잠금만 한 채
+거래내역과 정산 대기 입금(PendingDeposit)만 추가한다. 거래 후 잔액과 잔액은 정산
+(settle_pending) 때 거래 순서대로 한 번에 계산해 계좌 행 UPDATE 한 번으로 반영한다.
+정산은 LEDGER_COMBINE_WINDOW 마다 한 번 입금 커밋 직후에 실행되고, 그 밖의 체인
+변경(출금, 수정, 삭제, 일괄 등록)은 먼저 정산한 뒤 진행한다. 잔액과 거래내역 조회는
+정산하거나 잠그지 않고 대기 입금을 더해 계산한다(with_pending_balance, with_pending_posts).
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import (
+    Case,
+    DecimalField,
+    Exists,
+    F,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.expressions import Col
+from django.db.models.functions import Coalesce
+
+from ..models import Account, PendingDeposit, TransactionHistory
+from .bulk import insert_transactions
+from .cache_tags import account_tag, accounts_tag, invalidate_tags
+from .rollups import apply_rollups, rollup_entry
+from .shards import data_atomic, data_connection, on_commit
+
+# 잔액 체인 계산에 필요한 컬럼
+CHAIN_FIELDS = [
+    'transaction_amount',
+    'post_transaction_amount',
+    'transaction_type',
+    'transaction_timestamp',
+]
+
+
+class InsufficientBalanceError(Exception):
+    # 잔액 부족 - 일괄 등록이면 문제가 된 입력 행 번호(0부터)를 담는다
+
+    def __init__(self, row=None):
+        message = "잔액이 부족합니다."
+        if row is not None:
+            message = f"row {row}: {message}"
+        super().__init__(message)
+        self.row = row
+
+
+def signed_amount(transaction_type, amount):
+    return amount if transaction_type == 'DEPOSIT' else -amount
+
+
+def _lock_account(account_id):
+    # 같은 계좌의 체인 변경은 계좌 행 잠금으로 직렬화
+    return (
+        Account.objects.select_for_update()
+        .values_list('balance', 'user_id', 'write_combining')
+        .get(pk=account_id)
+    )
+
+
+def _lock_balance(account_id):
+    balance, user_id, combining = _lock_account(account_id)
+    # 잔액/거래 후 잔액은 UPDATE 로 바뀌어 시그널이 없으므로 여기서 커밋 후 무효화 예약
+    invalidate_tags(account_tag(account_id), accounts_tag(user_id))
+    if combining:
+        # 대기 입금을 먼저 체인에 반영해야 이후 계산이 맞음
+        balance, _ = _settle_locked(account_id, balance)
+    return balance
+
+
+def _rows_after(account_id, timestamp, pk=None):
+    """(timestamp, pk) 위치 뒤의 체인 구간. pk가 없으면 같은 시각 행은 모두 앞쪽"""
+    after = Q(transaction_timestamp__gt=timestamp)
+    if pk is not None:
+        after |= Q(transaction_timestamp=timestamp, id__gt=pk)
+    return TransactionHistory.objects.filter(
+        after, account_id=account_id, transaction_timestamp__gte=timestamp
+    )
+
+
+def _opening_balance(suffix, balance):
+    """삽입 위치 직전의 잔액 - 뒤 구간 첫 행에서 역산, 뒤 구간이 없으면 현재 잔액"""
+    first = (
+        suffix.order_by('transaction_timestamp', 'id')
+        .values_list(
+            'post_transaction_amount', 'transaction_type', 'transaction_amount'
+        )
+        .first()
+    )
+    if first is None:
+        return balance, False
+    post, transaction_type, amount = first
+    return post - signed_amount(transaction_type, amount), True
+
+
+def _shift(suffix, delta):
+    if delta:
+        suffix.update(post_transaction_amount=F('post_transaction_amount') + delta)
+
+
+def _apply_balance(account_id, delta):
+    if delta:
+        Account.objects.filter(pk=account_id).update(balance=F('balance') + delta)
+
+
+def _returning_supported():
+    # MariaDB 는 INSERT 만 RETURNING 을 지원하므로 PostgreSQL/SQLite(3.35+)만 사용
+    connection = data_connection()
+    return (
+        connection.vendor in ('postgresql', 'sqlite')
+        and connection.features.can_return_columns_from_insert
+    )
+
+
+def _update_balance_returning(account_id, delta):
+    """잔액이 음수가 되지 않을 때만 갱신 -> (새 잔액, user_id), 갱신하지 않았으면 None"""
+    connection = data_connection()
+    quote = connection.ops.quote_name
+    opts = Account._meta
+    balance_field = opts.get_field('balance')
+    table = quote(opts.db_table)
+    pk = quote(opts.pk.column)
+    balance = quote(balance_field.column)
+    user = quote(opts.get_field('user').column)
+    sql = (
+        f'UPDATE {table} SET {balance} = {balance} + %s '
+        f'WHERE {pk} = %s AND {balance} + %s >= 0 '
+        f'RETURNING {balance}, {user}'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [delta, account_id, delta])
+        row = cursor.fetchone()
+    if row is None:
+        return None
+    # ORM 조회와 같은 변환 적용 (SQLite 는 숫자로 반환)
+    value, user_id = row
+    col = Col(Account._meta.db_table, balance_field)
+    for converter in connection.ops.get_db_converters(col):
+        value = converter(value, col, connection)
+    return value, user_id
+
+
+def adjust_balance(account_id, delta):
+    """
+    계좌 잔액에 delta 를 더하고 새 잔액 반환 (잔액이 음수가 되면 InsufficientBalanceError)
+
+    PostgreSQL/SQLite 는 UPDATE ... RETURNING 한 문장으로 행 잠금, 갱신, 새 잔액 조회를
+    처리하고, 그 밖의 DB 는 SELECT ... FOR UPDATE 후 UPDATE 한다.
+    """
+    if settings.LEDGER_UPDATE_RETURNING and _returning_supported():
+        row = _update_balance_returning(account_id, delta)
+        if row is None:
+            if not Account.objects.filter(pk=account_id).exists():
+                raise Account.DoesNotExist("Account matching query does not exist.")
+            raise InsufficientBalanceError()
+        balance, user_id = row
+    else:
+        balance, user_id = (
+            Account.objects.select_for_update()
+            .values_list('balance', 'user_id')
+            .get(pk=account_id)
+        )
+        if balance + delta < 0:
+            raise InsufficientBalanceError()
+        _apply_balance(account_id, delta)
+        balance += delta
+    invalidate_tags(account_tag(account_id), accounts_tag(user_id))
+    return balance
+
+
+def _share_lock(account_id):
+    """계좌 행 공유 잠금 -> (user_id, write_combining)
+
+    입금끼리는 서로 막지 않고, 정산/체인 변경(FOR UPDATE)과만 직렬화된다.
+    """
+    queryset = Account.objects.filter(pk=account_id).values_list(
+        'user_id', 'write_combining'
+    )
+    connection = data_connection()
+    if not connection.features.has_select_for_update:
+        return queryset.get()
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'{sql} FOR SHARE', params)
+        row = cursor.fetchone()
+    if row is None:
+        raise Account.DoesNotExist("Account matching query does not exist.")
+    user_id, combining = row
+    return user_id, bool(combining)
+
+
+def settle_key(account_id):
+    return f'ledger_settle_{account_id}'
+
+
+def _request_settle(account_id):
+    # 묶음 주기마다 처음 커밋된 입금 한 건이 그동안 쌓인 대기 입금을 정산
+    if cache.add(settle_key(account_id), 1, timeout=settings.LEDGER_COMBINE_WINDOW):
+        settle_pending(account_id)
+
+
+def _append_deposit(account, data):
+    """입금 묶음 반영 계좌의 입금 - 거래내역과 대기 입금만 추가, 모드가 꺼져 있으면 None"""
+    user_id, combining = _share_lock(account.pk)
+    if not combining:
+        return None
+
+    # 거래 후 잔액은 정산 때 채움 (조회는 with_pending_posts 로 대기 입금을 더해 계산)
+    row = TransactionHistory.objects.create(
+        account=account, post_transaction_amount=0, **data
+    )
+    PendingDeposit.objects.create(
+        account_id=account.pk,
+        transaction_id=row.pk,
+        transaction_amount=row.transaction_amount,
+        transaction_timestamp=row.transaction_timestamp,
+    )
+    invalidate_tags(account_tag(account.pk), accounts_tag(user_id))
+    # 정산 실패가 이미 커밋된 입금 요청을 실패로 만들지 않도록 robust
+    on_commit(lambda: _request_settle(account.pk), robust=True)
+    return row
+
+
+def _settle_locked(account_id, balance):
+    """
+    잠긴 계좌의 대기 입금 정산 -> (새 잔액, 정산 건수)
+
+    가장 이른 대기 입금 시각 이후 구간을 (거래 시간, id) 순서로 다시 흘려 거래 후 잔액을
+    계산한다. 대기 입금이 모두 최신 행이면 바뀌는 행은 대기 입금뿐이다.
+    """
+    pending = list(
+        PendingDeposit.objects.filter(account_id=account_id).values_list(
+            'id', 'transaction_id', 'transaction_timestamp'
+        )
+    )
+    if not pending:
+        return balance, 0
+    pending_ids = {transaction_id for _, transaction_id, _ in pending}
+
+    window = list(
+        TransactionHistory.objects.filter(
+            account_id=account_id,
+            transaction_timestamp__gte=min(timestamp for _, _, timestamp in pending),
+        )
+        .order_by('transaction_timestamp', 'id')
+        .only('id', 'transaction_method', *CHAIN_FIELDS)
+    )
+    # 구간 시작 직전 잔액 = 현재 잔액 - 구간 안의 정산된 거래 효과
+    running = balance
+    for row in window:
+        if row.pk not in pending_ids:
+            running -= signed_amount(row.transaction_type, row.transaction_amount)
+
+    changed = []
+    added = []
+    for row in window:
+        running += signed_amount(row.transaction_type, row.transaction_amount)
+        if row.pk in pending_ids:
+            added.append(rollup_entry(row))
+        if row.post_transaction_amount != running:
+            row.post_transaction_amount = running
+            changed.append(row)
+
+    if changed:
+        TransactionHistory.objects.bulk_update(
+            changed, ['post_transaction_amount'], batch_size=1000
+        )
+    _apply_balance(account_id, running - balance)
+    PendingDeposit.objects.filter(id__in=[pk for pk, _, _ in pending]).delete()
+    apply_rollups(account_id, added=added)
+    return running, len(pending)
+
+
+@data_atomic
+def settle_pending(account_id):
+    """계좌의 대기 입금을 잔액과 거래 후 잔액에 반영 -> 정산 건수"""
+    try:
+        balance, user_id, _ = _lock_account(account_id)
+    except Account.DoesNotExist:
+        return 0
+    _, settled = _settle_locked(account_id, balance)
+    if settled:
+        invalidate_tags(account_tag(account_id), accounts_tag(user_id))
+    return settled
+
+
+def settle_accounts(accounts=None):
+    """대기 입금이 있는 계좌들을 정산 (accounts 가 None 이면 전체) -> 정산 건수"""
+    pending = PendingDeposit.objects.all()
+    if accounts is not None:
+        pending = pending.filter(account__in=accounts)
+    account_ids = list(pending.values_list('account_id', flat=True).distinct())
+    return sum(settle_pending(account_id) for account_id in account_ids)
+
+
+@data_atomic
+def set_write_combining(account_id, enabled):
+    """입금 묶음 반영 모드 변경 - 끄기 전에 대기 입금을 모두 정산"""
+    _, user_id, _ = _lock_account(account_id)
+    if not enabled:
+        settle_pending(account_id)
+    Account.objects.filter(pk=account_id).update(write_combining=enabled)
+    invalidate_tags(account_tag(account_id), accounts_tag(user_id))
+
+
+def with_pending_balance(queryset):
+    """계좌 조회에 정산 대기 입금 합계(pending_total)를 함께 읽음
+
+    같은 문장 안에서 읽으므로 조회 도중 정산이 끝나도 잔액과 어긋나지 않는다.
+    """
+    pending = (
+        PendingDeposit.objects.filter(account=OuterRef('pk'))
+        .order_by()
+        .values('account')
+        .annotate(total=Sum('transaction_amount'))
+        .values('total')
+    )
+    return queryset.annotate(
+        pending_total=Case(
+            When(write_combining=True, then=Subquery(pending)),
+            output_field=DecimalField(max_digits=17, decimal_places=2),
+        )
+    )
+
+
+def fold_pending(account):
+    """with_pending_balance 로 읽은 계좌의 잔액에 정산 대기 입금을 더함"""
+    pending = getattr(account, 'pending_total', None)
+    if pending:
+        account.balance += pending
+    return account
+
+
+def _chain_before(id_lookup):
+    """체인 순서((거래 시간, id))가 바깥 거래보다 앞선 행 조건 (같은 시각은 id_lookup 비교)"""
+    return Q(transaction_timestamp__lt=OuterRef('transaction_timestamp')) | Q(
+        transaction_timestamp=OuterRef('transaction_timestamp'),
+        **{id_lookup: OuterRef('pk')},
+    )
+
+
+def with_pending_posts(queryset):
+    """거래내역 조회에 정산 대기 입금을 반영한 거래 후 잔액(pending_post)을 함께 읽음
+
+    정산된 행은 저장된 값 + 그 행까지의 대기 입금 합계, 대기 입금 행은 직전 정산된 행의
+    값 + 그 행까지의 대기 입금 합계다. 같은 문장 안에서 읽으므로 조회 도중 정산이 끝나도
+    어긋나지 않고, 계좌 행을 잠그지 않아 입금과 서로 막지 않는다.
+    """
+    amount = DecimalField(max_digits=17, decimal_places=2)
+    zero = Value(0, output_field=amount)
+    pending_until = (
+        PendingDeposit.objects.filter(account_id=OuterRef('account_id'))
+        .filter(_chain_before('transaction_id__lte'))
+        .order_by()
+        .values('account_id')
+        .annotate(total=Sum('transaction_amount'))
+        .values('total')
+    )
+    settled_before = (
+        TransactionHistory.objects.filter(account_id=OuterRef('account_id'))
+        .filter(_chain_before('id__lt'))
+        .filter(~Exists(PendingDeposit.objects.filter(transaction_id=OuterRef('pk'))))
+        .order_by('-transaction_timestamp', '-id')
+        .values('post_transaction_amount')[:1]
+    )
+    return queryset.annotate(
+        pending_post=Case(
+            When(
+                Exists(PendingDeposit.objects.filter(transaction_id=OuterRef('pk'))),
+                then=Coalesce(Subquery(settled_before), zero),
+            ),
+            default=F('post_transaction_amount'),
+            output_field=amount,
+        )
+        + Coalesce(Subquery(pending_until), zero)
+    )
+
+
+def fold_pending_post(row):
+    """with_pending_posts 로 읽은 거래의 거래 후 잔액을 대기 입금 반영 값으로 바꿈"""
+    pending_post = getattr(row, 'pending_post', None)
+    if pending_post is not None:
+        row.post_transaction_amount = pending_post
+    return row
+
+
+def _ensure_non_negative(suffix):
+    if suffix.filter(post_transaction_amount__lt=0).exists():
+        raise InsufficientBalanceError()
+
+
+@data_atomic
+def record_transaction(account, data):
+    """거래 1건 삽입 - 과거 시각 삽입이면 뒤 구간을 한 번에 평행 이동"""
+    timestamp = data['transaction_timestamp']
+    delta = signed_amount(data['transaction_type'], data['transaction_amount'])
+    if account.write_combining:
+        if delta > 0:
+            row = _append_deposit(account, data)
+            if row is not None:
+                return row
+        else:
+            # 출금은 대기 입금을 정산한 뒤 기존 경로로 처리
+            _lock_balance(account.pk)
+    # 잔액 갱신이 계좌 행 잠금을 겸함 - 이후 체인 계산은 잠금 안에서 진행
+    balance = adjust_balance(account.pk, delta)
+
+    suffix = _rows_after(account.pk, timestamp)
+    opening, backdated = _opening_balance(suffix, balance - delta)
+    post = opening + delta
+    if post < 0:
+        raise InsufficientBalanceError()
+
+    if backdated:
+        _shift(suffix, delta)
+        if delta < 0:
+            _ensure_non_negative(suffix)
+
+    row = TransactionHistory.objects.create(
+        account=account, post_transaction_amount=post, **data
+    )
+    apply_rollups(account.pk, added=[rollup_entry(row)])
+    account.balance = balance
+    return row
+
+
+@data_atomic
+def update_transaction(instance, data):
+    """거래 수정 - 기존 위치에서 효과를 빼고 새 위치에 다시 반영"""
+    account_id = instance.account_id
+    balance = _lock_balance(account_id)
+    # 캐시된 인스턴스일 수 있으므로 잠금 이후의 값으로 다시 읽음
+    instance.refresh_from_db(fields=[*CHAIN_FIELDS, 'transaction_method'])
+    previous = rollup_entry(instance)
+    old_timestamp = instance.transaction_timestamp
+    old_delta = signed_amount(instance.transaction_type, instance.transaction_amount)
+
+    for field, value in data.items():
+        setattr(instance, field, value)
+    new_timestamp = instance.transaction_timestamp
+    new_delta = signed_amount(instance.transaction_type, instance.transaction_amount)
+
+    if new_timestamp == old_timestamp:
+        # 위치가 그대로면 자기 자신과 뒤 구간을 차액만큼 한 번에 이동
+        suffix = _rows_after(account_id, old_timestamp, instance.pk)
+        _shift(suffix, new_delta - old_delta)
+        instance.post_transaction_amount += new_delta - old_delta
+        check_from = suffix
+    else:
+        _shift(_rows_after(account_id, old_timestamp, instance.pk), -old_delta)
+        suffix = _rows_after(account_id, new_timestamp, instance.pk).exclude(
+            pk=instance.pk
+        )
+        opening, _ = _opening_balance(suffix, balance - old_delta)
+        _shift(suffix, new_delta)
+        instance.post_transaction_amount = opening + new_delta
+        # 이전/새 위치 중 앞선 시각 이후가 영향 구간
+        check_from = TransactionHistory.objects.filter(
+            account_id=account_id,
+            transaction_timestamp__gte=min(old_timestamp, new_timestamp),
+        ).exclude(pk=instance.pk)
+
+    if instance.post_transaction_amount < 0 or balance - old_delta + new_delta < 0:
+        raise InsufficientBalanceError()
+    if new_delta < old_delta or new_timestamp != old_timestamp:
+        _ensure_non_negative(check_from)
+
+    instance.save()
+    _apply_balance(account_id, new_delta - old_delta)
+    apply_rollups(account_id, added=[rollup_entry(instance)], removed=[previous])
+    return instance
+
+
+@data_atomic
+def delete_transaction(instance):
+    """거래 삭제 - 뒤 구간과 잔액에서 해당 거래 효과를 제거"""
+    account_id = instance.account_id
+    balance = _lock_balance(account_id)
+    instance.refresh_from_db(fields=[*CHAIN_FIELDS, 'transaction_method'])
+    delta = -signed_amount(instance.transaction_type, instance.transaction_amount)
+    if balance + delta < 0:
+        raise InsufficientBalanceError()
+
+    suffix = _rows_after(account_id, instance.transaction_timestamp, instance.pk)
+    _shift(suffix, delta)
+    if delta < 0:
+        _ensure_non_negative(suffix)
+
+    instance.delete()
+    _apply_balance(account_id, delta)
+    apply_rollups(account_id, removed=[rollup_entry(instance)])
+
+
+@data_atomic
+def record_batch(account, items):
+    """
+    거래 여러 건 일괄 삽입
+
+    items 는 (입력 행 번호, validated_data) 목록. 거래 시간 순으로 메모리에서
+    거래 후 잔액을 계산하고, 과거 시각 행이 있으면 기존 뒤 구간도 함께 보정한다.
+    """
+    balance = _lock_balance(account.pk)
+    ordered = sorted(items, key=lambda item: item[1]['transaction_timestamp'])
+    first_timestamp = ordered[0][1]['transaction_timestamp']
+
+    # 같은 시각의 기존 행은 새 행보다 앞(id가 작음)이므로 이후 시각만 보정 대상
+    existing = list(
+        _rows_after(account.pk, first_timestamp)
+        .order_by('transaction_timestamp', 'id')
+        .only('id', *CHAIN_FIELDS)
+    )
+    if existing:
+        first = existing[0]
+        running = first.post_transaction_amount - signed_amount(
+            first.transaction_type, first.transaction_amount
+        )
+    else:
+        running = balance
+
+    rows = []
+    shifted = []
+    offset = 0
+    last_withdraw_row = None
+    position = 0
+    for index, data in ordered:
+        # 이 행보다 앞선 기존 행들을 먼저 흘려보냄
+        while (
+            position < len(existing)
+            and existing[position].transaction_timestamp
+            <= data['transaction_timestamp']
+        ):
+            row = existing[position]
+            running = row.post_transaction_amount + offset
+            if offset:
+                if running < 0 and offset < 0:
+                    raise InsufficientBalanceError(last_withdraw_row)
+                row.post_transaction_amount = running
+                shifted.append(row)
+            position += 1
+
+        delta = signed_amount(data['transaction_type'], data['transaction_amount'])
+        if delta < 0:
+            last_withdraw_row = index
+        running += delta
+        offset += delta
+        if running < 0:
+            raise InsufficientBalanceError(index)
+        rows.append(
+            TransactionHistory(
+                account_id=account.pk, post_transaction_amount=running, **data
+            )
+        )
+
+    for row in existing[position:]:
+        if offset:
+            row.post_transaction_amount += offset
+            if row.post_transaction_amount < 0 and offset < 0:
+                raise InsufficientBalanceError(last_withdraw_row)
+            shifted.append(row)
+
+    if shifted:
+        TransactionHistory.objects.bulk_update(
+            shifted, ['post_transaction_amount'], batch_size=1000
+        )
+    insert_transactions(rows)
+    _apply_balance(account.pk, offset)
+    apply_rollups(account.pk, added=[rollup_entry(row) for row in rows])
+    account.balance = balance + offset
+    return rows
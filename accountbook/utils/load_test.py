@@ -0,0 +1,121 @@
+"""
+HTTP 부하 측정 도구 (벤치마크 명령용)
+
+서버를 하위 프로세스로 띄우고, fork 한 클라이언트 프로세스들이 정해진 시간 동안
+매 요청 새 연결로 GET 을 보내 응답 시간을 모은다.
+"""
+
+import contextlib
+import http.client
+import multiprocessing
+import os
+import signal
+import statistics
+import subprocess
+import time
+
+from django.conf import settings
+from django.core.management.base import CommandError
+
+HOST = '127.0.0.1'
+
+
+def request(port, path, headers):
+    connection = http.client.HTTPConnection(HOST, port, timeout=30)
+    try:
+        connection.request('GET', path, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        return response.status
+    finally:
+        connection.close()
+
+
+def wait_until_ready(port, path, headers, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if request(port, path, headers) == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise CommandError("서버가 시작되지 않았습니다.")
+
+
+@contextlib.contextmanager
+def running_server(command, port, path, headers, env=None):
+    """서버 하위 프로세스를 띄워 응답할 때까지 기다리고, 끝나면 워커까지 함께 종료"""
+    server = subprocess.Popen(
+        command,
+        env={
+            **os.environ,
+            'DJANGO_SETTINGS_MODULE': settings.SETTINGS_MODULE,
+            **(env or {}),
+        },
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    try:
+        wait_until_ready(port, path, headers)
+        yield server
+    finally:
+        # serve 는 SIGTERM 으로 정상 종료
+        os.killpg(server.pid, signal.SIGTERM)
+        server.wait(timeout=60)
+
+
+def _client(port, path, headers, duration, barrier, results):
+    """클라이언트 프로세스 - 매 요청 새 연결로 duration 초 동안 요청"""
+    timings = []
+    errors = 0
+    barrier.wait()
+    deadline = time.perf_counter() + duration
+    while True:
+        started = time.perf_counter()
+        if started >= deadline:
+            break
+        try:
+            status = request(port, path, headers)
+        except OSError:
+            status = None
+        if status == 200:
+            timings.append((time.perf_counter() - started) * 1000)
+        else:
+            errors += 1
+    results.put((timings, errors))
+
+
+def run_load(port, path, headers, clients, duration):
+    """(성공 요청 수, 오류 수, 소요 시간(ms) 목록)"""
+    context = multiprocessing.get_context('fork')
+    barrier = context.Barrier(clients)
+    results = context.Queue()
+    processes = [
+        context.Process(
+            target=_client, args=(port, path, headers, duration, barrier, results)
+        )
+        for _ in range(clients)
+    ]
+    for process in processes:
+        process.start()
+    timings = []
+    errors = 0
+    for _ in processes:
+        process_timings, process_errors = results.get()
+        timings.extend(process_timings)
+        errors += process_errors
+    for process in processes:
+        process.join()
+    return len(timings), errors, timings
+
+
+def summarize(label, requests, errors, timings, duration):
+    """결과 한 줄 (처리량, p50, p99, 오류 수)"""
+    percentiles = statistics.quantiles(timings, n=100)
+    return (
+        f"{label} {requests / duration:8.0f} req/s  "
+        f"p50 {percentiles[49]:7.2f}ms  p99 {percentiles[98]:7.2f}ms  "
+        f"오류 {errors}"
+    )
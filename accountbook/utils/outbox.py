@@ -0,0 +1,114 @@
+"""
+메일 발송 대기열(outbox)
+
+요청 처리 중에는 EmailOutbox 행만 INSERT 하므로 메일은 요청 트랜잭션이 커밋될 때
+함께 확정되고(롤백되면 사라짐), SMTP 왕복은 send_outbox_emails 워커가 맡는다.
+워커는 대상 행을 임대(lease)한 뒤 트랜잭션 밖에서 하나의 SMTP 연결로 일괄 발송한다.
+"""
+
+import logging
+import smtplib
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from ..models import EmailOutbox
+
+logger = logging.getLogger('accountbook.outbox')
+
+
+def enqueue_email(to_email, subject, body):
+    """발송 대기열에 메일 추가 - 호출한 트랜잭션과 함께 커밋된다"""
+    return EmailOutbox.objects.create(to_email=to_email, subject=subject, body=body)
+
+
+def retry_delay(attempts):
+    """지수 백오프 (기본 30초, 60초, 120초 ... 최대 1시간)"""
+    return timedelta(
+        seconds=min(settings.EMAIL_OUTBOX_RETRY_BASE * 2 ** (attempts - 1), 60 * 60)
+    )
+
+
+@transaction.atomic
+def claim_batch(batch_size):
+    """
+    발송 대상 행 임대
+
+    잠긴 행은 건너뛰므로(SKIP LOCKED) 워커를 여러 개 띄워도 같은 메일을 보내지 않는다.
+    임대 시간 동안 next_attempt_at 을 미뤄 두어 워커가 중간에 죽어도 나중에 다시 발송된다.
+    """
+    now = timezone.now()
+    rows = list(
+        EmailOutbox.objects.select_for_update(skip_locked=True)
+        .filter(status='PENDING', next_attempt_at__lte=now)
+        .order_by('next_attempt_at', 'id')[:batch_size]
+    )
+    if rows:
+        EmailOutbox.objects.filter(pk__in=[row.pk for row in rows]).update(
+            next_attempt_at=now + timedelta(seconds=settings.EMAIL_OUTBOX_LEASE)
+        )
+    return rows
+
+
+def _mark_sent(row):
+    EmailOutbox.objects.filter(pk=row.pk).update(
+        status='SENT', attempts=row.attempts + 1, sent_at=timezone.now(), last_error=''
+    )
+
+
+def _mark_failed(row, error):
+    attempts = row.attempts + 1
+    if attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+        status, next_attempt_at = 'FAILED', timezone.now()
+        logger.error(f"Outbox email {row.pk} to {row.to_email} gave up: {error}")
+    else:
+        status, next_attempt_at = 'PENDING', timezone.now() + retry_delay(attempts)
+        logger.warning(f"Outbox email {row.pk} failed (attempt {attempts}): {error}")
+    EmailOutbox.objects.filter(pk=row.pk).update(
+        status=status,
+        attempts=attempts,
+        next_attempt_at=next_attempt_at,
+        last_error=str(error)[:1000],
+    )
+
+
+def send_batch(batch_size=100, connection=None):
+    """대기 메일 한 묶음 발송 - (발송 건수, 실패 건수)"""
+    rows = claim_batch(batch_size)
+    if not rows:
+        return 0, 0
+
+    connection = connection or get_connection()
+    sent = failed = 0
+    try:
+        # 묶음 전체에서 SMTP 연결(및 TLS/로그인) 한 번만 수립
+        connection.open()
+        for row in rows:
+            message = EmailMessage(
+                row.subject, row.body, to=[row.to_email], connection=connection
+            )
+            try:
+                try:
+                    message.send()
+                except smtplib.SMTPServerDisconnected:
+                    # 서버가 연결을 끊었으면 한 번만 다시 연결해 재시도
+                    connection.close()
+                    connection.open()
+                    message.send()
+            except Exception as e:
+                _mark_failed(row, e)
+                failed += 1
+            else:
+                _mark_sent(row)
+                sent += 1
+    except Exception as e:
+        # 연결 자체 실패 - 아직 처리하지 못한 행은 모두 재시도 대상
+        for row in rows[sent + failed :]:
+            _mark_failed(row, e)
+            failed += 1
+    finally:
+        connection.close()
+    return sent, failed
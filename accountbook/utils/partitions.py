@@ -0,0 +1,182 @@
+"""
+transaction_history 월별 범위 파티션 관리 (PostgreSQL 전용)
+
+부모 테이블은 transaction_timestamp 기준 RANGE 파티션이고, 각 월은
+transaction_history_yYYYYmMM 파티션에 저장된다. 미리 만들지 못한 월의 행은
+transaction_history_default 에 쌓였다가 해당 월 파티션을 만들 때 옮겨진다.
+샤딩을 켜면 DB(샤드)마다 따로 관리하며, 아래 함수들은 현재 샤드의 연결
+(data_connection())에 적용된다.
+"""
+
+from datetime import date, datetime, timezone
+
+from .shards import data_atomic, data_connection
+
+PARENT_TABLE = 'transaction_history'
+DEFAULT_PARTITION = f'{PARENT_TABLE}_default'
+ARCHIVE_SCHEMA = 'archive'
+
+
+class PartitioningNotSupported(Exception):
+    pass
+
+
+def month_start(value):
+    return date(value.year, value.month, 1)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f'{PARENT_TABLE}_y{month.year:04d}m{month.month:02d}'
+
+
+def _bound(month):
+    # 파티션 경계는 UTC 월 경계
+    return datetime(month.year, month.month, 1, tzinfo=timezone.utc).isoformat()
+
+
+def _quote(name):
+    return data_connection().ops.quote_name(name)
+
+
+def ensure_postgresql():
+    if data_connection().vendor != 'postgresql':
+        raise PartitioningNotSupported("파티션 관리는 PostgreSQL에서만 지원합니다.")
+
+
+def is_partitioned(cursor):
+    cursor.execute(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+        "WHERE partrelid = to_regclass(%s))",
+        [PARENT_TABLE],
+    )
+    return cursor.fetchone()[0]
+
+
+def list_partitions(cursor):
+    """부모 테이블에 붙어 있는 파티션 (이름, 경계 표현식) 목록"""
+    cursor.execute(
+        "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+        "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = to_regclass(%s) ORDER BY c.relname",
+        [PARENT_TABLE],
+    )
+    return cursor.fetchall()
+
+
+def _partition_exists(cursor, name):
+    return any(relname == name for relname, _ in list_partitions(cursor))
+
+
+def create_partition_sql(month):
+    return (
+        f"CREATE TABLE IF NOT EXISTS {_quote(partition_name(month))} "
+        f"PARTITION OF {_quote(PARENT_TABLE)} "
+        f"FOR VALUES FROM ('{_bound(month)}') TO ('{_bound(add_months(month, 1))}')"
+    )
+
+
+@data_atomic
+def ensure_partition(month):
+    """
+    월 파티션 생성 - 이미 있으면 False
+
+    기본 파티션에 해당 월 행이 있으면 그대로 CREATE ... PARTITION OF 가 실패하므로
+    빈 테이블을 만들어 행을 옮긴 뒤 ATTACH 한다.
+    """
+    ensure_postgresql()
+    month = month_start(month)
+    name = partition_name(month)
+    lower, upper = _bound(month), _bound(add_months(month, 1))
+    with data_connection().cursor() as cursor:
+        if _partition_exists(cursor, name):
+            return False
+
+        cursor.execute(f"LOCK TABLE {_quote(PARENT_TABLE)} IN SHARE ROW EXCLUSIVE MODE")
+        cursor.execute(
+            f"SELECT EXISTS (SELECT 1 FROM {_quote(DEFAULT_PARTITION)} "
+            "WHERE transaction_timestamp >= %s AND transaction_timestamp < %s)",
+            [lower, upper],
+        )
+        if not cursor.fetchone()[0]:
+            cursor.execute(create_partition_sql(month))
+            return True
+
+        cursor.execute(
+            f"CREATE TABLE {_quote(name)} "
+            f"(LIKE {_quote(PARENT_TABLE)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {_quote(DEFAULT_PARTITION)} "
+            "WHERE transaction_timestamp >= %s AND transaction_timestamp < %s "
+            f"RETURNING *) INSERT INTO {_quote(name)} SELECT * FROM moved",
+            [lower, upper],
+        )
+        cursor.execute(
+            f"ALTER TABLE {_quote(PARENT_TABLE)} ATTACH PARTITION {_quote(name)} "
+            f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+        )
+    return True
+
+
+def create_future_partitions(months_ahead, start=None):
+    """이번 달(또는 start)부터 months_ahead 개월 뒤까지 파티션을 미리 생성"""
+    first = month_start(start or datetime.now(timezone.utc))
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(first, offset)
+        if ensure_partition(month):
+            created.append(partition_name(month))
+    return created
+
+
+def monthly_partitions_before(cursor, month):
+    """month 이전 월의 파티션 이름 목록 (기본 파티션 제외)"""
+    cutoff = partition_name(month_start(month))
+    prefix = f'{PARENT_TABLE}_y'
+    return [
+        relname
+        for relname, _ in list_partitions(cursor)
+        if relname.startswith(prefix) and relname < cutoff
+    ]
+
+
+def detach_partition(name, archive_schema=ARCHIVE_SCHEMA, drop=False):
+    """
+    파티션 분리 - 분리된 테이블은 archive 스키마로 옮기거나 삭제
+
+    분리 후에는 목록/상세 조회와 잔액 체인 계산 대상에서 빠진다.
+    """
+    ensure_postgresql()
+    with data_atomic(), data_connection().cursor() as cursor:
+        cursor.execute(
+            f"ALTER TABLE {_quote(PARENT_TABLE)} DETACH PARTITION {_quote(name)}"
+        )
+        if drop:
+            cursor.execute(f"DROP TABLE {_quote(name)}")
+            return None
+        cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {_quote(archive_schema)}")
+        cursor.execute(
+            f"ALTER TABLE {_quote(name)} SET SCHEMA {_quote(archive_schema)}"
+        )
+    return f'{archive_schema}.{name}'
+
+
+def copy_partition_to(name, stream, schema='public'):
+    """파티션(또는 보관 테이블) 전체를 CSV로 내보내기 - 삭제 전 백업용"""
+    ensure_postgresql()
+    sql = f"COPY {_quote(schema)}.{_quote(name)} TO STDOUT WITH (FORMAT csv, HEADER)"
+    with data_connection().cursor() as cursor:
+        raw_cursor = cursor.cursor
+        if hasattr(raw_cursor, 'copy_expert'):
+            # psycopg2
+            raw_cursor.copy_expert(sql, stream)
+        else:
+            # psycopg 3
+            with raw_cursor.copy(sql) as copy:
+                for data in copy:
+                    stream.write(bytes(data))
@@ -0,0 +1,271 @@
+"""
+요청 속도 제한
+
+카운터 증가와 한도 판단을 백엔드 연산 한 번(Redis 는 Lua 스크립트)으로 처리하므로
+cache.get -> cache.set 방식처럼 동시 요청이 같은 값을 읽고 한도를 넘어가는 일이 없다.
+
+- 고정 윈도우: INCR + 첫 증가 시 PEXPIRE
+- 슬라이딩 윈도우: 요청 시각 로그(ZSET)에서 윈도우 밖 항목 제거 후 개수 판단
+
+백엔드는 Redis(운영)와 프로세스 메모리(테스트/단일 프로세스) 두 가지이다.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import namedtuple
+from functools import wraps
+
+from django.conf import settings
+from rest_framework import status
+from rest_framework.response import Response
+
+logger = logging.getLogger('accountbook.rate_limit')
+
+FIXED_WINDOW = 'fixed'
+SLIDING_WINDOW = 'sliding'
+
+RATE_UNITS = {'s': 1, 'm': 60, 'h': 60 * 60, 'd': 60 * 60 * 24}
+
+# allowed: 허용 여부, count: 윈도우 내 요청 수, retry_after: 다시 시도 가능까지 초,
+# token: 환불(refund) 시 필요한 식별자 (슬라이딩 윈도우)
+RateLimitResult = namedtuple(
+    'RateLimitResult', ['allowed', 'count', 'limit', 'retry_after', 'token']
+)
+
+
+def parse_rate(rate):
+    """'5/5m' -> (5, 300), '10/h' -> (10, 3600)"""
+    count, period = rate.split('/')
+    multiplier = period[:-1] or '1'
+    return int(count), int(multiplier) * RATE_UNITS[period[-1]]
+
+
+FIXED_WINDOW_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if redis.call('PTTL', KEYS[1]) < 0 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[1])
+end
+return {count, redis.call('PTTL', KEYS[1])}
+"""
+
+FIXED_REFUND_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('DECR', KEYS[1])
+end
+return 0
+"""
+
+SLIDING_WINDOW_SCRIPT = """
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now_ms - window)
+local count = redis.call('ZCARD', KEYS[1])
+if count < limit then
+    redis.call('ZADD', KEYS[1], now_ms, ARGV[3])
+    redis.call('PEXPIRE', KEYS[1], window)
+    return {1, count + 1, 0}
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return {0, count, tonumber(oldest[2]) + window - now_ms}
+"""
+
+
+class RedisBackend:
+    def _client(self):
+        from django_redis import get_redis_connection
+
+        return get_redis_connection('default')
+
+    def fixed_hit(self, key, limit, window):
+        count, ttl_ms = self._client().eval(FIXED_WINDOW_SCRIPT, 1, key, window * 1000)
+        retry_after = max(ttl_ms, 0) / 1000 if count > limit else 0
+        return RateLimitResult(count <= limit, count, limit, retry_after, None)
+
+    def fixed_refund(self, key, token):
+        self._client().eval(FIXED_REFUND_SCRIPT, 1, key)
+
+    def sliding_hit(self, key, limit, window):
+        token = uuid.uuid4().hex
+        allowed, count, wait_ms = self._client().eval(
+            SLIDING_WINDOW_SCRIPT, 1, key, window * 1000, limit, token
+        )
+        return RateLimitResult(
+            bool(allowed), count, limit, max(wait_ms, 0) / 1000, token
+        )
+
+    def sliding_refund(self, key, token):
+        self._client().zrem(key, token)
+
+    def reset(self, key):
+        self._client().delete(key)
+
+
+class MemoryBackend:
+    """프로세스 메모리 백엔드 - 잠금 하나로 판단과 기록을 원자적으로 처리"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._logs = {}
+
+    def fixed_hit(self, key, limit, window):
+        now = time.monotonic()
+        with self._lock:
+            count, expires_at = self._counters.get(key, (0, 0))
+            if expires_at <= now:
+                count, expires_at = 0, now + window
+            count += 1
+            self._counters[key] = (count, expires_at)
+        retry_after = expires_at - now if count > limit else 0
+        return RateLimitResult(count <= limit, count, limit, retry_after, None)
+
+    def fixed_refund(self, key, token):
+        with self._lock:
+            if key in self._counters:
+                count, expires_at = self._counters[key]
+                self._counters[key] = (count - 1, expires_at)
+
+    def sliding_hit(self, key, limit, window):
+        now = time.monotonic()
+        token = uuid.uuid4().hex
+        with self._lock:
+            log = [
+                entry for entry in self._logs.get(key, []) if entry[0] > now - window
+            ]
+            if len(log) < limit:
+                log.append((now, token))
+                self._logs[key] = log
+                return RateLimitResult(True, len(log), limit, 0, token)
+            self._logs[key] = log
+            return RateLimitResult(
+                False, len(log), limit, log[0][0] + window - now, None
+            )
+
+    def sliding_refund(self, key, token):
+        with self._lock:
+            self._logs[key] = [
+                entry for entry in self._logs.get(key, []) if entry[1] != token
+            ]
+
+    def reset(self, key):
+        with self._lock:
+            self._counters.pop(key, None)
+            self._logs.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._counters.clear()
+            self._logs.clear()
+
+
+_redis_backend = RedisBackend()
+memory_backend = MemoryBackend()
+
+
+def get_backend():
+    """RATE_LIMIT_BACKEND (redis/memory), 비어 있으면 기본 캐시가 Redis 일 때만 redis"""
+    name = settings.RATE_LIMIT_BACKEND
+    if not name:
+        cache_backend = settings.CACHES['default']['BACKEND']
+        name = 'redis' if cache_backend.startswith('django_redis') else 'memory'
+    return _redis_backend if name == 'redis' else memory_backend
+
+
+class RateLimiter:
+    def __init__(self, scope, limit, window, algorithm=FIXED_WINDOW, backend=None):
+        self.scope = scope
+        self.limit = limit
+        self.window = window
+        self.algorithm = algorithm
+        self.backend = backend or get_backend()
+
+    @classmethod
+    def for_scope(cls, scope, algorithm=FIXED_WINDOW, backend=None):
+        """settings.RATE_LIMITS[scope] 의 한도로 생성"""
+        limit, window = parse_rate(settings.RATE_LIMITS[scope])
+        return cls(scope, limit, window, algorithm=algorithm, backend=backend)
+
+    def _key(self, ident):
+        return f'ratelimit:{self.scope}:{self.algorithm}:{ident}'
+
+    def hit(self, ident):
+        """요청 1회 기록 + 허용 여부 판단"""
+        if self.algorithm == SLIDING_WINDOW:
+            return self.backend.sliding_hit(self._key(ident), self.limit, self.window)
+        return self.backend.fixed_hit(self._key(ident), self.limit, self.window)
+
+    def refund(self, ident, result):
+        """허용된 hit 를 한도에 세지 않도록 되돌림"""
+        if not result.allowed:
+            return
+        if self.algorithm == SLIDING_WINDOW:
+            self.backend.sliding_refund(self._key(ident), result.token)
+        else:
+            self.backend.fixed_refund(self._key(ident), result.token)
+
+    def reset(self, ident):
+        self.backend.reset(self._key(ident))
+
+
+def get_client_ip(request):
+    """클라이언트 IP 주소 추출"""
+    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+    if x_forwarded_for:
+        return x_forwarded_for.split(',')[0].strip()
+    return request.META.get('REMOTE_ADDR')
+
+
+def rate_limited_response(message, result):
+    response = Response({"message": message}, status=status.HTTP_429_TOO_MANY_REQUESTS)
+    response['Retry-After'] = str(max(int(result.retry_after + 0.999), 1))
+    return response
+
+
+def rate_limit(
+    scope,
+    key=get_client_ip,
+    message="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+    algorithm=FIXED_WINDOW,
+    count_if=None,
+    reset_if=None,
+):
+    """
+    APIView 메서드용 속도 제한 데코레이터
+
+    key(request) 가 None 이면 제한하지 않는다. 요청 전에 한도를 먼저 차감하고,
+    count_if(response) 가 거짓이면 차감을 되돌리며 reset_if(response) 가 참이면 초기화한다.
+    (예: 성공한 가입만 세기, 실패한 로그인만 세고 성공하면 초기화)
+    """
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            ident = key(request)
+            if ident is None:
+                return view_method(self, request, *args, **kwargs)
+
+            limiter = RateLimiter.for_scope(scope, algorithm=algorithm)
+            result = limiter.hit(ident)
+            if not result.allowed:
+                logger.warning(f"Rate limit exceeded: {scope} {ident}")
+                return rate_limited_response(message, result)
+
+            try:
+                response = view_method(self, request, *args, **kwargs)
+            except Exception:
+                if count_if is not None:
+                    limiter.refund(ident, result)
+                raise
+            if reset_if is not None and reset_if(response):
+                limiter.reset(ident)
+            elif count_if is not None and not count_if(response):
+                limiter.refund(ident, result)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,170 @@
+"""
+읽기 복제본 선택
+
+복제본은 요청을 처리하는 동안에만 쓴다. ReplicaRoutingMiddleware 가 안전한 메서드
+(GET/HEAD/OPTIONS) 요청에 RoutingState 를 두면 라우터가 읽기를 복제본으로 보내고,
+다음 경우에는 기본 DB 를 읽는다.
+
+- 같은 요청에서 이미 쓰기가 있었거나 기본 DB 트랜잭션 안인 경우
+- 최근에 쓰기를 한 클라이언트(쿠키)나 사용자(캐시) - REPLICA_STICKY_SECONDS 동안
+  (자신이 방금 만든 거래를 지연된 복제본에서 읽지 않도록)
+- 복제본이 응답하지 않거나 복제 지연이 REPLICA_MAX_LAG 초를 넘는 경우
+  (상태는 프로세스마다 REPLICA_CHECK_INTERVAL 초에 한 번 확인)
+- 캐시를 채우는 조회 (primary_reads 블록) - 다른 주체(정산 작업, 관리자, 명령)의
+  쓰기가 복제본에 아직 반영되지 않았으면 옛 값이 새 태그 버전 아래 캐시되므로
+"""
+
+import contextvars
+import logging
+import random
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+from django.utils.functional import SimpleLazyObject
+
+logger = logging.getLogger('accountbook.replicas')
+
+STICKY_COOKIE = 'db_primary'
+
+# PostgreSQL 복제본의 지연(초) - 받은 WAL 을 모두 적용했으면 0
+# (쓰기가 없을 때 마지막 적용 시각만 보고 지연으로 오인하지 않도록)
+LAG_SQL = '''
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+'''
+
+ReplicaStatus = namedtuple('ReplicaStatus', ['available', 'lag', 'checked_at'])
+
+_status = {}
+_status_lock = threading.Lock()
+
+_state = contextvars.ContextVar('replica_routing', default=None)
+
+
+class RoutingState:
+    """요청 하나의 읽기 라우팅 상태"""
+
+    def __init__(self, request, pinned=False):
+        self.request = request
+        # True 면 이 요청의 읽기는 모두 기본 DB
+        self.pinned = pinned
+        self.wrote = False
+        self.user_checked = False
+        self._replica = None
+        self._chosen = False
+
+    def replica(self):
+        """이 요청이 읽을 복제본 (요청마다 한 번 고름), 없으면 None"""
+        if not self._chosen:
+            self._replica = choose_replica()
+            self._chosen = True
+        return self._replica
+
+
+def current_state():
+    return _state.get()
+
+
+def begin(request, pinned=False):
+    """요청의 라우팅 상태를 두고 reset 용 토큰을 반환"""
+    return _state.set(RoutingState(request, pinned))
+
+
+def end(token):
+    _state.reset(token)
+
+
+@contextmanager
+def primary_reads():
+    """블록 안의 읽기를 기본 DB 로 - 캐시 미스를 채우는 조회를 감쌈"""
+    state = _state.get()
+    if state is None or state.pinned:
+        yield
+        return
+    state.pinned = True
+    try:
+        yield
+    finally:
+        # 블록 안에서 쓰기가 있었으면 이후 읽기도 기본 DB 에 고정
+        state.pinned = state.wrote
+
+
+def request_user(request):
+    """DRF 인증이 끝났거나 세션 사용자를 이미 읽었을 때만 사용자 (평가하면 DB 를 읽음)"""
+    user = vars(request).get('user')
+    if isinstance(user, SimpleLazyObject):
+        return getattr(request, '_cached_user', None)
+    return user
+
+
+def replica_aliases():
+    return settings.DATABASE_REPLICAS
+
+
+def sticky_user_key(user_id):
+    return f'db_primary_user_{user_id}'
+
+
+def mark_user_sticky(user_id):
+    cache.set(sticky_user_key(user_id), 1, timeout=settings.REPLICA_STICKY_SECONDS)
+
+
+def is_user_sticky(user_id):
+    return cache.get(sticky_user_key(user_id)) is not None
+
+
+def measure_lag(alias):
+    """복제본 지연(초), 연결할 수 없으면 DatabaseError"""
+    connection = connections[alias]
+    if connection.vendor != 'postgresql':
+        # 테스트용 SQLite 등 지연을 잴 수 없는 대체 DB
+        connection.ensure_connection()
+        return 0.0
+    with connection.cursor() as cursor:
+        cursor.execute(LAG_SQL)
+        return float(cursor.fetchone()[0])
+
+
+def check_replica(alias):
+    try:
+        lag = measure_lag(alias)
+    except DatabaseError:
+        logger.warning("복제본 %s 에 연결할 수 없어 기본 DB 를 읽습니다.", alias)
+        # 끊긴 연결을 다음 확인 때 새로 열도록 닫음
+        connections[alias].close()
+        return ReplicaStatus(False, None, time.monotonic())
+    if lag > settings.REPLICA_MAX_LAG:
+        logger.warning("복제본 %s 지연 %.1f초 - 기본 DB 를 읽습니다.", alias, lag)
+    return ReplicaStatus(lag <= settings.REPLICA_MAX_LAG, lag, time.monotonic())
+
+
+def replica_status(alias):
+    """프로세스 안에서 REPLICA_CHECK_INTERVAL 초 동안 재사용하는 복제본 상태"""
+    status = _status.get(alias)
+    now = time.monotonic()
+    if status is None or now - status.checked_at >= settings.REPLICA_CHECK_INTERVAL:
+        status = check_replica(alias)
+        with _status_lock:
+            _status[alias] = status
+    return status
+
+
+def clear_replica_status():
+    with _status_lock:
+        _status.clear()
+
+
+def choose_replica():
+    """쓸 수 있는 복제본 별칭 하나, 없으면 None"""
+    available = [
+        alias for alias in replica_aliases() if replica_status(alias).available
+    ]
+    return random.choice(available) if available else None
@@ -0,0 +1,217 @@
+"""
+거래내역 일별/월별 사전 집계(rollup)
+
+거래 쓰기 경로(ledger)에서 증감분만 UPSERT 하여 항상 최신 상태로 유지하고,
+분석 조회는 원본 transaction_history 대신 이 집계 테이블만 읽는다.
+일/월 경계는 settings.TIME_ZONE 기준이다.
+"""
+
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db.models import Case, Count, DecimalField, Q, Sum, Value, When
+from django.db.models.functions import Coalesce, TruncDate, TruncMonth
+from django.utils import timezone
+
+from ..models import (
+    Account,
+    PendingDeposit,
+    TransactionDailyRollup,
+    TransactionHistory,
+    TransactionMonthlyRollup,
+)
+from .shards import data_atomic, data_connection
+
+ZERO = Decimal('0')
+
+ROLLUP_COLUMNS = ['deposit_total', 'deposit_count', 'withdraw_total', 'withdraw_count']
+
+
+def rollup_entry(row):
+    """집계에 필요한 값만 뽑은 튜플 (시각, 유형, 방법, 금액)"""
+    return (
+        row.transaction_timestamp,
+        row.transaction_type,
+        row.transaction_method,
+        row.transaction_amount,
+    )
+
+
+def _local_day(timestamp):
+    return timezone.localtime(timestamp, timezone.get_default_timezone()).date()
+
+
+def _month_of(day):
+    return day.replace(day=1)
+
+
+def _accumulate(added=(), removed=()):
+    """(일자, 방법) 별 증감분 합산 - 대량 등록도 버킷 수만큼의 행으로 줄어든다"""
+    deltas = defaultdict(lambda: [ZERO, 0, ZERO, 0])
+    for entries, sign in ((added, 1), (removed, -1)):
+        for timestamp, transaction_type, method, amount in entries:
+            delta = deltas[(_local_day(timestamp), method)]
+            offset = 0 if transaction_type == 'DEPOSIT' else 2
+            delta[offset] += sign * amount
+            delta[offset + 1] += sign
+    return deltas
+
+
+def _upsert(model, bucket_field, account_id, deltas):
+    connection = data_connection()
+    table = connection.ops.quote_name(model._meta.db_table)
+    columns = ['account_id', bucket_field, 'transaction_method', *ROLLUP_COLUMNS]
+    placeholders = ', '.join(['%s'] * len(columns))
+    updates = ', '.join(
+        f'{column} = {table}.{column} + EXCLUDED.{column}' for column in ROLLUP_COLUMNS
+    )
+    values = []
+    params = []
+    for (bucket, method), delta in deltas.items():
+        values.append(f'({placeholders})')
+        params.extend([account_id, bucket, method, *delta])
+    if not values:
+        return
+
+    # PostgreSQL/SQLite 공통 ON CONFLICT 구문으로 한 문장에 누적
+    sql = (
+        f'INSERT INTO {table} ({", ".join(columns)}) VALUES {", ".join(values)} '
+        f'ON CONFLICT (account_id, {bucket_field}, transaction_method) '
+        f'DO UPDATE SET {updates}'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+
+def apply_rollups(account_id, added=(), removed=()):
+    """거래 추가/삭제분을 일별, 월별 집계에 반영 (ledger 트랜잭션 안에서 호출)"""
+    daily = _accumulate(added, removed)
+    monthly = defaultdict(lambda: [ZERO, 0, ZERO, 0])
+    for (day, method), delta in daily.items():
+        target = monthly[(_month_of(day), method)]
+        for i, value in enumerate(delta):
+            target[i] += value
+
+    _upsert(TransactionDailyRollup, 'day', account_id, daily)
+    _upsert(TransactionMonthlyRollup, 'month', account_id, monthly)
+
+
+def _type_sum(transaction_type):
+    return Coalesce(
+        Sum(
+            Case(
+                When(transaction_type=transaction_type, then='transaction_amount'),
+                default=Value(ZERO),
+                output_field=DecimalField(max_digits=17, decimal_places=2),
+            )
+        ),
+        Value(ZERO),
+        output_field=DecimalField(max_digits=17, decimal_places=2),
+    )
+
+
+@data_atomic
+def rebuild_rollups(account_ids):
+    """계좌들의 집계를 원본 거래내역에서 다시 계산 - 일별은 GROUP BY 한 번, 월별은 일별에서"""
+    # ledger 쓰기와 같은 계좌 행 잠금으로 재계산 중 증분 반영이 끼어들지 않게 함
+    account_ids = list(
+        Account.objects.select_for_update()
+        .filter(id__in=account_ids)
+        .values_list('id', flat=True)
+    )
+    TransactionDailyRollup.objects.filter(account_id__in=account_ids).delete()
+    TransactionMonthlyRollup.objects.filter(account_id__in=account_ids).delete()
+
+    tz = timezone.get_default_timezone()
+    # 정산 대기 입금은 정산 때 증분으로 반영되므로 제외
+    pending = PendingDeposit.objects.filter(account_id__in=account_ids).values(
+        'transaction_id'
+    )
+    daily = (
+        TransactionHistory.objects.filter(account_id__in=account_ids)
+        .exclude(id__in=pending)
+        .annotate(day=TruncDate('transaction_timestamp', tzinfo=tz))
+        .values('account_id', 'day', 'transaction_method')
+        .annotate(
+            deposit_total=_type_sum('DEPOSIT'),
+            deposit_count=Count('id', filter=Q(transaction_type='DEPOSIT')),
+            withdraw_total=_type_sum('WITHDRAW'),
+            withdraw_count=Count('id', filter=Q(transaction_type='WITHDRAW')),
+        )
+        .order_by()
+    )
+    TransactionDailyRollup.objects.bulk_create(
+        (TransactionDailyRollup(**row) for row in daily.iterator()), batch_size=1000
+    )
+
+    monthly = (
+        TransactionDailyRollup.objects.filter(account_id__in=account_ids)
+        .annotate(month=TruncMonth('day'))
+        .values('account_id', 'month', 'transaction_method')
+        .annotate(**{column: Sum(column) for column in ROLLUP_COLUMNS})
+        .order_by()
+    )
+    TransactionMonthlyRollup.objects.bulk_create(
+        (TransactionMonthlyRollup(**row) for row in monthly.iterator()),
+        batch_size=1000,
+    )
+
+
+def _next_month(day):
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _month_span(start_date, end_date):
+    """[start_date, end_date] 안에 온전히 들어가는 달 범위 (첫 달 1일, 마지막 달 다음 달 1일)"""
+    first = start_date if start_date.day == 1 else _next_month(start_date)
+    day_after = end_date + timedelta(days=1)
+    after_last = day_after if day_after.day == 1 else _month_of(end_date)
+    return first, after_last
+
+
+def rollup_reads(period, start_date, end_date):
+    """
+    기간을 (모델, 버킷 컬럼, 시작, 끝) 조회 목록으로 분할
+
+    기간 안에 온전히 들어가는 달은 월별 집계 한 번, 앞뒤 자투리 날짜는 일별 집계로
+    읽으므로 기간 길이와 관계없이 최대 세 번의 인덱스 범위 조회로 끝난다.
+    일간/주간 분석은 버킷이 달 경계와 맞지 않으므로 일별 집계만 읽는다.
+    """
+    first_month, after_last_month = _month_span(start_date, end_date)
+    if period in ('DAILY', 'WEEKLY') or first_month >= after_last_month:
+        return [(TransactionDailyRollup, 'day', start_date, end_date)]
+
+    reads = []
+    if start_date < first_month:
+        reads.append(
+            (TransactionDailyRollup, 'day', start_date, first_month - timedelta(days=1))
+        )
+    reads.append(
+        (
+            TransactionMonthlyRollup,
+            'month',
+            first_month,
+            after_last_month - timedelta(days=1),
+        )
+    )
+    if after_last_month <= end_date:
+        reads.append((TransactionDailyRollup, 'day', after_last_month, end_date))
+    return reads
+
+
+def fetch_rollup_rows(accounts, period, start_date, end_date):
+    """여러 계좌를 합친 (버킷 일자, 방법, 입금 합계, 입금 건수, 출금 합계, 출금 건수) 행 목록"""
+    rows = []
+    for model, bucket_field, low, high in rollup_reads(period, start_date, end_date):
+        rows.extend(
+            model.objects.filter(
+                account__in=accounts,
+                **{f'{bucket_field}__gte': low, f'{bucket_field}__lte': high},
+            )
+            .values(bucket_field, 'transaction_method')
+            .annotate(**{column: Sum(column) for column in ROLLUP_COLUMNS})
+            .order_by()
+            .values_list(bucket_field, 'transaction_method', *ROLLUP_COLUMNS)
+        )
+    return rows
@@ -0,0 +1,474 @@
+"""
+사용자 단위 샤딩
+
+계좌(거래내역, 정산 대기 입금, 집계 포함), 분석, 알림은 소유 사용자의 샤드 DB 에 두고,
+사용자, 토큰, 메일 대기열과 샤드 맵(UserShard)은 기본 DB 에 둔다. 샤드의 users 행은
+FK 제약을 위한 사본이며 기준은 기본 DB 의 행이다. DATABASE_SHARDS 가 비어 있으면
+모든 데이터가 기본 DB 에 있다.
+
+- 샤드 맵: 처음 조회할 때 배정한다. 기본 DB 에 이미 데이터가 있는 사용자(샤딩 이전
+  가입자)는 'default' 로 배정해 rebalance_shards 로 옮길 때까지 그대로 읽는다.
+  프로세스 내 LRU(SHARD_MAP_LOCAL_TTL) -> 캐시 -> DB 순서로 조회한다. 캐시 항목에는
+  조회 전에 읽은 샤드 태그 버전을 함께 저장해, 맵 변경 전에 DB 를 읽은 요청이 변경 후
+  캐시를 채워도 그 항목은 쓰이지 않는다.
+- 현재 샤드: 요청 중에는 요청 사용자의 샤드, 명령/작업에서는 using_shard()/for_user()
+  블록의 샤드. ShardRouter 와 ledger 등의 raw SQL 이 같은 규칙(data_db())을 따른다.
+- ID: 샤드마다 SHARD_ID_RANGE 크기의 겹치지 않는 범위에서 발급해(prepare_shard)
+  옮긴 행이 대상 샤드의 행이나 계좌 ID 로 만든 캐시 키와 겹치지 않게 한다.
+- 이동(move_users): 이동 중으로 표시해 쓰기를 막고(ShardMoving), 모든 프로세스가 표시를
+  볼 때까지 기다린 뒤 복사 -> 맵 변경 -> 다시 대기 -> 원본 삭제 순서로 진행한다.
+"""
+
+import contextlib
+import contextvars
+import copy
+import logging
+import time
+from collections import namedtuple
+from contextlib import ContextDecorator
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from ..models import (
+    Account,
+    Analysis,
+    CustomUser,
+    Notification,
+    PendingDeposit,
+    TransactionDailyRollup,
+    TransactionHistory,
+    TransactionMonthlyRollup,
+    UserShard,
+)
+from . import cache_tags
+from .local_cache import LocalLRUCache
+from .replicas import request_user
+
+logger = logging.getLogger('accountbook.shards')
+
+# 샤드에 두는 모델 -> 소유 사용자 조회 경로 (복사/삭제 순서)
+SHARDED_MODELS = {
+    Account: 'user_id',
+    TransactionHistory: 'account__user_id',
+    PendingDeposit: 'account__user_id',
+    TransactionDailyRollup: 'account__user_id',
+    TransactionMonthlyRollup: 'account__user_id',
+    Analysis: 'user_id',
+    Notification: 'user_id',
+}
+# 기본 DB 에 데이터가 남아 있는지 확인할 때 보는 모델
+LEGACY_MODELS = (Account, Analysis, Notification)
+
+COPY_BATCH_SIZE = 1000
+
+ShardLocation = namedtuple('ShardLocation', ['alias', 'moving'])
+
+_local = LocalLRUCache(maxsize=settings.SHARD_MAP_LOCAL_SIZE)
+
+# ('alias', 별칭) 또는 ('request', 요청)
+_context = contextvars.ContextVar('shard_context', default=None)
+
+
+class ShardMoving(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = '데이터를 옮기는 중입니다. 잠시 후 다시 시도해주세요.'
+    default_code = 'shard_moving'
+
+
+def shard_aliases():
+    return settings.DATABASE_SHARDS
+
+
+def sharding_enabled():
+    return bool(settings.DATABASE_SHARDS)
+
+
+def data_aliases():
+    """사용자 데이터가 있을 수 있는 DB (샤딩 전 데이터가 남은 기본 DB 포함)"""
+    return [DEFAULT_DB_ALIAS, *shard_aliases()]
+
+
+def each_data_db():
+    """사용자 데이터가 있을 수 있는 DB 마다 그 DB 를 현재 샤드로 두고 별칭을 냄 (명령용)"""
+    for alias in data_aliases():
+        with using_shard(alias):
+            yield alias
+
+
+def is_sharded(model):
+    return model._meta.concrete_model in SHARDED_MODELS
+
+
+# 샤드 맵 --------------------------------------------------------------------
+
+
+def shard_map_key(user_id):
+    return f'user_shard_{user_id}'
+
+
+def _remember(user_id, location, version):
+    cache.set(
+        shard_map_key(user_id),
+        (*location, version),
+        timeout=settings.SHARD_MAP_CACHE_TTL,
+    )
+    _local.set(user_id, location, settings.SHARD_MAP_LOCAL_TTL)
+
+
+def forget(user_id):
+    """
+    이 프로세스의 항목을 지우고 캐시 항목은 태그 버전을 올려 버림
+    (다른 프로세스는 로컬 TTL 안에 만료)
+    """
+    _local.delete(user_id)
+    cache_tags.bump_tags([cache_tags.shard_tag(user_id)])
+
+
+def clear_local_map():
+    _local.clear()
+
+
+def placement(user_id):
+    """새 사용자를 둘 샤드"""
+    aliases = shard_aliases()
+    return aliases[user_id % len(aliases)]
+
+
+def has_legacy_data(user_id):
+    return any(
+        model.objects.using(DEFAULT_DB_ALIAS).filter(user_id=user_id).exists()
+        for model in LEGACY_MODELS
+    )
+
+
+def copy_users(users, alias):
+    """샤드의 users 사본을 기본 DB 의 행으로 만들거나 갱신 (샤드 안의 FK 제약용)"""
+    if alias == DEFAULT_DB_ALIAS:
+        return
+    fields = [
+        field.name
+        for field in CustomUser._meta.concrete_fields
+        if not field.primary_key
+    ]
+    # auto_now 필드가 호출한 쪽 인스턴스를 바꾸지 않도록 복사본을 저장
+    CustomUser.objects.using(alias).bulk_create(
+        [copy.copy(user) for user in users],
+        update_conflicts=True,
+        unique_fields=['id'],
+        update_fields=fields,
+    )
+
+
+def _assign(user_id):
+    if has_legacy_data(user_id):
+        alias = DEFAULT_DB_ALIAS
+    else:
+        alias = placement(user_id)
+        copy_users(CustomUser.objects.using(DEFAULT_DB_ALIAS).filter(pk=user_id), alias)
+    entry, _ = UserShard.objects.using(DEFAULT_DB_ALIAS).get_or_create(
+        user_id=user_id, defaults={'shard': alias}
+    )
+    return ShardLocation(entry.shard, entry.moving)
+
+
+def locate(user_id, assign=True):
+    """사용자 데이터 위치 (로컬 LRU -> 캐시 -> DB, 없으면 배정하거나 None)"""
+    location = _local.get(user_id)
+    if location is not None:
+        return location
+    tag = cache_tags.shard_tag(user_id)
+    cached, versions = cache_tags.get_with_versions(shard_map_key(user_id), [tag])
+    version = versions[tag]
+    # 저장 후 맵이 바뀌었거나 (forget) 버전이 없는 이전 형식이면 DB 에서 다시 조회
+    if cached is not None and len(cached) == 3 and cached[2] == version:
+        location = ShardLocation(*cached[:2])
+    else:
+        entry = (
+            UserShard.objects.using(DEFAULT_DB_ALIAS)
+            .filter(user_id=user_id)
+            .values_list('shard', 'moving')
+            .first()
+        )
+        if entry is not None:
+            location = ShardLocation(*entry)
+        elif assign:
+            location = _assign(user_id)
+        else:
+            return None
+    _remember(user_id, location, version)
+    return location
+
+
+def shard_for_user(user_id):
+    if not sharding_enabled():
+        return DEFAULT_DB_ALIAS
+    return locate(user_id).alias
+
+
+def assigned_shard(user_id):
+    """이미 배정된 샤드, 배정 전이면 None"""
+    location = locate(user_id, assign=False)
+    return None if location is None else location.alias
+
+
+# 현재 샤드 ------------------------------------------------------------------
+
+
+@contextlib.contextmanager
+def using_shard(alias):
+    """블록 안의 샤드 모델 조회/쓰기와 data_db() 를 alias 로 고정"""
+    token = _context.set(('alias', alias))
+    try:
+        yield alias
+    finally:
+        _context.reset(token)
+
+
+def for_user(user_id):
+    """블록 안에서 user_id 의 샤드를 씀 (요청 밖의 명령, 작업용)"""
+    if not sharding_enabled():
+        return contextlib.nullcontext(DEFAULT_DB_ALIAS)
+    return using_shard(shard_for_user(user_id))
+
+
+def bind_request(request):
+    """요청 사용자의 샤드를 쓰도록 요청을 두고 reset 용 토큰을 반환"""
+    return _context.set(('request', request))
+
+
+def unbind(token):
+    _context.reset(token)
+
+
+def current_owner():
+    """요청 중이면 인증이 끝난 요청 사용자 ID"""
+    context = _context.get()
+    if context is None or context[0] != 'request':
+        return None
+    user = request_user(context[1])
+    if user is None or not user.is_authenticated:
+        return None
+    return user.pk
+
+
+def current_shard():
+    """지금 샤드 모델이 쓸 DB, 정할 수 없으면 None"""
+    if not sharding_enabled():
+        return None
+    context = _context.get()
+    if context is None:
+        return None
+    if context[0] == 'alias':
+        return context[1]
+    owner = current_owner()
+    return None if owner is None else shard_for_user(owner)
+
+
+def data_db():
+    return current_shard() or DEFAULT_DB_ALIAS
+
+
+def data_connection():
+    """ledger, 집계 등 raw SQL 이 쓸 연결"""
+    return connections[data_db()]
+
+
+class DataAtomic(ContextDecorator):
+    """현재 샤드의 트랜잭션 - 별칭은 블록에 들어갈 때 정함"""
+
+    def _recreate_cm(self):
+        # 데코레이터는 스레드 사이에 공유되므로 호출마다 새로 만듦
+        return DataAtomic()
+
+    def __enter__(self):
+        self._atomic = transaction.atomic(using=data_db())
+        return self._atomic.__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self._atomic.__exit__(exc_type, exc_value, traceback)
+
+
+def data_atomic(func=None):
+    """@data_atomic 또는 with data_atomic(): - transaction.atomic 의 샤드판"""
+    if callable(func):
+        return DataAtomic()(func)
+    return DataAtomic()
+
+
+def on_commit(func, robust=False):
+    """현재 샤드 트랜잭션(없으면 기본 DB 트랜잭션)이 커밋된 뒤 실행"""
+    alias = data_db()
+    if not connections[alias].in_atomic_block:
+        alias = DEFAULT_DB_ALIAS
+    transaction.on_commit(func, using=alias, robust=robust)
+
+
+def owner_of(instance):
+    """모델 인스턴스의 소유 사용자 ID (알 수 없으면 None)"""
+    if isinstance(instance, CustomUser):
+        return instance.pk
+    user_id = getattr(instance, 'user_id', None)
+    if user_id is not None:
+        return user_id
+    account = instance._state.fields_cache.get('account')
+    if account is not None:
+        return account.user_id
+    return None
+
+
+def check_writable():
+    """요청 사용자의 데이터를 옮기는 중이면 ShardMoving"""
+    owner = current_owner()
+    if owner is not None and locate(owner).moving:
+        raise ShardMoving()
+
+
+# 샤드 준비와 이동 --------------------------------------------------------------
+
+
+def id_floor(alias):
+    """alias 가 발급할 ID 의 하한 (기본 DB 는 0, shard_N 은 N x SHARD_ID_RANGE)"""
+    if alias == DEFAULT_DB_ALIAS:
+        return 0
+    return (shard_aliases().index(alias) + 1) * settings.SHARD_ID_RANGE
+
+
+def prepare_shard(alias):
+    """샤드 모델 테이블의 다음 ID 를 샤드의 범위로 올림 (이미 넘었으면 그대로)"""
+    connection = connections[alias]
+    floor = id_floor(alias)
+    if not floor:
+        return
+    quote = connection.ops.quote_name
+    with transaction.atomic(using=alias), connection.cursor() as cursor:
+        for model in SHARDED_MODELS:
+            table = model._meta.db_table
+            if connection.vendor == 'postgresql':
+                cursor.execute(
+                    "SELECT setval(pg_get_serial_sequence(%s, 'id'), "
+                    "GREATEST(nextval(pg_get_serial_sequence(%s, 'id')), %s), false)",
+                    [table, table, floor],
+                )
+            elif connection.vendor == 'sqlite':
+                # AUTOINCREMENT 테이블은 sqlite_sequence 의 값 다음부터 발급
+                cursor.execute(
+                    f"SELECT COALESCE(MAX({quote('id')}), 0) FROM {quote(table)}"
+                )
+                current = max(cursor.fetchone()[0], floor - 1)
+                cursor.execute("DELETE FROM sqlite_sequence WHERE name = %s", [table])
+                cursor.execute(
+                    "INSERT INTO sqlite_sequence (name, seq) VALUES (%s, %s)",
+                    [table, current],
+                )
+            else:
+                logger.warning("%s 의 ID 범위를 설정하지 못했습니다.", alias)
+                return
+
+
+def _set_location(user_ids, **fields):
+    UserShard.objects.using(DEFAULT_DB_ALIAS).filter(user_id__in=user_ids).update(
+        **fields
+    )
+    for user_id in user_ids:
+        forget(user_id)
+
+
+def _copy_rows(model, lookup, user_ids, source, target):
+    """원본 행을 ID 와 생성일 그대로 복사 (auto_now 가 값을 바꾸지 않도록 raw INSERT)"""
+    connection = connections[target]
+    fields = model._meta.concrete_fields
+    quote = connection.ops.quote_name
+    sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+        quote(model._meta.db_table),
+        ', '.join(quote(field.column) for field in fields),
+        ', '.join(['%s'] * len(fields)),
+    )
+    rows = (
+        model.objects.using(source)
+        .filter(**{f'{lookup}__in': user_ids})
+        .order_by('pk')
+        .values_list(*[field.attname for field in fields])
+        .iterator(chunk_size=COPY_BATCH_SIZE)
+    )
+    copied = 0
+    batch = []
+    with connection.cursor() as cursor:
+        for row in rows:
+            batch.append(
+                [
+                    field.get_db_prep_save(value, connection)
+                    for field, value in zip(fields, row)
+                ]
+            )
+            if len(batch) >= COPY_BATCH_SIZE:
+                cursor.executemany(sql, batch)
+                copied += len(batch)
+                batch = []
+        if batch:
+            cursor.executemany(sql, batch)
+            copied += len(batch)
+    return copied
+
+
+def delete_user_data(user_ids, alias):
+    """alias 에서 사용자들의 샤드 데이터(와 샤드의 users 사본) 삭제"""
+    with transaction.atomic(using=alias):
+        Account.objects.using(alias).filter(user_id__in=user_ids).delete()
+        Analysis.objects.using(alias).filter(user_id__in=user_ids).delete()
+        Notification.objects.using(alias).filter(user_id__in=user_ids).delete()
+        if alias != DEFAULT_DB_ALIAS:
+            CustomUser.objects.using(alias).filter(pk__in=user_ids).delete()
+
+
+def move_users(user_ids, target, wait=None):
+    """
+    사용자들의 데이터를 target 샤드로 옮김 -> {원본 샤드: 옮긴 행 수}
+
+    복사하는 동안 원본 계좌 행을 잠가 표시가 보이기 전에 시작된 쓰기가 끝나기를 기다린다.
+    중간에 실패하면 맵을 바꾸지 않은 사용자는 원본 샤드에서 다시 쓰기를 받는다.
+    SHARD_MAP_LOCAL_TTL 동안 두 번 기다리므로 사용자를 묶어서 옮긴다.
+    이동 중 표시는 요청의 쓰기만 막으므로 정산 명령(--loop) 등은 멈춘 뒤 실행한다.
+    """
+    if wait is None:
+        wait = settings.SHARD_MAP_LOCAL_TTL
+    sources = {}
+    for user_id in user_ids:
+        alias = locate(user_id).alias
+        if alias != target:
+            sources.setdefault(alias, []).append(user_id)
+    if not sources:
+        return {}
+
+    moving = [user_id for ids in sources.values() for user_id in ids]
+    _set_location(moving, moving=True)
+    moved = {}
+    try:
+        time.sleep(wait)
+        for source, ids in sources.items():
+            copy_users(
+                CustomUser.objects.using(DEFAULT_DB_ALIAS).filter(pk__in=ids), target
+            )
+            with transaction.atomic(using=source), transaction.atomic(using=target):
+                list(
+                    Account.objects.using(source)
+                    .select_for_update()
+                    .filter(user_id__in=ids)
+                    .values_list('pk', flat=True)
+                )
+                copied = sum(
+                    _copy_rows(model, lookup, ids, source, target)
+                    for model, lookup in SHARDED_MODELS.items()
+                )
+            _set_location(ids, shard=target)
+            moved[source] = copied
+        # 옛 맵으로 원본을 읽던 프로세스가 새 맵을 볼 때까지 기다린 뒤 원본 삭제
+        time.sleep(wait)
+        for source in moved:
+            delete_user_data(sources[source], source)
+    finally:
+        _set_location(moving, moving=False)
+    return moved
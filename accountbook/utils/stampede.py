@@ -0,0 +1,153 @@
+"""
+캐시 스탬피드 방지
+
+- single-flight: 미스가 나면 잠금(cache.add)을 얻은 요청 하나만 다시 계산하고, 나머지는
+  이전 값이 있으면 그 값을 바로 쓰고, 없으면 계산이 끝날 때까지 잠시 기다렸다가 새 값을 읽는다.
+- 확률적 조기 갱신(XFetch): 남은 시간이 짧을수록, 재계산이 오래 걸릴수록 높은 확률로
+  만료 전에 한 요청이 미리 갱신한다. (현재 시각 - 계산 시간 * beta * ln(rand) >= 만료 시각)
+
+값은 (형식 표시, 값, 계산 시간, 논리 만료 시각) 튜플로 저장하고, 실제 TTL 은 논리 만료보다
+CACHE_STALE_GRACE 만큼 길게 둬 갱신하는 동안 다른 요청에 이전 값을 내줄 수 있게 한다.
+형식 표시가 다른 값(이전 배포가 같은 키에 둔 레코드 등)은 미스로 취급한다.
+
+잠금 값은 요청마다 다른 토큰이고, 해제는 값이 자기 토큰일 때만 지운다(Redis 는 Lua
+스크립트로 비교와 삭제를 한 번에). 계산이 CACHE_LOCK_TIMEOUT 보다 오래 걸려 다른 요청이
+잠금을 얻었으면 그 잠금을 지우지 않는다.
+"""
+
+import math
+import random
+import time
+import uuid
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .replicas import primary_reads
+
+# 기다리는 요청이 캐시를 다시 확인하는 간격 (초)
+POLL_INTERVAL = 0.01
+
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# 항목 형식을 바꾸면 올린다
+ENTRY_FORMAT = 'stampede.v1'
+
+Entry = namedtuple('Entry', ['value', 'delta', 'expires_at'])
+
+
+def lock_key(key):
+    return f'{key}:lock'
+
+
+def pack_entry(value, delta, expires_at):
+    """캐시에 저장할 튜플"""
+    return (ENTRY_FORMAT, value, delta, expires_at)
+
+
+def _uses_redis():
+    return settings.CACHES['default']['BACKEND'].startswith('django_redis')
+
+
+def release_lock(lock, token):
+    """잠금 값이 token 일 때만 삭제"""
+    if _uses_redis():
+        from django_redis import get_redis_connection
+
+        # cache.add 가 저장한 그대로의 키와 값으로 비교
+        client = cache.client
+        get_redis_connection('default').eval(
+            RELEASE_SCRIPT, 1, client.make_key(lock), client.encode(token)
+        )
+    elif cache.get(lock) == token:
+        # 프로세스 메모리 캐시 (테스트/단일 프로세스)
+        cache.delete(lock)
+
+
+def read_entry(raw):
+    """캐시에서 읽은 값 -> Entry, 다른 형식(이전 배포의 값 등)이면 None"""
+    if (
+        isinstance(raw, tuple)
+        and len(raw) == len(Entry._fields) + 1
+        and raw[0] == ENTRY_FORMAT
+    ):
+        return Entry(*raw[1:])
+    return None
+
+
+def is_fresh(entry, beta=None):
+    """조기 갱신 대상이 아니면 True"""
+    if beta is None:
+        beta = settings.CACHE_EARLY_REFRESH_BETA
+    # 1 - random() 은 (0, 1] 이라 log 가 정의됨
+    early = entry.delta * beta * -math.log(1.0 - random.random())
+    return time.time() + early < entry.expires_at
+
+
+def _compute_and_store(key, compute, timeout):
+    started = time.monotonic()
+    # 지연된 복제본의 옛 값이 새 태그 버전 아래 저장되지 않도록 기본 DB 에서 계산
+    with primary_reads():
+        value = compute()
+    delta = time.monotonic() - started
+    # None 은 저장하지 않음 (없는 객체 등)
+    if value is not None:
+        cache.set(
+            key,
+            pack_entry(value, delta, time.time() + timeout),
+            timeout=timeout + settings.CACHE_STALE_GRACE,
+        )
+    return value
+
+
+def recompute(key, compute, timeout, stale=None, accept=None):
+    """
+    single-flight 재계산
+
+    잠금을 얻으면 compute() 결과를 저장해 반환한다. 잠금을 못 얻으면 stale 이 있으면
+    그 값을, 없으면 잠금이 풀릴 때까지 (최대 CACHE_LOCK_WAIT 초) 기다려 저장된 값을 반환한다.
+    accept(value) 가 거짓인 값은 새 값으로 보지 않는다. 기다려도 값이 없으면 직접 계산한다.
+    """
+    lock = lock_key(key)
+    token = uuid.uuid4().hex
+    if cache.add(lock, token, timeout=settings.CACHE_LOCK_TIMEOUT):
+        try:
+            # 미스를 본 뒤 잠금을 얻기 전에 다른 요청이 계산을 마치고 잠금을 풀었을 수 있음
+            if stale is None:
+                entry = read_entry(cache.get(key))
+                if entry is not None and (accept is None or accept(entry.value)):
+                    return entry.value
+            return _compute_and_store(key, compute, timeout)
+        finally:
+            release_lock(lock, token)
+
+    if stale is not None:
+        return stale
+
+    deadline = time.monotonic() + settings.CACHE_LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL)
+        found = cache.get_many([key, lock])
+        entry = read_entry(found.get(key))
+        if entry is not None and (accept is None or accept(entry.value)):
+            return entry.value
+        if lock not in found:
+            # 계산한 요청이 저장하지 않고 끝남 (없는 객체, 예외)
+            break
+    return _compute_and_store(key, compute, timeout)
+
+
+def get_or_set(key, compute, timeout, beta=None):
+    """캐시 조회, 없거나 조기 갱신 대상이면 single-flight 로 compute() 결과 저장"""
+    entry = read_entry(cache.get(key))
+    if entry is None:
+        return recompute(key, compute, timeout)
+    if is_fresh(entry, beta):
+        return entry.value
+    return recompute(key, compute, timeout, stale=entry.value)
@@ -0,0 +1,105 @@
+"""
+기동 비용 측정
+
+새 인터프리터에서 python -X importtime 으로 django.setup() 과 URL 설정(모든 뷰 모듈)
+로딩, 첫 요청 처리를 실행하고 다음을 잰다.
+
+- import 합계: 최상위 import 의 누적 시간 합 (기동 구간 / 첫 요청 구간)
+- 준비 시간: 인터프리터 시작 후 URL 설정 로딩까지의 시간
+- 첫 요청 시간: WSGI 애플리케이션 생성부터 첫 응답 본문까지의 시간
+
+첫 요청은 DB 와 캐시를 쓰지 않는 인증 실패 요청(계좌 목록, 401)으로 보낸다.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+
+from django.conf import settings
+
+DEFAULT_PATH = '/api/accounts/'
+READY_MARKER = '--startup-ready--'
+
+# 자식 인터프리터에서 실행할 스크립트 (측정 대상 외 모듈은 되도록 불러오지 않음)
+SCRIPT = f'''
+import io, sys, time
+started = time.perf_counter()
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+ready = time.perf_counter()
+sys.stderr.write({READY_MARKER!r} + "\\n")
+sys.stderr.flush()
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+environ = {{
+    "REQUEST_METHOD": "GET",
+    "PATH_INFO": sys.argv[1],
+    "QUERY_STRING": "",
+    "SERVER_NAME": "localhost",
+    "SERVER_PORT": "80",
+    "HTTP_HOST": "localhost",
+    "wsgi.input": io.BytesIO(),
+    "wsgi.errors": sys.stderr,
+    "wsgi.url_scheme": "http",
+}}
+statuses = []
+response = application(environ, lambda status, headers: statuses.append(status))
+b"".join(response)
+response.close()
+first = time.perf_counter()
+print(statuses[0].split()[0], (ready - started) * 1000, (first - ready) * 1000)
+'''
+
+IMPORT_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def _parse_imports(lines):
+    """importtime 출력 -> (최상위 누적 합계 ms, [(누적 ms, 모듈)], 모듈 이름 목록)"""
+    total = 0
+    top_level = []
+    modules = []
+    for line in lines:
+        match = IMPORT_LINE.match(line)
+        if match is None:
+            continue
+        cumulative, indent, name = int(match[2]), len(match[3]), match[4]
+        modules.append(name)
+        # 들여쓰기 1칸이 최상위 import (하위 import 는 2칸씩 더 들여씀)
+        if indent == 1:
+            total += cumulative
+            top_level.append((cumulative / 1000, name))
+    top_level.sort(reverse=True)
+    return total / 1000, top_level, modules
+
+
+def measure_startup(settings_module, path=DEFAULT_PATH):
+    """새 인터프리터의 기동 비용 측정 결과(dict)"""
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': settings_module}
+    # .env 가 없는 환경(CI 등)에서도 설정을 불러올 수 있도록 측정용 키 지정
+    env.setdefault('SECRET_KEY', 'startup-measurement')
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', SCRIPT, path],
+        cwd=settings.BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    stderr = completed.stderr.splitlines()
+    marker = stderr.index(READY_MARKER)
+    import_ms, heaviest, modules = _parse_imports(stderr[:marker])
+    request_import_ms, _, request_modules = _parse_imports(stderr[marker + 1 :])
+    status, ready_ms, first_request_ms = completed.stdout.split()[-3:]
+    return {
+        'import_ms': import_ms,
+        'ready_ms': float(ready_ms),
+        'first_request_ms': float(first_request_ms),
+        'first_request_import_ms': request_import_ms,
+        'status': int(status),
+        'heaviest': heaviest,
+        'modules': modules + request_modules,
+    }
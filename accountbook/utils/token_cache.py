@@ -0,0 +1,43 @@
+"""
+검증된 JWT 캐시
+
+같은 액세스 토큰이 만료 전까지 수백 번 재사용되므로, 원문 토큰의 SHA-256 다이제스트를 키로
+검증 결과(토큰 객체)를 프로세스 메모리에 보관해 base64 디코드, HMAC 검증, JSON 파싱,
+클레임 검사를 건너뛴다. 항목은 토큰의 exp 시각에 만료되고 개수 상한을 넘으면 LRU 로 축출된다.
+서명 키를 바꾸면 프로세스를 재시작하거나 clear_token_cache() 를 호출해야 한다.
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+
+from .local_cache import LocalLRUCache
+
+_tokens = LocalLRUCache(maxsize=settings.JWT_CACHE_SIZE)
+
+
+def token_digest(raw_token):
+    if isinstance(raw_token, str):
+        raw_token = raw_token.encode('utf-8')
+    return hashlib.sha256(raw_token).digest()
+
+
+def get_validated_token(raw_token, validate):
+    """캐시된 검증 결과 반환, 없으면 validate(raw_token) 결과를 exp 까지 캐시"""
+    if settings.JWT_CACHE_SIZE <= 0:
+        return validate(raw_token)
+
+    key = token_digest(raw_token)
+    token = _tokens.get(key)
+    if token is None:
+        # 검증 실패는 예외로 올라가므로 캐시되지 않음
+        token = validate(raw_token)
+        remaining = token.get('exp', 0) - time.time()
+        if remaining > 0:
+            _tokens.set(key, token, remaining)
+    return token
+
+
+def clear_token_cache():
+    _tokens.clear()
@@ -0,0 +1,102 @@
+import hashlib
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+
+from ..filters import normalize_params
+from .cache_tags import account_tag, bump_tags, get_versions
+
+# 거래내역 목록 결과 캐시 (5분)
+LIST_CACHE_TIMEOUT = 60 * 5
+
+# 캐시 키에 반영되는 목록 조회 파라미터
+LIST_CACHE_PARAMS = (
+    'transaction_type',
+    'min_amount',
+    'max_amount',
+    'start_date',
+    'end_date',
+    'tz',
+    'page',
+    'page_size',
+    'pagination',
+    'cursor',
+)
+
+HIT_COUNTER_KEY = 'transactions_cache_hits'
+MISS_COUNTER_KEY = 'transactions_cache_misses'
+
+
+def get_generation(account_id):
+    """계좌별 거래내역 세대 번호 = 계좌 캐시 태그 버전"""
+    return get_versions([account_tag(account_id)])[account_tag(account_id)]
+
+
+def get_generations(account_ids):
+    """여러 계좌의 세대 번호를 한 번에 조회"""
+    versions = get_versions([account_tag(account_id) for account_id in account_ids])
+    return {account_id: versions[account_tag(account_id)] for account_id in account_ids}
+
+
+def bump_generation(account_id):
+    """
+    계좌의 거래내역이 바뀌었을 때 호출 - INCR 한 번으로 기존 목록 캐시 전체 무효화
+
+    이전 세대 키는 조회되지 않고 TTL로 자연 만료되므로 키 스캔이 필요 없다.
+    """
+    bump_tags([account_tag(account_id)])
+
+
+def list_url(request):
+    """
+    목록 파라미터만 남긴 요청 URL (이름순, build_transaction_filters 와 같은 정규화)
+
+    캐시 키와 next/previous 링크를 모두 이 URL 에서 만들어, 목록과 관계없는 파라미터가
+    다른 요청의 링크가 캐시된 응답으로 나가지 않게 한다.
+    """
+    params = normalize_params(request.query_params)
+    normalized = sorted(
+        (name, params[name]) for name in LIST_CACHE_PARAMS if name in params
+    )
+    url = request.build_absolute_uri(request.path)
+    return f'{url}?{urlencode(normalized)}' if normalized else url
+
+
+def list_cache_key(account_id, request, generation=None):
+    """계좌, 목록 URL(스킴/호스트와 정규화된 필터/페이지 파라미터), 현재 세대로 목록 캐시 키 생성"""
+    digest = hashlib.md5(list_url(request).encode('utf-8')).hexdigest()
+    if generation is None:
+        generation = get_generation(account_id)
+    return f'transactions_{account_id}_{generation}_{digest}'
+
+
+def _increment(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def record_hit():
+    _increment(HIT_COUNTER_KEY)
+
+
+def record_miss():
+    _increment(MISS_COUNTER_KEY)
+
+
+def get_cache_stats():
+    counters = cache.get_many([HIT_COUNTER_KEY, MISS_COUNTER_KEY])
+    hits = counters.get(HIT_COUNTER_KEY, 0)
+    misses = counters.get(MISS_COUNTER_KEY, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': hits / total if total else 0.0,
+    }
+
+
+def reset_cache_stats():
+    cache.delete_many([HIT_COUNTER_KEY, MISS_COUNTER_KEY])
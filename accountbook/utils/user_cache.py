@@ -0,0 +1,86 @@
+"""
+인증 사용자 캐시
+
+CookieJWTAuthentication 이 매 요청 users 테이블을 조회하지 않도록 뷰/권한 검사에 필요한
+필드만 캐시한다. 프로세스 내 LRU(짧은 TTL) -> Redis -> DB 순서로 조회하며,
+비밀번호 해시 등 나머지 필드는 지연 로딩(deferred) 필드로 남겨 캐시에 올리지 않는다.
+"""
+
+from functools import partial
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from .local_cache import LocalLRUCache
+from .replicas import primary_reads
+
+User = get_user_model()
+
+# request.user 로 쓰이는 필드 (뷰, 권한, 관리자 페이지 검사)
+USER_CACHE_FIELDS = (
+    'id',
+    'email',
+    'nickname',
+    'name',
+    'phone_number',
+    'is_active',
+    'is_staff',
+    'is_admin',
+    'is_superuser',
+    'date_joined',
+)
+
+
+_local = LocalLRUCache(maxsize=settings.USER_CACHE_LOCAL_SIZE)
+
+
+def user_cache_key(user_id):
+    return f'auth_user_{user_id}'
+
+
+def _build_user(fields):
+    # 캐시에 없는 필드는 deferred 로 두어 save() 시 덮어쓰지 않게 함
+    names = [
+        field.attname for field in User._meta.concrete_fields if field.attname in fields
+    ]
+    return User.from_db(DEFAULT_DB_ALIAS, names, [fields[name] for name in names])
+
+
+def get_cached_user(user_id):
+    """사용자 조회 (로컬 LRU -> Redis -> DB), 없으면 None"""
+    fields = _local.get(user_id)
+    if fields is None:
+        key = user_cache_key(user_id)
+        fields = cache.get(key)
+        if fields is None:
+            with primary_reads():
+                fields = (
+                    User.objects.filter(pk=user_id).values(*USER_CACHE_FIELDS).first()
+                )
+            if fields is None:
+                return None
+            cache.set(key, fields, timeout=settings.USER_CACHE_TTL)
+        _local.set(user_id, fields, settings.USER_CACHE_LOCAL_TTL)
+    return _build_user(fields)
+
+
+def _delete(user_id):
+    _local.delete(user_id)
+    cache.delete(user_cache_key(user_id))
+
+
+def invalidate_user(user_id):
+    """
+    사용자 정보 변경 시 호출
+
+    즉시 지우고 커밋 후 한 번 더 지워, 커밋 전 다른 요청이 옛 값을 다시 채운 경우도 정리한다.
+    다른 프로세스의 로컬 LRU 는 USER_CACHE_LOCAL_TTL 안에 만료된다.
+    """
+    _delete(user_id)
+    transaction.on_commit(partial(_delete, user_id))
+
+
+def clear_local_cache():
+    _local.clear()
@@ -5,7 +5,8 @@ from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 
 
-def send_verification_email(user):
+def build_verification_email(user):
+    """회원가입 인증 메일 (제목, 본문)"""
     uid = urlsafe_base64_encode(force_bytes(user.pk))
     token = default_token_generator.make_token(user)
     # settings에서 BASE_URL 가져오기
@@ -14,7 +15,11 @@ def send_verification_email(user):
 
     subject = "회원가입 인증 이메일"
     message = f"아래 링크를 클릭하여 이메일 인증을 완료하세요:\n{activation_link}"
+    return subject, message
+
 
+def send_verification_email(user):
+    subject, message = build_verification_email(user)
     send_mail(
         subject,
         message,
@@ -2,10 +2,6 @@
 
 import logging
 
-from django.core.cache import cache
-from django.db import transaction
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from drf_spectacular.utils import extend_schema
 from rest_framework import generics, status
 from rest_framework.exceptions import PermissionDenied
@@ -15,6 +11,13 @@ from rest_framework.response import Response
 from ..models import Account
 from ..permissions import IsAccountOwner
 from ..serializers import AccountCreateSerializer, AccountSerializer
+from ..utils import ledger
+from ..utils.cache_codec import ACCOUNT_SCHEMA, get_cached, set_cached
+from ..utils.cache_tags import account_tag, accounts_tag, tagged_key
+from ..utils.rate_limit import rate_limit
+from ..utils.replicas import primary_reads
+from ..utils.shards import data_atomic
+from ..utils.stampede import get_or_set
 
 logger = logging.getLogger('accountbook.accounts')
 
@@ -29,25 +32,22 @@ class AccountListCreateView(generics.ListCreateAPIView):
 
     def get_queryset(self):
         user = self.request.user
-        cache_key = f'account_list_{user.id}'
-        queryset = cache.get(cache_key)
-
-        if not queryset:
-
-            queryset = Account.objects.filter(user=user).only(
-                'id',
-                'account_number',
-                'bank_code',
-                'account_type',
-                'balance',
-                'created_at',
-            )
-
-            queryset_list = list(queryset)
-            cache.set(cache_key, queryset_list, timeout=60 * 5)
-            return queryset_list
-
-        return queryset
+        cache_key = tagged_key(f'account_list_{user.id}', [accounts_tag(user.id)])
+        accounts = get_cached(ACCOUNT_SCHEMA, cache_key, many=True)
+
+        if accounts is None:
+            # 입금 묶음 반영 계좌는 정산 대기 입금을 잔액에 더해 보여줌
+            # (캐시에 넣을 값이므로 복제본이 아닌 기본 DB 에서 조회)
+            with primary_reads():
+                accounts = [
+                    ledger.fold_pending(account)
+                    for account in ledger.with_pending_balance(
+                        Account.objects.filter(user=user).only(*ACCOUNT_SCHEMA.fields)
+                    )
+                ]
+            set_cached(ACCOUNT_SCHEMA, cache_key, accounts, timeout=60 * 5, many=True)
+
+        return accounts
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
@@ -59,10 +59,7 @@ class AccountListCreateView(generics.ListCreateAPIView):
         description="로그인한 사용자의 계좌 목록을 조회합니다.",
         responses={200: AccountSerializer(many=True)},
     )
-    @method_decorator(cache_page(60 * 5))
     def get(self, request, *args, **kwargs):
-        request._cache_update_cache = True
-        request._cache_key = f'account_list_view_{request.user.id}'
         return super().get(request, *args, **kwargs)
 
     @extend_schema(
@@ -79,28 +76,22 @@ class AccountListCreateView(generics.ListCreateAPIView):
             }
         },
     )
-    @transaction.atomic
+    # 사용자별 계좌 생성 속도 제한 - 생성 성공만 셈 (기본 1분에 5회)
+    @rate_limit(
+        'account_create',
+        key=lambda request: request.user.id,
+        message="계좌 생성 요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+        count_if=lambda response: response.status_code == status.HTTP_201_CREATED,
+    )
+    @data_atomic
     def post(self, request, *args, **kwargs):
         user_id = request.user.id
-        cache_key = f'account_create_limit_{user_id}'
-        create_count = cache.get(cache_key, 0)
-
-        if create_count >= 5:
-            logger.warning(f"Account creation rate limit exceeded for user {user_id}")
-            return Response(
-                {
-                    "message": "계좌 생성 요청이 너무 많습니다. 잠시 후 다시 시도해주세요."
-                },
-                status=status.HTTP_429_TOO_MANY_REQUESTS,
-            )
 
         try:
             serializer = self.get_serializer(data=request.data)
             serializer.is_valid(raise_exception=True)
             account = serializer.save()
 
-            cache.set(cache_key, create_count + 1, timeout=60)
-            cache.delete(f'account_list_{user_id}')
             logger.info(f"Account created: {account.id} by user {user_id}")
 
             return Response(
@@ -124,16 +115,22 @@ class AccountDetailView(generics.RetrieveDestroyAPIView):
     lookup_url_kwarg = 'account_id'
 
     def get_queryset(self):
-        return Account.objects.filter(user=self.request.user).only(
-            'id',
-            'account_number',
-            'bank_code',
-            'account_type',
-            'balance',
-            'created_at',
-            'user_id',
+        return ledger.with_pending_balance(
+            Account.objects.filter(user=self.request.user).only(
+                'id',
+                'account_number',
+                'bank_code',
+                'account_type',
+                'balance',
+                'created_at',
+                'user_id',
+            )
         )
 
+    def get_object(self):
+        # 정산 대기 입금을 잔액에 더해 보여줌
+        return ledger.fold_pending(super().get_object())
+
     @extend_schema(
         summary="계좌 상세 조회",
         description="특정 계좌의 상세 정보를 조회합니다.",
@@ -141,15 +138,16 @@ class AccountDetailView(generics.RetrieveDestroyAPIView):
     )
     def get(self, request, *args, **kwargs):
         account_id = kwargs.get('account_id')
-        cache_key = f'account_detail_{account_id}_{request.user.id}'
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(cached_data)
-
-        response = super().get(request, *args, **kwargs)
-        if response.status_code == 200:
-            cache.set(cache_key, response.data, timeout=60 * 5)
-        return response
+        cache_key = tagged_key(
+            f'account_detail_{account_id}_{request.user.id}', [account_tag(account_id)]
+        )
+        # 동시 미스는 한 요청만 DB 조회, 만료 전 확률적으로 미리 갱신
+        data = get_or_set(
+            cache_key,
+            lambda: self.retrieve(request, *args, **kwargs).data,
+            timeout=60 * 5,
+        )
+        return Response(data)
 
     @extend_schema(
         summary="계좌 삭제",
@@ -158,7 +156,7 @@ class AccountDetailView(generics.RetrieveDestroyAPIView):
             200: {"type": "object", "properties": {"message": {"type": "string"}}}
         },
     )
-    @transaction.atomic
+    @data_atomic
     def delete(self, request, *args, **kwargs):
         user_id = request.user.id
         account_id = kwargs.get('account_id')
@@ -173,8 +171,6 @@ class AccountDetailView(generics.RetrieveDestroyAPIView):
 
             logger.info(f"Account deleted: {account_id} by user {user_id}")
             self.perform_destroy(instance)
-            cache.delete(f'account_list_{user_id}')
-            cache.delete(f'account_detail_{account_id}_{user_id}')
             return Response({"message": "계좌가 삭제되었습니다."}, status=200)
         except PermissionDenied as e:
             return Response({"message": str(e)}, status=status.HTTP_403_FORBIDDEN)
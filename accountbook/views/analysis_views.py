@@ -0,0 +1,165 @@
+# accountbook/views/analysis_views.py
+
+from django.core.cache import cache
+from django.shortcuts import get_object_or_404
+from drf_spectacular.utils import extend_schema
+from rest_framework import generics, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+
+from ..models import Account, Analysis
+from ..serializers import AnalysisSerializer
+from ..utils import analysis_jobs, ledger
+from ..utils.analysis_engine import compute, load_columns, summarize
+
+
+class AnalysisResultMixin:
+    def get_result(self, analysis):
+        """사용자 전체 계좌의 집계 테이블에서 분석 결과 계산"""
+        accounts = Account.objects.filter(user=self.request.user).values('id')
+        # 정산 대기 입금은 정산 때 집계에 반영되므로 먼저 정산
+        ledger.settle_accounts(accounts)
+        return summarize(
+            accounts,
+            analysis.analysis_target,
+            analysis.analysis_period,
+            analysis.start_date,
+            analysis.end_date,
+        )
+
+    def with_result(self, analysis, result=None):
+        data = AnalysisSerializer(analysis, context={'request': self.request}).data
+        data['result'] = result if result is not None else self.get_result(analysis)
+        return data
+
+    def job_response(self, job_id, job):
+        return Response(
+            {
+                "job_id": job_id,
+                "analysis_id": job['analysis_id'],
+                "status": job['status'],
+                "status_url": reverse(
+                    'analysis_job', kwargs={'job_id': job_id}, request=self.request
+                ),
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class AnalysisListCreateView(AnalysisResultMixin, generics.ListCreateAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = AnalysisSerializer
+
+    def get_queryset(self):
+        return Analysis.objects.filter(user=self.request.user).order_by('-created_at')
+
+    @extend_schema(
+        summary="분석 목록 조회", responses={200: AnalysisSerializer(many=True)}
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    @extend_schema(
+        summary="분석 생성",
+        description=(
+            "분석 결과를 계산하고 차트 이미지 렌더링 작업을 등록합니다. "
+            "202와 작업 ID를 반환하며, 같은 조건/같은 데이터의 재요청은 캐시된 결과를 반환합니다."
+        ),
+        request=AnalysisSerializer,
+    )
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+        target = params['analysis_target']
+        period = params['analysis_period']
+
+        # 계좌별 거래내역 세대 번호가 바뀌면 데이터 버전도 바뀌어 캐시가 자연 무효화
+        cache_key = analysis_jobs.result_cache_key(
+            request.user.id,
+            target,
+            period,
+            params['start_date'],
+            params['end_date'],
+            analysis_jobs.data_version(request.user.id),
+        )
+        cached = cache.get(cache_key)
+        if cached:
+            job = analysis_jobs.get_job(cached['job_id'])
+            if job and job['status'] == analysis_jobs.DONE:
+                analysis = Analysis.objects.filter(
+                    pk=cached['analysis_id'], user=request.user
+                ).first()
+                if analysis:
+                    return Response(self.with_result(analysis, cached['result']))
+            elif job and job['status'] == analysis_jobs.PENDING:
+                return self.job_response(cached['job_id'], job)
+
+        accounts = Account.objects.filter(user=request.user).values('id')
+        # 정산 대기 입금은 정산 때 집계에 반영되므로 먼저 정산 (대기 입금이 커밋될 때
+        # 세대 번호가 이미 바뀌었으므로 위 캐시 키는 그대로 써도 됨)
+        ledger.settle_accounts(accounts)
+        columns = load_columns(
+            accounts, period, params['start_date'], params['end_date']
+        )
+        result, chart = compute(columns, target, period)
+
+        analysis = serializer.save(user=request.user)
+        job_id = analysis_jobs.start_render(analysis, chart)
+        cache.set(
+            cache_key,
+            {'job_id': job_id, 'analysis_id': analysis.pk, 'result': result},
+            timeout=analysis_jobs.RESULT_TIMEOUT,
+        )
+        return self.job_response(job_id, analysis_jobs.get_job(job_id))
+
+
+class AnalysisDetailView(AnalysisResultMixin, generics.RetrieveDestroyAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = AnalysisSerializer
+    lookup_url_kwarg = 'analysis_id'
+
+    def get_queryset(self):
+        return Analysis.objects.filter(user=self.request.user)
+
+    @extend_schema(summary="분석 결과 조회")
+    def get(self, request, *args, **kwargs):
+        return Response(self.with_result(self.get_object()))
+
+    @extend_schema(
+        summary="분석 삭제",
+        responses={
+            200: {"type": "object", "properties": {"message": {"type": "string"}}}
+        },
+    )
+    def delete(self, request, *args, **kwargs):
+        super().delete(request, *args, **kwargs)
+        return Response({"message": "분석이 삭제되었습니다."}, status=200)
+
+
+class AnalysisJobView(AnalysisResultMixin, generics.GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = AnalysisSerializer
+
+    @extend_schema(
+        summary="분석 작업 상태 조회",
+        description="렌더링 중이면 202, 완료되면 완성된 분석(결과 이미지 포함)을 반환합니다.",
+    )
+    def get(self, request, job_id):
+        job = analysis_jobs.get_job(job_id)
+        if not job or job['user_id'] != request.user.id:
+            return Response(
+                {"message": "분석 작업을 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        if job['status'] == analysis_jobs.PENDING:
+            return self.job_response(job_id, job)
+        if job['status'] == analysis_jobs.FAILED:
+            return Response(
+                {"message": "차트 생성에 실패했습니다.", "status": job['status']},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        analysis = get_object_or_404(Analysis, pk=job['analysis_id'], user=request.user)
+        return Response(self.with_result(analysis))
@@ -7,11 +7,11 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
 from django.core.cache import cache
 from django.db import transaction
-from django.utils import timezone
 from django.utils.encoding import force_bytes, force_str
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from drf_spectacular.utils import extend_schema
 from rest_framework import generics, status
+from rest_framework.exceptions import Throttled
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -19,6 +19,9 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView
 
 from ..serializers import SignupSerializer
+from ..throttling import AnonRateLimitThrottle
+from ..utils.rate_limit import SLIDING_WINDOW, get_client_ip, rate_limit
+from ..utils.user_cache import invalidate_user
 
 # 로거 설정
 logger = logging.getLogger('accountbook.auth')
@@ -26,6 +29,16 @@ logger = logging.getLogger('accountbook.auth')
 User = get_user_model()
 
 
+def _login_rate_key(request):
+    # 계정 + IP 기준, 계정 없이 보낸 요청은 인증 단계에서 바로 실패하므로 제한하지 않음
+    username = (
+        request.data.get(User.USERNAME_FIELD) if hasattr(request.data, 'get') else ''
+    )
+    if not username:
+        return None
+    return f'{username}:{get_client_ip(request)}'
+
+
 class SignupView(generics.CreateAPIView):
     serializer_class = SignupSerializer
     permission_classes = [AllowAny]
@@ -43,22 +56,15 @@ class SignupView(generics.CreateAPIView):
             }
         },
     )
+    # IP 기반 회원가입 속도 제한 - 성공한 가입만 셈 (기본 10분에 3회)
+    @rate_limit(
+        'signup',
+        message="회원가입 요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+        count_if=lambda response: response.status_code == status.HTTP_201_CREATED,
+    )
     @transaction.atomic
     def post(self, request, *args, **kwargs):
-        # IP 기반 회원가입 속도 제한
-        ip_address = self._get_client_ip(request)
-        cache_key = f'signup_rate_limit_{ip_address}'
-
-        # 10분에 3회로 제한
-        signup_attempts = cache.get(cache_key, 0)
-        if signup_attempts >= 3:
-            logger.warning(f"Signup rate limit exceeded from IP: {ip_address}")
-            return Response(
-                {
-                    "message": "회원가입 요청이 너무 많습니다. 잠시 후 다시 시도해주세요."
-                },
-                status=status.HTTP_429_TOO_MANY_REQUESTS,
-            )
+        ip_address = get_client_ip(request)
 
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -67,9 +73,6 @@ class SignupView(generics.CreateAPIView):
         try:
             user = serializer.save()
 
-            # 회원가입 시도 횟수 증가
-            cache.set(cache_key, signup_attempts + 1, timeout=60 * 10)  # 10분
-
             # 성공 로깅
             logger.info(f"User created successfully: {user.id} from {ip_address}")
 
@@ -86,15 +89,6 @@ class SignupView(generics.CreateAPIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-    def _get_client_ip(self, request):
-        """클라이언트 IP 주소 추출"""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
-        else:
-            ip = request.META.get('REMOTE_ADDR')
-        return ip
-
 
 class CookieTokenObtainPairView(TokenObtainPairView):
     # 로그인: JWT 발급 + 쿠키 저장
@@ -106,42 +100,26 @@ class CookieTokenObtainPairView(TokenObtainPairView):
             200: {"type": "object", "properties": {"message": {"type": "string"}}}
         },
     )
+    # 로그인 시도 횟수 제한 (브루트포스 공격 방지) - 실패만 세고 성공하면 초기화,
+    # 시도 전에 먼저 차감하므로 동시 요청이 몰려도 한도 이상은 인증 단계로 가지 않음
+    @rate_limit(
+        'login',
+        key=_login_rate_key,
+        message="너무 많은 로그인 시도. 5분 후에 다시 시도하세요.",
+        algorithm=SLIDING_WINDOW,
+        count_if=lambda response: response.status_code != status.HTTP_200_OK,
+        reset_if=lambda response: response.status_code == status.HTTP_200_OK,
+    )
     def post(self, request, *args, **kwargs):
         try:
-            # 로그인 시도 횟수 제한 (브루트포스 공격 방지)
-            username = request.data.get('username', '')
-            ip_address = self._get_client_ip(request)
-
-            if username:
-                # 사용자명 + IP 기반 캐시 키 생성
-                cache_key = f'login_attempts_{username}_{ip_address}'
-                login_attempts = cache.get(cache_key, 0)
-
-                # 5분 내 5회 이상 실패 시 잠금
-                if login_attempts >= 5:
-                    logger.warning(
-                        f"Login rate limit exceeded: {username} from {ip_address}"
-                    )
-                    return Response(
-                        {"message": "너무 많은 로그인 시도. 5분 후에 다시 시도하세요."},
-                        status=status.HTTP_429_TOO_MANY_REQUESTS,
-                    )
+            username = request.data.get(User.USERNAME_FIELD, '')
+            ip_address = get_client_ip(request)
 
+            # last_login 은 SIMPLE_JWT UPDATE_LAST_LOGIN 으로 갱신됨
             response = super().post(request, *args, **kwargs)
 
             if response.status_code == 200:
-                # 로그인 성공 시 시도 횟수 초기화
                 if username:
-                    cache.delete(cache_key)
-
-                    # 사용자 로그인 시간 업데이트 (선택적)
-                    try:
-                        user = User.objects.get(username=username)
-                        user.last_login = timezone.now()
-                        user.save(update_fields=['last_login'])
-                    except User.DoesNotExist:
-                        pass
-
                     logger.info(f"User logged in: {username} from {ip_address}")
 
                 refresh_token = response.data.get('refresh')
@@ -171,9 +149,7 @@ class CookieTokenObtainPairView(TokenObtainPairView):
                     path='/',
                 )
             else:
-                # 로그인 실패 시 시도 횟수 증가
                 if username:
-                    cache.set(cache_key, login_attempts + 1, timeout=60 * 5)  # 5분 유효
                     logger.warning(
                         f"Failed login attempt: {username} from {ip_address}"
                     )
@@ -186,15 +162,6 @@ class CookieTokenObtainPairView(TokenObtainPairView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-    def _get_client_ip(self, request):
-        """클라이언트 IP 주소 추출"""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
-        else:
-            ip = request.META.get('REMOTE_ADDR')
-        return ip
-
 
 class LogoutView(APIView):
     permission_classes = [IsAuthenticated]
@@ -208,7 +175,7 @@ class LogoutView(APIView):
     )
     def post(self, request, *args, **kwargs):
         user_id = request.user.id
-        ip_address = self._get_client_ip(request)
+        ip_address = get_client_ip(request)
 
         try:
             refresh_token = request.COOKIES.get('refresh_token')
@@ -229,23 +196,23 @@ class LogoutView(APIView):
 
         return response
 
-    def _get_client_ip(self, request):
-        """클라이언트 IP 주소 추출"""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
-        else:
-            ip = request.META.get('REMOTE_ADDR')
-        return ip
-
 
 # 이메일 인증 처리
 class ActivateUserView(APIView):
     permission_classes = [AllowAny]
+    # IP 기반 속도 제한 (기본 10분에 10회)
+    throttle_classes = [AnonRateLimitThrottle]
+    throttle_scope = 'activation'
+
+    def throttled(self, request, wait):
+        logger.warning(
+            f"Activation rate limit exceeded from IP: {get_client_ip(request)}"
+        )
+        raise Throttled(wait, detail="너무 많은 인증 시도. 잠시 후 다시 시도하세요.")
 
     @transaction.atomic
     def get(self, request, uidb64, token):
-        ip_address = self._get_client_ip(request)
+        ip_address = get_client_ip(request)
 
         try:
             # 캐싱을 통한 중복 인증 요청 방지
@@ -256,20 +223,6 @@ class ActivateUserView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            # IP 기반 속도 제한
-            ip_cache_key = f'activation_rate_limit_{ip_address}'
-            activation_attempts = cache.get(ip_cache_key, 0)
-
-            if activation_attempts >= 10:  # 10분에 10회로 제한
-                logger.warning(f"Activation rate limit exceeded from IP: {ip_address}")
-                return Response(
-                    {"message": "너무 많은 인증 시도. 잠시 후 다시 시도하세요."},
-                    status=status.HTTP_429_TOO_MANY_REQUESTS,
-                )
-
-            # 시도 횟수 증가
-            cache.set(ip_cache_key, activation_attempts + 1, timeout=60 * 10)  # 10분
-
             uid = urlsafe_base64_decode(uidb64).decode()
 
             # 필요한 필드만 조회
@@ -297,6 +250,7 @@ class ActivateUserView(APIView):
                 # 트랜잭션 내에서 사용자 활성화
                 user.is_active = True
                 user.save(update_fields=['is_active'])  # 필요한 필드만 업데이트
+                invalidate_user(user.id)
 
                 # 인증 완료 상태 캐싱 (1시간)
                 cache.set(cache_key, True, timeout=60 * 60)
@@ -323,12 +277,3 @@ class ActivateUserView(APIView):
                 {"message": "유효하지 않은 인증 링크입니다."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-
-    def _get_client_ip(self, request):
-        """클라이언트 IP 주소 추출"""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
-        else:
-            ip = request.META.get('REMOTE_ADDR')
-        return ip
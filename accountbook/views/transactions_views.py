@@ -1,80 +1,98 @@
 # accountbook/views/transactions_views.py
 
 from django.core.cache import cache
-from django.db import transaction
 from django.db.models import Q
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
-from django.utils.dateparse import parse_date
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import generics, status
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import JSONParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from ..filters import build_transaction_filters, normalize_params
 from ..models import Account, TransactionHistory
-from ..serializers import TransactionCreateSerializer, TransactionHistorySerializer
+from ..pagination import TransactionCursorPagination, TransactionPagination
+from ..parsers import CSVParser, read_csv_rows
+from ..renderers import CSVRenderer, NDJSONRenderer
+from ..serializers import (
+    InsufficientBalanceError,
+    TransactionCreateSerializer,
+    TransactionHistorySerializer,
+)
+from ..utils import ledger
+from ..utils.account_cache import get_account_record
+from ..utils.cache_codec import TRANSACTION_SCHEMA, get_cached, set_cached
+from ..utils.cache_tags import account_tag, tagged_key, transaction_tag
+from ..utils.export import stream_csv, stream_ndjson
+from ..utils.replicas import primary_reads
+from ..utils.shards import data_atomic, data_db
+from ..utils.transaction_cache import (
+    LIST_CACHE_TIMEOUT,
+    list_cache_key,
+    record_hit,
+    record_miss,
+)
+
+
+class TransactionAccountMixin:
+    def get_account_record(self):
+        """소유권 확인된 계좌 레코드 (near cache 조회, 요청 안에서는 한 번만)"""
+        if not hasattr(self, '_account_record'):
+            record = get_account_record(self.kwargs['account_id'])
+            if record is None or record.user_id != self.request.user.id:
+                raise Http404
+            self._account_record = record
+        return self._account_record
 
+    def get_account(self):
+        """id, user_id, write_combining 만 채운 계좌 (나머지 필드는 지연 로딩)"""
+        record = self.get_account_record()
+        return Account.from_db(
+            data_db(),
+            ['id', 'user_id', 'write_combining'],
+            [record.account_id, record.user_id, record.write_combining],
+        )
 
-class TransactionPagination(PageNumberPagination):
-    page_size = 20
-    page_size_query_param = 'page_size'
-    max_page_size = 100
+    def with_pending(self, queryset):
+        """입금 묶음 반영 계좌면 정산 대기 입금을 더한 거래 후 잔액을 함께 읽음 (잠금 없음)"""
+        if self.get_account_record().write_combining:
+            return ledger.with_pending_posts(queryset)
+        return queryset
 
 
-class TransactionListCreateView(generics.ListCreateAPIView):
+class TransactionListCreateView(TransactionAccountMixin, generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated]
     pagination_class = TransactionPagination
+    cursor_pagination_class = TransactionCursorPagination
+
+    @property
+    def paginator(self):
+        """cursor 파라미터가 있으면 키셋 페이지네이션, 없으면 기존 페이지 번호 방식"""
+        if not hasattr(self, '_paginator'):
+            params = normalize_params(self.request.query_params)
+            if 'cursor' in params or params.get('pagination') == 'cursor':
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
             return TransactionCreateSerializer
         return TransactionHistorySerializer
 
-    def get_account(self):
-        """계좌 정보를 캐싱하여 반복 조회 방지"""
-        account_id = self.kwargs.get('account_id')
-        user_id = self.request.user.id
-
-        # 캐시 키 생성
-        cache_key = f'account_{account_id}_user_{user_id}'
-
-        # 캐시에서 계좌 정보 조회
-        account = cache.get(cache_key)
-
-        if not account:
-            # 캐시에 없으면 DB에서 조회
-            account = get_object_or_404(Account, id=account_id, user=self.request.user)
-            # 캐시에 저장 (5분 유효)
-            cache.set(cache_key, account, timeout=60 * 5)
-
-        return account
-
     def get_queryset(self):
         account = self.get_account()
 
-        # 필터링 파라미터
-        filters = Q(account=account)
-
-        transaction_type = self.request.query_params.get('transaction_type')
-        min_amount = self.request.query_params.get('min_amount')
-        max_amount = self.request.query_params.get('max_amount')
-        start_date = self.request.query_params.get('start_date')
-        end_date = self.request.query_params.get('end_date')
-
-        # 필터링 조건 구성
-        if transaction_type in ['DEPOSIT', 'WITHDRAW']:
-            filters &= Q(transaction_type=transaction_type)
-        if min_amount:
-            filters &= Q(transaction_amount__gte=min_amount)
-        if max_amount:
-            filters &= Q(transaction_amount__lte=max_amount)
-        if start_date:
-            filters &= Q(transaction_timestamp__date__gte=parse_date(start_date))
-        if end_date:
-            filters &= Q(transaction_timestamp__date__lte=parse_date(end_date))
+        # 필터링 조건 구성 (날짜는 인덱스를 탈 수 있도록 반개구간 범위로 변환)
+        filters = Q(account=account) & build_transaction_filters(
+            self.request.query_params
+        )
 
         # 최적화된 쿼리셋 반환
-        return (
+        return self.with_pending(
             TransactionHistory.objects.filter(filters)
             .select_related('account')
             .only(
@@ -87,9 +105,15 @@ class TransactionListCreateView(generics.ListCreateAPIView):
                 'transaction_timestamp',
                 'account',
             )
-            .order_by('-transaction_timestamp')
+            .order_by('-transaction_timestamp', '-id')
         )
 
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        if page is None:
+            return None
+        return [ledger.fold_pending_post(row) for row in page]
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
         context['account'] = self.get_account()
@@ -129,6 +153,12 @@ class TransactionListCreateView(generics.ListCreateAPIView):
                 required=False,
                 type=str,
             ),
+            OpenApiParameter(
+                name='tz',
+                description='날짜 필터에 적용할 타임존 (예: Asia/Seoul, 기본: 서버 타임존)',
+                required=False,
+                type=str,
+            ),
             OpenApiParameter(
                 name='page',
                 description='페이지 번호',
@@ -141,11 +171,40 @@ class TransactionListCreateView(generics.ListCreateAPIView):
                 required=False,
                 type=int,
             ),
+            OpenApiParameter(
+                name='pagination',
+                description='cursor 지정 시 커서 기반 페이지네이션 사용 (기본: 페이지 번호)',
+                required=False,
+                type=str,
+            ),
+            OpenApiParameter(
+                name='cursor',
+                description='커서 기반 페이지네이션의 next/previous 커서',
+                required=False,
+                type=str,
+            ),
         ],
         responses={200: TransactionHistorySerializer(many=True)},
     )
     def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
+        # 소유권 확인 후 (계좌, 필터, 페이지, 세대) 기준 결과 캐시 조회
+        record = self.get_account_record()
+        cache_key = list_cache_key(
+            record.account_id, request, generation=record.balance_version
+        )
+        cached_data = cache.get(cache_key)
+        if cached_data is not None:
+            record_hit()
+            return Response(cached_data, headers={'X-Cache': 'HIT'})
+
+        record_miss()
+        # 캐시에 넣을 결과는 복제본이 아닌 기본 DB 에서 조회
+        with primary_reads():
+            response = super().get(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(cache_key, response.data, timeout=LIST_CACHE_TIMEOUT)
+        response['X-Cache'] = 'MISS'
+        return response
 
     @extend_schema(
         summary="거래내역 생성",
@@ -161,22 +220,12 @@ class TransactionListCreateView(generics.ListCreateAPIView):
             }
         },
     )
-    @transaction.atomic
+    @data_atomic
     def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         transaction_obj = serializer.save()
 
-        # 계좌 캐시 무효화
-        account_id = self.kwargs.get('account_id')
-        user_id = request.user.id
-        cache_key = f'account_{account_id}_user_{user_id}'
-        cache.delete(cache_key)
-
-        # 거래내역 목록 캐시 패턴 무효화 (안전 처리)
-        if hasattr(cache, 'delete_pattern'):
-            cache.delete_pattern(f'transactions_{account_id}_*')
-
         return Response(
             {
                 "message": "거래내역이 성공적으로 추가되었습니다.",
@@ -186,45 +235,194 @@ class TransactionListCreateView(generics.ListCreateAPIView):
         )
 
 
-class TransactionDetailView(generics.RetrieveUpdateDestroyAPIView):
+class TransactionBulkCreateView(TransactionAccountMixin, generics.GenericAPIView):
     permission_classes = [IsAuthenticated]
+    serializer_class = TransactionCreateSerializer
+    parser_classes = [JSONParser, CSVParser, MultiPartParser]
+    max_rows = 10_000
 
-    def get_account(self):
-        """계좌 정보를 캐싱하여 반복 조회 방지"""
-        account_id = self.kwargs['account_id']
-        user_id = self.request.user.id
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['account'] = self.get_account()
+        return context
 
-        # 캐시 키 생성
-        cache_key = f'account_{account_id}_user_{user_id}'
+    def get_rows(self, request):
+        """JSON 배열, text/csv 본문, multipart 'file' CSV 업로드를 행 목록으로 변환"""
+        if 'file' in request.FILES:
+            return read_csv_rows(request.FILES['file'])
+        if isinstance(request.data, list):
+            return request.data
+        raise ValidationError({"message": "거래내역 배열 또는 CSV 파일이 필요합니다."})
 
-        # 캐시에서 계좌 정보 조회
-        account = cache.get(cache_key)
+    @extend_schema(
+        summary="거래내역 일괄 등록",
+        description=(
+            "JSON 배열 또는 CSV(text/csv, multipart file)로 거래내역을 한 번에 등록합니다. "
+            "전체가 하나의 트랜잭션으로 처리되며, 잔액이 부족한 행이 있으면 "
+            "해당 행 번호(row)와 함께 전체가 거부됩니다."
+        ),
+        request=TransactionCreateSerializer(many=True),
+        responses={
+            201: {
+                "type": "object",
+                "properties": {
+                    "message": {"type": "string"},
+                    "created_count": {"type": "integer"},
+                },
+            }
+        },
+    )
+    @data_atomic
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(
+            data=self.get_rows(request),
+            many=True,
+            allow_empty=False,
+            max_length=self.max_rows,
+        )
+        serializer.is_valid(raise_exception=True)
+        try:
+            created = serializer.save()
+        except InsufficientBalanceError as e:
+            return Response(
+                {"message": "잔액이 부족합니다.", "row": e.row},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(
+            {
+                "message": "거래내역이 일괄 등록되었습니다.",
+                "created_count": len(created),
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class TransactionExportView(TransactionAccountMixin, generics.GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [CSVRenderer, NDJSONRenderer]
+    pagination_class = None
+
+    def get_queryset(self):
+        account = self.get_account()
+        filters = Q(account=account) & build_transaction_filters(
+            self.request.query_params
+        )
+        # 스트리밍은 미들웨어가 샤드 정보를 정리한 뒤 진행되므로 DB 를 미리 고정
+        return (
+            TransactionHistory.objects.using(data_db())
+            .filter(filters)
+            .order_by('-transaction_timestamp', '-id')
+        )
+
+    @extend_schema(
+        summary="거래내역 내보내기",
+        description=(
+            "거래내역 목록과 같은 필터로 전체 거래내역을 CSV 또는 NDJSON으로 스트리밍합니다. "
+            "format=csv(기본) 또는 format=ndjson, 혹은 Accept 헤더로 선택합니다."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='format',
+                description='내보내기 형식 (csv / ndjson)',
+                required=False,
+                type=str,
+            ),
+            OpenApiParameter(
+                name='transaction_type',
+                description='거래 유형 (DEPOSIT / WITHDRAW)',
+                required=False,
+                type=str,
+            ),
+            OpenApiParameter(
+                name='min_amount',
+                description='최소 거래 금액',
+                required=False,
+                type=int,
+            ),
+            OpenApiParameter(
+                name='max_amount',
+                description='최대 거래 금액',
+                required=False,
+                type=int,
+            ),
+            OpenApiParameter(
+                name='start_date',
+                description='조회 시작일 (YYYY-MM-DD)',
+                required=False,
+                type=str,
+            ),
+            OpenApiParameter(
+                name='end_date',
+                description='조회 종료일 (YYYY-MM-DD)',
+                required=False,
+                type=str,
+            ),
+            OpenApiParameter(
+                name='tz',
+                description='날짜 필터에 적용할 타임존 (예: Asia/Seoul, 기본: 서버 타임존)',
+                required=False,
+                type=str,
+            ),
+        ],
+        responses={(200, 'text/csv'): str, (200, 'application/x-ndjson'): str},
+    )
+    def get(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+        account_id = self.kwargs['account_id']
+        # 스트리밍은 응답 반환 후 진행되므로 시작 전에 대기 입금만 정산
+        if self.get_account_record().write_combining:
+            ledger.settle_pending(account_id)
+
+        if request.accepted_renderer.format == 'ndjson':
+            content, extension = stream_ndjson(queryset), 'ndjson'
+        else:
+            content, extension = stream_csv(queryset), 'csv'
+
+        response = StreamingHttpResponse(
+            content,
+            content_type=f'{request.accepted_renderer.media_type}; charset=utf-8',
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="transactions_{account_id}.{extension}"'
+        )
+        return response
 
-        if not account:
-            # 캐시에 없으면 DB에서 조회
-            account = get_object_or_404(Account, id=account_id, user=self.request.user)
-            # 캐시에 저장 (5분 유효)
-            cache.set(cache_key, account, timeout=60 * 5)
 
-        return account
+class TransactionDetailView(
+    TransactionAccountMixin, generics.RetrieveUpdateDestroyAPIView
+):
+    permission_classes = [IsAuthenticated]
 
     def get_object(self):
         """거래내역 객체 조회 최적화"""
         transaction_id = self.kwargs['pk']
         account_id = self.kwargs['account_id']
+        user_id = self.request.user.id
 
-        # 캐시 키 생성
-        cache_key = f'transaction_{transaction_id}_account_{account_id}'
+        # 수정/삭제는 캐시를 거치지 않고 DB 의 현재 행으로 처리
+        if self.request.method != 'GET':
+            return get_object_or_404(self.get_queryset(), pk=transaction_id)
 
-        # 캐시에서 거래내역 조회
-        transaction = cache.get(cache_key)
+        # 캐시 키 생성 - 소유자 기준으로 분리, 거래 후 잔액은 앞선 거래 변경에도 바뀌므로
+        # 계좌 태그에도 의존
+        cache_key = tagged_key(
+            f'transaction_{transaction_id}_account_{account_id}_user_{user_id}',
+            [transaction_tag(transaction_id), account_tag(account_id)],
+        )
 
-        if not transaction:
-            # 캐시에 없으면 DB에서 조회
-            queryset = self.get_queryset()
-            transaction = get_object_or_404(queryset, pk=transaction_id)
+        # 캐시에서 거래내역 조회
+        transaction = get_cached(TRANSACTION_SCHEMA, cache_key)
+
+        if transaction is None:
+            # 캐시에 없으면 기본 DB 에서 조회 (지연된 복제본의 값을 캐시하지 않도록)
+            queryset = self.with_pending(self.get_queryset())
+            with primary_reads():
+                transaction = ledger.fold_pending_post(
+                    get_object_or_404(queryset, pk=transaction_id)
+                )
             # 캐시에 저장 (5분 유효)
-            cache.set(cache_key, transaction, timeout=60 * 5)
+            set_cached(TRANSACTION_SCHEMA, cache_key, transaction, timeout=60 * 5)
 
         return transaction
 
@@ -263,27 +461,10 @@ class TransactionDetailView(generics.RetrieveUpdateDestroyAPIView):
             200: {"type": "object", "properties": {"message": {"type": "string"}}}
         },
     )
-    @transaction.atomic
+    @data_atomic
     def patch(self, request, *args, **kwargs):
-        response = super().partial_update(request, *args, **kwargs)
-
-        # 캐시 무효화
-        transaction_id = self.kwargs['pk']
-        account_id = self.kwargs['account_id']
-        user_id = request.user.id
-
-        # 거래내역 캐시 무효화
-        cache_key = f'transaction_{transaction_id}_account_{account_id}'
-        cache.delete(cache_key)
-
-        # 계좌 캐시 무효화
-        account_cache_key = f'account_{account_id}_user_{user_id}'
-        cache.delete(account_cache_key)
-
-        # 거래내역 목록 캐시 패턴 무효화 (안전 처리)
-        if hasattr(cache, 'delete_pattern'):
-            cache.delete_pattern(f'transactions_{account_id}_*')
-
+        # 캐시 무효화는 ledger 가 커밋 후 계좌 태그로 처리
+        super().partial_update(request, *args, **kwargs)
         return Response({"message": "거래내역이 수정되었습니다."}, status=200)
 
     @extend_schema(
@@ -292,24 +473,16 @@ class TransactionDetailView(generics.RetrieveUpdateDestroyAPIView):
             200: {"type": "object", "properties": {"message": {"type": "string"}}}
         },
     )
-    @transaction.atomic
+    @data_atomic
     def delete(self, request, *args, **kwargs):
-        # 삭제 전에 캐시 무효화
-        transaction_id = self.kwargs['pk']
-        account_id = self.kwargs['account_id']
-        user_id = request.user.id
-
-        # 거래내역 캐시 무효화
-        cache_key = f'transaction_{transaction_id}_account_{account_id}'
-        cache.delete(cache_key)
-
-        # 계좌 캐시 무효화
-        account_cache_key = f'account_{account_id}_user_{user_id}'
-        cache.delete(account_cache_key)
-
-        # 거래내역 목록 캐시 패턴 무효화 (안전 처리)
-        if hasattr(cache, 'delete_pattern'):
-            cache.delete_pattern(f'transactions_{account_id}_*')
-
-        response = super().delete(request, *args, **kwargs)
+        try:
+            super().delete(request, *args, **kwargs)
+        except InsufficientBalanceError:
+            return Response(
+                {"message": "잔액이 부족합니다."}, status=status.HTTP_400_BAD_REQUEST
+            )
         return Response({"message": "거래내역이 삭제되었습니다."}, status=200)
+
+    def perform_destroy(self, instance):
+        # 뒤쪽 거래의 거래 후 잔액과 계좌 잔액을 함께 되돌림
+        ledger.delete_transaction(instance)
@@ -1,7 +1,6 @@
 # accountbook/views/users_views.py
 
 from django.contrib.auth import get_user_model
-from django.core.cache import cache
 from django.db import transaction
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
@@ -12,6 +11,9 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from ..serializers import UserSerializer, UserUpdateSerializer
+from ..utils.cache_tags import invalidate_tags, tagged_key, user_tag
+from ..utils.stampede import get_or_set
+from ..utils.user_cache import invalidate_user
 
 User = get_user_model()
 
@@ -26,26 +28,19 @@ class UserProfileView(APIView):
     )
     def get(self, request):
         user_id = request.user.id
-        cache_key = f'user_profile_{user_id}'
-
-        # 캐시에서 사용자 정보 조회
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(cached_data)
-
-        # 캐시에 없으면 DB에서 조회 (필요한 필드만 선택)
-        user = (
-            User.objects.filter(id=user_id)
-            .only('id', 'email', 'nickname', 'name', 'phone_number', 'date_joined')
-            .first()
-        )
-
-        serializer = UserSerializer(user)
+        cache_key = tagged_key(f'user_profile_{user_id}', [user_tag(user_id)])
 
-        # 캐시에 저장 (30분 유효)
-        cache.set(cache_key, serializer.data, timeout=60 * 30)
+        def load():
+            # 캐시에 없으면 DB에서 조회 (필요한 필드만 선택)
+            user = (
+                User.objects.filter(id=user_id)
+                .only('id', 'email', 'nickname', 'name', 'phone_number', 'date_joined')
+                .first()
+            )
+            return UserSerializer(user).data
 
-        return Response(serializer.data)
+        # 캐시에서 사용자 정보 조회 (30분 유효, 동시 미스는 한 요청만 DB 조회)
+        return Response(get_or_set(cache_key, load, timeout=60 * 30))
 
     @extend_schema(
         summary="내 정보 수정",
@@ -70,9 +65,8 @@ class UserProfileView(APIView):
         serializer.is_valid(raise_exception=True)
         serializer.save()
 
-        # 캐시 무효화
-        cache_key = f'user_profile_{request.user.id}'
-        cache.delete(cache_key)
+        # 프로필 캐시는 post_save 시그널이 무효화, 인증 사용자 캐시는 여기서
+        invalidate_user(request.user.id)
 
         return Response({"message": "회원 정보가 수정되었습니다."})
 
@@ -90,8 +84,8 @@ class UserProfileView(APIView):
         # 소프트 삭제 패턴 적용 (실제 삭제 대신 is_active를 False로 설정)
         User.objects.filter(id=user_id).update(is_active=False)
 
-        # 캐시 무효화
-        cache_key = f'user_profile_{user_id}'
-        cache.delete(cache_key)
+        # QuerySet.update 는 시그널이 없으므로 직접 무효화
+        invalidate_tags(user_tag(user_id))
+        invalidate_user(user_id)
 
         return Response({"message": "Deleted successfully"}, status=status.HTTP_200_OK)
@@ -36,10 +36,8 @@ EMAIL_USE_TLS = (os.getenv('EMAIL_USE_TLS') or 'false').lower() == 'true'
 EMAIL_USE_SSL = (os.getenv('EMAIL_USE_SSL') or 'false').lower() == 'true'
 REDIS_HOST = os.getenv('REDIS_HOST', 'my-redis')
 
-
-print(f"[DEBUG] REDIS_HOST: {REDIS_HOST}")
-
-DEBUG = True
+# 운영 기본값 - 디버그 도구는 dev.py 에서만 추가
+DEBUG = False
 ALLOWED_HOSTS = ["*"]
 
 INSTALLED_APPS = [
@@ -56,16 +54,17 @@ INSTALLED_APPS = [
     "drf_spectacular",
     "rest_framework_simplejwt.token_blacklist",
     "corsheaders",
-    "debug_toolbar",
     "oauth",
 ]
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    # 세션/인증 미들웨어의 읽기도 복제본으로 보내도록 앞쪽에 둠
+    "accountbook.middleware.ReplicaRoutingMiddleware",
+    "accountbook.middleware.ShardRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
@@ -92,6 +91,34 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "config.wsgi.application"
 
+# DB 연결 재사용 - 지속 연결(CONN_MAX_AGE 초) 또는 psycopg 연결 풀(DB_POOL=true)
+# 상태 확인을 켜면 재사용 전에 끊긴 연결을 걸러냄 (풀은 꺼낼 때 확인)
+DB_CONN_MAX_AGE = int(os.getenv('DB_CONN_MAX_AGE') or 60)
+DB_CONN_HEALTH_CHECKS = (os.getenv('DB_CONN_HEALTH_CHECKS') or 'true').lower() == 'true'
+DB_POOL = (os.getenv('DB_POOL') or 'false').lower() == 'true'
+DB_POOL_MIN_SIZE = int(os.getenv('DB_POOL_MIN_SIZE') or 2)
+DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE') or 10)
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT') or 10)
+# 워커별 풀 대기 통계를 캐시 카운터로 보내는 최소 간격 (초)
+DB_POOL_STATS_INTERVAL = float(os.getenv('DB_POOL_STATS_INTERVAL') or 10)
+
+# 풀은 지속 연결과 함께 쓸 수 없음 (요청이 끝나면 연결을 풀에 반납)
+DATABASE_CONNECTION = {
+    "CONN_MAX_AGE": 0 if DB_POOL else DB_CONN_MAX_AGE,
+    "CONN_HEALTH_CHECKS": DB_CONN_HEALTH_CHECKS,
+    "OPTIONS": (
+        {
+            "pool": {
+                "min_size": DB_POOL_MIN_SIZE,
+                "max_size": DB_POOL_MAX_SIZE,
+                "timeout": DB_POOL_TIMEOUT,
+            }
+        }
+        if DB_POOL
+        else {}
+    ),
+}
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -100,9 +127,58 @@ DATABASES = {
         "PASSWORD": DB_PASSWORD,
         "HOST": DB_HOST,
         "PORT": DB_PORT,
+        **DATABASE_CONNECTION,
     }
 }
 
+# 읽기 복제본 - DB_REPLICA_HOSTS(쉼표 구분)마다 replica, replica_2, ... 별칭 추가
+# (이름, 계정, 포트는 기본 DB 와 같음. 테스트에서는 기본 DB 를 그대로 씀)
+DB_REPLICA_HOSTS = [
+    host.strip()
+    for host in (os.getenv('DB_REPLICA_HOSTS') or '').split(',')
+    if host.strip()
+]
+DATABASE_REPLICAS = [
+    'replica' if index == 0 else f'replica_{index + 1}'
+    for index in range(len(DB_REPLICA_HOSTS))
+]
+for _alias, _host in zip(DATABASE_REPLICAS, DB_REPLICA_HOSTS):
+    DATABASES[_alias] = {
+        **DATABASES["default"],
+        "HOST": _host,
+        "TEST": {"MIRROR": "default"},
+    }
+# 사용자 단위 샤딩 - DB_SHARD_HOSTS(쉼표 구분, "호스트" 또는 "호스트/DB이름")마다
+# shard_1, shard_2, ... 별칭 추가. 비어 있으면 모든 사용자 데이터가 기본 DB 에 있음
+DB_SHARD_HOSTS = [
+    host.strip()
+    for host in (os.getenv('DB_SHARD_HOSTS') or '').split(',')
+    if host.strip()
+]
+DATABASE_SHARDS = [f'shard_{index + 1}' for index in range(len(DB_SHARD_HOSTS))]
+for _alias, _host in zip(DATABASE_SHARDS, DB_SHARD_HOSTS):
+    _host, _, _name = _host.partition('/')
+    DATABASES[_alias] = {
+        **DATABASES["default"],
+        "HOST": _host,
+        "NAME": _name or DATABASES["default"]["NAME"],
+    }
+# 샤드 맵 캐시 - 이동 중 표시가 모든 프로세스에 보이기까지 최대 SHARD_MAP_LOCAL_TTL 초
+SHARD_MAP_CACHE_TTL = int(os.getenv('SHARD_MAP_CACHE_TTL') or 60 * 60)
+SHARD_MAP_LOCAL_TTL = float(os.getenv('SHARD_MAP_LOCAL_TTL') or 5)
+SHARD_MAP_LOCAL_SIZE = int(os.getenv('SHARD_MAP_LOCAL_SIZE') or 10000)
+# 샤드마다 겹치지 않는 ID 범위 크기 (shard_N 은 N x 범위부터 발급)
+SHARD_ID_RANGE = int(os.getenv('SHARD_ID_RANGE') or 10**12)
+
+DATABASE_ROUTERS = [
+    "accountbook.routers.ShardRouter",
+    "accountbook.routers.PrimaryReplicaRouter",
+]
+# 쓰기 뒤 기본 DB 고정 시간(초)은 허용 지연보다 길게 둬 자신의 쓰기를 놓치지 않게 함
+REPLICA_STICKY_SECONDS = int(os.getenv('REPLICA_STICKY_SECONDS') or 5)
+REPLICA_MAX_LAG = float(os.getenv('REPLICA_MAX_LAG') or 2)
+REPLICA_CHECK_INTERVAL = float(os.getenv('REPLICA_CHECK_INTERVAL') or 5)
+
 CACHES = {
     "default": {
         "BACKEND": "django_redis.cache.RedisCache",
@@ -113,10 +189,6 @@ CACHES = {
     }
 }
 
-INTERNAL_IPS = [
-    '127.0.0.1',
-]
-
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"
@@ -210,9 +282,20 @@ else:
     SESSION_COOKIE_SECURE = False
     COOKIE_SECURE = True
 
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+# 오프라인 개발/테스트: django.core.mail.backends.console.EmailBackend 또는
+# django.core.mail.backends.filebased.EmailBackend (EMAIL_FILE_PATH 에 .log 파일로 저장)
+EMAIL_BACKEND = os.getenv(
+    'EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend'
+)
+EMAIL_FILE_PATH = os.getenv('EMAIL_FILE_PATH') or str(BASE_DIR / 'tmp' / 'emails')
 DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
 
+# 메일 발송 대기열: 요청 경로에서는 대기열에 넣기만 하고 send_outbox_emails 워커가 발송
+EMAIL_OUTBOX_ENABLED = (os.getenv('EMAIL_OUTBOX_ENABLED') or 'true').lower() == 'true'
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv('EMAIL_OUTBOX_MAX_ATTEMPTS') or 5)
+EMAIL_OUTBOX_RETRY_BASE = int(os.getenv('EMAIL_OUTBOX_RETRY_BASE') or 30)
+EMAIL_OUTBOX_LEASE = int(os.getenv('EMAIL_OUTBOX_LEASE') or 300)
+
 
 # OAuth
 NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")
@@ -221,3 +304,73 @@ GITHUB_CLIENT_ID = os.getenv("GITHUB_CLIENT_ID")
 GITHUB_SECRET = os.getenv("GITHUB_SECRET")
 KAKAO_CLIENT_ID = os.getenv("KAKAO_CLIENT_ID")
 KAKAO_REDIRECT_URI = os.getenv("KAKAO_REDIRECT_URI")
+
+# 인증 사용자 캐시 (Redis 초 / 프로세스 내 LRU 초, 개수)
+USER_CACHE_TTL = int(os.getenv('USER_CACHE_TTL') or 300)
+USER_CACHE_LOCAL_TTL = float(os.getenv('USER_CACHE_LOCAL_TTL') or 10)
+USER_CACHE_LOCAL_SIZE = int(os.getenv('USER_CACHE_LOCAL_SIZE') or 1024)
+
+# 속도 제한 ('횟수/기간', 기간 단위 s/m/h/d) - accountbook/utils/rate_limit.py
+# 백엔드는 redis 또는 memory, 비우면 기본 캐시가 Redis 일 때 redis
+RATE_LIMIT_BACKEND = os.getenv('RATE_LIMIT_BACKEND', '')
+RATE_LIMITS = {
+    'signup': '3/10m',
+    'login': '5/5m',
+    'activation': '10/10m',
+    'account_create': '5/1m',
+}
+
+# 계좌 소유권 캐시 (Redis 초 / 프로세스 내 near cache 초, 개수 - 초가 0이면 near cache 사용 안 함)
+ACCOUNT_CACHE_TTL = int(os.getenv('ACCOUNT_CACHE_TTL') or 300)
+ACCOUNT_NEAR_CACHE_TTL = float(os.getenv('ACCOUNT_NEAR_CACHE_TTL') or 5)
+ACCOUNT_NEAR_CACHE_SIZE = int(os.getenv('ACCOUNT_NEAR_CACHE_SIZE') or 4096)
+
+# 거래 등록 시 잔액 갱신을 UPDATE ... RETURNING 한 문장으로 (PostgreSQL/SQLite, 그 외는 잠금 후 UPDATE)
+LEDGER_UPDATE_RETURNING = (
+    os.getenv('LEDGER_UPDATE_RETURNING') or 'true'
+).lower() == 'true'
+
+# 입금 묶음 반영 계좌의 정산 주기 (초) - 주기마다 한 번 대기 입금을 잔액에 반영
+LEDGER_COMBINE_WINDOW = float(os.getenv('LEDGER_COMBINE_WINDOW') or 0.2)
+
+# 캐시 코덱 - 직렬화 결과가 이 바이트 이상이면 zlib 압축 (accountbook/utils/cache_codec.py)
+CACHE_CODEC_COMPRESS_MIN = int(os.getenv('CACHE_CODEC_COMPRESS_MIN') or 1024)
+
+# 캐시 스탬피드 방지 (accountbook/utils/stampede.py) - 조기 갱신 강도, 재계산 잠금 초,
+# 잠금 대기 초, 논리 만료 후 이전 값을 내줄 수 있는 초
+CACHE_EARLY_REFRESH_BETA = float(os.getenv('CACHE_EARLY_REFRESH_BETA') or 1.0)
+CACHE_LOCK_TIMEOUT = float(os.getenv('CACHE_LOCK_TIMEOUT') or 5)
+CACHE_LOCK_WAIT = float(os.getenv('CACHE_LOCK_WAIT') or 1)
+CACHE_STALE_GRACE = int(os.getenv('CACHE_STALE_GRACE') or 60)
+
+# 검증된 JWT 프로세스 내 캐시 최대 개수 (0이면 사용 안 함)
+JWT_CACHE_SIZE = int(os.getenv('JWT_CACHE_SIZE') or 10000)
+
+# OAuth 제공자 HTTP 클라이언트 (oauth/clients.py)
+OAUTH_CONNECT_TIMEOUT = float(os.getenv('OAUTH_CONNECT_TIMEOUT') or 3)
+OAUTH_READ_TIMEOUT = float(os.getenv('OAUTH_READ_TIMEOUT') or 5)
+OAUTH_MAX_RETRIES = int(os.getenv('OAUTH_MAX_RETRIES') or 2)
+OAUTH_RETRY_BACKOFF = float(os.getenv('OAUTH_RETRY_BACKOFF') or 0.1)
+OAUTH_BREAKER_THRESHOLD = int(os.getenv('OAUTH_BREAKER_THRESHOLD') or 5)
+OAUTH_BREAKER_RESET = float(os.getenv('OAUTH_BREAKER_RESET') or 30)
+OAUTH_POOL_SIZE = int(os.getenv('OAUTH_POOL_SIZE') or 10)
+
+# 운영 서버 (python manage.py serve) - 워커 수(0이면 CPU 수 기준), 워커당 스레드 수,
+# 워커 재시작 요청 수(0이면 재시작 안 함)와 지터, 요청 제한 시간, 종료 시 유예 시간 (초)
+SERVE_BIND = os.getenv('SERVE_BIND') or '0.0.0.0:8000'
+SERVE_INTERFACE = os.getenv('SERVE_INTERFACE') or 'wsgi'
+SERVE_WORKERS = int(os.getenv('SERVE_WORKERS') or 0)
+SERVE_THREADS = int(os.getenv('SERVE_THREADS') or 1)
+SERVE_MAX_REQUESTS = int(os.getenv('SERVE_MAX_REQUESTS') or 1000)
+SERVE_MAX_REQUESTS_JITTER = int(os.getenv('SERVE_MAX_REQUESTS_JITTER') or 100)
+SERVE_TIMEOUT = int(os.getenv('SERVE_TIMEOUT') or 30)
+SERVE_GRACEFUL_TIMEOUT = int(os.getenv('SERVE_GRACEFUL_TIMEOUT') or 30)
+
+# 운영 설정 기동 예산 (ms) - startup_benchmark 와 테스트가 확인 (import 합계, 첫 요청)
+STARTUP_IMPORT_BUDGET_MS = int(os.getenv('STARTUP_IMPORT_BUDGET_MS') or 1500)
+STARTUP_FIRST_REQUEST_BUDGET_MS = int(
+    os.getenv('STARTUP_FIRST_REQUEST_BUDGET_MS') or 250
+)
+
+# 분석 차트 렌더링 프로세스 수 (0이면 요청 스레드에서 바로 렌더링)
+ANALYSIS_RENDER_WORKERS = int(os.getenv('ANALYSIS_RENDER_WORKERS') or 2)
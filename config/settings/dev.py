@@ -11,6 +11,18 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 DEBUG = True
 ALLOWED_HOSTS = ["*"]
 
+# 개발 전용 디버그 툴바 (base 의 목록을 바꾸지 않도록 새 목록으로)
+INSTALLED_APPS = [*INSTALLED_APPS, "debug_toolbar"]
+_toolbar_at = MIDDLEWARE.index("django.middleware.common.CommonMiddleware") + 1
+MIDDLEWARE = [
+    *MIDDLEWARE[:_toolbar_at],
+    "debug_toolbar.middleware.DebugToolbarMiddleware",
+    *MIDDLEWARE[_toolbar_at:],
+]
+INTERNAL_IPS = [
+    '127.0.0.1',
+]
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -19,5 +31,19 @@ DATABASES = {
         "PASSWORD": "qwe123",
         "HOST": "localhost",  # 로컬 개발 환경에서는 localhost로 변경
         "PORT": "5432",
+        **DATABASE_CONNECTION,
     }
 }
+# 로컬 개발 DB 하나만 사용 (복제본 없음)
+DATABASE_REPLICAS = []
+# 로컬 샤드 DB - 샤딩 테스트용, DB_SHARDING=true 일 때만 사용자 데이터를 나눔
+for _index in (1, 2):
+    DATABASES[f"shard_{_index}"] = {
+        **DATABASES["default"],
+        "NAME": f"django-postgres-shard-{_index}",
+    }
+DATABASE_SHARDS = (
+    ["shard_1", "shard_2"]
+    if (os.getenv('DB_SHARDING') or 'false').lower() == 'true'
+    else []
+)
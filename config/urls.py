@@ -3,13 +3,26 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 from django.views.generic import TemplateView
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
 from rest_framework.permissions import AllowAny
 
+
+def lazy_schema_view(name, **initkwargs):
+    """API 문서 뷰 - drf_spectacular.views(스키마 생성기 포함)는 첫 요청 때 불러옴"""
+    view = None
+
+    def schema_view(request, *args, **kwargs):
+        nonlocal view
+        if view is None:
+            from drf_spectacular import views
+
+            view = getattr(views, name).as_view(
+                permission_classes=[AllowAny], **initkwargs
+            )
+        return view(request, *args, **kwargs)
+
+    return schema_view
+
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     # 임시 메인
@@ -18,23 +31,18 @@ urlpatterns = [
     path('api/auth/', include('accountbook.urls.auth_urls')),
     path('api/users/', include('accountbook.urls.user_urls')),
     path('api/accounts/', include('accountbook.urls.account_urls')),
+    path('api/analyses/', include('accountbook.urls.analysis_urls')),
     path('api/', include('accountbook.urls.transaction_urls')),
     # API 문서 (항상 접근 가능)
-    path(
-        'api/schema/',
-        SpectacularAPIView.as_view(permission_classes=[AllowAny]),
-        name='schema',
-    ),
+    path('api/schema/', lazy_schema_view('SpectacularAPIView'), name='schema'),
     path(
         'swagger/',
-        SpectacularSwaggerView.as_view(
-            url_name='schema', permission_classes=[AllowAny]
-        ),
+        lazy_schema_view('SpectacularSwaggerView', url_name='schema'),
         name='swagger-ui',
     ),
     path(
         'api/redoc/',
-        SpectacularRedocView.as_view(url_name='schema', permission_classes=[AllowAny]),
+        lazy_schema_view('SpectacularRedocView', url_name='schema'),
         name='redoc',
     ),
     # include
@@ -42,9 +50,11 @@ urlpatterns = [
 ]
 
 
-if settings.DEBUG:
+if 'debug_toolbar' in settings.INSTALLED_APPS:
     import debug_toolbar
 
     urlpatterns = [path('__debug__/', include(debug_toolbar.urls))] + urlpatterns
+
+if settings.DEBUG:
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
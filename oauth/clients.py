@@ -0,0 +1,220 @@
+"""
+OAuth 제공자(네이버/깃허브/카카오) HTTP 클라이언트
+
+- 제공자별 requests.Session + 커넥션 풀: keep-alive 로 로그인마다 TLS 핸드셰이크 반복 방지
+- (연결, 읽기) 타임아웃: 멈춘 제공자가 워커를 붙잡지 못하게 함
+- 재시도 예산: 재시도는 최근 요청 수의 일정 비율까지만 허용해 장애 시 부하 증폭 방지
+- 서킷 브레이커: 연속 실패가 쌓이면 일정 시간 요청을 보내지 않고 바로 실패
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+logger = logging.getLogger('oauth.clients')
+
+# 재시도해도 안전한 응답 코드 (제공자 일시 장애)
+RETRYABLE_STATUS = {502, 503, 504}
+
+
+class ProviderError(Exception):
+    """제공자 호출 실패 (타임아웃, 연결 오류, 5xx)"""
+
+
+class ProviderUnavailable(ProviderError):
+    """서킷 브레이커가 열려 있어 호출하지 않음"""
+
+
+class RetryBudget:
+    """
+    재시도 예산 (토큰 버킷)
+
+    요청 한 번마다 ratio 만큼 적립하고 재시도 한 번에 1을 쓴다.
+    평상시에는 min_tokens 로 가끔의 재시도를 허용하고, 장애로 모든 요청이 실패하면
+    재시도가 전체 요청의 ratio 비율을 넘지 못한다.
+    """
+
+    def __init__(self, ratio=0.2, min_tokens=3, max_tokens=10):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = float(min_tokens)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self.tokens = min(self.tokens + self.ratio, self.max_tokens)
+
+    def withdraw(self):
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    """연속 실패 threshold 번이면 reset_timeout 초 동안 열림, 이후 시험 호출 1회 허용"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, threshold=5, reset_timeout=30.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                return True
+            # 시험 호출이 진행 중이면 나머지는 차단
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+def _not_sent(error):
+    """연결 수립 단계에서 실패해 요청이 서버에 전달되지 않았는지"""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+class ProviderClient:
+    def __init__(self, name):
+        self.name = name
+        self.timeout = (settings.OAUTH_CONNECT_TIMEOUT, settings.OAUTH_READ_TIMEOUT)
+        self.max_retries = settings.OAUTH_MAX_RETRIES
+        self.budget = RetryBudget()
+        self.breaker = CircuitBreaker(
+            threshold=settings.OAUTH_BREAKER_THRESHOLD,
+            reset_timeout=settings.OAUTH_BREAKER_RESET,
+        )
+        self.session = requests.Session()
+        # 재시도는 예산을 거쳐 직접 처리하므로 어댑터 자체 재시도는 끔
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=settings.OAUTH_POOL_SIZE, max_retries=0
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def request(self, method, url, **kwargs):
+        if not self.breaker.allow():
+            raise ProviderUnavailable(f"{self.name} 일시 차단 (서킷 브레이커 열림)")
+
+        kwargs.setdefault('timeout', self.timeout)
+        self.budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                # 연결 자체가 안 됐으면 요청이 처리되지 않았으므로 POST 도 재시도 가능
+                error = e
+                retryable = method == 'GET' or _not_sent(e)
+            else:
+                if response.status_code not in RETRYABLE_STATUS:
+                    self.breaker.record_success()
+                    return response
+                error = ProviderError(f"{self.name} 응답 {response.status_code}")
+                retryable = method == 'GET'
+
+            if (
+                not retryable
+                or attempt >= self.max_retries
+                or not self.budget.withdraw()
+            ):
+                self.breaker.record_failure()
+                logger.warning(f"OAuth provider {self.name} request failed: {error}")
+                if isinstance(error, ProviderError):
+                    raise error
+                raise ProviderError(f"{self.name} 요청 실패: {error}") from error
+
+            attempt += 1
+            time.sleep(settings.OAUTH_RETRY_BACKOFF * 2 ** (attempt - 1))
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def warm_up(self, url):
+        """
+        url 호스트 루트에 HEAD 한 번을 보내 keep-alive 연결(TCP + TLS)을 풀에 남겨 둠
+
+        준비용 호출이라 서킷 브레이커와 재시도 예산에 반영하지 않고, 실패해도 무시한다
+        (실제 요청 때 다시 연결).
+        """
+        parts = urlsplit(url)
+        try:
+            self.session.head(
+                f'{parts.scheme}://{parts.netloc}/',
+                timeout=self.timeout,
+                allow_redirects=False,
+            )
+        except requests.RequestException as e:
+            logger.debug(f"OAuth provider {self.name} warm-up skipped: {e}")
+
+
+# 토큰 요청과 프로필 호스트 연결 준비를 동시에 실행하기 위한 스레드 풀
+_pipeline_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='oauth')
+
+
+def pipelined(client, first, next_url):
+    """
+    first() (보통 토큰 요청) 를 실행하는 동안 다음 호출 대상(next_url) 호스트 연결을 미리 수립
+
+    요청 자체는 파이프라이닝하지 않는다. 프로필 호출은 토큰이 있어야 하므로 순차지만,
+    프로필 호스트의 TCP/TLS 핸드셰이크(와 HEAD 한 번)는 토큰 응답을 기다리는 동안
+    끝내 두고, 프로필 요청은 풀에 남은 연결을 재사용한다.
+    """
+    if urlsplit(next_url).netloc:
+        _pipeline_executor.submit(client.warm_up, next_url)
+    return first()
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(name):
+    """제공자별 공유 클라이언트 (프로세스당 하나)"""
+    with _clients_lock:
+        if name not in _clients:
+            _clients[name] = ProviderClient(name)
+        return _clients[name]
+
+
+def reset_clients():
+    with _clients_lock:
+        for client in _clients.values():
+            client.session.close()
+        _clients.clear()
@@ -1,6 +1,5 @@
 from urllib.parse import parse_qs, urlencode
 
-import requests
 from django.conf import settings
 from django.contrib.auth import get_user_model, login
 from django.contrib.auth.base_user import BaseUserManager
@@ -20,6 +19,8 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from accountbook.utils.jwt_cookie import set_jwt_cookie
+from accountbook.utils.user_cache import invalidate_user
+from oauth.clients import ProviderError, get_client, pipelined
 from oauth.serializers import (  # 👈 반드시 serializers 위치 확인
     NicknameCheckSerializer,
     NicknameSerializer,
@@ -72,7 +73,12 @@ def naver_callback(request):
     if NAVER_STATE != signing.loads(state):
         raise Http404("Invalid state value")
 
-    access_token = get_naver_access_token(code, state)
+    # 토큰을 기다리는 동안 프로필 호스트 연결을 미리 수립
+    access_token = pipelined(
+        get_client('naver'),
+        lambda: get_naver_access_token(code, state),
+        NAVER_PROFILE_URL,
+    )
     profile = get_naver_profile(access_token)
     email = profile.get('email')
 
@@ -81,6 +87,7 @@ def naver_callback(request):
         if not user.is_active:
             user.is_active = True
             user.save()
+            invalidate_user(user.id)
         login(request, user)
         return redirect('main')
 
@@ -113,7 +120,11 @@ def github_callback(request):
     if GITHUB_STATE != signing.loads(state):
         raise Http404("Invalid state value")
 
-    access_token = get_github_access_token(code, state)
+    access_token = pipelined(
+        get_client('github'),
+        lambda: get_github_access_token(code, state),
+        GITHUB_PROFILE_URL,
+    )
     if not access_token:
         raise Http404("Access token 없음")
 
@@ -125,6 +136,7 @@ def github_callback(request):
         if not user.is_active:
             user.is_active = True
             user.save()
+            invalidate_user(user.id)
         login(request, user)
         return redirect('main')
 
@@ -204,7 +216,10 @@ def get_naver_access_token(code, state):
         'state': state,
     }
 
-    response = requests.get(NAVER_TOKEN_URL, params=params)
+    try:
+        response = get_client('naver').get(NAVER_TOKEN_URL, params=params)
+    except ProviderError:
+        raise Http404("NAVER 토큰 요청 실패")
     if response.status_code != 200:
         raise Http404("NAVER 토큰 요청 실패")
 
@@ -215,7 +230,10 @@ def get_naver_access_token(code, state):
 def get_naver_profile(access_token):
     headers = {'Authorization': f'Bearer {access_token}'}
 
-    response = requests.get(NAVER_PROFILE_URL, headers=headers)
+    try:
+        response = get_client('naver').get(NAVER_PROFILE_URL, headers=headers)
+    except ProviderError:
+        raise Http404("NAVER 프로필 요청 실패")
     if response.status_code != 200:
         raise Http404("NAVER 프로필 요청 실패")
 
@@ -231,7 +249,10 @@ def get_github_access_token(code, state):
         'state': state,
     }
 
-    response = requests.get(GITHUB_TOKEN_URL, params=params)
+    try:
+        response = get_client('github').get(GITHUB_TOKEN_URL, params=params)
+    except ProviderError:
+        return None
     if response.status_code != 200:
         return None
 
@@ -242,14 +263,10 @@ def get_github_access_token(code, state):
 #  GitHub 프로필 요청
 def get_github_profile(access_token):
     headers = {'Authorization': f'Bearer {access_token}'}
-    print("== get_github_profile ==")
-    print(f"access_token: {access_token}")
-    print(f"headers: {headers}")
-
-    response = requests.get(GITHUB_PROFILE_URL, headers=headers)
-    print(f"response.status_code: {response.status_code}")
-    print(f"response.text: {response.text}")
-
+    try:
+        response = get_client('github').get(GITHUB_PROFILE_URL, headers=headers)
+    except ProviderError:
+        raise Http404("GitHub 프로필 요청 실패")
     if response.status_code != 200:
         raise Http404("GitHub 프로필 요청 실패")
 
@@ -338,11 +355,15 @@ class KakaoLoginRedirectView(RedirectView):
 def kakao_callback(request):
     code = request.GET.get('code')
     # 1. 액세스 토큰 요청
-    token_json = get_kakao_access_token(
-        code,
-        redirect_uri='http://localhost:8000/oauth/kakao/callback/',
-        client_id=settings.KAKAO_CLIENT_ID,
-        client_secret=getattr(settings, 'KAKAO_CLIENT_SECRET', None),
+    token_json = pipelined(
+        get_client('kakao'),
+        lambda: get_kakao_access_token(
+            code,
+            redirect_uri='http://localhost:8000/oauth/kakao/callback/',
+            client_id=settings.KAKAO_CLIENT_ID,
+            client_secret=getattr(settings, 'KAKAO_CLIENT_SECRET', None),
+        ),
+        KAKAO_PROFILE_URL,
     )
     access_token = token_json.get('access_token')
     if not access_token:
@@ -377,7 +398,6 @@ def kakao_callback(request):
 
 # 카카오 엑세스 토큰 발급
 def get_kakao_access_token(code, redirect_uri, client_id, client_secret=None):
-    url = "https://kauth.kakao.com/oauth/token"
     data = {
         'grant_type': 'authorization_code',
         'client_id': client_id,
@@ -387,13 +407,18 @@ def get_kakao_access_token(code, redirect_uri, client_id, client_secret=None):
     if client_secret:
         data['client_secret'] = client_secret
 
-    response = requests.post(url, data=data)
+    try:
+        response = get_client('kakao').post(KAKAO_TOKEN_URL, data=data)
+    except ProviderError:
+        return {}
     return response.json()
 
 
 # 카카오 유저 조희
 def get_kakao_profile(access_token):
-    url = "https://kapi.kakao.com/v2/user/me"
     headers = {"Authorization": f"Bearer {access_token}"}
-    response = requests.get(url, headers=headers)
+    try:
+        response = get_client('kakao').get(KAKAO_PROFILE_URL, headers=headers)
+    except ProviderError:
+        return {}
     return response.json()
@@ -0,0 +1,176 @@
+import json
+import time
+import unittest
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accountbook.models import Account
+from accountbook.utils import account_cache, cache_tags
+from accountbook.utils.account_cache import (
+    account_record_key,
+    clear_local_cache,
+    get_account_record,
+)
+from accountbook.utils.cache_tags import account_tag, get_versions
+from accountbook.utils.stampede import read_entry
+
+User = get_user_model()
+
+USES_REDIS = settings.CACHES['default']['BACKEND'].startswith('django_redis')
+
+
+class AccountNearCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        clear_local_cache()
+        self.addCleanup(clear_local_cache)
+        # Redis 캐시면 구독 스레드가 준비되어야 로컬 계층을 쓴다
+        if USES_REDIS:
+            cache_tags.listening_for_bumps()
+            cache_tags._listener.ready.wait(2)
+
+        self.user = User.objects.create_user(
+            email="near@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="NEAR-1",
+            bank_code="001",
+            account_type="CHECKING",
+        )
+        self.url = reverse(
+            'transaction_list_create', kwargs={'account_id': self.account.id}
+        )
+
+    def _count_remote_lookups(self):
+        return mock.patch.object(
+            account_cache,
+            'get_with_versions',
+            wraps=account_cache.get_with_versions,
+        )
+
+    def test_local_hit_skips_redis_and_db(self):
+        self.client.get(self.url)
+
+        with self._count_remote_lookups() as remote, self.assertNumQueries(0):
+            record = get_account_record(self.account.id)
+        remote.assert_not_called()
+        self.assertEqual(record.user_id, self.user.id)
+        self.assertEqual(
+            record.balance_version,
+            get_versions([account_tag(self.account.id)])[account_tag(self.account.id)],
+        )
+
+    def test_redis_stores_compact_record(self):
+        self.client.get(self.url)
+
+        # (형식 표시, 레코드, 계산 시간, 논리 만료 시각)
+        cached = read_entry(cache.get(account_record_key(self.account.id))).value
+        self.assertIsInstance(cached, tuple)
+        self.assertEqual(cached[:2], (self.account.id, self.user.id))
+
+        # 로컬 계층이 비어도 DB 조회 없이 Redis 에서 복원
+        clear_local_cache()
+        with self.assertNumQueries(0):
+            get_account_record(self.account.id)
+
+    def test_other_users_account_is_not_found(self):
+        self.client.get(self.url)
+        other = User.objects.create_user(
+            email="near-other@example.com", password="password123"
+        )
+        client = APIClient()
+        client.force_authenticate(user=other)
+
+        response = client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_deposit_evicts_and_refreshes_version(self):
+        before = get_account_record(self.account.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.url,
+                {
+                    "transaction_amount": 1000,
+                    "transaction_details": "입금",
+                    "transaction_type": "DEPOSIT",
+                    "transaction_method": "ATM",
+                    "transaction_timestamp": "2025-06-10T10:00:00Z",
+                },
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        after = get_account_record(self.account.id)
+        self.assertNotEqual(after.balance_version, before.balance_version)
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['count'], 1)
+
+    def test_stale_redis_record_is_reloaded(self):
+        get_account_record(self.account.id)
+        clear_local_cache()
+        cache_tags.bump_tags([account_tag(self.account.id)])
+
+        with self.assertNumQueries(1):
+            record = get_account_record(self.account.id)
+        self.assertEqual(
+            read_entry(cache.get(account_record_key(self.account.id))).value[2],
+            record.balance_version,
+        )
+
+    def test_previous_record_format_is_reloaded(self):
+        # 스탬피드 항목 이전 배포의 (account_id, user_id, version) 레코드
+        cache.set(account_record_key(self.account.id), (self.account.id, 1, 0))
+
+        with self.assertNumQueries(1):
+            record = get_account_record(self.account.id)
+        self.assertEqual(record.user_id, self.user.id)
+
+    def test_eviction_during_load_skips_local_fill(self):
+        load = account_cache._load
+
+        def racing_load(account_id, tag):
+            record = load(account_id, tag)
+            # DB 조회 직후 다른 요청이 같은 계좌를 변경
+            cache_tags.bump_tags([tag])
+            return record
+
+        with mock.patch.object(account_cache, '_load', racing_load):
+            get_account_record(self.account.id)
+
+        self.assertIsNone(account_cache._local.get(account_tag(self.account.id)))
+
+    @override_settings(ACCOUNT_NEAR_CACHE_TTL=0)
+    def test_disabled_near_cache_always_asks_redis(self):
+        get_account_record(self.account.id)
+
+        with self._count_remote_lookups() as remote:
+            get_account_record(self.account.id)
+        remote.assert_called_once()
+
+    @unittest.skipUnless(USES_REDIS, "pub/sub 은 Redis 캐시에서만")
+    def test_other_process_bump_evicts_over_pubsub(self):
+        tag = account_tag(self.account.id)
+        get_account_record(self.account.id)
+        self.assertIsNotNone(account_cache._local.get(tag))
+
+        # 다른 프로세스가 발행한 알림
+        cache_tags._redis().publish(
+            cache_tags.BUMP_CHANNEL, json.dumps(['other:1', [tag]])
+        )
+
+        deadline = time.monotonic() + 2
+        while account_cache._local.get(tag) is not None:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
@@ -0,0 +1,261 @@
+import tempfile
+import time
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase, APITransactionTestCase
+
+from accountbook.models import (
+    Account,
+    Analysis,
+    TransactionDailyRollup,
+    TransactionHistory,
+    TransactionMonthlyRollup,
+)
+from accountbook.utils import analysis_jobs
+from accountbook.utils.analysis_engine import summarize
+from accountbook.utils.rollups import rebuild_rollups
+
+User = get_user_model()
+
+
+def make_row(amount, transaction_type, timestamp, method="TRANSFER"):
+    return {
+        "transaction_amount": amount,
+        "transaction_details": "분석",
+        "transaction_type": transaction_type,
+        "transaction_method": method,
+        "transaction_timestamp": timestamp,
+    }
+
+
+class TransactionRollupTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="analysis@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="ANALYSIS-1",
+            bank_code="001",
+            account_type="CHECKING",
+        )
+        self.list_url = reverse(
+            'transaction_list_create', kwargs={'account_id': self.account.id}
+        )
+        rows = [
+            make_row(5000, "DEPOSIT", "2025-05-02T09:00:00Z"),
+            make_row(300, "WITHDRAW", "2025-05-20T09:00:00Z", "CARD"),
+            make_row(200, "WITHDRAW", "2025-06-03T09:00:00Z", "CARD"),
+            make_row(100, "WITHDRAW", "2025-06-30T09:00:00Z", "ATM"),
+            make_row(700, "WITHDRAW", "2025-07-05T09:00:00Z", "CARD"),
+        ]
+        response = self.client.post(
+            reverse('transaction_bulk_create', kwargs={'account_id': self.account.id}),
+            rows,
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def _snapshot(self):
+        return {
+            model.__name__: sorted(
+                model.objects.filter(account=self.account)
+                .exclude(deposit_count=0, withdraw_count=0)
+                .values_list(
+                    bucket,
+                    'transaction_method',
+                    'deposit_total',
+                    'deposit_count',
+                    'withdraw_total',
+                    'withdraw_count',
+                )
+            )
+            for model, bucket in (
+                (TransactionDailyRollup, 'day'),
+                (TransactionMonthlyRollup, 'month'),
+            )
+        }
+
+    def test_write_path_matches_rebuild(self):
+        self.client.post(
+            self.list_url,
+            make_row(50, "WITHDRAW", "2025-06-10T09:00:00Z"),
+            format='json',
+        )
+        june = TransactionHistory.objects.get(transaction_timestamp__day=3)
+        self.client.patch(
+            reverse(
+                'transaction_detail',
+                kwargs={'account_id': self.account.id, 'pk': june.pk},
+            ),
+            {
+                "transaction_method": "ATM",
+                "transaction_timestamp": "2025-07-01T09:00:00Z",
+            },
+            format='json',
+        )
+        july = TransactionHistory.objects.get(transaction_timestamp__day=5)
+        self.client.delete(
+            reverse(
+                'transaction_detail',
+                kwargs={'account_id': self.account.id, 'pk': july.pk},
+            )
+        )
+
+        incremental = self._snapshot()
+        rebuild_rollups([self.account.id])
+        self.assertEqual(incremental, self._snapshot())
+
+        monthly = dict(
+            TransactionMonthlyRollup.objects.filter(
+                account=self.account, transaction_method='ATM'
+            ).values_list('month', 'withdraw_total')
+        )
+        self.assertEqual(
+            monthly,
+            {date(2025, 6, 1): Decimal('100'), date(2025, 7, 1): Decimal('200')},
+        )
+
+    def test_summarize_reads_rollups_in_three_queries(self):
+        accounts = Account.objects.filter(user=self.user).values('id')
+        with self.assertNumQueries(3):
+            result = summarize(
+                accounts,
+                'TOTAL_SPENDING',
+                'MONTHLY',
+                date(2025, 5, 10),
+                date(2025, 7, 4),
+            )
+
+        self.assertEqual(result['total'], Decimal('600'))
+        self.assertEqual(result['count'], 3)
+        self.assertEqual(
+            [(row['period_start'], row['amount']) for row in result['series']],
+            [(date(2025, 5, 1), Decimal('300')), (date(2025, 6, 1), Decimal('300'))],
+        )
+        self.assertEqual(
+            result['by_method'], {'ATM': Decimal('100'), 'CARD': Decimal('500')}
+        )
+
+    def test_analysis_api_renders_chart_and_caches_result(self):
+        url = reverse('analysis_list_create')
+        payload = {
+            'analysis_target': 'TOTAL_INCOME',
+            'analysis_period': 'WEEKLY',
+            'start_date': '2025-04-28',
+            'end_date': '2025-05-31',
+        }
+        with (
+            tempfile.TemporaryDirectory() as media_root,
+            override_settings(MEDIA_ROOT=media_root, ANALYSIS_RENDER_WORKERS=0),
+        ):
+            response = self.client.post(url, payload, format='json')
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+            self.assertEqual(response.data['status'], 'done')
+
+            finished = self.client.get(response.data['status_url'])
+            self.assertEqual(finished.status_code, status.HTTP_200_OK)
+            self.assertTrue(finished.data['result_image'].endswith('.png'))
+            self.assertEqual(finished.data['result']['total'], Decimal('5000'))
+            self.assertEqual(
+                finished.data['result']['series'][0]['period_start'], date(2025, 4, 28)
+            )
+
+            # 같은 조건/같은 데이터 재요청은 기존 분석을 그대로 반환
+            # (계좌 ID 목록 + 분석 행 조회만, 집계 테이블은 읽지 않음)
+            with self.assertNumQueries(2):
+                repeated = self.client.post(url, payload, format='json')
+            self.assertEqual(repeated.status_code, status.HTTP_200_OK)
+            self.assertEqual(repeated.data['id'], response.data['analysis_id'])
+
+            # 거래내역이 바뀌면 데이터 버전이 바뀌어 새로 계산
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.post(
+                    self.list_url,
+                    make_row(1000, "DEPOSIT", "2025-05-03T09:00:00Z"),
+                    format='json',
+                )
+            changed = self.client.post(url, payload, format='json')
+            self.assertEqual(changed.status_code, status.HTTP_202_ACCEPTED)
+            self.assertNotEqual(
+                changed.data['analysis_id'], response.data['analysis_id']
+            )
+
+    def test_invalid_period_is_rejected(self):
+        invalid = self.client.post(
+            reverse('analysis_list_create'),
+            {
+                'analysis_target': 'TOTAL_INCOME',
+                'analysis_period': 'DAILY',
+                'start_date': '2025-06-01',
+                'end_date': '2025-05-01',
+            },
+            format='json',
+        )
+        self.assertEqual(invalid.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_job_of_other_user_is_not_found(self):
+        other = User.objects.create_user(email="other@example.com", password="pw")
+        self.client.force_authenticate(user=other)
+        with (
+            tempfile.TemporaryDirectory() as media_root,
+            override_settings(MEDIA_ROOT=media_root, ANALYSIS_RENDER_WORKERS=0),
+        ):
+            job = analysis_jobs.start_render(
+                Analysis.objects.create(
+                    user=self.user,
+                    analysis_target='TOTAL_INCOME',
+                    analysis_period='DAILY',
+                    start_date=date(2025, 5, 1),
+                    end_date=date(2025, 5, 2),
+                ),
+                {'labels': [], 'methods': [], 'matrix': []},
+            )
+        response = self.client.get(reverse('analysis_job', kwargs={'job_id': job}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class AnalysisRenderPoolTests(APITransactionTestCase):
+    # 실제 프로세스 풀 렌더링 - 완료 콜백이 다른 스레드의 DB 연결로 저장하므로 커밋된 데이터 필요
+
+    def test_chart_is_rendered_in_process_pool(self):
+        cache.clear()
+        user = User.objects.create_user(email="pool@example.com", password="pw")
+        self.client.force_authenticate(user=user)
+
+        with (
+            tempfile.TemporaryDirectory() as media_root,
+            override_settings(MEDIA_ROOT=media_root, ANALYSIS_RENDER_WORKERS=1),
+        ):
+            response = self.client.post(
+                reverse('analysis_list_create'),
+                {
+                    'analysis_target': 'TOTAL_SPENDING',
+                    'analysis_period': 'MONTHLY',
+                    'start_date': '2025-01-01',
+                    'end_date': '2025-12-31',
+                },
+                format='json',
+            )
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+            deadline = time.monotonic() + 60
+            while time.monotonic() < deadline:
+                finished = self.client.get(response.data['status_url'])
+                if finished.status_code != status.HTTP_202_ACCEPTED:
+                    break
+                time.sleep(0.1)
+
+            self.assertEqual(finished.status_code, status.HTTP_200_OK)
+            analysis = Analysis.objects.get(pk=response.data['analysis_id'])
+            with analysis.result_image.open('rb') as image:
+                self.assertEqual(image.read(8), b'\x89PNG\r\n\x1a\n')
@@ -0,0 +1,122 @@
+import pickle
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accountbook.models import Account, TransactionHistory
+from accountbook.utils.cache_codec import (
+    ACCOUNT_SCHEMA,
+    FLAG_ZLIB,
+    CacheSchema,
+    get_cached,
+    set_cached,
+)
+
+User = get_user_model()
+
+
+class CacheCodecTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="codec@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.accounts = [
+            Account.objects.create(
+                user=self.user,
+                account_number=f"CODEC-{i}",
+                bank_code="001",
+                account_type="CHECKING",
+                balance=Decimal('1234.50'),
+            )
+            for i in range(3)
+        ]
+
+    def test_round_trip_keeps_field_types(self):
+        data = ACCOUNT_SCHEMA.encode(self.accounts, many=True)
+        decoded = ACCOUNT_SCHEMA.decode(data, many=True)
+
+        self.assertEqual([a.pk for a in decoded], [a.pk for a in self.accounts])
+        first = decoded[0]
+        self.assertEqual(first.balance, Decimal('1234.50'))
+        self.assertEqual(first.created_at, self.accounts[0].created_at)
+        self.assertTrue(timezone.is_aware(first.created_at))
+        self.assertFalse(first._state.adding)
+        # 스키마 밖 필드는 지연 로딩
+        self.assertIn('user_id', first.get_deferred_fields())
+
+    def test_compresses_above_threshold(self):
+        with override_settings(CACHE_CODEC_COMPRESS_MIN=10_000):
+            plain = ACCOUNT_SCHEMA.encode(self.accounts, many=True)
+        with override_settings(CACHE_CODEC_COMPRESS_MIN=0):
+            compressed = ACCOUNT_SCHEMA.encode(self.accounts, many=True)
+
+        self.assertFalse(plain[0] & FLAG_ZLIB)
+        self.assertTrue(compressed[0] & FLAG_ZLIB)
+        self.assertEqual(
+            [a.account_number for a in ACCOUNT_SCHEMA.decode(compressed, many=True)],
+            [a.account_number for a in self.accounts],
+        )
+
+    def test_other_schema_version_or_pickle_is_a_miss(self):
+        newer = CacheSchema('account', 2, Account, ['id', 'account_number'])
+        self.assertIsNone(
+            newer.decode(ACCOUNT_SCHEMA.encode(self.accounts, many=True), many=True)
+        )
+
+        # 이전 배포가 남긴 pickle 목록
+        cache.set(ACCOUNT_SCHEMA.key('legacy'), self.accounts)
+        self.assertIsNone(get_cached(ACCOUNT_SCHEMA, 'legacy', many=True))
+
+        set_cached(ACCOUNT_SCHEMA, 'current', self.accounts, timeout=60, many=True)
+        self.assertIsNone(get_cached(newer, 'current', many=True))
+
+    def test_encoded_list_is_smaller_than_pickle(self):
+        encoded = ACCOUNT_SCHEMA.encode(self.accounts, many=True)
+        self.assertLess(len(encoded) * 3, len(pickle.dumps(self.accounts, -1)))
+
+    def test_account_list_served_from_codec_cache(self):
+        url = reverse('account_list_create')
+        first = self.client.get(url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(url)
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.data, first.data)
+
+    def test_transaction_detail_read_cached_and_write_uses_db(self):
+        account = self.accounts[0]
+        row = TransactionHistory.objects.create(
+            account=account,
+            transaction_amount=1000,
+            post_transaction_amount=1000,
+            transaction_details="입금",
+            transaction_type="DEPOSIT",
+            transaction_method="ATM",
+            transaction_timestamp=timezone.now(),
+        )
+        url = reverse(
+            'transaction_detail', kwargs={'account_id': account.id, 'pk': row.id}
+        )
+        first = self.client.get(url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(url)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second.data['transaction_amount'], '1000.00')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(url, {'transaction_details': "수정"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        row.refresh_from_db()
+        self.assertEqual(row.transaction_details, "수정")
+        self.assertEqual(self.client.get(url).data['transaction_details'], "수정")
@@ -0,0 +1,179 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accountbook.models import Account, TransactionHistory
+from accountbook.utils.cache_tags import (
+    account_tag,
+    invalidate_tags,
+    tagged_key,
+    user_tag,
+)
+
+User = get_user_model()
+
+
+class CacheTagTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="tags@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="TAG-1",
+            bank_code="001",
+            account_type="CHECKING",
+        )
+        self.detail_url = reverse(
+            'account_detail', kwargs={'account_id': self.account.id}
+        )
+        self.transactions_url = reverse(
+            'transaction_list_create', kwargs={'account_id': self.account.id}
+        )
+
+    def _deposit(self, amount, timestamp="2025-06-10T10:00:00Z"):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.transactions_url,
+                {
+                    "transaction_amount": amount,
+                    "transaction_details": "입금",
+                    "transaction_type": "DEPOSIT",
+                    "transaction_method": "ATM",
+                    "transaction_timestamp": timestamp,
+                },
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data['transaction_id']
+
+    def test_invalidation_changes_key_without_deleting_entries(self):
+        key = tagged_key('entry', [account_tag(1), user_tag(2)])
+        cache.set(key, 'value')
+        self.assertEqual(tagged_key('entry', [account_tag(1), user_tag(2)]), key)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_tags(account_tag(1))
+
+        self.assertNotEqual(tagged_key('entry', [account_tag(1), user_tag(2)]), key)
+        # 항목을 지우지 않고 키만 바뀜 (이전 항목은 TTL로 만료)
+        self.assertEqual(cache.get(key), 'value')
+
+    def test_reader_filling_cache_before_commit_is_not_served(self):
+        old_key = tagged_key('entry', [account_tag(1)])
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                invalidate_tags(account_tag(1))
+                # 커밋 전 다른 요청이 옛 데이터로 캐시를 채운 상황
+                cache.set(tagged_key('entry', [account_tag(1)]), 'stale')
+        self.assertIsNone(cache.get(tagged_key('entry', [account_tag(1)])))
+        self.assertEqual(cache.get(old_key), 'stale')
+
+    def test_transaction_create_refreshes_account_detail(self):
+        self.assertEqual(self.client.get(self.detail_url).data['balance'], '0.00')
+
+        self._deposit(1000)
+
+        self.assertEqual(self.client.get(self.detail_url).data['balance'], '1000.00')
+
+    def test_bulk_create_refreshes_account_list(self):
+        list_url = reverse('account_list_create')
+        self.client.get(list_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse(
+                    'transaction_bulk_create', kwargs={'account_id': self.account.id}
+                ),
+                [
+                    {
+                        "transaction_amount": 500,
+                        "transaction_details": "입금",
+                        "transaction_type": "DEPOSIT",
+                        "transaction_method": "ATM",
+                        "transaction_timestamp": "2025-06-10T10:00:00Z",
+                    }
+                ],
+                format='json',
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        results = self.client.get(list_url).data['results']
+        self.assertEqual(results[0]['balance'], '500.00')
+
+    def test_backdated_insert_refreshes_later_transaction_detail(self):
+        later = self._deposit(1000, "2025-06-10T10:00:00Z")
+        later_url = reverse(
+            'transaction_detail', kwargs={'account_id': self.account.id, 'pk': later}
+        )
+        self.assertEqual(
+            self.client.get(later_url).data['post_transaction_amount'], '1000.00'
+        )
+
+        self._deposit(500, "2025-06-01T10:00:00Z")
+
+        self.assertEqual(
+            self.client.get(later_url).data['post_transaction_amount'], '1500.00'
+        )
+
+    def test_account_list_is_per_user_and_refreshed_on_create(self):
+        list_url = reverse('account_list_create')
+        self.assertEqual(self.client.get(list_url).data['count'], 1)
+
+        other = User.objects.create_user(email="other@example.com", password="x")
+        other_client = APIClient()
+        other_client.force_authenticate(user=other)
+        self.assertEqual(other_client.get(list_url).data['count'], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Account.objects.create(
+                user=self.user,
+                account_number="TAG-2",
+                bank_code="001",
+                account_type="CHECKING",
+            )
+        self.assertEqual(self.client.get(list_url).data['count'], 2)
+
+    def test_cached_transaction_is_not_served_to_other_user(self):
+        transaction_id = self._deposit(1000)
+        url = reverse(
+            'transaction_detail',
+            kwargs={'account_id': self.account.id, 'pk': transaction_id},
+        )
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+        other = User.objects.create_user(email="other@example.com", password="x")
+        other_client = APIClient()
+        other_client.force_authenticate(user=other)
+        self.assertEqual(other_client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_profile_patch_refreshes_profile(self):
+        url = reverse('user_profile')
+        self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(url, {'nickname': 'renamed'})
+
+        self.assertEqual(self.client.get(url).data['nickname'], 'renamed')
+
+    def test_admin_style_save_invalidates_transaction_detail(self):
+        transaction_id = self._deposit(1000)
+        url = reverse(
+            'transaction_detail',
+            kwargs={'account_id': self.account.id, 'pk': transaction_id},
+        )
+        self.client.get(url)
+
+        row = TransactionHistory.objects.get(pk=transaction_id)
+        row.transaction_details = '관리자 수정'
+        with self.captureOnCommitCallbacks(execute=True):
+            row.save()
+
+        self.assertEqual(
+            self.client.get(url).data['transaction_details'], '관리자 수정'
+        )
@@ -0,0 +1,74 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from accountbook.utils import db_pool
+
+
+class FakePool:
+    """psycopg 풀처럼 pop_stats() 가 지난 호출 이후 증가분을 돌려줌"""
+
+    def __init__(self):
+        self.pending = {}
+
+    def pop_stats(self):
+        stats, self.pending = self.pending, {}
+        return stats
+
+
+@override_settings(DB_POOL_STATS_INTERVAL=60)
+class PoolStatsTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        db_pool._last_flush.clear()
+        self.pool = FakePool()
+        patcher = mock.patch.object(db_pool, 'get_pool', return_value=self.pool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_flush_adds_increments_to_counters(self):
+        self.pool.pending = {
+            'requests_num': 10,
+            'requests_queued': 4,
+            'requests_wait_ms': 200,
+            'connections_num': 2,
+        }
+        self.assertTrue(db_pool.flush_pool_stats())
+        self.pool.pending = {'requests_num': 10, 'requests_errors': 1}
+        self.assertTrue(db_pool.flush_pool_stats(force=True))
+
+        stats = db_pool.get_pool_stats()
+        self.assertEqual(stats['requests'], 20)
+        self.assertEqual(stats['queued'], 4)
+        self.assertEqual(stats['timeouts'], 1)
+        self.assertEqual(stats['queued_rate'], 0.2)
+        self.assertEqual(stats['avg_wait_ms'], 10.0)
+        self.assertEqual(stats['avg_queued_wait_ms'], 50.0)
+
+    def test_flush_is_throttled_per_interval(self):
+        self.pool.pending = {'requests_num': 1}
+        self.assertTrue(db_pool.flush_pool_stats())
+        self.pool.pending = {'requests_num': 1}
+
+        # 주기 안에서는 전송하지 않고 증가분을 풀에 남겨 둠
+        self.assertFalse(db_pool.flush_pool_stats())
+        self.assertEqual(db_pool.get_pool_stats()['requests'], 1)
+        self.assertEqual(self.pool.pending, {'requests_num': 1})
+
+    def test_without_pool_nothing_is_sent(self):
+        with mock.patch.object(db_pool, 'get_pool', return_value=None):
+            self.assertFalse(db_pool.flush_pool_stats(force=True))
+        self.assertEqual(db_pool.get_pool_stats()['requests'], 0)
+
+    def test_stats_command_reports_and_resets(self):
+        self.pool.pending = {'requests_num': 8, 'requests_queued': 2}
+        db_pool.flush_pool_stats()
+
+        out = StringIO()
+        call_command('db_pool_stats', '--reset', stdout=out)
+
+        self.assertIn('queued         : 2 (25.0%)', out.getvalue())
+        self.assertEqual(db_pool.get_pool_stats()['requests'], 0)
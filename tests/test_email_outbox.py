@@ -0,0 +1,114 @@
+import io
+import os
+import tempfile
+from datetime import timedelta
+
+from django.core import mail
+from django.core.cache import cache
+from django.core.mail.backends.locmem import EmailBackend as LocmemEmailBackend
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accountbook.models import EmailOutbox
+from accountbook.utils.outbox import enqueue_email, send_batch
+
+
+class CountingBackend(LocmemEmailBackend):
+    opened = 0
+    fail_for = set()
+
+    def open(self):
+        CountingBackend.opened += 1
+        return True
+
+    def send_messages(self, messages):
+        for message in messages:
+            if message.to[0] in self.fail_for:
+                raise ConnectionResetError("smtp 오류")
+        return super().send_messages(messages)
+
+
+COUNTING_BACKEND = f'{__name__}.CountingBackend'
+
+
+class EmailOutboxTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        CountingBackend.opened = 0
+        CountingBackend.fail_for = set()
+
+    def test_signup_enqueues_verification_mail_without_sending(self):
+        response = APIClient().post(
+            reverse('signup'),
+            {
+                'email': 'outbox@example.com',
+                'password': 'password123',
+                'nickname': 'outbox',
+            },
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(mail.outbox), 0)
+
+        queued = EmailOutbox.objects.get()
+        self.assertEqual(queued.to_email, 'outbox@example.com')
+        self.assertEqual(queued.status, 'PENDING')
+        self.assertIn('/api/auth/activate/', queued.body)
+
+    @override_settings(EMAIL_BACKEND=COUNTING_BACKEND)
+    def test_batch_reuses_one_connection(self):
+        for i in range(5):
+            enqueue_email(f'user{i}@example.com', '제목', '본문')
+
+        self.assertEqual(send_batch(batch_size=10), (5, 0))
+
+        self.assertEqual(CountingBackend.opened, 1)
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(EmailOutbox.objects.filter(status='SENT').count(), 5)
+        # 이미 보낸 메일은 다시 보내지 않음
+        self.assertEqual(send_batch(batch_size=10), (0, 0))
+
+    @override_settings(
+        EMAIL_BACKEND=COUNTING_BACKEND,
+        EMAIL_OUTBOX_MAX_ATTEMPTS=2,
+        EMAIL_OUTBOX_RETRY_BASE=30,
+    )
+    def test_failed_mail_is_retried_with_backoff_then_given_up(self):
+        CountingBackend.fail_for = {'broken@example.com'}
+        enqueue_email('broken@example.com', '제목', '본문')
+        enqueue_email('ok@example.com', '제목', '본문')
+
+        self.assertEqual(send_batch(), (1, 1))
+        broken = EmailOutbox.objects.get(to_email='broken@example.com')
+        self.assertEqual((broken.status, broken.attempts), ('PENDING', 1))
+        self.assertGreater(
+            broken.next_attempt_at, timezone.now() + timedelta(seconds=20)
+        )
+        # 백오프 시간 전에는 발송 대상이 아님
+        self.assertEqual(send_batch(), (0, 0))
+
+        EmailOutbox.objects.filter(pk=broken.pk).update(next_attempt_at=timezone.now())
+        self.assertEqual(send_batch(), (0, 1))
+        broken.refresh_from_db()
+        self.assertEqual((broken.status, broken.attempts), ('FAILED', 2))
+        self.assertIn('smtp 오류', broken.last_error)
+
+    def test_worker_command_with_file_backend(self):
+        enqueue_email('file@example.com', '파일 백엔드', '오프라인 발송')
+        with (
+            tempfile.TemporaryDirectory() as path,
+            override_settings(
+                EMAIL_BACKEND='django.core.mail.backends.filebased.EmailBackend',
+                EMAIL_FILE_PATH=path,
+            ),
+        ):
+            call_command('send_outbox_emails', stdout=io.StringIO())
+            files = os.listdir(path)
+            self.assertEqual(len(files), 1)
+            with open(os.path.join(path, files[0])) as f:
+                self.assertIn('file@example.com', f.read())
+        self.assertEqual(EmailOutbox.objects.get().status, 'SENT')
@@ -0,0 +1,181 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accountbook.models import Account, TransactionHistory
+from accountbook.utils import ledger
+
+User = get_user_model()
+
+
+def make_row(amount, transaction_type, timestamp):
+    return {
+        "transaction_amount": amount,
+        "transaction_details": "원장 테스트",
+        "transaction_type": transaction_type,
+        "transaction_method": "TRANSFER",
+        "transaction_timestamp": timestamp,
+    }
+
+
+class BalanceLedgerTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="ledger@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="LEDGER-1",
+            bank_code="001",
+            account_type="CHECKING",
+        )
+        kwargs = {'account_id': self.account.id}
+        self.list_url = reverse('transaction_list_create', kwargs=kwargs)
+        self.bulk_url = reverse('transaction_bulk_create', kwargs=kwargs)
+        # 10일 +1000, 12일 -300, 14일 +500
+        for row in [
+            make_row(1000, "DEPOSIT", "2025-06-10T09:00:00Z"),
+            make_row(300, "WITHDRAW", "2025-06-12T09:00:00Z"),
+            make_row(500, "DEPOSIT", "2025-06-14T09:00:00Z"),
+        ]:
+            response = self.client.post(self.list_url, row, format='json')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def detail_url(self, pk):
+        return reverse(
+            'transaction_detail', kwargs={'account_id': self.account.id, 'pk': pk}
+        )
+
+    def assertChain(self, expected_posts, expected_balance):
+        posts = list(
+            TransactionHistory.objects.filter(account=self.account)
+            .order_by('transaction_timestamp', 'id')
+            .values_list('post_transaction_amount', flat=True)
+        )
+        self.assertEqual(posts, [Decimal(value) for value in expected_posts])
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal(expected_balance))
+
+    def row_at(self, day):
+        return TransactionHistory.objects.get(
+            account=self.account, transaction_timestamp__day=day
+        )
+
+    def test_append_keeps_running_balance(self):
+        self.assertChain(['1000', '700', '1200'], '1200')
+
+    def test_backdated_insert_shifts_later_rows(self):
+        response = self.client.post(
+            self.list_url,
+            make_row(200, "DEPOSIT", "2025-06-11T09:00:00Z"),
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertChain(['1000', '1200', '900', '1400'], '1400')
+
+    def test_backdated_withdraw_cannot_overdraw_later_rows(self):
+        # 현재 잔액(1200)으로는 가능하지만 11일 시점 이후 12일 잔액이 음수가 됨
+        response = self.client.post(
+            self.list_url,
+            make_row(900, "WITHDRAW", "2025-06-11T09:00:00Z"),
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertChain(['1000', '700', '1200'], '1200')
+
+    def test_edit_amount_in_place(self):
+        response = self.client.patch(
+            self.detail_url(self.row_at(12).pk),
+            {"transaction_amount": 100},
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertChain(['1000', '900', '1400'], '1400')
+
+    def test_edit_timestamp_moves_row_in_chain(self):
+        response = self.client.patch(
+            self.detail_url(self.row_at(12).pk),
+            {"transaction_timestamp": "2025-06-15T09:00:00Z"},
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertChain(['1000', '1500', '1200'], '1200')
+
+    def test_delete_shifts_later_rows(self):
+        response = self.client.delete(self.detail_url(self.row_at(12).pk))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertChain(['1000', '1500'], '1500')
+
+    def test_delete_deposit_that_funds_later_withdraw_is_rejected(self):
+        response = self.client.delete(self.detail_url(self.row_at(10).pk))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertChain(['1000', '700', '1200'], '1200')
+
+    def test_bulk_import_with_backdated_rows(self):
+        rows = [
+            make_row(100, "DEPOSIT", "2025-06-15T09:00:00Z"),
+            make_row(50, "WITHDRAW", "2025-06-11T09:00:00Z"),
+            make_row(400, "DEPOSIT", "2025-06-13T09:00:00Z"),
+        ]
+        response = self.client.post(self.bulk_url, rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertChain(['1000', '950', '650', '1050', '1550', '1650'], '1650')
+
+    def test_bulk_backdated_withdraw_overdrawing_existing_row_is_rejected(self):
+        rows = [make_row(800, "WITHDRAW", "2025-06-11T09:00:00Z")]
+        response = self.client.post(self.bulk_url, rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['row'], 0)
+        self.assertChain(['1000', '700', '1200'], '1200')
+
+    def _account_statements(self, row):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.list_url, row, format='json')
+        table = Account._meta.db_table
+        return response, [q['sql'] for q in queries if f'"{table}"' in q['sql']]
+
+    def test_deposit_updates_balance_in_one_statement(self):
+        response, statements = self._account_statements(
+            make_row(100, "DEPOSIT", "2025-06-15T09:00:00Z")
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(statements), 1)
+        self.assertIn('RETURNING', statements[0])
+        self.assertChain(['1000', '700', '1200', '1300'], '1300')
+
+    @override_settings(LEDGER_UPDATE_RETURNING=False)
+    def test_fallback_locks_then_updates(self):
+        response, statements = self._account_statements(
+            make_row(100, "DEPOSIT", "2025-06-15T09:00:00Z")
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(statements), 2)
+        self.assertChain(['1000', '700', '1200', '1300'], '1300')
+
+    def test_overdraw_leaves_balance_untouched(self):
+        for returning in (True, False):
+            with override_settings(LEDGER_UPDATE_RETURNING=returning):
+                response = self.client.post(
+                    self.list_url,
+                    make_row(5000, "WITHDRAW", "2025-06-15T09:00:00Z"),
+                    format='json',
+                )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertChain(['1000', '700', '1200'], '1200')
+
+    def test_adjust_balance_returns_new_balance(self):
+        self.assertEqual(
+            ledger.adjust_balance(self.account.pk, Decimal('0.50')), Decimal('1200.50')
+        )
+        with self.assertRaises(Account.DoesNotExist):
+            ledger.adjust_balance(0, Decimal('1'))
@@ -0,0 +1,236 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import requests
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from oauth import oauth_views
+from oauth.clients import (
+    CircuitBreaker,
+    ProviderError,
+    ProviderUnavailable,
+    RetryBudget,
+    get_client,
+    reset_clients,
+)
+
+User = get_user_model()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _handle(self):
+        server = self.server
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        path = self.path.split('?')[0]
+        with server.lock:
+            server.requests.append(path)
+            server.peers.add(self.client_address)
+            plan = server.plans.get(path, [])
+            status, body, delay = plan.pop(0) if len(plan) > 1 else plan[0]
+        if delay:
+            time.sleep(delay)
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _handle
+    do_POST = _handle
+
+    def do_HEAD(self):
+        with self.server.lock:
+            self.server.heads.append(self.path)
+            self.server.peers.add(self.client_address)
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+@override_settings(
+    OAUTH_CONNECT_TIMEOUT=1,
+    OAUTH_READ_TIMEOUT=0.3,
+    OAUTH_MAX_RETRIES=2,
+    OAUTH_RETRY_BACKOFF=0,
+    OAUTH_BREAKER_THRESHOLD=3,
+    OAUTH_BREAKER_RESET=60,
+)
+class ProviderClientTests(APITestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        cls.server.daemon_threads = True
+        cls.server.lock = threading.Lock()
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f'http://127.0.0.1:{cls.server.server_address[1]}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        reset_clients()
+        self.server.requests = []
+        self.server.peers = set()
+        self.server.heads = []
+        self.server.plans = {}
+        self.addCleanup(reset_clients)
+
+    def plan(self, path, *responses):
+        # (상태 코드, 본문, 지연 초) - 마지막 응답은 계속 반복
+        self.server.plans[path] = list(responses)
+
+    def test_keep_alive_reuses_connection(self):
+        self.plan('/me', (200, {'ok': True}, 0))
+        client = get_client('naver')
+
+        for _ in range(5):
+            self.assertEqual(client.get(f'{self.base}/me').json(), {'ok': True})
+
+        self.assertEqual(len(self.server.requests), 5)
+        self.assertEqual(len(self.server.peers), 1)
+
+    def test_warm_up_leaves_connection_for_next_request(self):
+        self.plan('/me', (200, {'ok': True}, 0))
+        client = get_client('naver')
+
+        client.warm_up(f'{self.base}/me?x=1')
+        client.get(f'{self.base}/me')
+
+        self.assertEqual(self.server.heads, ['/'])
+        self.assertEqual(self.server.requests, ['/me'])
+        self.assertEqual(len(self.server.peers), 1)
+        # 준비용 호출은 브레이커에 반영하지 않음
+        self.assertEqual(client.breaker.failures, 0)
+
+    def test_warm_up_ignores_unreachable_host(self):
+        client = get_client('naver')
+        with mock.patch.object(
+            client.session, 'head', side_effect=requests.ConnectionError('down')
+        ):
+            client.warm_up('https://provider.invalid/me')
+
+        self.assertEqual(client.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_read_timeout_raises_provider_error(self):
+        self.plan('/slow', (200, {}, 1))
+        client = get_client('naver')
+        client.max_retries = 0
+
+        started = time.monotonic()
+        with self.assertRaises(ProviderError):
+            client.get(f'{self.base}/slow')
+        self.assertLess(time.monotonic() - started, 0.9)
+
+    def test_get_retries_server_error(self):
+        self.plan('/me', (503, {}, 0), (200, {'ok': True}, 0))
+
+        response = get_client('naver').get(f'{self.base}/me')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.requests, ['/me', '/me'])
+
+    def test_post_is_not_retried_after_request_sent(self):
+        self.plan('/token', (503, {}, 0), (200, {}, 0))
+
+        with self.assertRaises(ProviderError):
+            get_client('kakao').post(f'{self.base}/token', data={'code': 'x'})
+        self.assertEqual(self.server.requests, ['/token'])
+
+    def test_retry_budget_limits_retries(self):
+        self.plan('/down', (503, {}, 0))
+        client = get_client('github')
+        client.breaker.threshold = 1000
+
+        for _ in range(20):
+            with self.assertRaises(ProviderError):
+                client.get(f'{self.base}/down')
+
+        # 요청 20번 + 재시도는 초기 예산(3) + 20 * 0.2 이하
+        self.assertLessEqual(len(self.server.requests), 20 + 3 + 4)
+
+    def test_breaker_opens_after_consecutive_failures(self):
+        self.plan('/down', (503, {}, 0))
+        client = get_client('naver')
+        client.max_retries = 0
+
+        for _ in range(3):
+            with self.assertRaises(ProviderError):
+                client.get(f'{self.base}/down')
+        with self.assertRaises(ProviderUnavailable):
+            client.get(f'{self.base}/down')
+
+        self.assertEqual(len(self.server.requests), 3)
+        # 다른 제공자는 영향 없음
+        self.plan('/me', (200, {}, 0))
+        self.assertEqual(get_client('github').get(f'{self.base}/me').status_code, 200)
+
+    def test_naver_callback_with_stub_provider(self):
+        User.objects.create_user(email='naver@example.com', password='x')
+        self.plan('/token', (200, {'access_token': 'tok'}, 0))
+        self.plan('/me', (200, {'response': {'email': 'naver@example.com'}}, 0))
+
+        with mock.patch.multiple(
+            oauth_views,
+            NAVER_TOKEN_URL=f'{self.base}/token',
+            NAVER_PROFILE_URL=f'{self.base}/me',
+        ):
+            response = self.client.get(
+                reverse('oauth:naver_callback'),
+                {'code': 'abc', 'state': signing.dumps(oauth_views.NAVER_STATE)},
+            )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.url, reverse('main'))
+        self.assertEqual(self.server.requests, ['/token', '/me'])
+
+    def test_naver_callback_provider_down_returns_404(self):
+        self.plan('/token', (503, {}, 0))
+
+        with mock.patch.object(oauth_views, 'NAVER_TOKEN_URL', f'{self.base}/token'):
+            response = self.client.get(
+                reverse('oauth:naver_callback'),
+                {'code': 'abc', 'state': signing.dumps(oauth_views.NAVER_STATE)},
+            )
+
+        self.assertEqual(response.status_code, 404)
+
+
+class BreakerAndBudgetTests(APITestCase):
+    def test_breaker_half_open_after_reset_timeout(self):
+        breaker = CircuitBreaker(threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        self.assertFalse(breaker.allow())
+
+        time.sleep(0.06)
+        self.assertTrue(breaker.allow())
+        # 시험 호출 중에는 다른 호출 차단
+        self.assertFalse(breaker.allow())
+        breaker.record_success()
+        self.assertTrue(breaker.allow())
+
+    def test_budget_refills_with_requests(self):
+        budget = RetryBudget(ratio=0.5, min_tokens=0)
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
@@ -0,0 +1,84 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accountbook.models import Account, TransactionHistory
+
+User = get_user_model()
+
+
+class TransactionCursorPaginationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="cursor@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="CURSOR-1",
+            bank_code="001",
+            account_type="CHECKING",
+        )
+        now = timezone.now()
+        # 같은 시각의 거래가 여러 건 있어도 누락/중복 없이 넘겨야 함
+        TransactionHistory.objects.bulk_create(
+            [
+                TransactionHistory(
+                    account=self.account,
+                    transaction_amount=100 + i,
+                    post_transaction_amount=100 + i,
+                    transaction_details=f"거래 {i}",
+                    transaction_type="DEPOSIT",
+                    transaction_method="ATM",
+                    transaction_timestamp=now - timedelta(minutes=i // 4),
+                )
+                for i in range(23)
+            ]
+        )
+        self.url = reverse(
+            'transaction_list_create', kwargs={'account_id': self.account.id}
+        )
+
+    def test_cursor_walks_all_rows_in_order(self):
+        seen = []
+        response = self.client.get(self.url, {'pagination': 'cursor', 'page_size': 5})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            seen.extend(row['id'] for row in response.data['results'])
+            if not response.data['next']:
+                break
+            response = self.client.get(response.data['next'])
+
+        expected = list(
+            TransactionHistory.objects.filter(account=self.account)
+            .order_by('-transaction_timestamp', '-id')
+            .values_list('id', flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    def test_previous_cursor_returns_previous_page(self):
+        first = self.client.get(self.url, {'pagination': 'cursor', 'page_size': 5})
+        second = self.client.get(first.data['next'])
+        back = self.client.get(second.data['previous'])
+        self.assertEqual(
+            [row['id'] for row in back.data['results']],
+            [row['id'] for row in first.data['results']],
+        )
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_mode_still_default(self):
+        response = self.client.get(self.url, {'page': 2, 'page_size': 10})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 23)
+        self.assertEqual(len(response.data['results']), 10)
@@ -0,0 +1,209 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APIClient, APIRequestFactory, APITestCase
+
+from accountbook.utils.rate_limit import (
+    SLIDING_WINDOW,
+    RateLimiter,
+    get_backend,
+    get_client_ip,
+    memory_backend,
+    parse_rate,
+)
+from accountbook.views.auth_views import CookieTokenObtainPairView
+
+User = get_user_model()
+
+REDIS_AVAILABLE = settings.CACHES['default']['BACKEND'].startswith('django_redis')
+
+
+@override_settings(RATE_LIMIT_BACKEND='memory')
+class RateLimiterTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        memory_backend.clear()
+
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate('5/5m'), (5, 300))
+        self.assertEqual(parse_rate('10/h'), (10, 3600))
+
+    def test_fixed_window_limit_and_refund(self):
+        limiter = RateLimiter('test', limit=2, window=60)
+
+        first = limiter.hit('a')
+        self.assertTrue(limiter.hit('a').allowed)
+        blocked = limiter.hit('a')
+        self.assertFalse(blocked.allowed)
+        self.assertGreater(blocked.retry_after, 0)
+
+        # 다른 식별자는 별도 카운터
+        self.assertTrue(limiter.hit('b').allowed)
+
+        limiter.reset('a')
+        limiter.hit('a')
+        limiter.refund('a', first)
+        self.assertTrue(limiter.hit('a').allowed)
+
+    def test_sliding_window_frees_slots_as_time_passes(self):
+        limiter = RateLimiter('test', limit=2, window=10, algorithm=SLIDING_WINDOW)
+        now = time.monotonic()
+
+        with mock.patch('accountbook.utils.rate_limit.time.monotonic') as clock:
+            clock.return_value = now
+            self.assertTrue(limiter.hit('a').allowed)
+            clock.return_value = now + 5
+            self.assertTrue(limiter.hit('a').allowed)
+            blocked = limiter.hit('a')
+            self.assertFalse(blocked.allowed)
+            self.assertAlmostEqual(blocked.retry_after, 5)
+
+            # 첫 요청만 윈도우 밖으로 빠짐
+            clock.return_value = now + 10.5
+            self.assertTrue(limiter.hit('a').allowed)
+            self.assertFalse(limiter.hit('a').allowed)
+
+    def test_client_ip_prefers_forwarded_for(self):
+        request = APIRequestFactory().get(
+            '/', HTTP_X_FORWARDED_FOR='1.2.3.4, 10.0.0.1', REMOTE_ADDR='10.0.0.1'
+        )
+        self.assertEqual(get_client_ip(request), '1.2.3.4')
+
+    def test_signup_counts_only_successful_signups(self):
+        url = reverse('signup')
+        # 검증 실패는 한도에 포함되지 않음
+        for _ in range(5):
+            response = self.client.post(url, {'email': 'not-an-email'})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        for i in range(3):
+            response = self.client.post(
+                url,
+                {
+                    'email': f'limit{i}@example.com',
+                    'password': 'password123',
+                    'nickname': f'limit{i}',
+                },
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.post(
+            url,
+            {
+                'email': 'limit9@example.com',
+                'password': 'password123',
+                'nickname': 'l9',
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn('Retry-After', response)
+        self.assertIn('message', response.data)
+
+    def test_activation_throttle(self):
+        url = reverse('activate', kwargs={'uidb64': 'MQ', 'token': 'bad'})
+        for _ in range(10):
+            self.assertEqual(
+                self.client.get(url).status_code, status.HTTP_400_BAD_REQUEST
+            )
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_account_create_limit_per_user(self):
+        user = User.objects.create_user(email='acc@example.com', password='x')
+        client = APIClient()
+        client.force_authenticate(user=user)
+        url = reverse('account_list_create')
+
+        for i in range(5):
+            response = client.post(
+                url,
+                {
+                    'account_number': f'RL-{i}',
+                    'bank_code': '001',
+                    'account_type': 'CHECKING',
+                },
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = client.post(
+            url,
+            {'account_number': 'RL-9', 'bank_code': '001', 'account_type': 'CHECKING'},
+        )
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+
+class ConcurrentLoginMixin:
+    backend = None
+    attempts = 200
+
+    def setUp(self):
+        cache.clear()
+        memory_backend.clear()
+
+    def _concurrent_logins(self):
+        reached = []
+        lock = threading.Lock()
+        barrier = threading.Barrier(50)
+
+        def failing_login(view, request, *args, **kwargs):
+            with lock:
+                reached.append(1)
+            return Response(status=status.HTTP_401_UNAUTHORIZED)
+
+        view = CookieTokenObtainPairView.as_view()
+        factory = APIRequestFactory()
+
+        def attempt(i):
+            request = factory.post(
+                '/api/auth/login/',
+                {'email': 'victim@example.com', 'password': f'guess-{i}'},
+                format='json',
+                REMOTE_ADDR='10.1.1.1',
+            )
+            if i < 50:
+                barrier.wait()
+            return view(request).status_code
+
+        with (
+            override_settings(RATE_LIMIT_BACKEND=self.backend),
+            mock.patch(
+                'rest_framework_simplejwt.views.TokenObtainPairView.post', failing_login
+            ),
+        ):
+            with ThreadPoolExecutor(max_workers=50) as executor:
+                codes = list(executor.map(attempt, range(self.attempts)))
+        return len(reached), codes
+
+    def test_concurrent_attempts_never_exceed_limit(self):
+        reached, codes = self._concurrent_logins()
+        limit, _ = parse_rate(settings.RATE_LIMITS['login'])
+
+        self.assertEqual(reached, limit)
+        self.assertEqual(codes.count(status.HTTP_429_TOO_MANY_REQUESTS), 200 - limit)
+
+
+class MemoryConcurrentLoginTests(ConcurrentLoginMixin, APITestCase):
+    backend = 'memory'
+
+
+@skipUnless(REDIS_AVAILABLE, 'Redis 캐시 백엔드에서만 실행')
+class RedisConcurrentLoginTests(ConcurrentLoginMixin, APITestCase):
+    backend = 'redis'
+
+    def test_fixed_window_is_atomic(self):
+        with override_settings(RATE_LIMIT_BACKEND='redis'):
+            limiter = RateLimiter('test', limit=7, window=60, backend=get_backend())
+        with ThreadPoolExecutor(max_workers=50) as executor:
+            results = list(executor.map(lambda _: limiter.hit('a'), range(200)))
+
+        self.assertEqual(sum(result.allowed for result in results), 7)
+        blocked = [result for result in results if not result.allowed]
+        self.assertTrue(all(0 < result.retry_after <= 60 for result in blocked))
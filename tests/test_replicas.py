@@ -0,0 +1,132 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import OperationalError, router
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from accountbook.middleware import ReplicaRoutingMiddleware
+from accountbook.models import Account
+from accountbook.utils import replicas
+from accountbook.utils.stampede import get_or_set
+
+User = get_user_model()
+
+
+@override_settings(
+    DATABASE_REPLICAS=['replica'],
+    REPLICA_STICKY_SECONDS=5,
+    REPLICA_MAX_LAG=2,
+    REPLICA_CHECK_INTERVAL=60,
+)
+class ReplicaRoutingTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        replicas.clear_replica_status()
+        self.addCleanup(replicas.clear_replica_status)
+        patcher = mock.patch.object(replicas, 'measure_lag', return_value=0.0)
+        self.measure_lag = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.factory = RequestFactory()
+        self.user = User(pk=1, email='replica@example.com')
+
+    def handle(self, request, write=False):
+        """뷰에서 읽기 -> (쓰기) -> 읽기 순서로 라우팅된 DB 를 기록"""
+        routed = []
+
+        def view(request):
+            routed.append(router.db_for_read(Account))
+            if write:
+                router.db_for_write(Account)
+            routed.append(router.db_for_read(Account))
+            return HttpResponse()
+
+        response = ReplicaRoutingMiddleware(view)(request)
+        return routed, response
+
+    def get(self, user=None, **cookies):
+        request = self.factory.get('/api/accounts/')
+        request.COOKIES.update(cookies)
+        if user is not None:
+            request.user = user
+        return request
+
+    def test_safe_reads_go_to_replica_until_request_writes(self):
+        routed, response = self.handle(self.get(), write=True)
+
+        self.assertEqual(routed, ['replica', 'default'])
+        # 쓰기가 있었던 GET 도 이후 읽기를 기본 DB 에 고정
+        self.assertIn(replicas.STICKY_COOKIE, response.cookies)
+
+    def test_write_request_sticks_client_and_user_to_primary(self):
+        request = self.factory.post('/api/accounts/')
+        request.user = self.user
+        routed, response = self.handle(request)
+
+        self.assertEqual(routed, ['default', 'default'])
+        cookie = response.cookies[replicas.STICKY_COOKIE]
+        self.assertEqual(cookie['max-age'], 5)
+        self.assertTrue(replicas.is_user_sticky(self.user.pk))
+
+        # 쿠키를 보낸 클라이언트, 쿠키가 없는 같은 사용자의 다른 클라이언트
+        self.assertEqual(
+            self.handle(self.get(**{replicas.STICKY_COOKIE: '1'}))[0],
+            ['default', 'default'],
+        )
+        self.assertEqual(self.handle(self.get(self.user))[0], ['default', 'default'])
+        other = User(pk=2, email='other@example.com')
+        self.assertEqual(self.handle(self.get(other))[0], ['replica', 'replica'])
+
+    def test_cache_fill_reads_use_primary(self):
+        routed = []
+
+        def view(request):
+            with replicas.primary_reads():
+                routed.append(router.db_for_read(Account))
+            # 캐시 미스를 채우는 계산도 기본 DB 에서
+            routed.append(
+                get_or_set('replica_fill', lambda: router.db_for_read(Account), 60)
+            )
+            routed.append(router.db_for_read(Account))
+            with replicas.primary_reads():
+                router.db_for_write(Account)
+            routed.append(router.db_for_read(Account))
+            return HttpResponse()
+
+        ReplicaRoutingMiddleware(view)(self.get())
+
+        # 블록이 끝나면 다시 복제본, 블록 안에서 쓰기가 있었으면 계속 기본 DB
+        self.assertEqual(routed, ['default', 'default', 'replica', 'default'])
+
+    def test_lagging_replica_falls_back_to_primary(self):
+        self.measure_lag.return_value = 10.0
+
+        self.assertEqual(self.handle(self.get())[0], ['default', 'default'])
+
+    def test_unreachable_replica_falls_back_to_primary(self):
+        self.measure_lag.side_effect = OperationalError('connection refused')
+
+        with mock.patch.object(replicas, 'connections') as connections:
+            self.assertEqual(self.handle(self.get())[0], ['default', 'default'])
+        connections['replica'].close.assert_called_once_with()
+
+    def test_status_is_reused_within_interval(self):
+        self.handle(self.get())
+        self.handle(self.get())
+        self.assertEqual(self.measure_lag.call_count, 1)
+
+        with override_settings(REPLICA_CHECK_INTERVAL=0):
+            self.handle(self.get())
+        self.assertEqual(self.measure_lag.call_count, 2)
+
+    def test_outside_requests_use_primary(self):
+        self.assertEqual(router.db_for_read(Account), 'default')
+        self.assertFalse(router.allow_migrate('replica', 'accountbook'))
+        self.assertTrue(router.allow_migrate('default', 'accountbook'))
+
+    def test_middleware_is_skipped_without_replicas(self):
+        with override_settings(DATABASE_REPLICAS=[]):
+            with self.assertRaises(MiddlewareNotUsed):
+                ReplicaRoutingMiddleware(lambda request: HttpResponse())
@@ -0,0 +1,53 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+import config.asgi
+import config.wsgi
+from accountbook.management.commands import serve
+
+
+@mock.patch.object(serve.DjangoApplication, 'run', autospec=True)
+class ServeCommandTests(SimpleTestCase):
+    def call(self, **options):
+        call_command('serve', stdout=StringIO(), **options)
+
+    def test_wsgi_preloads_app_and_recycles_workers(self, run):
+        with mock.patch.object(serve, 'cpu_count', return_value=4):
+            self.call(max_requests=500)
+
+        app = run.call_args.args[0]
+        self.assertIs(app.load(), config.wsgi.application)
+        self.assertTrue(app.cfg.preload_app)
+        self.assertEqual(app.cfg.workers, 9)
+        self.assertEqual(app.cfg.worker_class_str, 'sync')
+        self.assertEqual(app.cfg.max_requests, 500)
+        self.assertEqual(app.cfg.graceful_timeout, 30)
+
+    def test_asgi_uses_uvicorn_workers(self, run):
+        with mock.patch.object(serve, 'cpu_count', return_value=4):
+            self.call(interface='asgi')
+
+        app = run.call_args.args[0]
+        self.assertIs(app.load(), config.asgi.application)
+        self.assertEqual(app.cfg.workers, 4)
+        self.assertEqual(app.cfg.worker_class_str, 'uvicorn_worker.UvicornWorker')
+
+    def test_threads_switch_to_gthread(self, run):
+        self.call(threads=4, workers=2)
+
+        app = run.call_args.args[0]
+        self.assertEqual(app.cfg.workers, 2)
+        self.assertEqual(app.cfg.worker_class_str, 'gthread')
+
+    def test_closes_connection_pools_before_fork(self, run):
+        connection = mock.Mock()
+        with mock.patch.object(
+            serve.connections, 'all', return_value=[connection]
+        ) as all_connections:
+            self.call(workers=1)
+
+        all_connections.assert_called_with(initialized_only=True)
+        connection.close_pool.assert_called_once_with()
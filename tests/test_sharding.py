@@ -0,0 +1,260 @@
+from io import StringIO
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.admin import site
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accountbook.models import Account, TransactionHistory, UserShard
+from accountbook.utils import cache_tags, ledger, shards
+from accountbook.utils.account_cache import clear_local_cache
+
+User = get_user_model()
+
+SHARDS = ['shard_1', 'shard_2']
+
+
+def make_row(amount, transaction_type='DEPOSIT', timestamp='2026-01-10T09:00:00Z'):
+    return {
+        "transaction_amount": amount,
+        "transaction_details": "샤딩 테스트",
+        "transaction_type": transaction_type,
+        "transaction_method": "TRANSFER",
+        "transaction_timestamp": timestamp,
+    }
+
+
+@skipUnless(set(SHARDS) <= set(settings.DATABASES), "샤드 DB 설정 없음")
+@override_settings(DATABASE_SHARDS=SHARDS)
+class ShardingTests(APITestCase):
+    databases = {'default', *SHARDS}
+
+    def setUp(self):
+        cache.clear()
+        clear_local_cache()
+        shards.clear_local_map()
+        for alias in SHARDS:
+            shards.prepare_shard(alias)
+        self.client = APIClient()
+
+    def create_user(self, name):
+        return User.objects.create_user(
+            email=f"{name}@example.com", password="password123"
+        )
+
+    def create_account(self, user, number):
+        self.client.force_authenticate(user=user)
+        response = self.client.post(
+            reverse('account_list_create'),
+            {"account_number": number, "bank_code": "001", "account_type": "CHECKING"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data['account_id']
+
+    def post_transaction(self, user, account_id, amount):
+        self.client.force_authenticate(user=user)
+        return self.client.post(
+            reverse('transaction_list_create', kwargs={'account_id': account_id}),
+            make_row(amount),
+            format='json',
+        )
+
+    def list_transaction_ids(self, user, account_id):
+        self.client.force_authenticate(user=user)
+        response = self.client.get(
+            reverse('transaction_list_create', kwargs={'account_id': account_id})
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [row['id'] for row in response.data['results']]
+
+    def test_views_write_and_read_the_owner_shard(self):
+        users = [self.create_user('first'), self.create_user('second')]
+        accounts = {}
+        for index, user in enumerate(users):
+            accounts[user.pk] = self.create_account(user, f"SHARD-{index}")
+            response = self.post_transaction(user, accounts[user.pk], 1000)
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        placed = [shards.shard_for_user(user.pk) for user in users]
+        # 연속된 ID 의 새 사용자는 서로 다른 샤드에 배정
+        self.assertEqual(sorted(placed), SHARDS)
+        self.assertFalse(Account.objects.using('default').exists())
+        for user, alias in zip(users, placed):
+            account = Account.objects.using(alias).get(user_id=user.pk)
+            self.assertEqual(account.pk, accounts[user.pk])
+            self.assertGreaterEqual(account.pk, shards.id_floor(alias))
+            self.assertEqual(account.balance, 1000)
+            self.assertEqual(
+                TransactionHistory.objects.using(alias)
+                .filter(account_id=account.pk)
+                .count(),
+                1,
+            )
+            self.assertEqual(len(self.list_transaction_ids(user, account.pk)), 1)
+            # 다른 사용자의 계좌는 자신의 샤드에 없으므로 찾을 수 없음
+            other = accounts[next(u.pk for u in users if u.pk != user.pk)]
+            response = self.client.get(
+                reverse('transaction_list_create', kwargs={'account_id': other})
+            )
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_legacy_user_reads_default_until_rebalanced(self):
+        user = self.create_user('legacy')
+        with override_settings(DATABASE_SHARDS=[]):
+            account = Account.objects.create(
+                user=user, account_number="LEGACY-1", bank_code="001"
+            )
+            row = ledger.record_transaction(
+                account, {**make_row(500), 'transaction_timestamp': account.created_at}
+            )
+
+        self.assertEqual(shards.shard_for_user(user.pk), 'default')
+        self.assertEqual(self.list_transaction_ids(user, account.pk), [row.pk])
+
+        out = StringIO()
+        call_command('rebalance_shards', wait=0, stdout=out)
+
+        target = shards.shard_for_user(user.pk)
+        self.assertIn(target, SHARDS)
+        self.assertFalse(Account.objects.using('default').exists())
+        self.assertFalse(TransactionHistory.objects.using('default').exists())
+        moved = TransactionHistory.objects.using(target).get(pk=row.pk)
+        # ID, 생성 시각, 잔액 체인을 그대로 옮김
+        self.assertEqual(moved.created_at, row.created_at)
+        self.assertEqual(moved.post_transaction_amount, 500)
+        self.assertEqual(Account.objects.using(target).get(pk=account.pk).balance, 500)
+        self.assertFalse(UserShard.objects.get(user=user).moving)
+        self.assertEqual(self.list_transaction_ids(user, account.pk), [row.pk])
+
+    def test_move_between_shards_keeps_ids(self):
+        user = self.create_user('mover')
+        account_id = self.create_account(user, "MOVE-1")
+        self.post_transaction(user, account_id, 1000)
+        self.post_transaction(user, account_id, 2000)
+        source = shards.shard_for_user(user.pk)
+        target = next(alias for alias in SHARDS if alias != source)
+        before = self.list_transaction_ids(user, account_id)
+
+        moved = shards.move_users([user.pk], target, wait=0)
+
+        # 계좌 1 + 거래 2 + 일별/월별 집계 1씩
+        self.assertEqual(moved, {source: 5})
+        self.assertEqual(shards.shard_for_user(user.pk), target)
+        self.assertFalse(Account.objects.using(source).exists())
+        self.assertFalse(User.objects.using(source).filter(pk=user.pk).exists())
+        self.assertEqual(self.list_transaction_ids(user, account_id), before)
+
+        response = self.post_transaction(user, account_id, 500)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertGreaterEqual(
+            response.data['transaction_id'], shards.id_floor(target)
+        )
+        self.assertEqual(Account.objects.using(target).get(pk=account_id).balance, 3500)
+
+    def test_map_entry_cached_by_racing_reader_is_ignored(self):
+        user = self.create_user('racer')
+        self.create_account(user, "RACE-1")
+        before = shards.locate(user.pk)
+        tag = cache_tags.shard_tag(user.pk)
+        version = cache_tags.get_versions([tag])[tag]
+        target = next(alias for alias in SHARDS if alias != before.alias)
+
+        shards.move_users([user.pk], target, wait=0)
+        # 이동 전에 DB 를 읽은 요청이 이동이 끝난 뒤 캐시를 채움
+        shards._remember(user.pk, before, version)
+        shards.clear_local_map()
+
+        self.assertEqual(shards.locate(user.pk), (target, False))
+
+    def test_writes_are_rejected_while_moving(self):
+        user = self.create_user('blocked')
+        account_id = self.create_account(user, "BLOCK-1")
+        UserShard.objects.filter(user=user).update(moving=True)
+        shards.forget(user.pk)
+
+        response = self.post_transaction(user, account_id, 1000)
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        # 읽기는 계속 원본 샤드에서
+        self.assertEqual(self.list_transaction_ids(user, account_id), [])
+
+    def test_deleting_user_removes_shard_data(self):
+        user = self.create_user('leaving')
+        self.create_account(user, "LEAVE-1")
+        alias = shards.shard_for_user(user.pk)
+
+        with self.captureOnCommitCallbacks(using='default', execute=True):
+            user.delete()
+
+        self.assertFalse(Account.objects.using(alias).exists())
+        self.assertFalse(User.objects.using(alias).exists())
+
+    def test_rebalance_moves_users_from_crowded_shard(self):
+        users = [self.create_user(f'crowded{index}') for index in range(3)]
+        for user in users:
+            UserShard.objects.create(user=user, shard='shard_1')
+        out = StringIO()
+
+        call_command('rebalance_shards', dry_run=True, stdout=out)
+
+        self.assertIn("shard_2 로 옮길 사용자 1명", out.getvalue())
+
+    def test_admin_lists_each_shard(self):
+        users = [self.create_user('first'), self.create_user('second')]
+        numbers = {}
+        for index, user in enumerate(users):
+            with shards.for_user(user.pk) as alias:
+                account = Account.objects.create(
+                    user=user, account_number=f"ADMIN-{index}", bank_code="001"
+                )
+            numbers[alias] = (account.pk, account.account_number)
+        # 아직 옮기지 않은 기본 DB 의 계좌
+        with override_settings(DATABASE_SHARDS=[]):
+            account = Account.objects.create(
+                user=self.create_user('legacy'),
+                account_number="ADMIN-LEGACY",
+                bank_code="001",
+            )
+        numbers['default'] = (account.pk, account.account_number)
+        admin = User.objects.create_superuser(
+            email="admin@example.com", password="password123"
+        )
+        self.client.force_login(admin)
+        url = reverse('admin:accountbook_account_changelist')
+
+        for alias in SHARDS:
+            response = self.client.get(url, {'shard': alias})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            for other, (_, number) in numbers.items():
+                if other == alias:
+                    self.assertContains(response, number)
+                else:
+                    self.assertNotContains(response, number)
+
+        # 샤드를 고르지 않으면 모든 DB 를 합쳐 정렬, 페이지 나눔과 검색도 전체에서
+        model_admin = site._registry[Account]
+        with mock.patch.object(model_admin, 'list_per_page', 2):
+            pages = [self.client.get(url, {'p': page}) for page in (1, 2)]
+        listed = [
+            account.pk for page in pages for account in page.context['cl'].result_list
+        ]
+        self.assertEqual(
+            listed, sorted((pk for pk, _ in numbers.values()), reverse=True)
+        )
+        self.assertEqual(pages[0].context['cl'].result_count, 3)
+        response = self.client.get(url, {'q': 'ADMIN-LEGACY'})
+        self.assertContains(response, 'ADMIN-LEGACY')
+        self.assertNotContains(response, 'ADMIN-0')
+
+        # 전체 목록에서 연 변경 화면은 객체가 있는 샤드를 찾음
+        account_id, number = numbers['shard_2']
+        response = self.client.get(
+            reverse('admin:accountbook_account_change', args=[account_id])
+        )
+        self.assertContains(response, number)
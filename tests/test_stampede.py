@@ -0,0 +1,147 @@
+import threading
+import time
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase, APITransactionTestCase
+
+from accountbook.models import Account
+from accountbook.utils import stampede
+from accountbook.utils.account_cache import clear_local_cache
+from accountbook.utils.stampede import (
+    get_or_set,
+    is_fresh,
+    lock_key,
+    pack_entry,
+    read_entry,
+)
+
+User = get_user_model()
+
+
+class StampedeTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_fresh_entry_is_served_without_compute(self):
+        compute = mock.Mock(return_value='new')
+        cache.set('key', pack_entry('old', 0.01, time.time() + 60))
+
+        self.assertEqual(get_or_set('key', compute, timeout=60), 'old')
+        compute.assert_not_called()
+
+    @mock.patch.object(stampede.random, 'random', return_value=0.5)
+    def test_early_refresh_recomputes_near_expiry(self, _random):
+        compute = mock.Mock(return_value='new')
+        # 계산이 오래 걸린 항목이 만료 직전이면 조기 갱신 대상
+        cache.set('key', pack_entry('old', 10, time.time() + 1))
+
+        self.assertEqual(get_or_set('key', compute, timeout=60), 'new')
+        compute.assert_called_once()
+        self.assertTrue(is_fresh(read_entry(cache.get('key')), beta=0))
+
+    @mock.patch.object(stampede.random, 'random', return_value=0.5)
+    def test_refresh_in_progress_serves_stale_value(self, _random):
+        compute = mock.Mock(return_value='new')
+        cache.set('key', pack_entry('old', 10, time.time() + 1))
+        cache.add(lock_key('key'), 1)
+
+        self.assertEqual(get_or_set('key', compute, timeout=60), 'old')
+        compute.assert_not_called()
+
+    def test_missing_value_is_not_cached_and_waiters_do_not_block(self):
+        self.assertIsNone(get_or_set('missing', lambda: None, timeout=60))
+        self.assertIsNone(cache.get('missing'))
+
+        started = time.monotonic()
+        cache.add(lock_key('missing'), 1, timeout=0.05)
+        self.assertIsNone(get_or_set('missing', lambda: None, timeout=60))
+        self.assertLess(time.monotonic() - started, 0.5)
+
+    def test_lock_taken_over_after_timeout_is_not_released(self):
+        def slow():
+            # 계산이 CACHE_LOCK_TIMEOUT 을 넘겨 잠금이 만료되고 다른 요청이 잠금을 얻음
+            cache.delete(lock_key('key'))
+            cache.add(lock_key('key'), 'other')
+            return 'new'
+
+        self.assertEqual(get_or_set('key', slow, timeout=60), 'new')
+        self.assertEqual(cache.get(lock_key('key')), 'other')
+
+        cache.delete(lock_key('key'))
+        get_or_set('other', lambda: 'value', timeout=60)
+        self.assertIsNone(cache.get(lock_key('other')))
+
+    def test_legacy_value_is_treated_as_miss(self):
+        cache.set('key', {'id': 1})
+
+        self.assertEqual(get_or_set('key', lambda: 'new', timeout=60), 'new')
+
+
+class ConcurrentMissTests(APITransactionTestCase):
+    threads = 100
+
+    def setUp(self):
+        cache.clear()
+        clear_local_cache()
+        self.user = User.objects.create_user(
+            email="stampede@example.com", password="password123"
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="STAMPEDE-1",
+            bank_code="001",
+            account_type="CHECKING",
+        )
+
+    def _run_concurrently(self, url):
+        queries = []
+        lock = threading.Lock()
+
+        def count(execute, sql, params, many, context):
+            with lock:
+                queries.append(sql)
+            return execute(sql, params, many, context)
+
+        def install(sender, connection, **kwargs):
+            connection.execute_wrappers.append(count)
+
+        barrier = threading.Barrier(self.threads)
+        statuses = []
+
+        def request():
+            client = APIClient()
+            client.force_authenticate(user=self.user)
+            try:
+                barrier.wait()
+                statuses.append(client.get(url).status_code)
+            finally:
+                connections.close_all()
+
+        connection_created.connect(install)
+        try:
+            workers = [threading.Thread(target=request) for _ in range(self.threads)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        finally:
+            connection_created.disconnect(install)
+        return statuses, queries
+
+    def test_concurrent_misses_run_one_query(self):
+        url = reverse('account_detail', kwargs={'account_id': self.account.id})
+
+        with mock.patch.object(
+            stampede, '_compute_and_store', wraps=stampede._compute_and_store
+        ) as compute:
+            statuses, queries = self._run_concurrently(url)
+
+        self.assertEqual(statuses, [status.HTTP_200_OK] * self.threads)
+        self.assertEqual(len(queries), 1, queries)
+        compute.assert_called_once()
@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from accountbook.utils.startup import measure_startup
+
+
+def loaded(modules, package):
+    return any(name == package or name.startswith(f'{package}.') for name in modules)
+
+
+class ProductionStartupTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.result = measure_startup('config.settings.prod')
+
+    def test_first_request_is_served(self):
+        # 인증 없는 계좌 목록 요청 - DB/캐시 없이 401
+        self.assertEqual(self.result['status'], 401)
+
+    def test_debug_and_schema_modules_are_not_loaded(self):
+        modules = self.result['modules']
+        self.assertFalse(loaded(modules, 'debug_toolbar'))
+        self.assertFalse(loaded(modules, 'drf_yasg'))
+        # API 문서 뷰는 문서 요청 때 불러옴
+        self.assertFalse(loaded(modules, 'drf_spectacular.views'))
+
+    def test_startup_within_budget(self):
+        self.assertLessEqual(
+            self.result['import_ms'], settings.STARTUP_IMPORT_BUDGET_MS
+        )
+        self.assertLessEqual(
+            self.result['first_request_ms'], settings.STARTUP_FIRST_REQUEST_BUDGET_MS
+        )
@@ -0,0 +1,88 @@
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accountbook.authentication import CookieJWTAuthentication
+from accountbook.utils.local_cache import LocalLRUCache
+from accountbook.utils.token_cache import clear_token_cache
+from accountbook.utils.user_cache import clear_local_cache
+
+User = get_user_model()
+
+
+class TokenCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        clear_token_cache()
+        clear_local_cache()
+        self.addCleanup(clear_token_cache)
+        self.addCleanup(clear_local_cache)
+        self.user = User.objects.create_user(
+            email="tokencache@example.com", password="password123"
+        )
+        self.authentication = CookieJWTAuthentication()
+        self.factory = APIRequestFactory()
+
+    def _request(self, token):
+        return self.factory.get('/', HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def _authenticate_counting(self, *requests):
+        original = JWTAuthentication.get_validated_token
+        with mock.patch.object(
+            JWTAuthentication,
+            'get_validated_token',
+            autospec=True,
+            side_effect=original,
+        ) as validate:
+            results = [self.authentication.authenticate(r) for r in requests]
+        return results, validate.call_count
+
+    def test_same_token_is_verified_once(self):
+        request = self._request(AccessToken.for_user(self.user))
+
+        results, verified = self._authenticate_counting(request, request, request)
+
+        self.assertEqual(verified, 1)
+        self.assertTrue(all(user == self.user for user, _ in results))
+
+    def test_tampered_token_is_not_served_from_cache(self):
+        token = str(AccessToken.for_user(self.user))
+        self.authentication.authenticate(self._request(token))
+
+        results, verified = self._authenticate_counting(self._request(token[:-2]))
+
+        self.assertEqual(verified, 1)
+        self.assertIsNone(results[0])
+
+    def test_entry_expires_with_token(self):
+        token = AccessToken.for_user(self.user)
+        token.set_exp(lifetime=timedelta(seconds=30))
+        request = self._request(token)
+        self.authentication.authenticate(request)
+
+        with mock.patch(
+            'accountbook.utils.local_cache.time.monotonic',
+            return_value=time.monotonic() + 31,
+        ):
+            # 캐시 항목이 만료되어 다시 검증 -> 만료 토큰이므로 거부는 simplejwt 가 판단
+            _, verified = self._authenticate_counting(request)
+        self.assertEqual(verified, 1)
+
+
+class LocalLRUCacheTests(APITestCase):
+    def test_evicts_least_recently_used(self):
+        lru = LocalLRUCache(maxsize=2)
+        lru.set('a', 1, 60)
+        lru.set('b', 2, 60)
+        lru.get('a')
+        lru.set('c', 3, 60)
+
+        self.assertEqual(len(lru), 2)
+        self.assertIsNone(lru.get('b'))
+        self.assertEqual((lru.get('a'), lru.get('c')), (1, 3))
@@ -0,0 +1,129 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accountbook.models import Account, TransactionHistory
+
+User = get_user_model()
+
+
+def make_row(amount, transaction_type, timestamp, details="일괄 등록"):
+    return {
+        "transaction_amount": amount,
+        "transaction_details": details,
+        "transaction_type": transaction_type,
+        "transaction_method": "TRANSFER",
+        "transaction_timestamp": timestamp,
+    }
+
+
+class TransactionBulkCreateTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="bulk@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="BULK-1",
+            bank_code="001",
+            account_type="CHECKING",
+            balance=1000,
+        )
+        self.url = reverse(
+            'transaction_bulk_create', kwargs={'account_id': self.account.id}
+        )
+
+    def test_json_rows_are_applied_in_timestamp_order(self):
+        rows = [
+            make_row(500, "WITHDRAW", "2025-06-10T12:00:00Z"),
+            make_row(2000, "DEPOSIT", "2025-06-10T09:00:00Z"),
+            make_row(300, "DEPOSIT", "2025-06-11T09:00:00Z"),
+        ]
+        response = self.client.post(self.url, rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created_count'], 3)
+
+        posts = list(
+            TransactionHistory.objects.filter(account=self.account)
+            .order_by('transaction_timestamp')
+            .values_list('post_transaction_amount', flat=True)
+        )
+        self.assertEqual(posts, [Decimal('3000'), Decimal('2500'), Decimal('2800')])
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal('2800'))
+
+    def test_overdraft_rejects_whole_batch_with_row_index(self):
+        rows = [
+            make_row(500, "DEPOSIT", "2025-06-10T09:00:00Z"),
+            make_row(5000, "WITHDRAW", "2025-06-10T10:00:00Z"),
+        ]
+        response = self.client.post(self.url, rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['row'], 1)
+        self.assertEqual(TransactionHistory.objects.count(), 0)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal('1000'))
+
+    def test_validation_errors_are_reported_per_row(self):
+        rows = [
+            make_row(100, "DEPOSIT", "2025-06-10T09:00:00Z"),
+            make_row(-1, "DEPOSIT", "2025-06-10T09:00:00Z"),
+        ]
+        response = self.client.post(self.url, rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('transaction_amount', response.data[1])
+
+    def test_csv_body_and_file_upload(self):
+        csv_text = (
+            "transaction_amount,transaction_details,transaction_type,"
+            "transaction_method,transaction_timestamp\n"
+            '100,"커피, 디저트",WITHDRAW,CARD,2025-06-10T09:00:00Z\n'
+            "400,이자,DEPOSIT,INTEREST,2025-06-10T10:00:00Z\n"
+        )
+        response = self.client.post(
+            self.url, csv_text.encode('utf-8'), content_type='text/csv'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        upload = SimpleUploadedFile(
+            'history.csv', csv_text.encode('utf-8'), content_type='text/csv'
+        )
+        response = self.client.post(self.url, {'file': upload}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal('1600'))
+        self.assertTrue(
+            TransactionHistory.objects.filter(
+                transaction_details="커피, 디저트"
+            ).exists()
+        )
+
+    def test_empty_batch_is_rejected(self):
+        response = self.client.post(self.url, [], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_large_batch(self):
+        # PostgreSQL에서는 COPY 경로를 사용하는 크기
+        rows = [
+            make_row(10, "DEPOSIT", f"2025-06-10T09:{i // 60:02d}:{i % 60:02d}Z")
+            for i in range(600)
+        ]
+        response = self.client.post(self.url, rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            TransactionHistory.objects.filter(account=self.account).count(), 600
+        )
+        latest = TransactionHistory.objects.filter(account=self.account).latest(
+            'transaction_timestamp'
+        )
+        self.assertEqual(latest.post_transaction_amount, Decimal('7000'))
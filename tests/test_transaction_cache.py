@@ -0,0 +1,130 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accountbook.models import Account
+from accountbook.utils.transaction_cache import get_cache_stats
+
+User = get_user_model()
+
+
+class TransactionListCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="listcache@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="CACHE-1",
+            bank_code="001",
+            account_type="CHECKING",
+        )
+        self.url = reverse(
+            'transaction_list_create', kwargs={'account_id': self.account.id}
+        )
+
+    def _deposit(self, amount):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.url,
+                {
+                    "transaction_amount": amount,
+                    "transaction_details": "입금",
+                    "transaction_type": "DEPOSIT",
+                    "transaction_method": "ATM",
+                    "transaction_timestamp": "2025-06-10T10:00:00Z",
+                },
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data['transaction_id']
+
+    def test_repeated_query_is_served_from_cache(self):
+        self._deposit(1000)
+        first = self.client.get(self.url, {'transaction_type': 'DEPOSIT'})
+        self.assertEqual(first['X-Cache'], 'MISS')
+
+        # 파라미터 순서/공백이 달라도 같은 키로 정규화
+        with self.assertNumQueries(0):
+            second = self.client.get(
+                f'{self.url}?page=&transaction_type=DEPOSIT%20&page_size='
+            )
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.data, first.data)
+
+        stats = get_cache_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_padded_params_filter_like_their_cache_key(self):
+        self._deposit(1000)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                self.url,
+                {
+                    "transaction_amount": 300,
+                    "transaction_details": "출금",
+                    "transaction_type": "WITHDRAW",
+                    "transaction_method": "ATM",
+                    "transaction_timestamp": "2025-06-11T10:00:00Z",
+                },
+            )
+
+        # 캐시가 비어 있어도 공백이 붙은 값은 정리된 값과 같은 조건으로 조회
+        padded = self.client.get(
+            f'{self.url}?transaction_type=DEPOSIT%20&start_date=%202025-06-01'
+        )
+        self.assertEqual(padded['X-Cache'], 'MISS')
+        self.assertEqual(padded.data['count'], 1)
+
+        clean = self.client.get(
+            self.url, {'transaction_type': 'DEPOSIT', 'start_date': '2025-06-01'}
+        )
+        self.assertEqual(clean['X-Cache'], 'HIT')
+        self.assertEqual(clean.data, padded.data)
+
+    def test_cached_links_keep_only_list_params(self):
+        self._deposit(1000)
+        self._deposit(500)
+
+        first = self.client.get(f'{self.url}?page_size=1&utm_source=mail')
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertEqual(
+            first.data['next'], f'http://testserver{self.url}?page=2&page_size=1'
+        )
+
+        # 목록과 관계없는 파라미터만 다른 요청은 같은 항목과 같은 링크를 받음
+        second = self.client.get(f'{self.url}?page_size=1&ref=other')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertNotIn('utm_source', second.data['next'])
+
+        cursor = self.client.get(f'{self.url}?pagination=cursor&page_size=1&ref=x')
+        self.assertNotIn('ref=', cursor.data['next'])
+        self.assertIn('pagination=cursor', cursor.data['next'])
+
+    def test_write_invalidates_cached_pages(self):
+        self._deposit(1000)
+        self.assertEqual(self.client.get(self.url).data['count'], 1)
+
+        transaction_id = self._deposit(500)
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['count'], 2)
+
+        detail_url = reverse(
+            'transaction_detail',
+            kwargs={'account_id': self.account.id, 'pk': transaction_id},
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(detail_url)
+        self.assertEqual(self.client.get(self.url).data['count'], 1)
+
+    def test_other_user_cannot_read_cached_page(self):
+        self.client.get(self.url)
+        other = User.objects.create_user(email="intruder@example.com", password="pw")
+        self.client.force_authenticate(user=other)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
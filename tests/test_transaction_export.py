@@ -0,0 +1,83 @@
+import csv
+import io
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accountbook.models import Account, TransactionHistory
+
+User = get_user_model()
+
+
+class TransactionExportTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="export@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="EXPORT-1",
+            bank_code="001",
+            account_type="CHECKING",
+        )
+        for day, (amount, transaction_type) in enumerate(
+            [(1000, "DEPOSIT"), (300, "WITHDRAW"), (2000, "DEPOSIT")], start=10
+        ):
+            TransactionHistory.objects.create(
+                account=self.account,
+                transaction_amount=amount,
+                post_transaction_amount=amount,
+                transaction_details=f"내보내기, {day}일",
+                transaction_type=transaction_type,
+                transaction_method="TRANSFER",
+                transaction_timestamp=f"2025-06-{day}T10:00:00Z",
+            )
+        self.url = reverse('transaction_export', kwargs={'account_id': self.account.id})
+
+    def _content(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def test_csv_export_matches_list_serializer_columns(self):
+        response = self.client.get(self.url)
+        self.assertTrue(response['Content-Type'].startswith('text/csv'))
+        rows = list(csv.DictReader(io.StringIO(self._content(response))))
+
+        self.assertEqual(len(rows), 3)
+        listed = self.client.get(
+            reverse('transaction_list_create', kwargs={'account_id': self.account.id})
+        ).data['results']
+        for exported, serialized in zip(rows, listed):
+            self.assertEqual(
+                exported, {key: str(value) for key, value in serialized.items()}
+            )
+
+    def test_ndjson_export_with_filters(self):
+        response = self.client.get(
+            self.url,
+            {
+                'format': 'ndjson',
+                'transaction_type': 'DEPOSIT',
+                'end_date': '2025-06-11',
+            },
+        )
+        lines = self._content(response).splitlines()
+        self.assertEqual(len(lines), 1)
+        row = json.loads(lines[0])
+        self.assertEqual(row['transaction_amount'], '1000.00')
+        self.assertEqual(row['transaction_type_name'], '입금')
+        self.assertEqual(row['transaction_timestamp'], '2025-06-10T10:00:00Z')
+
+    def test_other_users_account_is_not_exported(self):
+        other = User.objects.create_user(email="other@example.com", password="pw")
+        self.client.force_authenticate(user=other)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,147 @@
+import itertools
+import unittest
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APIRequestFactory, APITestCase
+
+from accountbook.models import Account, TransactionHistory
+from accountbook.views.transactions_views import TransactionListCreateView
+
+User = get_user_model()
+
+FILTER_PARAMS = {
+    'transaction_type': 'WITHDRAW',
+    'min_amount': '1000',
+    'max_amount': '50000',
+    'start_date': '2025-06-01',
+    'end_date': '2025-06-30',
+}
+
+
+class TransactionFilterTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="filter@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="FILTER-1",
+            bank_code="001",
+            account_type="CHECKING",
+        )
+        self.url = reverse(
+            'transaction_list_create', kwargs={'account_id': self.account.id}
+        )
+
+    def _create(self, timestamp, amount=1000):
+        return TransactionHistory.objects.create(
+            account=self.account,
+            transaction_amount=amount,
+            post_transaction_amount=amount,
+            transaction_details="필터 테스트",
+            transaction_type="DEPOSIT",
+            transaction_method="ATM",
+            transaction_timestamp=timestamp,
+        )
+
+    def _ids(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {row['id'] for row in response.data['results']}
+
+    def test_date_range_is_inclusive_half_open(self):
+        utc = ZoneInfo('UTC')
+        before = self._create(datetime(2025, 6, 9, 23, 59, 59, tzinfo=utc))
+        first = self._create(datetime(2025, 6, 10, 0, 0, tzinfo=utc))
+        last = self._create(datetime(2025, 6, 11, 23, 59, 59, 999999, tzinfo=utc))
+        after = self._create(datetime(2025, 6, 12, 0, 0, tzinfo=utc))
+
+        ids = self._ids(
+            self.client.get(
+                self.url, {'start_date': '2025-06-10', 'end_date': '2025-06-11'}
+            )
+        )
+        self.assertEqual(ids, {first.id, last.id})
+        self.assertNotIn(before.id, ids)
+        self.assertNotIn(after.id, ids)
+
+    def test_date_range_uses_requested_timezone(self):
+        # 2025-06-10 00:30 KST == 2025-06-09 15:30 UTC
+        seoul = self._create(
+            datetime(2025, 6, 10, 0, 30, tzinfo=ZoneInfo('Asia/Seoul'))
+        )
+        ids = self._ids(
+            self.client.get(
+                self.url,
+                {
+                    'start_date': '2025-06-10',
+                    'end_date': '2025-06-10',
+                    'tz': 'Asia/Seoul',
+                },
+            )
+        )
+        self.assertEqual(ids, {seoul.id})
+        ids = self._ids(
+            self.client.get(
+                self.url, {'start_date': '2025-06-10', 'end_date': '2025-06-10'}
+            )
+        )
+        self.assertEqual(ids, set())
+
+    def test_amount_range(self):
+        small = self._create(datetime(2025, 6, 10, tzinfo=ZoneInfo('UTC')), 500)
+        large = self._create(datetime(2025, 6, 10, tzinfo=ZoneInfo('UTC')), 5000)
+        ids = self._ids(self.client.get(self.url, {'min_amount': '1000'}))
+        self.assertEqual(ids, {large.id})
+        ids = self._ids(self.client.get(self.url, {'max_amount': '1000'}))
+        self.assertEqual(ids, {small.id})
+
+    def test_invalid_filter_values(self):
+        for params in (
+            {'start_date': '2025-13-01'},
+            {'min_amount': 'abc'},
+            {'start_date': '2025-06-01', 'tz': 'Mars/Olympus'},
+        ):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @unittest.skipUnless(
+        connection.vendor == 'postgresql', 'EXPLAIN 검사는 PostgreSQL 전용'
+    )
+    def test_no_filter_combination_falls_back_to_seq_scan(self):
+        factory = APIRequestFactory()
+        names = list(FILTER_PARAMS)
+
+        with connection.cursor() as cursor:
+            # 데이터가 적어도 인덱스를 쓸 수 있는지 여부만 판단하도록 seq scan 비용을 최대로
+            cursor.execute('SET LOCAL enable_seqscan = off')
+
+        for size in range(len(names) + 1):
+            for combo in itertools.combinations(names, size):
+                params = {name: FILTER_PARAMS[name] for name in combo}
+                request = factory.get(self.url, params)
+                request.user = self.user
+                view = TransactionListCreateView()
+                view.setup(request, account_id=self.account.id)
+                view.request = view.initialize_request(request)
+                view.request.user = self.user
+                plan = view.get_queryset().explain()
+
+                with self.subTest(filters=combo):
+                    self.assertNotIn('Seq Scan on transaction_history', plan)
+                    if 'start_date' in combo or 'end_date' in combo:
+                        index_conds = [
+                            line for line in plan.splitlines() if 'Index Cond' in line
+                        ]
+                        self.assertTrue(
+                            any('transaction_timestamp' in c for c in index_conds),
+                            plan,
+                        )
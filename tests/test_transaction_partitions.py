@@ -0,0 +1,105 @@
+import unittest
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APIRequestFactory, APITestCase
+
+from accountbook.models import Account, TransactionHistory
+from accountbook.utils.partitions import (
+    DEFAULT_PARTITION,
+    detach_partition,
+    ensure_partition,
+    is_partitioned,
+    partition_name,
+)
+from accountbook.views.transactions_views import TransactionListCreateView
+
+User = get_user_model()
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', '파티션은 PostgreSQL 전용')
+class TransactionPartitionTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="partition@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="PARTITION-1",
+            bank_code="001",
+            account_type="CHECKING",
+        )
+        self.url = reverse(
+            'transaction_list_create', kwargs={'account_id': self.account.id}
+        )
+        for timestamp in ("2025-05-20T09:00:00Z", "2025-06-10T09:00:00Z"):
+            response = self.client.post(
+                self.url,
+                {
+                    "transaction_amount": 1000,
+                    "transaction_details": "파티션",
+                    "transaction_type": "DEPOSIT",
+                    "transaction_method": "TRANSFER",
+                    "transaction_timestamp": timestamp,
+                },
+                format='json',
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def _count(self, table):
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT COUNT(*) FROM {connection.ops.quote_name(table)}')
+            return cursor.fetchone()[0]
+
+    def test_table_is_partitioned(self):
+        with connection.cursor() as cursor:
+            self.assertTrue(is_partitioned(cursor))
+
+    def test_ensure_partition_moves_rows_out_of_default(self):
+        # 미리 만들지 않은 과거 월의 행은 기본 파티션에 쌓여 있음
+        self.assertEqual(self._count(DEFAULT_PARTITION), 2)
+
+        self.assertTrue(ensure_partition(date(2025, 6, 1)))
+        self.assertFalse(ensure_partition(date(2025, 6, 1)))
+
+        self.assertEqual(self._count(partition_name(date(2025, 6, 1))), 1)
+        self.assertEqual(self._count(DEFAULT_PARTITION), 1)
+        response = self.client.get(self.url)
+        self.assertEqual(len(response.data['results']), 2)
+
+    def test_date_filtered_list_prunes_partitions(self):
+        ensure_partition(date(2025, 5, 1))
+        ensure_partition(date(2025, 6, 1))
+
+        request = APIRequestFactory().get(
+            self.url, {'start_date': '2025-06-01', 'end_date': '2025-06-30'}
+        )
+        view = TransactionListCreateView()
+        view.setup(request, account_id=self.account.id)
+        view.request = view.initialize_request(request)
+        view.request.user = self.user
+        plan = view.get_queryset().explain()
+
+        self.assertIn(partition_name(date(2025, 6, 1)), plan)
+        self.assertNotIn(partition_name(date(2025, 5, 1)), plan)
+        self.assertNotIn(DEFAULT_PARTITION, plan)
+
+    def test_detached_partition_is_archived(self):
+        ensure_partition(date(2025, 5, 1))
+
+        archived = detach_partition(partition_name(date(2025, 5, 1)))
+
+        self.assertEqual(archived, f'archive.{partition_name(date(2025, 5, 1))}')
+        self.assertEqual(
+            TransactionHistory.objects.filter(account=self.account).count(), 1
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT COUNT(*) FROM {archived}')
+            self.assertEqual(cursor.fetchone()[0], 1)
@@ -0,0 +1,124 @@
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.contrib.auth.tokens import default_token_generator
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accountbook.utils.user_cache import clear_local_cache, user_cache_key
+
+User = get_user_model()
+
+
+class UserCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        clear_local_cache()
+        self.addCleanup(clear_local_cache)
+        self.user = User.objects.create_user(
+            email="usercache@example.com", password="password123", nickname="before"
+        )
+        self.client = self._client_for(self.user)
+        self.url = reverse('user_profile')
+
+    def _client_for(self, user):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+        return client
+
+    def test_authenticated_request_skips_user_query(self):
+        # 첫 요청: 사용자 조회 + 프로필 조회
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # 이후 요청: 사용자/프로필 모두 캐시
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data['email'], self.user.email)
+
+        # 로컬 LRU 가 비어도 Redis 에서 복원
+        clear_local_cache()
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+    def test_cached_user_does_not_hold_password(self):
+        self.client.get(self.url)
+        self.assertNotIn('password', cache.get(user_cache_key(self.user.id)))
+
+    def test_patch_invalidates_and_keeps_password(self):
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(self.url, {'nickname': 'after'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(cache.get(user_cache_key(self.user.id)))
+
+        self.client.get(self.url)
+        self.assertEqual(cache.get(user_cache_key(self.user.id))['nickname'], 'after')
+        # 캐시에서 만든 사용자를 저장해도 비밀번호는 그대로
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password('password123'))
+        self.assertEqual(self.user.nickname, 'after')
+
+    def test_patch_writes_only_changed_columns(self):
+        User.objects.filter(pk=self.user.pk).update(name="홍길동")
+        self.client.get(self.url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(
+                self.url, {'nickname': 'after', 'name': "홍길동"}
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        updates = [
+            query['sql'] for query in queries if query['sql'].startswith('UPDATE')
+        ]
+        self.assertEqual(len(updates), 1)
+        columns = updates[0].split(' SET ')[1].split(' WHERE ')[0]
+        self.assertIn('"nickname"', columns)
+        self.assertNotIn('"name"', columns)
+        self.assertNotIn('"password"', columns)
+
+    def test_delete_rejects_following_requests(self):
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_activation_invalidates_inactive_entry(self):
+        user = User.objects.create_user(
+            email="inactive@example.com", password="password123", is_active=False
+        )
+        client = self._client_for(user)
+        self.assertEqual(client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        uidb64 = urlsafe_base64_encode(force_bytes(user.pk))
+        token = default_token_generator.make_token(user)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.get(
+                reverse('activate', kwargs={'uidb64': uidb64, 'token': token})
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(client.get(self.url).status_code, status.HTTP_200_OK)
+
+    def test_admin_edit_invalidates(self):
+        self.client.get(self.url)
+        self.user.is_active = False
+
+        with self.captureOnCommitCallbacks(execute=True):
+            admin.site._registry[User].save_model(None, self.user, None, True)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,218 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accountbook.models import (
+    Account,
+    PendingDeposit,
+    TransactionDailyRollup,
+    TransactionHistory,
+)
+from accountbook.utils import ledger
+from accountbook.utils.account_cache import clear_local_cache
+from accountbook.utils.rollups import rebuild_rollups
+
+User = get_user_model()
+
+
+def make_row(amount, transaction_type, timestamp):
+    return {
+        "transaction_amount": amount,
+        "transaction_details": "묶음 반영 테스트",
+        "transaction_type": transaction_type,
+        "transaction_method": "TRANSFER",
+        "transaction_timestamp": timestamp,
+    }
+
+
+class WriteCombiningTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        clear_local_cache()
+        self.user = User.objects.create_user(
+            email="combining@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="COMBINE-1",
+            bank_code="001",
+            account_type="CHECKING",
+            write_combining=True,
+        )
+        self.list_url = reverse(
+            'transaction_list_create', kwargs={'account_id': self.account.id}
+        )
+
+    def post(self, amount, transaction_type, timestamp):
+        response = self.client.post(
+            self.list_url, make_row(amount, transaction_type, timestamp), format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response
+
+    def assertChain(self, expected_posts, expected_balance):
+        posts = list(
+            TransactionHistory.objects.filter(account=self.account)
+            .order_by('transaction_timestamp', 'id')
+            .values_list('post_transaction_amount', flat=True)
+        )
+        self.assertEqual(posts, [Decimal(value) for value in expected_posts])
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal(expected_balance))
+
+    def test_deposits_are_pending_until_settled(self):
+        self.post(1000, "DEPOSIT", "2025-06-10T09:00:00Z")
+        self.post(500, "DEPOSIT", "2025-06-11T09:00:00Z")
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, 0)
+        self.assertEqual(PendingDeposit.objects.count(), 2)
+
+        self.assertEqual(ledger.settle_pending(self.account.id), 2)
+        self.assertChain(['1000', '1500'], '1500')
+        self.assertFalse(PendingDeposit.objects.exists())
+
+    def test_settle_orders_backdated_deposit_before_settled_rows(self):
+        self.post(1000, "DEPOSIT", "2025-06-10T09:00:00Z")
+        self.post(500, "DEPOSIT", "2025-06-14T09:00:00Z")
+        ledger.settle_pending(self.account.id)
+
+        # 이미 정산된 14일 행 앞에 끼어드는 대기 입금
+        self.post(200, "DEPOSIT", "2025-06-12T09:00:00Z")
+        self.post(300, "DEPOSIT", "2025-06-15T09:00:00Z")
+        ledger.settle_pending(self.account.id)
+
+        self.assertChain(['1000', '1200', '1700', '2000'], '2000')
+
+    def test_reads_fold_in_pending_deposits(self):
+        self.post(1000, "DEPOSIT", "2025-06-10T09:00:00Z")
+        self.post(500, "DEPOSIT", "2025-06-11T09:00:00Z")
+
+        accounts = self.client.get(reverse('account_list_create'))
+        self.assertEqual(
+            Decimal(accounts.data['results'][0]['balance']), Decimal('1500')
+        )
+        detail = self.client.get(
+            reverse('account_detail', kwargs={'account_id': self.account.id})
+        )
+        self.assertEqual(Decimal(detail.data['balance']), Decimal('1500'))
+        # 잔액 조회는 정산하지 않음
+        self.assertEqual(PendingDeposit.objects.count(), 2)
+
+        # 거래내역 조회도 정산하지 않고 대기 입금을 더해 계산
+        transactions = self.client.get(self.list_url)
+        posts = [
+            Decimal(row['post_transaction_amount'])
+            for row in transactions.data['results']
+        ]
+        self.assertEqual(posts, [Decimal('1500'), Decimal('1000')])
+        self.assertEqual(PendingDeposit.objects.count(), 2)
+
+    def test_reads_fold_backdated_pending_deposit_without_locking(self):
+        self.post(1000, "DEPOSIT", "2025-06-10T09:00:00Z")
+        self.post(500, "DEPOSIT", "2025-06-14T09:00:00Z")
+        ledger.settle_pending(self.account.id)
+        # 정산된 14일 행 앞에 끼어드는 대기 입금과 마지막 대기 입금
+        response = self.post(200, "DEPOSIT", "2025-06-12T09:00:00Z")
+        self.post(300, "DEPOSIT", "2025-06-15T09:00:00Z")
+
+        with CaptureQueriesContext(connection) as queries:
+            transactions = self.client.get(self.list_url)
+        posts = [
+            Decimal(row['post_transaction_amount'])
+            for row in transactions.data['results']
+        ]
+        self.assertEqual(
+            posts, [Decimal(value) for value in ('2000', '1700', '1200', '1000')]
+        )
+        self.assertFalse(
+            any('FOR UPDATE' in query['sql'] for query in queries.captured_queries)
+        )
+        self.assertEqual(PendingDeposit.objects.count(), 2)
+
+        detail = self.client.get(
+            reverse(
+                'transaction_detail',
+                kwargs={
+                    'account_id': self.account.id,
+                    'pk': response.data['transaction_id'],
+                },
+            )
+        )
+        self.assertEqual(
+            Decimal(detail.data['post_transaction_amount']), Decimal('1200')
+        )
+        # 정산 후 저장된 값과 같음
+        ledger.settle_pending(self.account.id)
+        self.assertChain(['1000', '1200', '1700', '2000'], '2000')
+
+    def test_withdraw_settles_pending_deposits_first(self):
+        self.post(1000, "DEPOSIT", "2025-06-10T09:00:00Z")
+        self.post(300, "WITHDRAW", "2025-06-11T09:00:00Z")
+
+        self.assertChain(['1000', '700'], '700')
+        self.assertFalse(PendingDeposit.objects.exists())
+
+    def test_edit_and_delete_settle_first(self):
+        self.post(1000, "DEPOSIT", "2025-06-10T09:00:00Z")
+        response = self.post(500, "DEPOSIT", "2025-06-11T09:00:00Z")
+        url = reverse(
+            'transaction_detail',
+            kwargs={
+                'account_id': self.account.id,
+                'pk': response.data['transaction_id'],
+            },
+        )
+
+        self.client.patch(url, {"transaction_amount": 700}, format='json')
+        self.assertChain(['1000', '1700'], '1700')
+
+        self.post(100, "DEPOSIT", "2025-06-12T09:00:00Z")
+        self.client.delete(url)
+        self.assertChain(['1000', '1100'], '1100')
+
+    def test_first_commit_in_window_settles(self):
+        with override_settings(LEDGER_COMBINE_WINDOW=60):
+            for day in (10, 11, 12):
+                with self.captureOnCommitCallbacks(execute=True):
+                    self.post(100, "DEPOSIT", f"2025-06-{day}T09:00:00Z")
+
+        # 첫 입금만 정산, 같은 주기의 나머지는 다음 정산까지 대기
+        self.assertEqual(PendingDeposit.objects.count(), 2)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal('100'))
+
+    def test_disabling_mode_settles_pending(self):
+        self.post(1000, "DEPOSIT", "2025-06-10T09:00:00Z")
+
+        ledger.set_write_combining(self.account.id, False)
+
+        self.assertChain(['1000'], '1000')
+        self.account.refresh_from_db()
+        self.assertFalse(self.account.write_combining)
+        # 이후 입금은 바로 잔액에 반영 (캐시된 계좌 레코드가 아직 켜짐이어도)
+        self.post(500, "DEPOSIT", "2025-06-11T09:00:00Z")
+        self.assertChain(['1000', '1500'], '1500')
+
+    def test_rollups_count_pending_deposits_once(self):
+        self.post(1000, "DEPOSIT", "2025-06-10T09:00:00Z")
+        self.post(500, "DEPOSIT", "2025-06-10T10:00:00Z")
+        ledger.settle_pending(self.account.id)
+        self.post(200, "DEPOSIT", "2025-06-10T11:00:00Z")
+
+        # 재계산은 대기 입금을 빼고, 정산이 증분으로 더함
+        rebuild_rollups([self.account.id])
+        ledger.settle_pending(self.account.id)
+
+        rollup = TransactionDailyRollup.objects.get(account=self.account)
+        self.assertEqual(rollup.deposit_total, Decimal('1700'))
+        self.assertEqual(rollup.deposit_count, 3)